@@ -0,0 +1,74 @@
+import os
+import time
+import statistics
+from typing import Awaitable, Callable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from contribution.infrastructure import (
+    MongoDBConfig,
+    MongoDBPoolMetrics,
+    motor_client_factory,
+    env_var_by_key,
+)
+
+
+def benchmark_motor_client() -> AsyncIOMotorClient:
+    port_as_str = os.getenv("BENCHMARK_MONGODB_PORT")
+    if port_as_str:
+        port: Optional[int] = int(port_as_str)
+    else:
+        port = None
+
+    mongodb_config = MongoDBConfig(
+        url=env_var_by_key("BENCHMARK_MONGODB_URL"),
+        port=port,
+    )
+    return motor_client_factory(
+        mongodb_config=mongodb_config,
+        pool_metrics=MongoDBPoolMetrics(),
+    )
+
+
+async def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    *,
+    rounds: int,
+) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - started_at)
+
+    report(name, timings)
+    return timings
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    rounds: int,
+) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+
+    report(name, timings)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    timings_in_ms = sorted(timing * 1000 for timing in timings)
+    p95_index = max(int(len(timings_in_ms) * 0.95) - 1, 0)
+
+    print(  # noqa: T201
+        f"{name:<48} "
+        f"mean={statistics.fmean(timings_in_ms):>10.3f}ms "
+        f"p50={statistics.median(timings_in_ms):>10.3f}ms "
+        f"p95={timings_in_ms[p95_index]:>10.3f}ms",
+    )
@@ -0,0 +1,74 @@
+"""
+Compares loading release dates and money of 10k movie
+documents stored as ISO strings and string amounts, as
+mappers did before, and as native BSON dates and Decimal128.
+Measures BSON decoding together with conversion into
+domain values, which is what data mappers do on load.
+
+Usage::
+
+    python benchmarks/bson_values.py
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import bson
+
+from contribution.domain import Money
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+    date_from_bson,
+    money_to_bson,
+    money_from_bson,
+)
+from _measure import measure
+
+
+DOCUMENTS = 10_000
+ROUNDS = 20
+
+
+def main() -> None:
+    release_date = date(1999, 3, 31)
+    budget = Money(amount=Decimal("63000000.00"), currency="USD")
+
+    for name, value, value_from_bson in (
+        (
+            "release date as ISO string",
+            release_date.isoformat(),
+            date_from_bson,
+        ),
+        (
+            "release date as BSON date",
+            date_to_bson(release_date),
+            date_from_bson,
+        ),
+        (
+            "budget with string amount",
+            {"amount": str(budget.amount), "currency": budget.currency},
+            money_from_bson,
+        ),
+        (
+            "budget with Decimal128 amount",
+            money_to_bson(budget),
+            money_from_bson,
+        ),
+    ):
+        encoded_documents = [
+            bson.encode({"value": value}) for _ in range(DOCUMENTS)
+        ]
+
+        def load() -> None:
+            for encoded_document in encoded_documents:
+                value_from_bson(bson.decode(encoded_document)["value"])
+
+        measure(
+            f"{name} ({len(encoded_documents[0])} B)",
+            load,
+            rounds=ROUNDS,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Compares `collections` and `embedded` credits layouts on
+movies with 10, 100 and 1000 roles, writers and crew
+members each:
+
+* saving movie together with its credits,
+* loading all credits of movie by ids,
+* changing one role,
+* removing tenth part of credits.
+
+Usage::
+
+    BENCHMARK_MONGODB_URL=mongodb://localhost \\
+        python benchmarks/embedded_credits.py
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import date
+
+from dishka import AsyncContainer
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    MPAA,
+    CrewMembership,
+    Writing,
+    MovieId,
+    PersonId,
+    RoleId,
+    WriterId,
+    CrewMemberId,
+    Movie,
+    Role,
+    Writer,
+    CrewMember,
+)
+from contribution.application import (
+    UnitOfWork,
+    MovieGateway,
+    RoleGateway,
+    WriterGateway,
+    CrewMemberGateway,
+)
+from contribution.infrastructure import (
+    CreditsLayout,
+    ensure_indexes,
+    env_var_by_key,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+from _measure import measure_async
+
+
+CREDITS = (10, 100, 1000)
+ROUNDS = 20
+
+
+@dataclass(frozen=True, slots=True)
+class _Credits:
+    movie: Movie
+    roles: list[Role]
+    writers: list[Writer]
+    crew: list[CrewMember]
+
+
+async def main() -> None:
+    os.environ["MONGODB_URL"] = env_var_by_key("BENCHMARK_MONGODB_URL")
+    benchmark_mongodb_port = os.getenv("BENCHMARK_MONGODB_PORT")
+    if benchmark_mongodb_port:
+        os.environ["MONGODB_PORT"] = benchmark_mongodb_port
+
+    for credits_layout in CreditsLayout:
+        os.environ["MONGODB_CREDITS_LAYOUT"] = credits_layout
+
+        ioc_container = cli_ioc_container_factory()
+        motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+        await ensure_indexes(motor_database)
+
+        for credits_count in CREDITS:
+            await _run(
+                ioc_container,
+                name=f"{credits_layout} x{credits_count}",
+                credits_count=credits_count,
+            )
+        await ioc_container.close()
+
+
+async def _run(
+    ioc_container: AsyncContainer,
+    *,
+    name: str,
+    credits_count: int,
+) -> None:
+    saved_credits: list[_Credits] = []
+
+    async def save() -> None:
+        credits = _credits(credits_count)
+        await _save(ioc_container, credits)
+        saved_credits.append(credits)
+
+    await measure_async(f"{name} save", save, rounds=ROUNDS)
+
+    credits_to_load = iter(saved_credits)
+
+    async def load() -> None:
+        await _load(ioc_container, next(credits_to_load))
+
+    await measure_async(f"{name} load", load, rounds=ROUNDS)
+
+    credits_to_change = iter(saved_credits)
+
+    async def change_role() -> None:
+        await _change_role(ioc_container, next(credits_to_change))
+
+    await measure_async(f"{name} change role", change_role, rounds=ROUNDS)
+
+    credits_to_remove = iter(saved_credits)
+
+    async def remove() -> None:
+        await _remove(ioc_container, next(credits_to_remove))
+
+    await measure_async(f"{name} remove 10%", remove, rounds=ROUNDS)
+
+
+async def _save(ioc_container: AsyncContainer, credits: _Credits) -> None:
+    async with ioc_container() as request_container:
+        movie_gateway = await request_container.get(MovieGateway)
+        role_gateway = await request_container.get(RoleGateway)
+        writer_gateway = await request_container.get(WriterGateway)
+        crew_member_gateway = await request_container.get(CrewMemberGateway)
+        unit_of_work = await request_container.get(UnitOfWork)
+
+        await movie_gateway.save(credits.movie)
+        await role_gateway.save_many(credits.roles)
+        await writer_gateway.save_many(credits.writers)
+        await crew_member_gateway.save_many(credits.crew)
+        await unit_of_work.commit()
+
+
+async def _load(ioc_container: AsyncContainer, credits: _Credits) -> None:
+    async with ioc_container() as request_container:
+        role_gateway = await request_container.get(RoleGateway)
+        writer_gateway = await request_container.get(WriterGateway)
+        crew_member_gateway = await request_container.get(CrewMemberGateway)
+
+        await role_gateway.list_by_ids(role.id for role in credits.roles)
+        await writer_gateway.list_by_ids(
+            writer.id for writer in credits.writers
+        )
+        await crew_member_gateway.list_by_ids(
+            crew_member.id for crew_member in credits.crew
+        )
+
+
+async def _change_role(
+    ioc_container: AsyncContainer,
+    credits: _Credits,
+) -> None:
+    async with ioc_container() as request_container:
+        role_gateway = await request_container.get(RoleGateway)
+        unit_of_work = await request_container.get(UnitOfWork)
+
+        role = await role_gateway.by_id(credits.roles[-1].id)
+        assert role
+        role.importance += 1
+        await role_gateway.update(role)
+        await unit_of_work.commit()
+
+
+async def _remove(ioc_container: AsyncContainer, credits: _Credits) -> None:
+    removed_count = max(len(credits.roles) // 10, 1)
+
+    async with ioc_container() as request_container:
+        role_gateway = await request_container.get(RoleGateway)
+        writer_gateway = await request_container.get(WriterGateway)
+        crew_member_gateway = await request_container.get(CrewMemberGateway)
+        unit_of_work = await request_container.get(UnitOfWork)
+
+        roles = await role_gateway.list_by_ids(
+            role.id for role in credits.roles[:removed_count]
+        )
+        writers = await writer_gateway.list_by_ids(
+            writer.id for writer in credits.writers[:removed_count]
+        )
+        crew = await crew_member_gateway.list_by_ids(
+            crew_member.id for crew_member in credits.crew[:removed_count]
+        )
+        await role_gateway.delete_many(roles)
+        await writer_gateway.delete_many(writers)
+        await crew_member_gateway.delete_many(crew)
+        await unit_of_work.commit()
+
+
+def _credits(credits_count: int) -> _Credits:
+    movie = Movie(
+        id=MovieId(uuid7()),
+        eng_title="Matrix",
+        original_title="Matrix",
+        summary="Summary",
+        description="Description",
+        release_date=date(1999, 3, 31),
+        countries=["US"],
+        genres=[],
+        mpaa=MPAA.R,
+        duration=136,
+        budget=None,
+        revenue=None,
+    )
+    roles = [
+        Role(
+            id=RoleId(uuid7()),
+            movie_id=movie.id,
+            person_id=PersonId(uuid7()),
+            character=f"Character #{number}",
+            importance=number,
+            is_spoiler=False,
+        )
+        for number in range(credits_count)
+    ]
+    writers = [
+        Writer(
+            id=WriterId(uuid7()),
+            movie_id=movie.id,
+            person_id=PersonId(uuid7()),
+            writing=Writing.SCREENPLAY,
+        )
+        for _ in range(credits_count)
+    ]
+    crew = [
+        CrewMember(
+            id=CrewMemberId(uuid7()),
+            movie_id=movie.id,
+            person_id=PersonId(uuid7()),
+            membership=CrewMembership.PRODUCER,
+        )
+        for _ in range(credits_count)
+    ]
+    return _Credits(movie=movie, roles=roles, writers=writers, crew=crew)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Compares per request overhead of ensuring indexes in collection
+factories (as it was done before indexes were moved to startup)
+with getting app scoped collection handles.
+
+Usage::
+
+    BENCHMARK_MONGODB_URL=mongodb://localhost \\
+        python benchmarks/ensure_indexes.py
+"""
+
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    motor_database_factory,
+    ensure_indexes,
+)
+from _measure import benchmark_motor_client, measure_async
+
+
+ROUNDS = 200
+
+COLLECTION_FACTORIES = (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+)
+
+
+async def main() -> None:
+    motor_client = benchmark_motor_client()
+    motor_database = motor_database_factory(motor_client)
+    await ensure_indexes(motor_database)
+
+    async def ensure_indexes_per_request() -> None:
+        await ensure_indexes(motor_database)
+
+    async def collections_per_request() -> None:
+        _collections(motor_database)
+
+    await measure_async(
+        "ensure indexes on every request",
+        ensure_indexes_per_request,
+        rounds=ROUNDS,
+    )
+    await measure_async(
+        "app scoped collections",
+        collections_per_request,
+        rounds=ROUNDS,
+    )
+
+
+def _collections(motor_database: AsyncIOMotorDatabase) -> list:
+    return [factory(motor_database) for factory in COLLECTION_FACTORIES]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
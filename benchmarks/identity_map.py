@@ -0,0 +1,77 @@
+"""
+Compares identity map keyed by id with the list based
+identity maps it replaced on 10, 1k and 10k roles.
+
+Usage::
+
+    python benchmarks/identity_map.py
+"""
+
+from typing import Optional
+
+from uuid_extensions import uuid7
+
+from contribution.domain import RoleId, MovieId, PersonId, Role
+from contribution.infrastructure import RoleMap
+from _measure import measure
+
+
+SIZES = (10, 1_000, 10_000)
+
+
+class ListRoleMap:
+    def __init__(self):
+        self._roles: list[Role] = list()
+
+    def by_id(self, id: RoleId) -> Optional[Role]:
+        for role in self._roles:
+            if role.id == id:
+                return role
+        return None
+
+    def save(self, role: Role) -> None:
+        role_from_map = self.by_id(role.id)
+        if role_from_map:
+            message = "Role already exists in identity map"
+            raise Exception(message)
+        self._roles.append(role)
+
+
+def main() -> None:
+    for size in SIZES:
+        roles = _roles(size)
+        rounds = 1 if size == 10_000 else 20
+
+        for role_map_factory in (ListRoleMap, RoleMap):
+
+            def save_and_lookup_roles() -> None:
+                role_map = role_map_factory()
+                for role in roles:
+                    role_map.save(role)
+                for role in roles:
+                    role_map.by_id(role.id)
+
+            measure(
+                f"{role_map_factory.__name__}, {size} roles",
+                save_and_lookup_roles,
+                rounds=rounds,
+            )
+
+
+def _roles(size: int) -> list[Role]:
+    movie_id = MovieId(uuid7())
+    return [
+        Role(
+            id=RoleId(uuid7()),
+            movie_id=movie_id,
+            person_id=PersonId(uuid7()),
+            character=f"Character #{number}",
+            importance=number,
+            is_spoiler=False,
+        )
+        for number in range(size)
+    ]
+
+
+if __name__ == "__main__":
+    main()
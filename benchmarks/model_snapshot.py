@@ -0,0 +1,139 @@
+"""
+Compares deep copies the unit of work used to keep for
+clean models with model snapshots that replaced them:
+time to register 1k models as clean and find out their
+changes, and memory retained by registered models.
+
+Usage::
+
+    python benchmarks/model_snapshot.py
+"""
+
+import copy
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    ContributionStatus,
+    EditMovieContributionId,
+    EditMovieContribution,
+    MovieId,
+    MovieRole,
+    PersonId,
+    RoleId,
+    UserId,
+    User,
+    Maybe,
+)
+from contribution.infrastructure.database.model_snapshot import (
+    ModelSnapshot,
+)
+from _measure import measure
+
+
+MODELS = 1_000
+
+
+def main() -> None:
+    for model_name, model_factory in (
+        ("User", _user),
+        ("EditMovieContribution", _edit_movie_contribution),
+    ):
+        models = [model_factory() for _ in range(MODELS)]
+
+        def register_deep_copies() -> None:
+            clean_models = [copy.deepcopy(model) for model in models]
+            for clean_model, model in zip(clean_models, models):
+                clean_model != model
+
+        def register_snapshots() -> None:
+            snapshots = [ModelSnapshot(model) for model in models]
+            for snapshot, model in zip(snapshots, models):
+                snapshot.changed_fields(model)
+
+        measure(
+            f"deepcopy, {MODELS} {model_name}",
+            register_deep_copies,
+            rounds=20,
+        )
+        measure(
+            f"snapshot, {MODELS} {model_name}",
+            register_snapshots,
+            rounds=20,
+        )
+        _report_memory(
+            f"deepcopy, {MODELS} {model_name}",
+            lambda: [copy.deepcopy(model) for model in models],
+        )
+        _report_memory(
+            f"snapshot, {MODELS} {model_name}",
+            lambda: [ModelSnapshot(model) for model in models],
+        )
+
+
+def _report_memory(name: str, func: Callable[[], Any]) -> None:
+    tracemalloc.start()
+    retained = func()
+    retained_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+
+    print(f"{name:<48} retained={retained_size / 1024:>10.1f}KiB")  # noqa: T201
+
+
+def _user() -> User:
+    return User(
+        id=UserId(uuid7()),
+        name="JohnDoe",
+        email="John@Doe.com",
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+
+
+def _edit_movie_contribution() -> EditMovieContribution:
+    return EditMovieContribution(
+        id=EditMovieContributionId(uuid7()),
+        status=ContributionStatus.PENDING,
+        created_at=datetime.now(timezone.utc),
+        status_updated_at=None,
+        author_id=UserId(uuid7()),
+        movie_id=MovieId(uuid7()),
+        eng_title=Maybe[str].with_value("Matrix"),
+        original_title=Maybe[str].without_value(),
+        summary=Maybe[str].with_value("Summary"),
+        description=Maybe[str].with_value("Description"),
+        release_date=Maybe.without_value(),
+        countries=Maybe.with_value(["US", "GB"]),
+        genres=Maybe.without_value(),
+        mpaa=Maybe.without_value(),
+        duration=Maybe[int].without_value(),
+        budget=Maybe.without_value(),
+        revenue=Maybe.without_value(),
+        roles_to_add=[
+            MovieRole(
+                id=RoleId(uuid7()),
+                person_id=PersonId(uuid7()),
+                character=f"Character #{number}",
+                importance=number,
+                is_spoiler=False,
+            )
+            for number in range(50)
+        ],
+        roles_to_remove=[RoleId(uuid7()) for _ in range(50)],
+        writers_to_add=[],
+        writers_to_remove=[],
+        crew_to_add=[],
+        crew_to_remove=[],
+        photos_to_add=[],
+    )
+
+
+if __name__ == "__main__":
+    main()
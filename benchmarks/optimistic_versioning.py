@@ -0,0 +1,149 @@
+"""
+Compares `lock` and `version` concurrency modes under
+contention: concurrent operations acquire the same user,
+increment its rating and commit. Conflicting operations
+are retried until every operation is committed.
+
+In `lock` mode every acquire writes lock field, so
+concurrent transactions abort on acquire. In `version`
+mode acquire only reads, conflicts are detected by
+version conditions on commit.
+
+Usage::
+
+    BENCHMARK_MONGODB_URL=mongodb://localhost \\
+        python benchmarks/optimistic_versioning.py
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+
+from dishka import AsyncContainer
+from pymongo.errors import PyMongoError
+from uuid_extensions import uuid7
+
+from contribution.domain import UserId, User
+from contribution.application import (
+    ConcurrentModificationError,
+    UnitOfWork,
+    UserGateway,
+)
+from contribution.infrastructure import (
+    ConcurrencyMode,
+    env_var_by_key,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+CONCURRENT_OPERATIONS = (1, 4, 16, 64)
+OPERATIONS_PER_WORKER = 20
+
+
+@dataclass(slots=True)
+class _Result:
+    committed: int = 0
+    conflicts: int = 0
+
+
+async def main() -> None:
+    os.environ["MONGODB_URL"] = env_var_by_key("BENCHMARK_MONGODB_URL")
+    benchmark_mongodb_port = os.getenv("BENCHMARK_MONGODB_PORT")
+    if benchmark_mongodb_port:
+        os.environ["MONGODB_PORT"] = benchmark_mongodb_port
+
+    for concurrency_mode in ConcurrencyMode:
+        if concurrency_mode is ConcurrencyMode.VERSION:
+            os.environ["MONGODB_VERSIONED_COLLECTIONS"] = "users"
+        else:
+            os.environ["MONGODB_VERSIONED_COLLECTIONS"] = ""
+
+        ioc_container = cli_ioc_container_factory()
+        for workers in CONCURRENT_OPERATIONS:
+            await _run(
+                ioc_container,
+                concurrency_mode=concurrency_mode,
+                workers=workers,
+            )
+        await ioc_container.close()
+
+
+async def _run(
+    ioc_container: AsyncContainer,
+    *,
+    concurrency_mode: ConcurrencyMode,
+    workers: int,
+) -> None:
+    user_id = await _create_user(ioc_container)
+    result = _Result()
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _increment_rating(ioc_container, user_id, result)
+            for _ in range(workers)
+        ),
+    )
+    duration = time.perf_counter() - started_at
+
+    print(  # noqa: T201
+        f"{concurrency_mode:>7} x{workers:<3} "
+        f"committed={result.committed:<5} "
+        f"conflicts={result.conflicts:<6} "
+        f"throughput={result.committed / duration:8.1f} ops/s "
+        f"total={duration * 1000:8.1f}ms",
+    )
+
+
+async def _create_user(ioc_container: AsyncContainer) -> UserId:
+    user = User(
+        id=UserId(uuid7()),
+        name=uuid7().hex,
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+    async with ioc_container() as request_container:
+        user_gateway = await request_container.get(UserGateway)
+        unit_of_work = await request_container.get(UnitOfWork)
+
+        await user_gateway.save(user)
+        await unit_of_work.commit()
+
+    return user.id
+
+
+async def _increment_rating(
+    ioc_container: AsyncContainer,
+    user_id: UserId,
+    result: _Result,
+) -> None:
+    for _ in range(OPERATIONS_PER_WORKER):
+        while True:
+            try:
+                async with ioc_container() as request_container:
+                    user_gateway = await request_container.get(UserGateway)
+                    unit_of_work = await request_container.get(UnitOfWork)
+
+                    user = await user_gateway.acquire_by_id(user_id)
+                    assert user
+                    user.rating += 1
+                    await user_gateway.update(user)
+                    await unit_of_work.commit()
+            except ConcurrentModificationError:
+                result.conflicts += 1
+            except PyMongoError as error:
+                if not error.has_error_label("TransientTransactionError"):
+                    raise
+                result.conflicts += 1
+            else:
+                result.committed += 1
+                break
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,208 @@
+"""
+Compares writing changes of movie accepting (movie, roles,
+writers and crew members) with one bulk write per collection,
+as unit of work did before, and with one client level bulk
+write. Client level bulk write requires MongoDB 8.0 or newer.
+
+Usage::
+
+    BENCHMARK_MONGODB_URL=mongodb://localhost \\
+        python benchmarks/unit_of_work_commit.py
+"""
+
+import asyncio
+from datetime import date
+
+from uuid_extensions import uuid7
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from contribution.domain import (
+    MPAA,
+    CrewMembership,
+    Writing,
+    MovieId,
+    PersonId,
+    RoleId,
+    WriterId,
+    CrewMemberId,
+    Movie,
+    Role,
+    Writer,
+    CrewMember,
+)
+from contribution.infrastructure import (
+    CommitMovieCollectionChanges,
+    CommitRoleCollectionChanges,
+    CommitWriterCollectionChanges,
+    CommitCrewMemberCollectionChanges,
+    movie_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    motor_database_factory,
+    ensure_indexes,
+    MongoDBSession,
+    UUIDCodec,
+    ModelVersions,
+    CreditsLayout,
+)
+from _measure import benchmark_motor_client, measure_async
+
+
+ROUNDS = 100
+CREDITS = 10
+
+
+async def main() -> None:
+    motor_client = benchmark_motor_client()
+    motor_database = motor_database_factory(motor_client)
+    await ensure_indexes(motor_database)
+
+    async def commit_by_collection() -> None:
+        await _commit(motor_client, client_bulk_write=False)
+
+    async def commit_in_one_bulk_write() -> None:
+        await _commit(motor_client, client_bulk_write=True)
+
+    await measure_async(
+        "bulk write per collection",
+        commit_by_collection,
+        rounds=ROUNDS,
+    )
+    await measure_async(
+        "client level bulk write",
+        commit_in_one_bulk_write,
+        rounds=ROUNDS,
+    )
+
+
+async def _commit(
+    motor_client: AsyncIOMotorClient,
+    *,
+    client_bulk_write: bool,
+) -> None:
+    motor_database = motor_database_factory(motor_client)
+
+    session = MongoDBSession(motor_client)
+    uuid_codec = UUIDCodec()
+    try:
+        committers_and_models = (
+            (
+                CommitMovieCollectionChanges(
+                    collection=movie_collection_factory(motor_database),
+                    session=session,
+                    uuid_codec=uuid_codec,
+                    model_versions=ModelVersions(),
+                ),
+                [_movie()],
+            ),
+            (
+                CommitRoleCollectionChanges(
+                    collection=role_collection_factory(motor_database),
+                    movie_collection=movie_collection_factory(motor_database),
+                    session=session,
+                    uuid_codec=uuid_codec,
+                    credits_layout=CreditsLayout.COLLECTIONS,
+                ),
+                _roles(),
+            ),
+            (
+                CommitWriterCollectionChanges(
+                    collection=writer_collection_factory(motor_database),
+                    movie_collection=movie_collection_factory(motor_database),
+                    session=session,
+                    uuid_codec=uuid_codec,
+                    credits_layout=CreditsLayout.COLLECTIONS,
+                ),
+                _writers(),
+            ),
+            (
+                CommitCrewMemberCollectionChanges(
+                    collection=crew_member_collection_factory(
+                        motor_database,
+                    ),
+                    movie_collection=movie_collection_factory(motor_database),
+                    session=session,
+                    uuid_codec=uuid_codec,
+                    credits_layout=CreditsLayout.COLLECTIONS,
+                ),
+                _crew(),
+            ),
+        )
+
+        if not client_bulk_write:
+            for committer, models in committers_and_models:
+                await committer(new=models, dirty=[], deleted=[])
+        else:
+            write_models = []
+            for committer, models in committers_and_models:
+                write_models.extend(
+                    committer.write_models(new=models, dirty=[], deleted=[]),
+                )
+            await motor_client.bulk_write(
+                write_models,
+                session=await session.get(),
+            )
+
+        await session.commit_transaction()
+    finally:
+        await session.end()
+
+
+def _movie() -> Movie:
+    return Movie(
+        id=MovieId(uuid7()),
+        eng_title="Matrix",
+        original_title="Matrix",
+        summary="Summary",
+        description="Description",
+        release_date=date(1999, 3, 31),
+        countries=["US"],
+        genres=[],
+        mpaa=MPAA.R,
+        duration=136,
+        budget=None,
+        revenue=None,
+    )
+
+
+def _roles() -> list[Role]:
+    return [
+        Role(
+            id=RoleId(uuid7()),
+            movie_id=MovieId(uuid7()),
+            person_id=PersonId(uuid7()),
+            character=f"Character #{number}",
+            importance=number,
+            is_spoiler=False,
+        )
+        for number in range(CREDITS)
+    ]
+
+
+def _writers() -> list[Writer]:
+    return [
+        Writer(
+            id=WriterId(uuid7()),
+            movie_id=MovieId(uuid7()),
+            person_id=PersonId(uuid7()),
+            writing=Writing.SCREENPLAY,
+        )
+        for _ in range(CREDITS)
+    ]
+
+
+def _crew() -> list[CrewMember]:
+    return [
+        CrewMember(
+            id=CrewMemberId(uuid7()),
+            movie_id=MovieId(uuid7()),
+            person_id=PersonId(uuid7()),
+            membership=CrewMembership.PRODUCER,
+        )
+        for _ in range(CREDITS)
+    ]
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
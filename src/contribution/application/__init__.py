@@ -1,3 +1,5 @@
 from .command_processors import *
 from .commands import *
+from .queries import *
+from .query_processors import *
 from .common import *
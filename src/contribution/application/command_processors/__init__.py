@@ -17,15 +17,30 @@ __all__ = (
     "UpdatePersonProcessor",
     "UpdatePersonLoggingProcessor",
     "update_person_factory",
+    "ImportUsersProcessor",
+    "ImportUsersLoggingProcessor",
+    "import_users_factory",
+    "ImportMoviesProcessor",
+    "ImportMoviesLoggingProcessor",
+    "import_movies_factory",
+    "ImportPersonsProcessor",
+    "ImportPersonsLoggingProcessor",
+    "import_persons_factory",
     "AddMovieProcessor",
     "AddMovieLoggingProcessor",
     "add_movie_factory",
+    "AddMoviesProcessor",
+    "AddMoviesLoggingProcessor",
+    "add_movies_factory",
     "EditMovieProcessor",
     "EditMovieLoggingProcessor",
     "edit_movie_factory",
     "AddPersonProcessor",
     "AddPersonLoggingProcessor",
     "add_person_factory",
+    "AddPersonsProcessor",
+    "AddPersonsLoggingProcessor",
+    "add_persons_factory",
     "EditPersonProcessor",
     "EditPersonLoggingProcessor",
     "edit_person_factory",
@@ -85,11 +100,31 @@ from .update_person import (
     UpdatePersonLoggingProcessor,
     update_person_factory,
 )
+from .import_users import (
+    ImportUsersProcessor,
+    ImportUsersLoggingProcessor,
+    import_users_factory,
+)
+from .import_movies import (
+    ImportMoviesProcessor,
+    ImportMoviesLoggingProcessor,
+    import_movies_factory,
+)
+from .import_persons import (
+    ImportPersonsProcessor,
+    ImportPersonsLoggingProcessor,
+    import_persons_factory,
+)
 from .add_movie import (
     AddMovieProcessor,
     AddMovieLoggingProcessor,
     add_movie_factory,
 )
+from .add_movies import (
+    AddMoviesProcessor,
+    AddMoviesLoggingProcessor,
+    add_movies_factory,
+)
 from .edit_movie import (
     EditMovieProcessor,
     EditMovieLoggingProcessor,
@@ -100,6 +135,11 @@ from .add_person import (
     AddPersonLoggingProcessor,
     add_person_factory,
 )
+from .add_persons import (
+    AddPersonsProcessor,
+    AddPersonsLoggingProcessor,
+    add_persons_factory,
+)
 from .edit_person import (
     EditPersonProcessor,
     EditPersonLoggingProcessor,
@@ -32,6 +32,7 @@ from contribution.application.common import (
     UserGateway,
     AchievementGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     OnEventOccurred,
     AchievementEarnedEvent,
 )
@@ -53,6 +54,7 @@ def accept_movie_adding_factory(
     movie_gateway: MovieGateway,
     achievement_gateway: AchievementGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     on_achievement_earned: OnEventOccurred[AchievementEarnedEvent],
 ) -> CommandProcessor[AcceptMovieAddingCommand, Optional[AchievementId]]:
     accept_movie_adding_processor = AcceptMovieAddingProcessor(
@@ -74,6 +76,7 @@ def accept_movie_adding_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = AcceptMovieAddingLoggingProcessor(
         processor=tx_processor,
@@ -38,6 +38,7 @@ from contribution.application.common import (
     UserGateway,
     AchievementGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     OnEventOccurred,
     AchievementEarnedEvent,
 )
@@ -62,6 +63,7 @@ def accept_movie_editing_factory(
     movie_gateway: MovieGateway,
     achievement_gateway: AchievementGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     on_achievement_earned: OnEventOccurred[AchievementEarnedEvent],
 ) -> CommandProcessor[AcceptMovieEditingCommand, Optional[AchievementId]]:
     accept_movie_editing_processor = AcceptMovieEditingProcessor(
@@ -86,6 +88,7 @@ def accept_movie_editing_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = AcceptMovieEditingLoggingProcessor(
         processor=tx_processor,
@@ -25,6 +25,7 @@ from contribution.application.common import (
     UserGateway,
     AchievementGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     OnEventOccurred,
     AchievementEarnedEvent,
 )
@@ -43,6 +44,7 @@ def accept_person_editing_factory(
     person_gateway: PersonGateway,
     achievement_gateway: AchievementGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     on_achievement_earned: OnEventOccurred[AchievementEarnedEvent],
 ) -> CommandProcessor[AcceptPersonEditingCommand, Optional[AchievementId]]:
     accept_person_editing_processor = AcceptPersonEditingProcessor(
@@ -61,6 +63,7 @@ def accept_person_editing_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = AcceptPersonEditingLoggingProcessor(
         operation_id=operation_id,
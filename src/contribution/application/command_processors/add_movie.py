@@ -25,6 +25,7 @@ from contribution.application.common import (
     UserGateway,
     PermissionsGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     IdentityProvider,
     OnEventOccurred,
     MovieAddedEvent,
@@ -48,6 +49,7 @@ def add_movie_factory(
     user_gateway: UserGateway,
     permissions_gateway: PermissionsGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     identity_provider: IdentityProvider,
     on_movie_added: OnEventOccurred[MovieAddedEvent],
 ) -> CommandProcessor[AddMovieCommand, AddMovieContributionId]:
@@ -86,6 +88,7 @@ def add_movie_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = AddMovieLoggingProcessor(
         processor=tx_processor,
@@ -0,0 +1,396 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Union
+
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    AddMovieContributionId,
+    PersonId,
+    MovieRole,
+    MovieWriter,
+    MovieCrewMember,
+    DomainError,
+    UserIsNotActiveError,
+    AddMovie,
+)
+from contribution.application.common import (
+    OperationId,
+    AccessConcern,
+    CreateMovieRoles,
+    CreateMovieWriters,
+    CreateMovieCrew,
+    CommandProcessor,
+    AuthorizationProcessor,
+    TransactionProcessor,
+    BatchItemResult,
+    UserDoesNotExistError,
+    PersonsDoNotExistError,
+    NotEnoughPermissionsError,
+    ContributionBatchIsTooLargeError,
+    AddMovieContributionGateway,
+    PersonGateway,
+    UserGateway,
+    PermissionsGateway,
+    UnitOfWork,
+    TransactionRetryPolicy,
+    IdentityProvider,
+    OnEventOccurred,
+    MovieAddedEvent,
+    make_func_cacheable,
+    ensure_contribution_batch_size,
+)
+from contribution.application.commands import (
+    AddMovieCommand,
+    AddMoviesCommand,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def add_movies_factory(
+    operation_id: OperationId,
+    add_movie: AddMovie,
+    access_concern: AccessConcern,
+    create_movie_roles: CreateMovieRoles,
+    create_movie_writers: CreateMovieWriters,
+    create_movie_crew: CreateMovieCrew,
+    add_movie_contribution_gateway: AddMovieContributionGateway,
+    person_gateway: PersonGateway,
+    user_gateway: UserGateway,
+    permissions_gateway: PermissionsGateway,
+    unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
+    identity_provider: IdentityProvider,
+    on_movie_added: OnEventOccurred[MovieAddedEvent],
+) -> CommandProcessor[
+    AddMoviesCommand,
+    list[BatchItemResult[AddMovieContributionId]],
+]:
+    current_timestamp = datetime.now(timezone.utc)
+
+    create_movie_roles = make_func_cacheable(create_movie_roles)
+    create_movie_writers = make_func_cacheable(create_movie_writers)
+    create_movie_crew = make_func_cacheable(create_movie_crew)
+
+    add_movies_processor = AddMoviesProcessor(
+        add_movie=add_movie,
+        create_movie_roles=create_movie_roles,
+        create_movie_writers=create_movie_writers,
+        create_movie_crew=create_movie_crew,
+        add_movie_contribution_gateway=add_movie_contribution_gateway,
+        person_gateway=person_gateway,
+        user_gateway=user_gateway,
+        identity_provider=identity_provider,
+        current_timestamp=current_timestamp,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=add_movies_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    callback_processor = AddMoviesCallbackProcessor(
+        processor=authz_processor,
+        create_movie_roles=create_movie_roles,
+        create_movie_writers=create_movie_writers,
+        create_movie_crew=create_movie_crew,
+        identity_provider=identity_provider,
+        on_movie_added=on_movie_added,
+        current_timestamp=current_timestamp,
+    )
+    tx_processor = TransactionProcessor(
+        processor=callback_processor,
+        unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
+    )
+    log_processor = AddMoviesLoggingProcessor(
+        processor=tx_processor,
+        operation_id=operation_id,
+        identity_provider=identity_provider,
+    )
+
+    return log_processor
+
+
+@dataclass(frozen=True, slots=True)
+class _MovieCredits:
+    roles: list[MovieRole]
+    writers: list[MovieWriter]
+    crew: list[MovieCrewMember]
+
+    @property
+    def person_ids(self) -> set[PersonId]:
+        return {
+            *(role.person_id for role in self.roles),
+            *(writer.person_id for writer in self.writers),
+            *(crew_member.person_id for crew_member in self.crew),
+        }
+
+
+class AddMoviesProcessor:
+    """
+    Adds batch of movies on behalf of one author. Does the
+    same checks as `AddMovieProcessor`, but loads author
+    once and checks existence of persons of all movies
+    with one query. Movie rejected by check is returned
+    with error, other movies are saved.
+    """
+
+    def __init__(
+        self,
+        *,
+        add_movie: AddMovie,
+        create_movie_roles: CreateMovieRoles,
+        create_movie_writers: CreateMovieWriters,
+        create_movie_crew: CreateMovieCrew,
+        add_movie_contribution_gateway: AddMovieContributionGateway,
+        person_gateway: PersonGateway,
+        user_gateway: UserGateway,
+        identity_provider: IdentityProvider,
+        current_timestamp: datetime,
+    ):
+        self._add_movie = add_movie
+        self._create_movie_roles = create_movie_roles
+        self._create_movie_writers = create_movie_writers
+        self._create_movie_crew = create_movie_crew
+        self._add_movie_contribution_gateway = add_movie_contribution_gateway
+        self._person_gateway = person_gateway
+        self._user_gateway = user_gateway
+        self._identity_provider = identity_provider
+        self._current_timestamp = current_timestamp
+
+    async def process(
+        self,
+        command: AddMoviesCommand,
+    ) -> list[BatchItemResult[AddMovieContributionId]]:
+        ensure_contribution_batch_size(len(command.movies))
+
+        current_user_id = await self._identity_provider.user_id()
+
+        author = await self._user_gateway.by_id(current_user_id)
+        if not author:
+            raise UserDoesNotExistError()
+        if not author.is_active:
+            raise UserIsNotActiveError()
+
+        # Credits are validated before persons are checked,
+        # so invalid movies don't add ids to query
+        credits_or_errors: list[Union[_MovieCredits, DomainError]] = []
+        for movie_command in command.movies:
+            try:
+                credits_or_errors.append(self._movie_credits(movie_command))
+            except DomainError as error:
+                credits_or_errors.append(error)
+
+        person_ids = {
+            person_id
+            for movie_credits in credits_or_errors
+            if isinstance(movie_credits, _MovieCredits)
+            for person_id in movie_credits.person_ids
+        }
+        persons = await self._person_gateway.list_by_ids(person_ids)
+        existing_person_ids = {person.id for person in persons}
+
+        results: list[BatchItemResult[AddMovieContributionId]] = []
+        for movie_command, movie_credits in zip(
+            command.movies,
+            credits_or_errors,
+        ):
+            if isinstance(movie_credits, DomainError):
+                results.append(BatchItemResult(error=movie_credits))
+                continue
+
+            non_existing_person_ids = movie_credits.person_ids.difference(
+                existing_person_ids,
+            )
+            if non_existing_person_ids:
+                results.append(
+                    BatchItemResult(
+                        error=PersonsDoNotExistError(non_existing_person_ids),
+                    ),
+                )
+                continue
+
+            try:
+                contribution = self._add_movie(
+                    id=AddMovieContributionId(uuid7()),
+                    author=author,
+                    eng_title=movie_command.eng_title,
+                    original_title=movie_command.original_title,
+                    summary=movie_command.summary,
+                    description=movie_command.description,
+                    release_date=movie_command.release_date,
+                    countries=movie_command.countries,
+                    genres=movie_command.genres,
+                    mpaa=movie_command.mpaa,
+                    duration=movie_command.duration,
+                    budget=movie_command.budget,
+                    revenue=movie_command.revenue,
+                    roles=movie_credits.roles,
+                    writers=movie_credits.writers,
+                    crew=movie_credits.crew,
+                    photos=movie_command.photos,
+                    current_timestamp=self._current_timestamp,
+                )
+            except DomainError as error:
+                results.append(BatchItemResult(error=error))
+                continue
+
+            await self._add_movie_contribution_gateway.save(contribution)
+            results.append(BatchItemResult(result=contribution.id))
+
+        return results
+
+    def _movie_credits(self, movie_command: AddMovieCommand) -> _MovieCredits:
+        return _MovieCredits(
+            roles=self._create_movie_roles(movie_command.roles),
+            writers=self._create_movie_writers(movie_command.writers),
+            crew=self._create_movie_crew(movie_command.crew),
+        )
+
+
+class AddMoviesCallbackProcessor:
+    def __init__(
+        self,
+        *,
+        processor: AuthorizationProcessor,
+        create_movie_roles: CreateMovieRoles,
+        create_movie_writers: CreateMovieWriters,
+        create_movie_crew: CreateMovieCrew,
+        identity_provider: IdentityProvider,
+        on_movie_added: OnEventOccurred[MovieAddedEvent],
+        current_timestamp: datetime,
+    ):
+        self._processor = processor
+        self._create_movie_roles = create_movie_roles
+        self._create_movie_writers = create_movie_writers
+        self._create_movie_crew = create_movie_crew
+        self._identity_provider = identity_provider
+        self._on_movie_added = on_movie_added
+        self._current_timestamp = current_timestamp
+
+    async def process(
+        self,
+        command: AddMoviesCommand,
+    ) -> list[BatchItemResult[AddMovieContributionId]]:
+        results = await self._processor.process(command)
+        current_user_id = await self._identity_provider.user_id()
+
+        for movie_command, result in zip(command.movies, results):
+            if result.result is None:
+                continue
+
+            event = MovieAddedEvent(
+                contribution_id=result.result,
+                author_id=current_user_id,
+                eng_title=movie_command.eng_title,
+                original_title=movie_command.original_title,
+                summary=movie_command.summary,
+                description=movie_command.description,
+                release_date=movie_command.release_date,
+                countries=movie_command.countries,
+                genres=movie_command.genres,
+                mpaa=movie_command.mpaa,
+                duration=movie_command.duration,
+                budget=movie_command.budget,
+                revenue=movie_command.revenue,
+                roles=self._create_movie_roles(movie_command.roles),
+                writers=self._create_movie_writers(movie_command.writers),
+                crew=self._create_movie_crew(movie_command.crew),
+                photos=movie_command.photos,
+                added_at=self._current_timestamp,
+            )
+            await self._on_movie_added(event)
+
+        return results
+
+
+class AddMoviesLoggingProcessor:
+    def __init__(
+        self,
+        *,
+        processor: TransactionProcessor,
+        operation_id: OperationId,
+        identity_provider: IdentityProvider,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+        self._identity_provider = identity_provider
+
+    async def process(
+        self,
+        command: AddMoviesCommand,
+    ) -> list[BatchItemResult[AddMovieContributionId]]:
+        current_user_id = await self._identity_provider.user_id()
+
+        logger.debug(
+            "'Add Movies' command processing started",
+            extra={
+                "operation_id": self._operation_id,
+                "user_id": current_user_id,
+                "movies": len(command.movies),
+            },
+        )
+
+        try:
+            results = await self._processor.process(command)
+        except ContributionBatchIsTooLargeError as error:
+            logger.info(
+                "Expected error occurred: Batch of movies is too large",
+                extra={
+                    "operation_id": self._operation_id,
+                    "movies": len(command.movies),
+                    "max_size": error.max_size,
+                },
+            )
+            raise error
+        except NotEnoughPermissionsError as error:
+            logger.info(
+                "Expected error occurred: User has not enough permissions",
+                extra={
+                    "operation_id": self._operation_id,
+                    "current_user_permissions": (
+                        await self._identity_provider.permissions()
+                    ),
+                },
+            )
+            raise error
+        except UserDoesNotExistError as error:
+            logger.error(
+                "Unexpected error occurred: "
+                "User is authenticated, but user gateway returns None",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except UserIsNotActiveError as error:
+            logger.info(
+                "Expected error occurred: User is not active",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'Add Movies' command processing completed",
+            extra={
+                "operation_id": self._operation_id,
+                "contribution_ids": [
+                    result.result for result in results if result.result
+                ],
+                "rejected_movies": {
+                    index: repr(result.error)
+                    for index, result in enumerate(results)
+                    if result.error
+                },
+            },
+        )
+
+        return results
@@ -20,6 +20,7 @@ from contribution.application.common import (
     UserGateway,
     PermissionsGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     IdentityProvider,
     OnEventOccurred,
     PersonAddedEvent,
@@ -38,6 +39,7 @@ def add_person_factory(
     user_gateway: UserGateway,
     permissions_gateway: PermissionsGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     identity_provider: IdentityProvider,
     on_person_added: OnEventOccurred[PersonAddedEvent],
 ) -> CommandProcessor[AddPersonCommand, AddPersonContributionId]:
@@ -65,6 +67,7 @@ def add_person_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = AddPersonLoggingProcessor(
         processor=tx_processor,
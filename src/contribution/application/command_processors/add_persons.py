@@ -0,0 +1,275 @@
+import logging
+from datetime import datetime, timezone
+
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    AddPersonContributionId,
+    DomainError,
+    UserIsNotActiveError,
+    AddPerson,
+)
+from contribution.application.common import (
+    OperationId,
+    AccessConcern,
+    CommandProcessor,
+    AuthorizationProcessor,
+    TransactionProcessor,
+    BatchItemResult,
+    UserDoesNotExistError,
+    NotEnoughPermissionsError,
+    ContributionBatchIsTooLargeError,
+    AddPersonContributionGateway,
+    UserGateway,
+    PermissionsGateway,
+    UnitOfWork,
+    TransactionRetryPolicy,
+    IdentityProvider,
+    OnEventOccurred,
+    PersonAddedEvent,
+    ensure_contribution_batch_size,
+)
+from contribution.application.commands import AddPersonsCommand
+
+
+logger = logging.getLogger(__name__)
+
+
+def add_persons_factory(
+    operation_id: OperationId,
+    add_person: AddPerson,
+    access_concern: AccessConcern,
+    add_person_contribution_gateway: AddPersonContributionGateway,
+    user_gateway: UserGateway,
+    permissions_gateway: PermissionsGateway,
+    unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
+    identity_provider: IdentityProvider,
+    on_person_added: OnEventOccurred[PersonAddedEvent],
+) -> CommandProcessor[
+    AddPersonsCommand,
+    list[BatchItemResult[AddPersonContributionId]],
+]:
+    current_timestamp = datetime.now(timezone.utc)
+
+    add_persons_processor = AddPersonsProcessor(
+        add_person=add_person,
+        add_person_contribution_gateway=add_person_contribution_gateway,
+        user_gateway=user_gateway,
+        identity_provider=identity_provider,
+        current_timestamp=current_timestamp,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=add_persons_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    callback_processor = AddPersonsCallbackProcessor(
+        processor=authz_processor,
+        identity_provider=identity_provider,
+        on_person_added=on_person_added,
+        current_timestamp=current_timestamp,
+    )
+    tx_processor = TransactionProcessor(
+        processor=callback_processor,
+        unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
+    )
+    log_processor = AddPersonsLoggingProcessor(
+        processor=tx_processor,
+        operation_id=operation_id,
+        identity_provider=identity_provider,
+    )
+
+    return log_processor
+
+
+class AddPersonsProcessor:
+    """
+    Adds batch of persons on behalf of one author. Does the
+    same checks as `AddPersonProcessor`, but loads author
+    once. Person rejected by check is returned with error,
+    other persons are saved.
+    """
+
+    def __init__(
+        self,
+        *,
+        add_person: AddPerson,
+        add_person_contribution_gateway: AddPersonContributionGateway,
+        user_gateway: UserGateway,
+        identity_provider: IdentityProvider,
+        current_timestamp: datetime,
+    ):
+        self._add_person = add_person
+        self._add_person_contribution_gateway = add_person_contribution_gateway
+        self._user_gateway = user_gateway
+        self._identity_provider = identity_provider
+        self._current_timestamp = current_timestamp
+
+    async def process(
+        self,
+        command: AddPersonsCommand,
+    ) -> list[BatchItemResult[AddPersonContributionId]]:
+        ensure_contribution_batch_size(len(command.persons))
+
+        current_user_id = await self._identity_provider.user_id()
+
+        author = await self._user_gateway.by_id(current_user_id)
+        if not author:
+            raise UserDoesNotExistError()
+        if not author.is_active:
+            raise UserIsNotActiveError()
+
+        results: list[BatchItemResult[AddPersonContributionId]] = []
+        for person_command in command.persons:
+            try:
+                contribution = self._add_person(
+                    id=AddPersonContributionId(uuid7()),
+                    author=author,
+                    first_name=person_command.first_name,
+                    last_name=person_command.last_name,
+                    sex=person_command.sex,
+                    birth_date=person_command.birth_date,
+                    death_date=person_command.death_date,
+                    photos=person_command.photos,
+                    current_timestamp=self._current_timestamp,
+                )
+            except DomainError as error:
+                results.append(BatchItemResult(error=error))
+                continue
+
+            await self._add_person_contribution_gateway.save(contribution)
+            results.append(BatchItemResult(result=contribution.id))
+
+        return results
+
+
+class AddPersonsCallbackProcessor:
+    def __init__(
+        self,
+        *,
+        processor: AuthorizationProcessor,
+        identity_provider: IdentityProvider,
+        on_person_added: OnEventOccurred[PersonAddedEvent],
+        current_timestamp: datetime,
+    ):
+        self._processor = processor
+        self._identity_provider = identity_provider
+        self._on_person_added = on_person_added
+        self._current_timestamp = current_timestamp
+
+    async def process(
+        self,
+        command: AddPersonsCommand,
+    ) -> list[BatchItemResult[AddPersonContributionId]]:
+        results = await self._processor.process(command)
+        current_user_id = await self._identity_provider.user_id()
+
+        for person_command, result in zip(command.persons, results):
+            if result.result is None:
+                continue
+
+            event = PersonAddedEvent(
+                contribtion_id=result.result,
+                author_id=current_user_id,
+                first_name=person_command.first_name,
+                last_name=person_command.last_name,
+                sex=person_command.sex,
+                birth_date=person_command.birth_date,
+                death_date=person_command.death_date,
+                photos=person_command.photos,
+                added_at=self._current_timestamp,
+            )
+            await self._on_person_added(event)
+
+        return results
+
+
+class AddPersonsLoggingProcessor:
+    def __init__(
+        self,
+        *,
+        processor: TransactionProcessor,
+        operation_id: OperationId,
+        identity_provider: IdentityProvider,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+        self._identity_provider = identity_provider
+
+    async def process(
+        self,
+        command: AddPersonsCommand,
+    ) -> list[BatchItemResult[AddPersonContributionId]]:
+        current_user_id = await self._identity_provider.user_id()
+
+        logger.debug(
+            "'Add Persons' command processing started",
+            extra={
+                "operation_id": self._operation_id,
+                "user_id": current_user_id,
+                "persons": len(command.persons),
+            },
+        )
+
+        try:
+            results = await self._processor.process(command)
+        except ContributionBatchIsTooLargeError as error:
+            logger.info(
+                "Expected error occurred: Batch of persons is too large",
+                extra={
+                    "operation_id": self._operation_id,
+                    "persons": len(command.persons),
+                    "max_size": error.max_size,
+                },
+            )
+            raise error
+        except NotEnoughPermissionsError as error:
+            logger.info(
+                "Expected error occurred: User has not enough permissions",
+                extra={
+                    "operation_id": self._operation_id,
+                    "current_user_permissions": (
+                        await self._identity_provider.permissions()
+                    ),
+                },
+            )
+            raise error
+        except UserDoesNotExistError as error:
+            logger.error(
+                "Unexpected error occurred: "
+                "User is authenticated, but user gateway returns None",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except UserIsNotActiveError as error:
+            logger.info(
+                "Expected error occurred: User is not active",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'Add Persons' command processing completed",
+            extra={
+                "operation_id": self._operation_id,
+                "contribution_ids": [
+                    result.result for result in results if result.result
+                ],
+                "rejected_persons": {
+                    index: repr(result.error)
+                    for index, result in enumerate(results)
+                    if result.error
+                },
+            },
+        )
+
+        return results
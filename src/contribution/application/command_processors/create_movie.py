@@ -23,6 +23,7 @@ from contribution.application.common import (
     MovieGateway,
     PersonGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import CreateMovieCommand
 
@@ -39,6 +40,7 @@ def create_movie_factory(
     movie_gateway: MovieGateway,
     person_gateway: PersonGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[CreateMovieCommand, None]:
     create_movie_processor = CreateMovieProcessor(
         create_movie=create_movie,
@@ -51,6 +53,7 @@ def create_movie_factory(
     tx_processor = TransactionProcessor(
         processor=create_movie_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = CreateMovieLoggingProcessor(
         processor=tx_processor,
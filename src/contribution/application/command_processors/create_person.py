@@ -13,6 +13,7 @@ from contribution.application.common import (
     PersonIdIsAlreadyTakenError,
     PersonGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import CreatePersonCommand
 
@@ -25,6 +26,7 @@ def create_person_factory(
     create_person: CreatePerson,
     person_gateway: PersonGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[CreatePersonCommand, None]:
     create_person_processor = CreatePersonProcessor(
         create_person=create_person,
@@ -33,6 +35,7 @@ def create_person_factory(
     tx_processor = TransactionProcessor(
         processor=create_person_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = CreatePersonLoggingProcessor(
         processor=tx_processor,
@@ -16,6 +16,7 @@ from contribution.application.common import (
     UserTelegramIsAlreadyTakenError,
     UserGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import CreateUserCommand
 
@@ -28,6 +29,7 @@ def create_user_factory(
     create_user: CreateUser,
     user_gateway: UserGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[CreateUserCommand, None]:
     create_user_processor = CreateUserProcessor(
         create_user=create_user,
@@ -36,6 +38,7 @@ def create_user_factory(
     tx_processor = TransactionProcessor(
         processor=create_user_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = CreateUserLoggingProcessor(
         processor=tx_processor,
@@ -37,6 +37,7 @@ from contribution.application.common import (
     CrewMemberGateway,
     PermissionsGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     IdentityProvider,
     OnEventOccurred,
     MovieEditedEvent,
@@ -64,6 +65,7 @@ def edit_movie_factory(
     crew_member_gateway: CrewMemberGateway,
     permissions_gateway: PermissionsGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     identity_provider: IdentityProvider,
     on_movie_edited: OnEventOccurred[MovieEditedEvent],
 ) -> CommandProcessor[EditMovieCommand, EditMovieContributionId]:
@@ -106,6 +108,7 @@ def edit_movie_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = EditMovieLoggingProcessor(
         processor=tx_processor,
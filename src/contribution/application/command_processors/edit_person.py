@@ -21,6 +21,7 @@ from contribution.application.common import (
     PersonGateway,
     PermissionsGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     IdentityProvider,
     OnEventOccurred,
     PersonEditedEvent,
@@ -40,6 +41,7 @@ def edit_person_factory(
     person_gateway: PersonGateway,
     permissions_gateway: PermissionsGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     identity_provider: IdentityProvider,
     on_person_edited: OnEventOccurred[PersonEditedEvent],
 ) -> CommandProcessor[EditPersonCommand, EditPersonContributionId]:
@@ -68,6 +70,7 @@ def edit_person_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = EditPersonLoggingProcessor(
         processor=tx_processor,
@@ -0,0 +1,300 @@
+import logging
+from collections import Counter
+from typing import Iterable, Sequence
+from uuid import UUID
+
+from contribution.domain import (
+    DomainError,
+    Person,
+    PersonId,
+    Role,
+    Writer,
+    CrewMember,
+    CreateMovie,
+    CreateRole,
+    CreateWriter,
+    CreateCrewMember,
+)
+from contribution.application.common import (
+    OperationId,
+    CommandProcessor,
+    TransactionProcessor,
+    ApplicationError,
+    MovieIdIsAlreadyTakenError,
+    PersonsDoNotExistError,
+    RolesAlreadyExistError,
+    WritersAlreadyExistError,
+    CrewMembersAlreadyExistError,
+    MovieGateway,
+    PersonGateway,
+    RoleGateway,
+    WriterGateway,
+    CrewMemberGateway,
+    UnitOfWork,
+    TransactionRetryPolicy,
+)
+from contribution.application.commands import (
+    CreateMovieCommand,
+    ImportMoviesCommand,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def import_movies_factory(
+    operation_id: OperationId,
+    create_movie: CreateMovie,
+    create_role: CreateRole,
+    create_writer: CreateWriter,
+    create_crew_member: CreateCrewMember,
+    movie_gateway: MovieGateway,
+    person_gateway: PersonGateway,
+    role_gateway: RoleGateway,
+    writer_gateway: WriterGateway,
+    crew_member_gateway: CrewMemberGateway,
+    unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
+) -> CommandProcessor[ImportMoviesCommand, None]:
+    import_movies_processor = ImportMoviesProcessor(
+        create_movie=create_movie,
+        create_role=create_role,
+        create_writer=create_writer,
+        create_crew_member=create_crew_member,
+        movie_gateway=movie_gateway,
+        person_gateway=person_gateway,
+        role_gateway=role_gateway,
+        writer_gateway=writer_gateway,
+        crew_member_gateway=crew_member_gateway,
+    )
+    tx_processor = TransactionProcessor(
+        processor=import_movies_processor,
+        unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
+    )
+    log_processor = ImportMoviesLoggingProcessor(
+        processor=tx_processor,
+        operation_id=operation_id,
+    )
+
+    return log_processor
+
+
+class ImportMoviesProcessor:
+    """
+    Creates batch of movies together with their roles,
+    writers and crew members in one transaction. Does the
+    same checks as `CreateMovieProcessor`, but ids of
+    movies and credits and persons of credits are checked
+    with one query per collection per batch instead of
+    several queries per movie.
+    """
+
+    def __init__(
+        self,
+        *,
+        create_movie: CreateMovie,
+        create_role: CreateRole,
+        create_writer: CreateWriter,
+        create_crew_member: CreateCrewMember,
+        movie_gateway: MovieGateway,
+        person_gateway: PersonGateway,
+        role_gateway: RoleGateway,
+        writer_gateway: WriterGateway,
+        crew_member_gateway: CrewMemberGateway,
+    ):
+        self._create_movie = create_movie
+        self._create_role = create_role
+        self._create_writer = create_writer
+        self._create_crew_member = create_crew_member
+        self._movie_gateway = movie_gateway
+        self._person_gateway = person_gateway
+        self._role_gateway = role_gateway
+        self._writer_gateway = writer_gateway
+        self._crew_member_gateway = crew_member_gateway
+
+    async def process(self, command: ImportMoviesCommand) -> None:
+        movies = await self._movies_to_import(command)
+        await self._ensure_credit_ids_are_not_taken(movies)
+        persons = await self._list_credit_persons(movies)
+
+        roles: list[Role] = []
+        writers: list[Writer] = []
+        crew: list[CrewMember] = []
+        for movie_command in movies:
+            new_movie = self._create_movie(
+                id=movie_command.id,
+                eng_title=movie_command.eng_title,
+                original_title=movie_command.original_title,
+                summary=movie_command.summary,
+                description=movie_command.description,
+                release_date=movie_command.release_date,
+                countries=movie_command.countries,
+                genres=movie_command.genres,
+                mpaa=movie_command.mpaa,
+                duration=movie_command.duration,
+                budget=movie_command.budget,
+                revenue=movie_command.revenue,
+            )
+            await self._movie_gateway.save(new_movie)
+
+            for movie_role in movie_command.roles:
+                role = self._create_role(
+                    id=movie_role.id,
+                    movie=new_movie,
+                    person=persons[movie_role.person_id],
+                    character=movie_role.character,
+                    importance=movie_role.importance,
+                    is_spoiler=movie_role.is_spoiler,
+                )
+                roles.append(role)
+            for movie_writer in movie_command.writers:
+                writer = self._create_writer(
+                    id=movie_writer.id,
+                    movie=new_movie,
+                    person=persons[movie_writer.person_id],
+                    writing=movie_writer.writing,
+                )
+                writers.append(writer)
+            for movie_crew_member in movie_command.crew:
+                crew_member = self._create_crew_member(
+                    id=movie_crew_member.id,
+                    movie=new_movie,
+                    person=persons[movie_crew_member.person_id],
+                    membership=movie_crew_member.membership,
+                )
+                crew.append(crew_member)
+
+        await self._role_gateway.save_many(roles)
+        await self._writer_gateway.save_many(writers)
+        await self._crew_member_gateway.save_many(crew)
+
+    async def _movies_to_import(
+        self,
+        command: ImportMoviesCommand,
+    ) -> list[CreateMovieCommand]:
+        movie_ids = [movie.id for movie in command.movies]
+        if _duplicates(movie_ids):
+            raise MovieIdIsAlreadyTakenError()
+        movies_with_same_ids = await self._movie_gateway.list_by_ids(
+            movie_ids,
+        )
+        if movies_with_same_ids and not command.skip_existing:
+            raise MovieIdIsAlreadyTakenError()
+
+        # Credits of existing movie were committed together
+        # with it, so they are skipped too
+        existing_movie_ids = {movie.id for movie in movies_with_same_ids}
+        return [
+            movie
+            for movie in command.movies
+            if movie.id not in existing_movie_ids
+        ]
+
+    async def _ensure_credit_ids_are_not_taken(
+        self,
+        movies: Sequence[CreateMovieCommand],
+    ) -> None:
+        role_ids = [role.id for movie in movies for role in movie.roles]
+        duplicate_role_ids = _duplicates(role_ids)
+        if duplicate_role_ids:
+            raise RolesAlreadyExistError(duplicate_role_ids)
+        existing_roles = await self._role_gateway.list_by_ids(role_ids)
+        if existing_roles:
+            raise RolesAlreadyExistError([role.id for role in existing_roles])
+
+        writer_ids = [
+            writer.id for movie in movies for writer in movie.writers
+        ]
+        duplicate_writer_ids = _duplicates(writer_ids)
+        if duplicate_writer_ids:
+            raise WritersAlreadyExistError(duplicate_writer_ids)
+        existing_writers = await self._writer_gateway.list_by_ids(writer_ids)
+        if existing_writers:
+            raise WritersAlreadyExistError(
+                [writer.id for writer in existing_writers],
+            )
+
+        crew_member_ids = [
+            crew_member.id for movie in movies for crew_member in movie.crew
+        ]
+        duplicate_crew_member_ids = _duplicates(crew_member_ids)
+        if duplicate_crew_member_ids:
+            raise CrewMembersAlreadyExistError(duplicate_crew_member_ids)
+        existing_crew = await self._crew_member_gateway.list_by_ids(
+            crew_member_ids,
+        )
+        if existing_crew:
+            raise CrewMembersAlreadyExistError(
+                [crew_member.id for crew_member in existing_crew],
+            )
+
+    async def _list_credit_persons(
+        self,
+        movies: Sequence[CreateMovieCommand],
+    ) -> dict[PersonId, Person]:
+        person_ids: set[PersonId] = set()
+        for movie in movies:
+            person_ids.update(role.person_id for role in movie.roles)
+            person_ids.update(writer.person_id for writer in movie.writers)
+            person_ids.update(
+                crew_member.person_id for crew_member in movie.crew
+            )
+        persons = await self._person_gateway.list_by_ids(person_ids)
+
+        non_existing_person_ids = person_ids.difference(
+            person.id for person in persons
+        )
+        if non_existing_person_ids:
+            raise PersonsDoNotExistError(non_existing_person_ids)
+
+        return {person.id: person for person in persons}
+
+
+class ImportMoviesLoggingProcessor:
+    def __init__(
+        self,
+        *,
+        processor: TransactionProcessor,
+        operation_id: OperationId,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+
+    async def process(self, command: ImportMoviesCommand) -> None:
+        logger.debug(
+            "'Import Movies' command processing started",
+            extra={
+                "operation_id": self._operation_id,
+                "movies": len(command.movies),
+            },
+        )
+
+        try:
+            result = await self._processor.process(command)
+        except (DomainError, ApplicationError) as error:
+            logger.info(
+                "Expected error occurred: Batch of movies is rejected",
+                extra={
+                    "operation_id": self._operation_id,
+                    "error": repr(error),
+                },
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'Import Movies' command processing completed",
+            extra={"operation_id": self._operation_id},
+        )
+
+        return result
+
+
+def _duplicates[I: UUID](ids: Iterable[I]) -> list[I]:
+    return [id for id, count in Counter(ids).items() if count > 1]
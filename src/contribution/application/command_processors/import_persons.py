@@ -0,0 +1,128 @@
+import logging
+
+from contribution.domain import DomainError, CreatePerson
+from contribution.application.common import (
+    OperationId,
+    CommandProcessor,
+    TransactionProcessor,
+    ApplicationError,
+    PersonIdIsAlreadyTakenError,
+    PersonGateway,
+    UnitOfWork,
+    TransactionRetryPolicy,
+)
+from contribution.application.commands import ImportPersonsCommand
+
+
+logger = logging.getLogger(__name__)
+
+
+def import_persons_factory(
+    operation_id: OperationId,
+    create_person: CreatePerson,
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
+) -> CommandProcessor[ImportPersonsCommand, None]:
+    import_persons_processor = ImportPersonsProcessor(
+        create_person=create_person,
+        person_gateway=person_gateway,
+    )
+    tx_processor = TransactionProcessor(
+        processor=import_persons_processor,
+        unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
+    )
+    log_processor = ImportPersonsLoggingProcessor(
+        processor=tx_processor,
+        operation_id=operation_id,
+    )
+
+    return log_processor
+
+
+class ImportPersonsProcessor:
+    """
+    Creates batch of persons in one transaction. Does the
+    same checks as `CreatePersonProcessor`, but with one
+    query per batch instead of one per person.
+    """
+
+    def __init__(
+        self,
+        *,
+        create_person: CreatePerson,
+        person_gateway: PersonGateway,
+    ):
+        self._create_person = create_person
+        self._person_gateway = person_gateway
+
+    async def process(self, command: ImportPersonsCommand) -> None:
+        person_ids = [person.id for person in command.persons]
+        if len(set(person_ids)) != len(person_ids):
+            raise PersonIdIsAlreadyTakenError()
+
+        persons_with_same_ids = await self._person_gateway.list_by_ids(
+            person_ids,
+        )
+        if persons_with_same_ids and not command.skip_existing:
+            raise PersonIdIsAlreadyTakenError()
+        existing_person_ids = {person.id for person in persons_with_same_ids}
+
+        for person_command in command.persons:
+            if person_command.id in existing_person_ids:
+                continue
+            new_person = self._create_person(
+                id=person_command.id,
+                first_name=person_command.first_name,
+                last_name=person_command.last_name,
+                sex=person_command.sex,
+                birth_date=person_command.birth_date,
+                death_date=person_command.death_date,
+            )
+            await self._person_gateway.save(new_person)
+
+
+class ImportPersonsLoggingProcessor:
+    def __init__(
+        self,
+        *,
+        processor: TransactionProcessor,
+        operation_id: OperationId,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+
+    async def process(self, command: ImportPersonsCommand) -> None:
+        logger.debug(
+            "'Import Persons' command processing started",
+            extra={
+                "operation_id": self._operation_id,
+                "persons": len(command.persons),
+            },
+        )
+
+        try:
+            result = await self._processor.process(command)
+        except (DomainError, ApplicationError) as error:
+            logger.info(
+                "Expected error occurred: Batch of persons is rejected",
+                extra={
+                    "operation_id": self._operation_id,
+                    "error": repr(error),
+                },
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'Import Persons' command processing completed",
+            extra={"operation_id": self._operation_id},
+        )
+
+        return result
@@ -0,0 +1,149 @@
+import logging
+
+from contribution.domain import DomainError, CreateUser
+from contribution.application.common import (
+    OperationId,
+    CommandProcessor,
+    TransactionProcessor,
+    ApplicationError,
+    UserIdIsAlreadyTakenError,
+    UserNameIsAlreadyTakenError,
+    UserEmailIsAlreadyTakenError,
+    UserTelegramIsAlreadyTakenError,
+    UserGateway,
+    UnitOfWork,
+    TransactionRetryPolicy,
+)
+from contribution.application.commands import ImportUsersCommand
+
+
+logger = logging.getLogger(__name__)
+
+
+def import_users_factory(
+    operation_id: OperationId,
+    create_user: CreateUser,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
+) -> CommandProcessor[ImportUsersCommand, None]:
+    import_users_processor = ImportUsersProcessor(
+        create_user=create_user,
+        user_gateway=user_gateway,
+    )
+    tx_processor = TransactionProcessor(
+        processor=import_users_processor,
+        unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
+    )
+    log_processor = ImportUsersLoggingProcessor(
+        processor=tx_processor,
+        operation_id=operation_id,
+    )
+
+    return log_processor
+
+
+class ImportUsersProcessor:
+    """
+    Creates batch of users in one transaction. Does the
+    same checks as `CreateUserProcessor`, but with one
+    query per checked field per batch instead of one per
+    user.
+    """
+
+    def __init__(
+        self,
+        *,
+        create_user: CreateUser,
+        user_gateway: UserGateway,
+    ):
+        self._create_user = create_user
+        self._user_gateway = user_gateway
+
+    async def process(self, command: ImportUsersCommand) -> None:
+        user_ids = [user.id for user in command.users]
+        if len(set(user_ids)) != len(user_ids):
+            raise UserIdIsAlreadyTakenError()
+        users_with_same_ids = await self._user_gateway.list_by_ids(user_ids)
+        if users_with_same_ids and not command.skip_existing:
+            raise UserIdIsAlreadyTakenError()
+        existing_user_ids = {user.id for user in users_with_same_ids}
+        users = [
+            user for user in command.users if user.id not in existing_user_ids
+        ]
+
+        names = [user.name for user in users]
+        if len(set(names)) != len(names):
+            raise UserNameIsAlreadyTakenError()
+        if await self._user_gateway.list_by_names(names):
+            raise UserNameIsAlreadyTakenError()
+
+        emails = [user.email for user in users if user.email]
+        if len(set(emails)) != len(emails):
+            raise UserEmailIsAlreadyTakenError()
+        if emails and await self._user_gateway.list_by_emails(emails):
+            raise UserEmailIsAlreadyTakenError()
+
+        telegrams = [user.telegram for user in users if user.telegram]
+        if len(set(telegrams)) != len(telegrams):
+            raise UserTelegramIsAlreadyTakenError()
+        if telegrams and await self._user_gateway.list_by_telegrams(
+            telegrams,
+        ):
+            raise UserTelegramIsAlreadyTakenError()
+
+        for user_command in users:
+            new_user = self._create_user(
+                id=user_command.id,
+                name=user_command.name,
+                email=user_command.email,
+                telegram=user_command.telegram,
+                is_active=user_command.is_active,
+            )
+            await self._user_gateway.save(new_user)
+
+
+class ImportUsersLoggingProcessor:
+    def __init__(
+        self,
+        *,
+        processor: TransactionProcessor,
+        operation_id: OperationId,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+
+    async def process(self, command: ImportUsersCommand) -> None:
+        logger.debug(
+            "'Import Users' command processing started",
+            extra={
+                "operation_id": self._operation_id,
+                "users": len(command.users),
+            },
+        )
+
+        try:
+            result = await self._processor.process(command)
+        except (DomainError, ApplicationError) as error:
+            logger.info(
+                "Expected error occurred: Batch of users is rejected",
+                extra={
+                    "operation_id": self._operation_id,
+                    "error": repr(error),
+                },
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'Import Users' command processing completed",
+            extra={"operation_id": self._operation_id},
+        )
+
+        return result
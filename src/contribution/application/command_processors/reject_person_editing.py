@@ -19,6 +19,7 @@ from contribution.application.common import (
     UserGateway,
     AchievementGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
     OnEventOccurred,
     AchievementEarnedEvent,
 )
@@ -35,6 +36,7 @@ def reject_person_editing_factory(
     user_gateway: UserGateway,
     achievement_gateway: AchievementGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
     on_achievement_earned: OnEventOccurred[AchievementEarnedEvent],
 ) -> CommandProcessor[RejectPersonEditingCommand, Optional[AchievementId]]:
     reject_person_editing_processor = RejectPersonEditingProcessor(
@@ -51,6 +53,7 @@ def reject_person_editing_factory(
     tx_processor = TransactionProcessor(
         processor=callback_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = RejectPersonEditingLoggingProcessor(
         processor=tx_processor,
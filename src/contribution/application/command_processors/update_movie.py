@@ -29,6 +29,7 @@ from contribution.application.common import (
     MovieGateway,
     PersonGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import UpdateMovieCommand
 
@@ -48,6 +49,7 @@ def update_movie_factory(
     movie_gateway: MovieGateway,
     person_gateway: PersonGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[UpdateMovieCommand, None]:
     update_movie_processor = UpdateMovieProcessor(
         update_movie=update_movie,
@@ -63,6 +65,7 @@ def update_movie_factory(
     tx_processor = TransactionProcessor(
         processor=update_movie_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = UpdateMovieLoggingProcessor(
         processor=tx_processor,
@@ -13,6 +13,7 @@ from contribution.application.common import (
     PersonDoesNotExistError,
     PersonGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import UpdatePersonCommand
 
@@ -25,6 +26,7 @@ def update_person_factory(
     update_person: UpdatePerson,
     person_gateway: PersonGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[UpdatePersonCommand, None]:
     update_person_processor = UpdatePersonProcessor(
         update_person=update_person,
@@ -33,6 +35,7 @@ def update_person_factory(
     tx_processor = TransactionProcessor(
         processor=update_person_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = UpdatePersonLoggingProcessor(
         processor=tx_processor,
@@ -16,6 +16,7 @@ from contribution.application.common import (
     UserDoesNotExistError,
     UserGateway,
     UnitOfWork,
+    TransactionRetryPolicy,
 )
 from contribution.application.commands import UpdateUserCommand
 
@@ -28,6 +29,7 @@ def update_user_factory(
     update_user: UpdateUser,
     user_gateway: UserGateway,
     unit_of_work: UnitOfWork,
+    transaction_retry_policy: TransactionRetryPolicy,
 ) -> CommandProcessor[UpdateUserCommand, None]:
     update_user_processor = UpdateUserProcessor(
         update_user=update_user,
@@ -36,6 +38,7 @@ def update_user_factory(
     tx_processor = TransactionProcessor(
         processor=update_user_processor,
         unit_of_work=unit_of_work,
+        retry_policy=transaction_retry_policy,
     )
     log_processor = UpdateUserLoggingProcessor(
         processor=tx_processor,
@@ -5,9 +5,14 @@ __all__ = (
     "UpdateMovieCommand",
     "CreatePersonCommand",
     "UpdatePersonCommand",
+    "ImportUsersCommand",
+    "ImportMoviesCommand",
+    "ImportPersonsCommand",
     "AddMovieCommand",
+    "AddMoviesCommand",
     "EditMovieCommand",
     "AddPersonCommand",
+    "AddPersonsCommand",
     "EditPersonCommand",
     "AcceptMovieAddingCommand",
     "AcceptMovieEditingCommand",
@@ -25,9 +30,14 @@ from .create_movie import CreateMovieCommand
 from .update_movie import UpdateMovieCommand
 from .create_person import CreatePersonCommand
 from .update_person import UpdatePersonCommand
+from .import_users import ImportUsersCommand
+from .import_movies import ImportMoviesCommand
+from .import_persons import ImportPersonsCommand
 from .add_movie import AddMovieCommand
+from .add_movies import AddMoviesCommand
 from .edit_movie import EditMovieCommand
 from .add_person import AddPersonCommand
+from .add_persons import AddPersonsCommand
 from .edit_person import EditPersonCommand
 from .accept_movie_adding import AcceptMovieAddingCommand
 from .accept_movie_editing import AcceptMovieEditingCommand
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .add_movie import AddMovieCommand
+
+
+@dataclass(frozen=True, slots=True)
+class AddMoviesCommand:
+    movies: Sequence[AddMovieCommand]
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .add_person import AddPersonCommand
+
+
+@dataclass(frozen=True, slots=True)
+class AddPersonsCommand:
+    persons: Sequence[AddPersonCommand]
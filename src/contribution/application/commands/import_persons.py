@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .create_person import CreatePersonCommand
+
+
+@dataclass(frozen=True, slots=True)
+class ImportPersonsCommand:
+    persons: Sequence[CreatePersonCommand]
+    # Records whose ids are taken are skipped instead of
+    # rejecting the batch, so batch that was committed
+    # before can be imported again
+    skip_existing: bool = False
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .create_user import CreateUserCommand
+
+
+@dataclass(frozen=True, slots=True)
+class ImportUsersCommand:
+    users: Sequence[CreateUserCommand]
+    # Records whose ids are taken are skipped instead of
+    # rejecting the batch, so batch that was committed
+    # before can be imported again
+    skip_existing: bool = False
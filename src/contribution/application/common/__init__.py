@@ -2,10 +2,19 @@ from .command_processors import *
 from .events import *
 from .exceptions import *
 from .gateways import *
+from .read_models import *
 from .services import *
 from .value_objects import *
 
 from .event_callback import OnEventOccurred as OnEventOccurred
 from .identity_provider import IdentityProvider as IdentityProvider
 from .unit_of_work import UnitOfWork as UnitOfWork
+from .transaction_retry_policy import (
+    TransactionRetryPolicy as TransactionRetryPolicy,
+)
 from .make_cachable import make_func_cacheable as make_func_cacheable
+from .batch import (
+    MAX_CONTRIBUTION_BATCH_SIZE as MAX_CONTRIBUTION_BATCH_SIZE,
+    BatchItemResult as BatchItemResult,
+    ensure_contribution_batch_size as ensure_contribution_batch_size,
+)
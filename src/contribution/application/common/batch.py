@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Final, Optional
+
+from contribution.application.common.exceptions import (
+    ContributionBatchIsTooLargeError,
+)
+
+
+MAX_CONTRIBUTION_BATCH_SIZE: Final = 50
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItemResult[R]:
+    """
+    Result of one command of batch, either result of
+    command or error that rejected it. Rejected command
+    doesn't prevent other commands of batch from being
+    processed.
+    """
+
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+
+
+def ensure_contribution_batch_size(size: int) -> None:
+    if size > MAX_CONTRIBUTION_BATCH_SIZE:
+        raise ContributionBatchIsTooLargeError(MAX_CONTRIBUTION_BATCH_SIZE)
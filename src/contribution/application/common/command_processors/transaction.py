@@ -1,18 +1,72 @@
+import asyncio
+from typing import Optional
+
 from contribution.application.common.unit_of_work import UnitOfWork
+from contribution.application.common.transaction_retry_policy import (
+    TransactionRetryPolicy,
+)
 from .command import CommandProcessor
 
 
 class TransactionProcessor[C, R]:
+    """
+    Processes command and commits changes. If retry policy
+    is passed, operations failed with retryable errors are
+    rolled back and processed again, and commits with
+    unknown result are retried without processing command
+    again.
+
+    Whole chain of wrapped processors is run again on
+    retry, including callbacks of events, so they must
+    not have side effects outside of unit of work. Events
+    are registered as outbox messages, which are written
+    by commit and forgotten by rollback.
+    """
+
     def __init__(
         self,
         *,
         processor: CommandProcessor[C, R],
         unit_of_work: UnitOfWork,
+        retry_policy: Optional[TransactionRetryPolicy] = None,
     ):
         self._processor = processor
         self._unit_of_work = unit_of_work
+        self._retry_policy = retry_policy
 
     async def process(self, command: C) -> R:
-        result = await self._processor.process(command)
-        await self._unit_of_work.commit()
-        return result
+        attempt = 1
+        while True:
+            try:
+                result = await self._processor.process(command)
+                await self._commit()
+                return result
+            except Exception as error:
+                if not self._retry_policy:
+                    raise
+                delay = self._retry_policy.operation_retry_delay(
+                    error,
+                    attempt,
+                )
+                if delay is None:
+                    raise
+
+            await self._unit_of_work.rollback()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _commit(self) -> None:
+        attempt = 1
+        while True:
+            try:
+                await self._unit_of_work.commit()
+                return
+            except Exception as error:
+                if not self._retry_policy:
+                    raise
+                delay = self._retry_policy.commit_retry_delay(error, attempt)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
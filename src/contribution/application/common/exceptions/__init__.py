@@ -17,8 +17,11 @@ __all__ = (
     "CrewMembersAlreadyExistError",
     "CrewMembersDoNotExistError",
     "ContributionDoesNotExistError",
+    "InvalidContributionCursorError",
+    "ContributionBatchIsTooLargeError",
     "AchievementDoesNotExistError",
     "NotEnoughPermissionsError",
+    "ConcurrentModificationError",
 )
 
 from .base import ApplicationError
@@ -50,6 +53,11 @@ from .crew import (
     CrewMembersAlreadyExistError,
     CrewMembersDoNotExistError,
 )
-from .contribution import ContributionDoesNotExistError
+from .contribution import (
+    ContributionDoesNotExistError,
+    InvalidContributionCursorError,
+    ContributionBatchIsTooLargeError,
+)
 from .achievement import AchievementDoesNotExistError
 from .permissions import NotEnoughPermissionsError
+from .concurrency import ConcurrentModificationError
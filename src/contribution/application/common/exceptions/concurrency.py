@@ -0,0 +1,9 @@
+from .base import ApplicationError
+
+
+class ConcurrentModificationError(ApplicationError):
+    """
+    Raised when changes can't be committed because acquired
+    models were changed by another operation in the meantime.
+    Operation can be retried from the beginning.
+    """
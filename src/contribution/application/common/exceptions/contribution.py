@@ -3,3 +3,12 @@ from .base import ApplicationError
 
 class ContributionDoesNotExistError(ApplicationError):
     ...
+
+
+class InvalidContributionCursorError(ApplicationError):
+    ...
+
+
+class ContributionBatchIsTooLargeError(ApplicationError):
+    def __init__(self, max_size: int):
+        self.max_size = max_size
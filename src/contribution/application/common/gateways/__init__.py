@@ -11,6 +11,7 @@ __all__ = (
     "AddPersonContributionGateway",
     "EditPersonContributionGateway",
     "PermissionsGateway",
+    "ContributionSummaryGateway",
 )
 
 from .user import UserGateway
@@ -25,3 +26,4 @@ from .edit_movie_contribution import EditMovieContributionGateway
 from .add_person_contribution import AddPersonContributionGateway
 from .edit_person_contribution import EditPersonContributionGateway
 from .permissions import PermissionsGateway
+from .contribution_summary import ContributionSummaryGateway
@@ -0,0 +1,58 @@
+from typing import Protocol, Optional
+
+from contribution.domain import ContributionStatus, UserId
+from contribution.application.common.read_models import (
+    AddMovieContributionSummary,
+    EditMovieContributionSummary,
+    AddPersonContributionSummary,
+    EditPersonContributionSummary,
+    ContributionPage,
+)
+
+
+class ContributionSummaryGateway(Protocol):
+    """
+    Reads summaries of contributions page by page. Raises
+    `InvalidContributionCursorError` if cursor was not
+    returned by the same method.
+    """
+
+    async def list_add_movie_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[AddMovieContributionSummary]:
+        raise NotImplementedError
+
+    async def list_edit_movie_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[EditMovieContributionSummary]:
+        raise NotImplementedError
+
+    async def list_add_person_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[AddPersonContributionSummary]:
+        raise NotImplementedError
+
+    async def list_edit_person_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[EditPersonContributionSummary]:
+        raise NotImplementedError
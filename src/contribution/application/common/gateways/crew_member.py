@@ -2,6 +2,8 @@ from typing import Iterable, Protocol, Optional
 
 from contribution.domain import (
     CrewMemberId,
+    MovieId,
+    PersonId,
     CrewMember,
 )
 
@@ -16,6 +18,15 @@ class CrewMemberGateway(Protocol):
     ) -> list[CrewMember]:
         raise NotImplementedError
 
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[CrewMember]:
+        raise NotImplementedError
+
+    async def list_by_person_id(
+        self,
+        person_id: PersonId,
+    ) -> list[CrewMember]:
+        raise NotImplementedError
+
     async def save_many(self, crew_members: Iterable[CrewMember]) -> None:
         raise NotImplementedError
 
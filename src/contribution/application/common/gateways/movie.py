@@ -1,4 +1,4 @@
-from typing import Protocol, Optional
+from typing import Iterable, Protocol, Optional
 
 from contribution.domain import MovieId, Movie
 
@@ -10,6 +10,9 @@ class MovieGateway(Protocol):
     async def acquire_by_id(self, id: MovieId) -> Optional[Movie]:
         raise NotImplementedError
 
+    async def list_by_ids(self, ids: Iterable[MovieId]) -> list[Movie]:
+        raise NotImplementedError
+
     async def save(self, movie: Movie) -> None:
         raise NotImplementedError
 
@@ -4,3 +4,6 @@ from typing import Protocol
 class PermissionsGateway(Protocol):
     async def for_contribution(self) -> int:
         raise NotImplementedError
+
+    async def for_moderation(self) -> int:
+        raise NotImplementedError
@@ -1,6 +1,6 @@
 from typing import Iterable, Protocol, Optional
 
-from contribution.domain import RoleId, Role
+from contribution.domain import RoleId, MovieId, PersonId, Role
 
 
 class RoleGateway(Protocol):
@@ -13,6 +13,12 @@ class RoleGateway(Protocol):
     ) -> list[Role]:
         raise NotImplementedError
 
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[Role]:
+        raise NotImplementedError
+
+    async def list_by_person_id(self, person_id: PersonId) -> list[Role]:
+        raise NotImplementedError
+
     async def save_many(self, roles: Iterable[Role]) -> None:
         raise NotImplementedError
 
@@ -1,4 +1,4 @@
-from typing import Protocol, Optional
+from typing import Iterable, Protocol, Optional
 
 from contribution.domain import UserId, User
 
@@ -16,6 +16,21 @@ class UserGateway(Protocol):
     async def by_telegram(self, telegram: str) -> Optional[User]:
         raise NotImplementedError
 
+    async def list_by_ids(self, ids: Iterable[UserId]) -> list[User]:
+        raise NotImplementedError
+
+    async def list_by_names(self, names: Iterable[str]) -> list[User]:
+        raise NotImplementedError
+
+    async def list_by_emails(self, emails: Iterable[str]) -> list[User]:
+        raise NotImplementedError
+
+    async def list_by_telegrams(
+        self,
+        telegrams: Iterable[str],
+    ) -> list[User]:
+        raise NotImplementedError
+
     async def acquire_by_id(self, id: UserId) -> Optional[User]:
         raise NotImplementedError
 
@@ -1,6 +1,6 @@
 from typing import Iterable, Protocol, Optional
 
-from contribution.domain import WriterId, Writer
+from contribution.domain import WriterId, MovieId, PersonId, Writer
 
 
 class WriterGateway(Protocol):
@@ -13,6 +13,12 @@ class WriterGateway(Protocol):
     ) -> list[Writer]:
         raise NotImplementedError
 
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[Writer]:
+        raise NotImplementedError
+
+    async def list_by_person_id(self, person_id: PersonId) -> list[Writer]:
+        raise NotImplementedError
+
     async def save_many(self, writers: Iterable[Writer]) -> None:
         raise NotImplementedError
 
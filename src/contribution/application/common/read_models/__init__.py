@@ -0,0 +1,17 @@
+__all__ = (
+    "ContributionSummary",
+    "AddMovieContributionSummary",
+    "EditMovieContributionSummary",
+    "AddPersonContributionSummary",
+    "EditPersonContributionSummary",
+    "ContributionPage",
+)
+
+from .contribution_summaries import (
+    ContributionSummary,
+    AddMovieContributionSummary,
+    EditMovieContributionSummary,
+    AddPersonContributionSummary,
+    EditPersonContributionSummary,
+    ContributionPage,
+)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Sequence
+
+from contribution.domain import (
+    ContributionStatus,
+    AddMovieContributionId,
+    EditMovieContributionId,
+    AddPersonContributionId,
+    EditPersonContributionId,
+    UserId,
+    MovieId,
+    PersonId,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ContributionSummary:
+    status: ContributionStatus
+    created_at: datetime
+    status_updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class AddMovieContributionSummary(ContributionSummary):
+    id: AddMovieContributionId
+    author_id: UserId
+    eng_title: str
+    original_title: str
+
+
+@dataclass(frozen=True, slots=True)
+class EditMovieContributionSummary(ContributionSummary):
+    id: EditMovieContributionId
+    author_id: UserId
+    movie_id: MovieId
+
+
+@dataclass(frozen=True, slots=True)
+class AddPersonContributionSummary(ContributionSummary):
+    id: AddPersonContributionId
+    author_id: UserId
+    first_name: str
+    last_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class EditPersonContributionSummary(ContributionSummary):
+    id: EditPersonContributionId
+    author_id: UserId
+    person_id: PersonId
+
+
+@dataclass(frozen=True, slots=True)
+class ContributionPage[S: ContributionSummary]:
+    """
+    Page of contribution summaries ordered from newest to
+    oldest. `next_cursor` is opaque token of next page,
+    it is None if there are no more pages.
+    """
+
+    summaries: Sequence[S]
+    next_cursor: Optional[str]
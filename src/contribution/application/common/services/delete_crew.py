@@ -1,6 +1,6 @@
 from typing import Collection
 
-from contribution.domain import CrewMemberId
+from contribution.domain import CrewMemberId, CrewMember
 from contribution.application.common.exceptions import (
     CrewMembersDoNotExistError,
 )
@@ -15,21 +15,18 @@ class DeleteCrew:
         self,
         crew_member_ids: Collection[CrewMemberId],
     ) -> None:
-        await self._ensure_crew_members_exist(crew_member_ids)
-
         crew_members = await self._crew_member_gateway.list_by_ids(
             crew_member_ids,
         )
+        self._ensure_crew_members_exist(crew_member_ids, crew_members)
+
         await self._crew_member_gateway.delete_many(crew_members)
 
-    async def _ensure_crew_members_exist(
+    def _ensure_crew_members_exist(
         self,
         crew_member_ids: Collection[CrewMemberId],
+        crew_members: Collection[CrewMember],
     ) -> None:
-        crew_members = await self._crew_member_gateway.list_by_ids(
-            crew_member_ids,
-        )
-
         some_of_crew_members_are_missing = len(crew_member_ids) != len(
             crew_members,
         )
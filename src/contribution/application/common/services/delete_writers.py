@@ -1,6 +1,6 @@
 from typing import Collection
 
-from contribution.domain import WriterId
+from contribution.domain import WriterId, Writer
 from contribution.application.common.exceptions import WritersDoNotExistError
 from contribution.application.common.gateways import WriterGateway
 
@@ -10,17 +10,16 @@ class DeleteWriters:
         self._writer_gateway = writer_gateway
 
     async def __call__(self, writer_ids: Collection[WriterId]) -> None:
-        await self._ensure_writers_exist(writer_ids)
-
         writers = await self._writer_gateway.list_by_ids(writer_ids)
+        self._ensure_writers_exist(writer_ids, writers)
+
         await self._writer_gateway.delete_many(writers)
 
-    async def _ensure_writers_exist(
+    def _ensure_writers_exist(
         self,
         writer_ids: Collection[WriterId],
+        writers: Collection[Writer],
     ) -> None:
-        writers = await self._writer_gateway.list_by_ids(writer_ids)
-
         some_of_writers_are_missing = len(writer_ids) != len(writers)
         if some_of_writers_are_missing:
             ids_of_writers_from_gateway = [writer.id for writer in writers]
@@ -10,12 +10,14 @@ class EnsurePersonsExist:
         self._person_gateway = person_gateway
 
     async def __call__(self, person_ids: Collection[PersonId]) -> None:
-        persons = await self._person_gateway.list_by_ids(person_ids)
-        some_persons_are_missing = len(persons) != len(person_ids)
+        # Same person may be referenced by several credits
+        unique_person_ids = set(person_ids)
+        persons = await self._person_gateway.list_by_ids(unique_person_ids)
+        some_persons_are_missing = len(persons) != len(unique_person_ids)
 
         if some_persons_are_missing:
             ids_of_persons_from_gateway = [person.id for person in persons]
-            non_existing_person_ids = set(person_ids).difference(
+            non_existing_person_ids = unique_person_ids.difference(
                 ids_of_persons_from_gateway,
             )
             raise PersonsDoNotExistError(non_existing_person_ids)
@@ -0,0 +1,27 @@
+from typing import Optional, Protocol
+
+
+class TransactionRetryPolicy(Protocol):
+    def operation_retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Returns seconds to wait before running operation
+        again from the beginning after its attempt failed
+        with error, or None if error must be raised.
+        """
+        raise NotImplementedError
+
+    def commit_retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Returns seconds to wait before committing changes
+        again after commit attempt failed with error, or
+        None if error must be handled as operation error.
+        """
+        raise NotImplementedError
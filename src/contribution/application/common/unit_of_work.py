@@ -4,3 +4,10 @@ from typing import Protocol
 class UnitOfWork(Protocol):
     async def commit(self) -> None:
         raise NotImplementedError
+
+    async def rollback(self) -> None:
+        """
+        Discards loaded models and registered changes, so
+        operation can be run again from the beginning.
+        """
+        raise NotImplementedError
@@ -0,0 +1,3 @@
+__all__ = ("ListContributionsQuery",)
+
+from .list_contributions import ListContributionsQuery
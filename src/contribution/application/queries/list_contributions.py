@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from contribution.domain import ContributionStatus, UserId
+
+
+@dataclass(frozen=True, slots=True)
+class ListContributionsQuery:
+    # Contributions of current user are listed if neither
+    # `author_id` nor `all_authors` is passed. Listing
+    # contributions of other users requires moderation
+    # permissions
+    author_id: Optional[UserId] = None
+    all_authors: bool = False
+    status: Optional[ContributionStatus] = None
+    limit: int = 20
+    cursor: Optional[str] = None
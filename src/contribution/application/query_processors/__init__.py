@@ -0,0 +1,27 @@
+__all__ = (
+    "MAX_CONTRIBUTION_PAGE_SIZE",
+    "ListAddMovieContributionsProcessor",
+    "ListEditMovieContributionsProcessor",
+    "ListAddPersonContributionsProcessor",
+    "ListEditPersonContributionsProcessor",
+    "ContributionAuthorScopeProcessor",
+    "ListContributionsLoggingProcessor",
+    "list_add_movie_contributions_factory",
+    "list_edit_movie_contributions_factory",
+    "list_add_person_contributions_factory",
+    "list_edit_person_contributions_factory",
+)
+
+from .list_contributions import (
+    MAX_CONTRIBUTION_PAGE_SIZE,
+    ListAddMovieContributionsProcessor,
+    ListEditMovieContributionsProcessor,
+    ListAddPersonContributionsProcessor,
+    ListEditPersonContributionsProcessor,
+    ContributionAuthorScopeProcessor,
+    ListContributionsLoggingProcessor,
+    list_add_movie_contributions_factory,
+    list_edit_movie_contributions_factory,
+    list_add_person_contributions_factory,
+    list_edit_person_contributions_factory,
+)
@@ -0,0 +1,361 @@
+import logging
+from dataclasses import replace
+from typing import Final
+
+from contribution.application.common import (
+    OperationId,
+    AccessConcern,
+    CommandProcessor,
+    AuthorizationProcessor,
+    InvalidContributionCursorError,
+    NotEnoughPermissionsError,
+    PermissionsGateway,
+    IdentityProvider,
+    ContributionSummaryGateway,
+    ContributionSummary,
+    AddMovieContributionSummary,
+    EditMovieContributionSummary,
+    AddPersonContributionSummary,
+    EditPersonContributionSummary,
+    ContributionPage,
+)
+from contribution.application.queries import ListContributionsQuery
+
+
+logger = logging.getLogger(__name__)
+
+MAX_CONTRIBUTION_PAGE_SIZE: Final = 100
+
+
+def list_add_movie_contributions_factory(
+    operation_id: OperationId,
+    access_concern: AccessConcern,
+    contribution_summary_gateway: ContributionSummaryGateway,
+    permissions_gateway: PermissionsGateway,
+    identity_provider: IdentityProvider,
+) -> CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[AddMovieContributionSummary],
+]:
+    list_processor = ListAddMovieContributionsProcessor(
+        contribution_summary_gateway=contribution_summary_gateway,
+    )
+    author_scope_processor = ContributionAuthorScopeProcessor(
+        processor=list_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=author_scope_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    log_processor = ListContributionsLoggingProcessor(
+        processor=authz_processor,
+        operation_id=operation_id,
+        query_name="List Add Movie Contributions",
+    )
+
+    return log_processor
+
+
+def list_edit_movie_contributions_factory(
+    operation_id: OperationId,
+    access_concern: AccessConcern,
+    contribution_summary_gateway: ContributionSummaryGateway,
+    permissions_gateway: PermissionsGateway,
+    identity_provider: IdentityProvider,
+) -> CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[EditMovieContributionSummary],
+]:
+    list_processor = ListEditMovieContributionsProcessor(
+        contribution_summary_gateway=contribution_summary_gateway,
+    )
+    author_scope_processor = ContributionAuthorScopeProcessor(
+        processor=list_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=author_scope_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    log_processor = ListContributionsLoggingProcessor(
+        processor=authz_processor,
+        operation_id=operation_id,
+        query_name="List Edit Movie Contributions",
+    )
+
+    return log_processor
+
+
+def list_add_person_contributions_factory(
+    operation_id: OperationId,
+    access_concern: AccessConcern,
+    contribution_summary_gateway: ContributionSummaryGateway,
+    permissions_gateway: PermissionsGateway,
+    identity_provider: IdentityProvider,
+) -> CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[AddPersonContributionSummary],
+]:
+    list_processor = ListAddPersonContributionsProcessor(
+        contribution_summary_gateway=contribution_summary_gateway,
+    )
+    author_scope_processor = ContributionAuthorScopeProcessor(
+        processor=list_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=author_scope_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    log_processor = ListContributionsLoggingProcessor(
+        processor=authz_processor,
+        operation_id=operation_id,
+        query_name="List Add Person Contributions",
+    )
+
+    return log_processor
+
+
+def list_edit_person_contributions_factory(
+    operation_id: OperationId,
+    access_concern: AccessConcern,
+    contribution_summary_gateway: ContributionSummaryGateway,
+    permissions_gateway: PermissionsGateway,
+    identity_provider: IdentityProvider,
+) -> CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[EditPersonContributionSummary],
+]:
+    list_processor = ListEditPersonContributionsProcessor(
+        contribution_summary_gateway=contribution_summary_gateway,
+    )
+    author_scope_processor = ContributionAuthorScopeProcessor(
+        processor=list_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    authz_processor = AuthorizationProcessor(
+        processor=author_scope_processor,
+        access_concern=access_concern,
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+    log_processor = ListContributionsLoggingProcessor(
+        processor=authz_processor,
+        operation_id=operation_id,
+        query_name="List Edit Person Contributions",
+    )
+
+    return log_processor
+
+
+class ListAddMovieContributionsProcessor:
+    def __init__(
+        self,
+        *,
+        contribution_summary_gateway: ContributionSummaryGateway,
+    ):
+        self._contribution_summary_gateway = contribution_summary_gateway
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[AddMovieContributionSummary]:
+        gateway = self._contribution_summary_gateway
+        return await gateway.list_add_movie_contributions(
+            author_id=query.author_id,
+            status=query.status,
+            limit=_page_size(query),
+            cursor=query.cursor,
+        )
+
+
+class ListEditMovieContributionsProcessor:
+    def __init__(
+        self,
+        *,
+        contribution_summary_gateway: ContributionSummaryGateway,
+    ):
+        self._contribution_summary_gateway = contribution_summary_gateway
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[EditMovieContributionSummary]:
+        gateway = self._contribution_summary_gateway
+        return await gateway.list_edit_movie_contributions(
+            author_id=query.author_id,
+            status=query.status,
+            limit=_page_size(query),
+            cursor=query.cursor,
+        )
+
+
+class ListAddPersonContributionsProcessor:
+    def __init__(
+        self,
+        *,
+        contribution_summary_gateway: ContributionSummaryGateway,
+    ):
+        self._contribution_summary_gateway = contribution_summary_gateway
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[AddPersonContributionSummary]:
+        gateway = self._contribution_summary_gateway
+        return await gateway.list_add_person_contributions(
+            author_id=query.author_id,
+            status=query.status,
+            limit=_page_size(query),
+            cursor=query.cursor,
+        )
+
+
+class ListEditPersonContributionsProcessor:
+    def __init__(
+        self,
+        *,
+        contribution_summary_gateway: ContributionSummaryGateway,
+    ):
+        self._contribution_summary_gateway = contribution_summary_gateway
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[EditPersonContributionSummary]:
+        gateway = self._contribution_summary_gateway
+        return await gateway.list_edit_person_contributions(
+            author_id=query.author_id,
+            status=query.status,
+            limit=_page_size(query),
+            cursor=query.cursor,
+        )
+
+
+class ContributionAuthorScopeProcessor[S: ContributionSummary]:
+    """
+    Limits listed contributions to contributions of current
+    user unless current user has moderation permissions.
+    Query without `author_id` and `all_authors` lists
+    contributions of current user.
+    """
+
+    def __init__(
+        self,
+        *,
+        processor: CommandProcessor[
+            ListContributionsQuery,
+            ContributionPage[S],
+        ],
+        access_concern: AccessConcern,
+        permissions_gateway: PermissionsGateway,
+        identity_provider: IdentityProvider,
+    ):
+        self._processor = processor
+        self._access_concern = access_concern
+        self._permissions_gateway = permissions_gateway
+        self._identity_provider = identity_provider
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[S]:
+        current_user_id = await self._identity_provider.user_id()
+
+        if query.author_id is None and not query.all_authors:
+            query = replace(query, author_id=current_user_id)
+        elif query.author_id != current_user_id:
+            await self._ensure_current_user_is_moderator()
+
+        return await self._processor.process(query)
+
+    async def _ensure_current_user_is_moderator(self) -> None:
+        current_user_permissions = await self._identity_provider.permissions()
+        required_permissions = await self._permissions_gateway.for_moderation()
+
+        access = self._access_concern.authorize(
+            current_user_permissions,
+            required_permissions,
+        )
+        if not access:
+            raise NotEnoughPermissionsError()
+
+
+class ListContributionsLoggingProcessor[S: ContributionSummary]:
+    def __init__(
+        self,
+        *,
+        processor: CommandProcessor[
+            ListContributionsQuery,
+            ContributionPage[S],
+        ],
+        operation_id: OperationId,
+        query_name: str,
+    ):
+        self._processor = processor
+        self._operation_id = operation_id
+        self._query_name = query_name
+
+    async def process(
+        self,
+        query: ListContributionsQuery,
+    ) -> ContributionPage[S]:
+        logger.debug(
+            "'%s' query processing started",
+            self._query_name,
+            extra={
+                "operation_id": self._operation_id,
+                "query": query,
+            },
+        )
+
+        try:
+            result = await self._processor.process(query)
+        except NotEnoughPermissionsError as error:
+            logger.info(
+                "Expected error occurred: User has not enough permissions",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except InvalidContributionCursorError as error:
+            logger.info(
+                "Expected error occurred: Invalid contribution cursor",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+        except Exception as error:
+            logger.exception(
+                "Unexpected error occurred",
+                extra={"operation_id": self._operation_id},
+            )
+            raise error
+
+        logger.debug(
+            "'%s' query processing completed",
+            self._query_name,
+            extra={
+                "operation_id": self._operation_id,
+                "summaries": len(result.summaries),
+            },
+        )
+
+        return result
+
+
+def _page_size(query: ListContributionsQuery) -> int:
+    return max(1, min(query.limit, MAX_CONTRIBUTION_PAGE_SIZE))
@@ -1,12 +1,23 @@
+from typing import Any
+
 from redis.asyncio import Redis
 
+from contribution.infrastructure.operation_id.round_trips import (
+    count_redis_call,
+)
 from .config import RedisConfig
 
 
 def redis_factory(
     redis_config: RedisConfig,
 ) -> Redis:
-    return Redis.from_url(
+    return _RoundTripCountingRedis.from_url(
         url=redis_config.url,
         decode_responses=True,
     )
+
+
+class _RoundTripCountingRedis(Redis):
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        count_redis_call()
+        return await super().execute_command(*args, **options)
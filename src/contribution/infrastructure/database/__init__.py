@@ -4,6 +4,8 @@ from .identity_maps import *
 from .data_mappers import *
 
 from .config import (
+    MongoDBClientProfile as MongoDBClientProfile,
+    MongoDBClientOptions as MongoDBClientOptions,
     MongoDBConfig as MongoDBConfig,
     mongodb_config_from_env as mongodb_config_from_env,
 )
@@ -11,6 +13,62 @@ from .motor_ import (
     motor_client_factory as motor_client_factory,
     motor_session_factory as motor_session_factory,
     motor_database_factory as motor_database_factory,
+    uuid_codec_factory as uuid_codec_factory,
+    model_versions_factory as model_versions_factory,
+    credits_layout_factory as credits_layout_factory,
+)
+from .pool_metrics import (
+    CHECKOUT_WAIT_BUCKETS_MS as CHECKOUT_WAIT_BUCKETS_MS,
+    MongoDBPoolStats as MongoDBPoolStats,
+    MongoDBPoolMetrics as MongoDBPoolMetrics,
+)
+from .warm_up import warm_up_motor_client as warm_up_motor_client
+from .indexes import ensure_indexes as ensure_indexes
+from .uuid_migration import (
+    CollectionSize as CollectionSize,
+    UUIDMigrationResult as UUIDMigrationResult,
+    collection_sizes as collection_sizes,
+    migrate_uuids as migrate_uuids,
+)
+from .export import (
+    ExportCompression as ExportCompression,
+    ExportResult as ExportResult,
+    SnapshotIsNotSupportedError as SnapshotIsNotSupportedError,
+    exported_collection_names as exported_collection_names,
+    snapshot_cluster_time as snapshot_cluster_time,
+    export_collection as export_collection,
+)
+from .moderation_queue import (
+    ModerationQueueProjector as ModerationQueueProjector,
+)
+from .session import MongoDBSession as MongoDBSession
+from .uuid_codec import (
+    UUIDRepresentation as UUIDRepresentation,
+    UUIDCodec as UUIDCodec,
+)
+from .model_versions import (
+    ConcurrencyMode as ConcurrencyMode,
+    ModelVersions as ModelVersions,
+)
+from .credits_layout import CreditsLayout as CreditsLayout
+from .transaction_retry import (
+    TransactionRetryMetrics as TransactionRetryMetrics,
+    MongoDBTransactionRetryPolicy as MongoDBTransactionRetryPolicy,
+    transaction_retry_policy_factory as transaction_retry_policy_factory,
 )
 from .lock_factory import MongoDBLockFactory as MongoDBLockFactory
-from .unit_of_work import MongoDBUnitOfWork as MongoDBUnitOfWork
+from .batch_loader import BatchLoader as BatchLoader
+from .processed_operations import (
+    PROCESSED_OPERATION_TTL as PROCESSED_OPERATION_TTL,
+    ProcessedOperations as ProcessedOperations,
+)
+from .outbox import (
+    SENT_OUTBOX_MESSAGE_TTL as SENT_OUTBOX_MESSAGE_TTL,
+    OutboxMessage as OutboxMessage,
+    Outbox as Outbox,
+)
+from .edited_entities import EditedEntities as EditedEntities
+from .unit_of_work import (
+    DeferredCommitsAreRolledBackError as DeferredCommitsAreRolledBackError,
+    MongoDBUnitOfWork as MongoDBUnitOfWork,
+)
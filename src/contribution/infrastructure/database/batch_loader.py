@@ -0,0 +1,149 @@
+# mypy: disable-error-code="type-var, arg-type, attr-defined"
+
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Final,
+    Iterable,
+    Mapping,
+    Optional,
+)
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from .credits_layout import embedded_credits_pipeline
+from .identity_maps import IdentityMap
+from .session import MongoDBSession
+from .unit_of_work import MongoDBUnitOfWork
+from .uuid_codec import UUIDCodec
+
+
+DEFAULT_CHUNK_SIZE: Final = 500
+
+
+class BatchLoader[K: UUID, M]:
+    """
+    Loads models by ids for `list_by_ids` methods of data
+    mappers. Models that already exist in identity map are
+    taken from it, only missing ones are queried using one
+    `$in` query per chunk of ids. Documents are read from
+    cursor in batches of chunk size, so large result sets
+    are never fetched at once. Also loads models by other
+    filters for `list_by_*` methods. If embedded field is passed,
+    models are loaded from documents embedded in that array
+    field of collection documents. Projection, if passed, is
+    applied to documents of collection.
+
+    Example of usage::
+
+        class RoleMapper:
+            def __init__(...):
+                ...
+                self._batch_loader = BatchLoader(
+                    identity_map=role_map,
+                    collection=role_collection,
+                    unit_of_work=unit_of_work,
+                    session=session,
+                    uuid_codec=uuid_codec,
+                    document_to_model=self._document_to_role,
+                )
+
+            async def list_by_ids(self, ids):
+                return await self._batch_loader.load(ids)
+    """
+
+    def __init__(
+        self,
+        *,
+        identity_map: IdentityMap[K, M],
+        collection: AsyncIOMotorCollection,
+        unit_of_work: MongoDBUnitOfWork,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        document_to_model: Callable[[Mapping[str, Any]], M],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        embedded_field: Optional[str] = None,
+        projection: Optional[Mapping[str, Any]] = None,
+    ):
+        self._identity_map = identity_map
+        self._collection = collection
+        self._unit_of_work = unit_of_work
+        self._session = session
+        self._uuid_codec = uuid_codec
+        self._document_to_model = document_to_model
+        self._chunk_size = chunk_size
+        self._embedded_field = embedded_field
+        self._projection = projection
+
+    async def load(self, ids: Iterable[K]) -> list[M]:
+        """
+        Returns models with ids in order of ids, skipping
+        ids of models that don't exist.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        models: dict[K, M] = {}
+        missing_ids = []
+        for id in unique_ids:
+            model_from_map = self._identity_map.by_id(id)
+            if model_from_map:
+                models[id] = model_from_map
+            else:
+                missing_ids.append(id)
+
+        for chunk_start in range(0, len(missing_ids), self._chunk_size):
+            chunk = missing_ids[chunk_start : chunk_start + self._chunk_size]
+            await self._load_missing(chunk, models)
+
+        return [models[id] for id in unique_ids if id in models]
+
+    async def load_matching(self, filter: Mapping[str, Any]) -> list[M]:
+        """
+        Returns models of all documents matching filter.
+        Models that already exist in identity map are taken
+        from it instead of documents.
+        """
+        models = []
+        async for document in await self._cursor(filter):
+            model = self._document_to_model(document)
+            model_from_map = self._identity_map.by_id(model.id)
+            if model_from_map:
+                models.append(model_from_map)
+                continue
+
+            self._identity_map.save(model)
+            self._unit_of_work.register_clean(model)
+            models.append(model)
+
+        return models
+
+    async def _load_missing(
+        self,
+        missing_ids: list[K],
+        models: dict[K, M],
+    ) -> None:
+        filter = {"id": self._uuid_codec.query_many(missing_ids)}
+        async for document in await self._cursor(filter):
+            model = self._document_to_model(document)
+            self._identity_map.save(model)
+            self._unit_of_work.register_clean(model)
+            models[model.id] = model
+
+    async def _cursor(
+        self,
+        filter: Mapping[str, Any],
+    ) -> AsyncIterable[Mapping[str, Any]]:
+        if self._embedded_field:
+            return self._collection.aggregate(
+                embedded_credits_pipeline(self._embedded_field, filter),
+                session=await self._session.get(),
+                batchSize=self._chunk_size,
+            )
+        return self._collection.find(
+            filter,
+            projection=self._projection,
+            session=await self._session.get(),
+            batch_size=self._chunk_size,
+        )
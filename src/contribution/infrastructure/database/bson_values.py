@@ -0,0 +1,81 @@
+"""
+Conversions of dates and money into native BSON values
+and back. Dates are stored as BSON dates at midnight UTC,
+money amounts as Decimal128, which allows range queries
+and indexes on them.
+
+Readers also accept ISO format strings and string amounts,
+which were stored before, so old documents are still read.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Final, Mapping, Union, cast
+
+from bson import Decimal128
+
+from contribution.domain import Currency, Money
+
+
+_DECIMAL128_SPECIAL_FORM_MASK: Final = 0b11 << 61
+_DECIMAL128_COEFFICIENT_HIGH_MASK: Final = (1 << 49) - 1
+_DECIMAL128_EXPONENT_MASK: Final = (1 << 14) - 1
+
+
+def date_to_bson(value: date) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+def date_from_bson(value: Union[datetime, str]) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value.date()
+
+
+def datetime_from_bson(value: Union[datetime, str]) -> datetime:
+    """
+    Returns timezone aware datetime. BSON dates are
+    decoded as naive datetimes in UTC.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def money_to_bson(money: Money) -> dict[str, Any]:
+    return {
+        "amount": Decimal128(money.amount),
+        "currency": money.currency,
+    }
+
+
+def money_from_bson(money_as_dict: Mapping[str, Any]) -> Money:
+    amount = money_as_dict["amount"]
+    if isinstance(amount, Decimal128):
+        amount = decimal128_to_decimal(amount)
+    else:
+        amount = Decimal(amount)
+
+    return Money(
+        amount=amount,
+        currency=cast(Currency, money_as_dict["currency"]),
+    )
+
+
+def decimal128_to_decimal(value: Decimal128) -> Decimal:
+    """
+    Faster equivalent of `Decimal128.to_decimal` for
+    finite values, which builds Decimal digit by digit.
+    """
+    high = int.from_bytes(value.bid[8:], "little")
+    if high & _DECIMAL128_SPECIAL_FORM_MASK == _DECIMAL128_SPECIAL_FORM_MASK:
+        return value.to_decimal()
+
+    low = int.from_bytes(value.bid[:8], "little")
+    coefficient = ((high & _DECIMAL128_COEFFICIENT_HIGH_MASK) << 64) | low
+    exponent = ((high >> 49) & _DECIMAL128_EXPONENT_MASK) - 6176
+    sign = "-" if high >> 63 else ""
+
+    return Decimal(f"{sign}{coefficient}E{exponent}")
@@ -1,9 +1,17 @@
-from typing import Any, Sequence
+# mypy: disable-error-code="arg-type"
+
+from typing import Any, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import Achievement
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     AchievementCollection,
 )
@@ -13,70 +21,86 @@ class CommitAchievementCollectionChanges:
     def __init__(
         self,
         collection: AchievementCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
 
     async def __call__(
         self,
         *,
         new: Sequence[Achievement],
-        clean: Sequence[Achievement],
-        dirty: Sequence[Achievement],
+        dirty: Sequence[tuple[Achievement, Set[str]]],
         deleted: Sequence[Achievement],
-    ) -> None:
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[Achievement],
+        dirty: Sequence[tuple[Achievement, Set[str]]],
+        deleted: Sequence[Achievement],
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._achievement_to_document(achievement))
+            InsertOne(
+                self._achievement_to_document(achievement),
+                namespace=self._collection.full_name,
+            )
             for achievement in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_achievement.id.hex},
+                {"id": self._uuid_codec.query(achievement.id)},
                 self._pipeline_to_update_achievement(
-                    clean_achievement,
-                    dirty_achievement,
+                    achievement,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_achievement, dirty_achievement in zip(clean, dirty)
+            for achievement, dirty_fields in dirty
         ]
         deletes = [
-            DeleteOne({"id": achievement.id.hex}) for achievement in deleted
+            DeleteOne(
+                {"id": self._uuid_codec.query(achievement.id)},
+                namespace=self._collection.full_name,
+            )
+            for achievement in deleted
         ]
 
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
-            )
+        return [*inserts, *updates, *deletes]
 
     def _achievement_to_document(
         self,
         achievement: Achievement,
     ) -> dict[str, Any]:
         document = {
-            "id": achievement.id.hex,
-            "user_id": achievement.user_id.hex,
+            "id": self._uuid_codec.encode(achievement.id),
+            "user_id": self._uuid_codec.encode(achievement.user_id),
             "achieved": achievement.achieved,
-            "achieved_at": achievement.achieved_at.isoformat(),
+            "achieved_at": achievement.achieved_at,
         }
         return document
 
     def _pipeline_to_update_achievement(
         self,
-        clean: Achievement,
         dirty: Achievement,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.achieved != dirty.achieved:
+        if "achieved" in dirty_fields:
             pipeline["$set"]["achieved"] = dirty.achieved
-        if clean.achieved_at != dirty.achieved_at:
-            pipeline["$set"]["achieved_at"] = dirty.achieved_at.isoformat()
+        if "achieved_at" in dirty_fields:
+            pipeline["$set"]["achieved_at"] = dirty.achieved_at
 
         return pipeline
@@ -1,9 +1,9 @@
-# mypy: disable-error-code="assignment"
+# mypy: disable-error-code="assignment, arg-type"
 
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import (
     MovieRole,
@@ -11,6 +11,19 @@ from contribution.domain import (
     MovieCrewMember,
     AddMovieContribution,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+    money_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     AddMovieContributionCollection,
 )
@@ -20,61 +33,92 @@ class CommitAddMovieContributionCollectionChanges:
     def __init__(
         self,
         collection: AddMovieContributionCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[AddMovieContribution],
-        clean: Sequence[AddMovieContribution],
-        dirty: Sequence[AddMovieContribution],
+        dirty: Sequence[tuple[AddMovieContribution, Set[str]]],
+        deleted: Sequence[AddMovieContribution],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[AddMovieContribution],
+        dirty: Sequence[tuple[AddMovieContribution, Set[str]]],
         deleted: Sequence[AddMovieContribution],
-    ) -> None:
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._contribution_to_document(contribution))
+            InsertOne(
+                self._contribution_to_document(contribution),
+                namespace=self._collection.full_name,
+            )
             for contribution in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_contribution.id.hex},
+                self._filter(contribution),
                 self._pipeline_to_update_contribution(
-                    clean_contribution,
-                    dirty_contribution,
+                    contribution,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_contribution, dirty_contribution in zip(clean, dirty)
+            for contribution, dirty_fields in dirty
         ]
         deletes = [
-            DeleteOne({"id": contribution.id.hex}) for contribution in deleted
+            DeleteOne(
+                self._filter(contribution),
+                namespace=self._collection.full_name,
+            )
+            for contribution in deleted
         ]
 
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
-            )
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, contribution: AddMovieContribution) -> dict[str, Any]:
+        """
+        Returns filter that matches document of contribution
+        only if it wasn't changed since contribution was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(contribution.id),
+            **self._model_versions.filter(contribution),
+        }
 
     def _contribution_to_document(
         self,
         contribution: AddMovieContribution,
     ) -> dict[str, Any]:
         document = {
-            "id": contribution.id.hex,
+            "id": self._uuid_codec.encode(contribution.id),
+            "version": 0,
             "status": contribution.status,
-            "author_id": contribution.author_id.hex,
+            "created_at": contribution.created_at,
+            "author_id": self._uuid_codec.encode(contribution.author_id),
             "eng_title": contribution.eng_title,
             "original_title": contribution.original_title,
             "summary": contribution.summary,
             "description": contribution.description,
-            "release_date": contribution.release_date.isoformat(),
+            "release_date": date_to_bson(contribution.release_date),
             "countries": list(contribution.countries),
             "genres": list(contribution.genres),
             "mpaa": contribution.mpaa,
@@ -83,23 +127,15 @@ class CommitAddMovieContributionCollectionChanges:
         }
 
         if contribution.status_updated_at:
-            document[
-                "status_updated_at"
-            ] = contribution.status_updated_at.isoformat()
+            document["status_updated_at"] = contribution.status_updated_at
         else:
             document["status_updated_at"] = None
         if contribution.budget:
-            document["budget"] = {
-                "amount": str(contribution.budget.amount),
-                "currency": contribution.budget.currency,
-            }
+            document["budget"] = money_to_bson(contribution.budget)
         else:
             document["budget"] = None
         if contribution.revenue:
-            document["revenue"] = {
-                "amount": str(contribution.revenue.amount),
-                "currency": contribution.revenue.currency,
-            }
+            document["revenue"] = money_to_bson(contribution.revenue)
         else:
             document["revenue"] = None
 
@@ -117,65 +153,59 @@ class CommitAddMovieContributionCollectionChanges:
 
     def _pipeline_to_update_contribution(
         self,
-        clean: AddMovieContribution,
         dirty: AddMovieContribution,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.status != dirty.status:
+        if "status" in dirty_fields:
             pipeline["$set"]["status"] = dirty.status
-        if clean.status_updated_at != dirty.status_updated_at:
+        if "status_updated_at" in dirty_fields:
             if dirty.status_updated_at:
-                pipeline["$set"][
-                    "status_updated_at"
-                ] = dirty.status_updated_at.isoformat()
+                pipeline["$set"]["status_updated_at"] = dirty.status_updated_at
             else:
                 pipeline["$set"]["status_updated_at"] = None
-        if clean.eng_title != dirty.eng_title:
+        if "eng_title" in dirty_fields:
             pipeline["$set"]["eng_title"] = dirty.eng_title
-        if clean.original_title != dirty.original_title:
+        if "original_title" in dirty_fields:
             pipeline["$set"]["original_title"] = dirty.original_title
-        if clean.summary != dirty.summary:
+        if "summary" in dirty_fields:
             pipeline["$set"]["summary"] = dirty.summary
-        if clean.description != dirty.description:
+        if "description" in dirty_fields:
             pipeline["$set"]["description"] = dirty.description
-        if clean.release_date != dirty.release_date:
-            pipeline["$set"]["release_date"] = dirty.release_date.isoformat()
-        if clean.countries != dirty.countries:
+        if "release_date" in dirty_fields:
+            pipeline["$set"]["release_date"] = date_to_bson(dirty.release_date)
+        if "countries" in dirty_fields:
             pipeline["$set"]["countries"] = list(dirty.countries)
-        if clean.genres != dirty.genres:
+        if "genres" in dirty_fields:
             pipeline["$set"]["genres"] = list(dirty.genres)
-        if clean.mpaa != dirty.mpaa:
+        if "mpaa" in dirty_fields:
             pipeline["$set"]["mpaa"] = dirty.mpaa
-        if clean.duration != dirty.duration:
+        if "duration" in dirty_fields:
             pipeline["$set"]["duration"] = dirty.duration
-        if clean.budget != dirty.budget:
+        if "budget" in dirty_fields:
             if dirty.budget:
-                pipeline["$set"]["budget"] = {
-                    "amount": str(dirty.budget.amount),
-                    "currency": dirty.budget.currency,
-                }
+                pipeline["$set"]["budget"] = money_to_bson(dirty.budget)
             else:
                 pipeline["$set"]["budget"] = None
-        if clean.revenue != dirty.revenue:
+        if "revenue" in dirty_fields:
             if dirty.revenue:
-                pipeline["$set"]["revenue"] = {
-                    "amount": str(dirty.revenue.amount),
-                    "currency": dirty.revenue.currency,
-                }
+                pipeline["$set"]["revenue"] = money_to_bson(dirty.revenue)
             else:
                 pipeline["$set"]["revenue"] = None
-        if clean.roles != dirty.roles:
+        if "roles" in dirty_fields:
             pipeline["$set"]["roles"] = self._movie_roles_to_dicts(dirty.roles)
-        if clean.writers != dirty.writers:
+        if "writers" in dirty_fields:
             pipeline["$set"]["writers"] = self._movie_writers_to_dicts(
                 dirty.writers,
             )
-        if clean.crew != dirty.crew:
+        if "crew" in dirty_fields:
             pipeline["$set"]["crew"] = self._movie_crew_to_dicts(dirty.crew)
-        if clean.photos != dirty.photos:
+        if "photos" in dirty_fields:
             pipeline["$set"]["photos"] = list(dirty.photos)
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
 
     def _movie_roles_to_dicts(
@@ -185,8 +215,8 @@ class CommitAddMovieContributionCollectionChanges:
         movie_roles_as_dicts = []
         for movie_role in movie_roles:
             movie_role_as_dict = {
-                "id": movie_role.id.hex,
-                "person_id": movie_role.person_id.hex,
+                "id": self._uuid_codec.encode(movie_role.id),
+                "person_id": self._uuid_codec.encode(movie_role.person_id),
                 "character": movie_role.character,
                 "importance": movie_role.importance,
                 "is_spoiler": movie_role.is_spoiler,
@@ -202,8 +232,8 @@ class CommitAddMovieContributionCollectionChanges:
         movie_writers_as_dicts = []
         for movie_writer in movie_writers:
             movie_writer_as_dict = {
-                "id": movie_writer.id.hex,
-                "person_id": movie_writer.person_id.hex,
+                "id": self._uuid_codec.encode(movie_writer.id),
+                "person_id": self._uuid_codec.encode(movie_writer.person_id),
                 "writing": movie_writer.writing,
             }
             movie_writers_as_dicts.append(movie_writer_as_dict)
@@ -217,8 +247,10 @@ class CommitAddMovieContributionCollectionChanges:
         movie_crew_as_dicts = []
         for movie_crew_member in movie_crew:
             movie_crew_member_as_dict = {
-                "id": movie_crew_member.id.hex,
-                "person_id": movie_crew_member.person_id.hex,
+                "id": self._uuid_codec.encode(movie_crew_member.id),
+                "person_id": self._uuid_codec.encode(
+                    movie_crew_member.person_id,
+                ),
                 "membership": movie_crew_member.membership,
             }
             movie_crew_as_dicts.append(movie_crew_member_as_dict)
@@ -1,11 +1,23 @@
-# mypy: disable-error-code="assignment"
+# mypy: disable-error-code="assignment, arg-type"
 
-from typing import Any, Sequence
+from typing import Any, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import AddPersonContribution
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     AddPersonContributionCollection,
 )
@@ -15,71 +27,100 @@ class CommitAddPersonContributionCollectionChanges:
     def __init__(
         self,
         collection: AddPersonContributionCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[AddPersonContribution],
-        clean: Sequence[AddPersonContribution],
-        dirty: Sequence[AddPersonContribution],
+        dirty: Sequence[tuple[AddPersonContribution, Set[str]]],
         deleted: Sequence[AddPersonContribution],
-    ) -> None:
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[AddPersonContribution],
+        dirty: Sequence[tuple[AddPersonContribution, Set[str]]],
+        deleted: Sequence[AddPersonContribution],
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._contribution_to_document(contribution))
+            InsertOne(
+                self._contribution_to_document(contribution),
+                namespace=self._collection.full_name,
+            )
             for contribution in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_contribution.id.hex},
+                self._filter(contribution),
                 self._pipeline_to_update_contribution(
-                    clean_contribution,
-                    dirty_contribution,
+                    contribution,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_contribution, dirty_contribution in zip(clean, dirty)
+            for contribution, dirty_fields in dirty
         ]
         deletes = [
-            DeleteOne({"id": contribution.id.hex}) for contribution in deleted
+            DeleteOne(
+                self._filter(contribution),
+                namespace=self._collection.full_name,
+            )
+            for contribution in deleted
         ]
 
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
-            )
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, contribution: AddPersonContribution) -> dict[str, Any]:
+        """
+        Returns filter that matches document of contribution
+        only if it wasn't changed since contribution was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(contribution.id),
+            **self._model_versions.filter(contribution),
+        }
 
     def _contribution_to_document(
         self,
         contribution: AddPersonContribution,
     ) -> dict[str, Any]:
         document = {
-            "id": contribution.id.hex,
+            "id": self._uuid_codec.encode(contribution.id),
+            "version": 0,
             "status": contribution.status,
-            "author_id": contribution.author_id.hex,
+            "created_at": contribution.created_at,
+            "author_id": self._uuid_codec.encode(contribution.author_id),
             "first_name": contribution.first_name,
             "last_name": contribution.last_name,
             "sex": contribution.sex,
-            "birth_date": contribution.birth_date.isoformat(),
+            "birth_date": date_to_bson(contribution.birth_date),
             "photos": list(contribution.photos),
         }
 
         if contribution.status_updated_at:
-            document[
-                "status_updated_at"
-            ] = contribution.status_updated_at.isoformat()
+            document["status_updated_at"] = contribution.status_updated_at
         else:
             document["status_updated_at"] = None
         if contribution.death_date:
-            document["death_date"] = contribution.death_date.isoformat()
+            document["death_date"] = date_to_bson(contribution.death_date)
         else:
             document["death_date"] = None
 
@@ -87,34 +128,34 @@ class CommitAddPersonContributionCollectionChanges:
 
     def _pipeline_to_update_contribution(
         self,
-        clean: AddPersonContribution,
         dirty: AddPersonContribution,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.status != dirty.status:
+        if "status" in dirty_fields:
             pipeline["$set"]["status"] = dirty.status
-        if clean.status_updated_at != dirty.status_updated_at:
+        if "status_updated_at" in dirty_fields:
             if dirty.status_updated_at:
-                pipeline["$set"][
-                    "status_updated_at"
-                ] = dirty.status_updated_at.isoformat()
+                pipeline["$set"]["status_updated_at"] = dirty.status_updated_at
             else:
                 pipeline["$set"]["status_updated_at"] = None
-        if clean.first_name != dirty.first_name:
+        if "first_name" in dirty_fields:
             pipeline["$set"]["first_name"] = dirty.first_name
-        if clean.last_name != dirty.last_name:
+        if "last_name" in dirty_fields:
             pipeline["$set"]["last_name"] = dirty.last_name
-        if clean.sex != dirty.sex:
+        if "sex" in dirty_fields:
             pipeline["$set"]["sex"] = dirty.sex
-        if clean.birth_date != dirty.birth_date:
-            pipeline["$set"]["birth_date"] = dirty.birth_date.isoformat()
-        if clean.death_date != dirty.death_date:
+        if "birth_date" in dirty_fields:
+            pipeline["$set"]["birth_date"] = date_to_bson(dirty.birth_date)
+        if "death_date" in dirty_fields:
             if dirty.death_date:
-                pipeline["$set"]["death_date"] = dirty.death_date.isoformat()
+                pipeline["$set"]["death_date"] = date_to_bson(dirty.death_date)
             else:
                 pipeline["$set"]["death_date"] = None
-        if clean.photos != dirty.photos:
+        if "photos" in dirty_fields:
             pipeline["$set"]["photos"] = list(dirty.photos)
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
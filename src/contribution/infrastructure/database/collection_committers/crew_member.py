@@ -1,80 +1,151 @@
-from typing import Any, Sequence
+# mypy: disable-error-code="arg-type"
 
-from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from typing import Any, Sequence, Set, Union, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import CrewMember
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     CrewMemberCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+    embedded_credits_write_models,
+)
 
 
 class CommitCrewMemberCollectionChanges:
     def __init__(
         self,
         collection: CrewMemberCollection,
-        session: AsyncIOMotorClientSession,
+        movie_collection: MovieCollection,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._collection = collection
+        self._movie_collection = movie_collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+
+        # In embedded layout changes are written into
+        # movie documents
+        self._bulk_write_collection: AsyncIOMotorCollection
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._bulk_write_collection = movie_collection
+        else:
+            self._bulk_write_collection = collection
 
     async def __call__(
         self,
         *,
         new: Sequence[CrewMember],
-        clean: Sequence[CrewMember],
-        dirty: Sequence[CrewMember],
+        dirty: Sequence[tuple[CrewMember, Set[str]]],
         deleted: Sequence[CrewMember],
-    ) -> None:
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._bulk_write_collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[CrewMember],
+        dirty: Sequence[tuple[CrewMember, Set[str]]],
+        deleted: Sequence[CrewMember],
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne, DeleteMany]]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            return embedded_credits_write_models(
+                field="crew",
+                namespace=self._movie_collection.full_name,
+                uuid_codec=self._uuid_codec,
+                new=[
+                    (crew_member, self._crew_member_to_document(crew_member))
+                    for crew_member in new
+                ],
+                dirty=[
+                    (
+                        crew_member,
+                        self._pipeline_to_update_crew_member(
+                            crew_member,
+                            dirty_fields,
+                        ),
+                    )
+                    for crew_member, dirty_fields in dirty
+                ],
+                deleted=deleted,
+            )
+
         inserts = [
-            InsertOne(self._crew_member_to_document(crew_member))
+            InsertOne(
+                self._crew_member_to_document(crew_member),
+                namespace=self._collection.full_name,
+            )
             for crew_member in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_crew_member.id.hex},
+                {"id": self._uuid_codec.query(crew_member.id)},
                 self._pipeline_to_update_crew_member(
-                    clean_crew_member,
-                    dirty_crew_member,
+                    crew_member,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_crew_member, dirty_crew_member in zip(clean, dirty)
-        ]
-        deletes = [
-            DeleteOne({"id": crew_member.id.hex}) for crew_member in deleted
+            for crew_member, dirty_fields in dirty
         ]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
+        # Deleted crew members are removed by one indexed
+        # delete of all their ids
+        deletes = []
+        if deleted:
+            deletes.append(
+                DeleteMany(
+                    {
+                        "id": self._uuid_codec.query_many(
+                            crew_member.id for crew_member in deleted
+                        ),
+                    },
+                    namespace=self._collection.full_name,
+                ),
             )
 
+        return [*inserts, *updates, *deletes]
+
     def _crew_member_to_document(
         self,
         crew_member: CrewMember,
     ) -> dict[str, Any]:
         document = {
-            "id": crew_member.id.hex,
-            "movie_id": crew_member.movie_id.hex,
-            "person_id": crew_member.person_id.hex,
+            "id": self._uuid_codec.encode(crew_member.id),
+            "movie_id": self._uuid_codec.encode(crew_member.movie_id),
+            "person_id": self._uuid_codec.encode(crew_member.person_id),
             "membership": crew_member.membership,
         }
         return document
 
     def _pipeline_to_update_crew_member(
         self,
-        clean: CrewMember,
         dirty: CrewMember,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.membership != dirty.membership:
+        if "membership" in dirty_fields:
             pipeline["$set"]["membership"] = dirty.membership
 
         return pipeline
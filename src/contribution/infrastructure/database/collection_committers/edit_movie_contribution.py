@@ -1,9 +1,9 @@
-# mypy: disable-error-code="assignment"
+# mypy: disable-error-code="assignment, arg-type"
 
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import (
     MovieRole,
@@ -11,6 +11,19 @@ from contribution.domain import (
     MovieCrewMember,
     EditMovieContribution,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+    money_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     EditMovieContributionCollection,
 )
@@ -20,64 +33,93 @@ class CommitEditMovieContributionCollectionChanges:
     def __init__(
         self,
         collection: EditMovieContributionCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[EditMovieContribution],
-        clean: Sequence[EditMovieContribution],
-        dirty: Sequence[EditMovieContribution],
+        dirty: Sequence[tuple[EditMovieContribution, Set[str]]],
+        deleted: Sequence[EditMovieContribution],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[EditMovieContribution],
+        dirty: Sequence[tuple[EditMovieContribution, Set[str]]],
         deleted: Sequence[EditMovieContribution],
-    ) -> None:
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._contribution_to_document(contribution))
+            InsertOne(
+                self._contribution_to_document(contribution),
+                namespace=self._collection.full_name,
+            )
             for contribution in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_contribution.id.hex},
+                self._filter(contribution),
                 self._pipeline_to_update_contribution(
-                    clean_contribution,
-                    dirty_contribution,
+                    contribution,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_contribution, dirty_contribution in zip(clean, dirty)
+            for contribution, dirty_fields in dirty
         ]
         deletes = [
-            DeleteOne({"id": contribution.id.hex}) for contribution in deleted
+            DeleteOne(
+                self._filter(contribution),
+                namespace=self._collection.full_name,
+            )
+            for contribution in deleted
         ]
 
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
-            )
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, contribution: EditMovieContribution) -> dict[str, Any]:
+        """
+        Returns filter that matches document of contribution
+        only if it wasn't changed since contribution was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(contribution.id),
+            **self._model_versions.filter(contribution),
+        }
 
     def _contribution_to_document(
         self,
         contribution: EditMovieContribution,
     ) -> dict[str, Any]:
         document = {
-            "id": contribution.id.hex,
+            "id": self._uuid_codec.encode(contribution.id),
+            "version": 0,
             "status": contribution.status,
-            "author_id": contribution.author_id.hex,
-            "movie_id": contribution.movie_id.hex,
+            "created_at": contribution.created_at,
+            "author_id": self._uuid_codec.encode(contribution.author_id),
+            "movie_id": self._uuid_codec.encode(contribution.movie_id),
             "photos_to_add": list(contribution.photos_to_add),
         }
 
         if contribution.status_updated_at:
-            document[
-                "status_updated_at"
-            ] = contribution.status_updated_at.isoformat()
+            document["status_updated_at"] = contribution.status_updated_at
         else:
             document["status_updated_at"] = None
         if contribution.eng_title.is_set:
@@ -89,9 +131,9 @@ class CommitEditMovieContributionCollectionChanges:
         if contribution.description.is_set:
             document["description"] = contribution.description.value
         if contribution.release_date.is_set:
-            document[
-                "release_date"
-            ] = contribution.release_date.value.isoformat()
+            document["release_date"] = date_to_bson(
+                contribution.release_date.value,
+            )
         if contribution.countries.is_set:
             document["countries"] = list(contribution.countries.value)
         if contribution.genres.is_set:
@@ -103,39 +145,35 @@ class CommitEditMovieContributionCollectionChanges:
         if contribution.budget.is_set:
             budget = contribution.budget.value
             if budget:
-                document["budget"] = {
-                    "amount": str(budget.amount),
-                    "currency": budget.currency,
-                }
+                document["budget"] = money_to_bson(budget)
             else:
                 document["budget"] = None
         if contribution.revenue.is_set:
             revenue = contribution.revenue.value
             if revenue:
-                document["revenue"] = {
-                    "amount": str(revenue.amount),
-                    "currency": revenue.currency,
-                }
+                document["revenue"] = money_to_bson(revenue)
             else:
                 document["revenue"] = None
 
         document["roles_to_add"] = self._movie_roles_to_dicts(
             movie_roles=contribution.roles_to_add,
         )
-        document["roles_to_more"] = [
-            role_id.hex for role_id in contribution.roles_to_remove
+        document["roles_to_remove"] = [
+            self._uuid_codec.encode(role_id)
+            for role_id in contribution.roles_to_remove
         ]
         document["writers_to_add"] = self._movie_writers_to_dicts(
             movie_writers=contribution.writers_to_add,
         )
         document["writers_to_remove"] = [
-            writer_id.hex for writer_id in contribution.writers_to_remove
+            self._uuid_codec.encode(writer_id)
+            for writer_id in contribution.writers_to_remove
         ]
         document["crew_to_add"] = self._movie_crew_to_dicts(
             movie_crew=contribution.crew_to_add,
         )
         document["crew_to_remove"] = [
-            crew_member_id.hex
+            self._uuid_codec.encode(crew_member_id)
             for crew_member_id in contribution.crew_to_remove
         ]
 
@@ -143,120 +181,117 @@ class CommitEditMovieContributionCollectionChanges:
 
     def _pipeline_to_update_contribution(
         self,
-        clean: EditMovieContribution,
         dirty: EditMovieContribution,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}, "$unset": {}}
 
-        if clean.status != dirty.status:
+        if "status" in dirty_fields:
             pipeline["$set"]["status"] = dirty.status.value
-        if clean.status_updated_at != dirty.status_updated_at:
+        if "status_updated_at" in dirty_fields:
             if dirty.status_updated_at:
-                pipeline["$set"][
-                    "status_updated_at"
-                ] = dirty.status_updated_at.isoformat()
+                pipeline["$set"]["status_updated_at"] = dirty.status_updated_at
             else:
                 pipeline["$set"]["status_updated_at"] = None
-        if clean.eng_title != dirty.eng_title:
+        if "eng_title" in dirty_fields:
             if dirty.eng_title.is_set:
                 pipeline["$set"]["eng_title"] = dirty.eng_title.value
             else:
                 pipeline["$unset"]["eng_title"] = ""
-        if clean.original_title != dirty.original_title:
+        if "original_title" in dirty_fields:
             if dirty.original_title.is_set:
                 pipeline["$set"]["original_title"] = dirty.original_title.value
             else:
                 pipeline["$unset"]["original_title"] = ""
-        if clean.summary != dirty.summary:
+        if "summary" in dirty_fields:
             if dirty.summary.is_set:
                 pipeline["$set"]["summary"] = dirty.summary.value
             else:
                 pipeline["$unset"]["summary"] = ""
-        if clean.description != dirty.description:
+        if "description" in dirty_fields:
             if dirty.description.is_set:
                 pipeline["$set"]["description"] = dirty.description.value
             else:
                 pipeline["$unset"]["decription"] = ""
-        if clean.release_date != dirty.release_date:
+        if "release_date" in dirty_fields:
             if dirty.release_date.is_set:
-                pipeline["$set"][
-                    "release_date"
-                ] = dirty.release_date.value.isoformat()
+                pipeline["$set"]["release_date"] = date_to_bson(
+                    dirty.release_date.value,
+                )
             else:
                 pipeline["$unset"]["release_date"] = ""
-        if clean.countries != dirty.countries:
+        if "countries" in dirty_fields:
             if dirty.countries.is_set:
                 pipeline["$set"]["countries"] = list(dirty.countries.value)
             else:
                 pipeline["$unset"]["countries"] = ""
-        if clean.genres != dirty.genres:
+        if "genres" in dirty_fields:
             if dirty.genres.is_set:
                 pipeline["$set"]["genres"] = [
                     genre.value for genre in dirty.genres.value
                 ]
             else:
                 pipeline["$unset"]["genres"] = ""
-        if clean.mpaa != dirty.mpaa:
+        if "mpaa" in dirty_fields:
             if dirty.mpaa.is_set:
                 pipeline["$set"]["mpaa"] = dirty.mpaa.value.value
             else:
                 pipeline["$unset"]["mpaa"] = ""
-        if clean.duration != dirty.duration:
+        if "duration" in dirty_fields:
             if dirty.duration.is_set:
                 pipeline["$set"]["duration"] = dirty.duration.value
             else:
                 pipeline["$unset"]["duration"] = ""
-        if clean.budget != dirty.budget:
+        if "budget" in dirty_fields:
             if dirty.budget.is_set:
                 budget = dirty.budget.value
                 if budget:
-                    pipeline["$set"]["budget"] = {
-                        "amount": str(budget.amount),
-                        "currency": budget.currency,
-                    }
+                    pipeline["$set"]["budget"] = money_to_bson(budget)
                 else:
                     pipeline["$set"]["budget"] = None
             else:
                 pipeline["$unset"]["budget"] = ""
-        if clean.revenue != dirty.revenue:
+        if "revenue" in dirty_fields:
             if dirty.revenue.is_set:
                 revenue = dirty.revenue.value
                 if revenue:
-                    pipeline["$set"]["revenue"] = {
-                        "amount": str(revenue.amount),
-                        "currency": revenue.currency,
-                    }
+                    pipeline["$set"]["revenue"] = money_to_bson(revenue)
                 else:
                     pipeline["$set"]["revenue"] = None
             else:
                 pipeline["$unset"]["revenue"] = ""
-        if clean.roles_to_add != dirty.roles_to_add:
+        if "roles_to_add" in dirty_fields:
             pipeline["$set"]["roles_to_add"] = self._movie_roles_to_dicts(
                 dirty.roles_to_add,
             )
-        if clean.roles_to_remove != dirty.roles_to_remove:
+        if "roles_to_remove" in dirty_fields:
             pipeline["$set"]["roles_to_remove"] = [
-                role_id.hex for role_id in dirty.roles_to_remove
+                self._uuid_codec.encode(role_id)
+                for role_id in dirty.roles_to_remove
             ]
-        if clean.writers_to_add != dirty.writers_to_add:
+        if "writers_to_add" in dirty_fields:
             pipeline["$set"]["writers_to_add"] = self._movie_writers_to_dicts(
                 dirty.writers_to_add,
             )
-        if clean.writers_to_remove != dirty.writers_to_remove:
+        if "writers_to_remove" in dirty_fields:
             pipeline["$set"]["writers_to_remove"] = [
-                writer_id.hex for writer_id in dirty.writers_to_remove
+                self._uuid_codec.encode(writer_id)
+                for writer_id in dirty.writers_to_remove
             ]
-        if clean.crew_to_add != dirty.crew_to_add:
+        if "crew_to_add" in dirty_fields:
             pipeline["$set"]["crew_to_add"] = self._movie_crew_to_dicts(
                 dirty.crew_to_add,
             )
-        if clean.crew_to_remove != dirty.crew_to_remove:
+        if "crew_to_remove" in dirty_fields:
             pipeline["$set"]["crew_to_remove"] = [
-                writer_id.hex for writer_id in dirty.writers_to_remove
+                self._uuid_codec.encode(crew_member_id)
+                for crew_member_id in dirty.crew_to_remove
             ]
-        if clean.photos_to_add != dirty.photos_to_add:
+        if "photos_to_add" in dirty_fields:
             pipeline["$set"]["photos_to_add"] = list(dirty.photos_to_add)
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
 
     def _movie_roles_to_dicts(
@@ -266,8 +301,8 @@ class CommitEditMovieContributionCollectionChanges:
         movie_roles_as_dicts = []
         for movie_role in movie_roles:
             movie_role_as_dict = {
-                "id": movie_role.id.hex,
-                "person_id": movie_role.person_id.hex,
+                "id": self._uuid_codec.encode(movie_role.id),
+                "person_id": self._uuid_codec.encode(movie_role.person_id),
                 "character": movie_role.character,
                 "importance": movie_role.importance,
                 "is_spoiler": movie_role.is_spoiler,
@@ -283,8 +318,8 @@ class CommitEditMovieContributionCollectionChanges:
         movie_writers_as_dicts = []
         for movie_writer in movie_writers:
             movie_writer_as_dict = {
-                "id": movie_writer.id.hex,
-                "person_id": movie_writer.person_id.hex,
+                "id": self._uuid_codec.encode(movie_writer.id),
+                "person_id": self._uuid_codec.encode(movie_writer.person_id),
                 "writing": movie_writer.writing,
             }
             movie_writers_as_dicts.append(movie_writer_as_dict)
@@ -298,8 +333,10 @@ class CommitEditMovieContributionCollectionChanges:
         movie_crew_as_dicts = []
         for movie_crew_member in movie_crew:
             movie_crew_member_as_dict = {
-                "id": movie_crew_member.id.hex,
-                "person_id": movie_crew_member.person_id.hex,
+                "id": self._uuid_codec.encode(movie_crew_member.id),
+                "person_id": self._uuid_codec.encode(
+                    movie_crew_member.person_id,
+                ),
                 "membership": movie_crew_member.membership,
             }
             movie_crew_as_dicts.append(movie_crew_member_as_dict)
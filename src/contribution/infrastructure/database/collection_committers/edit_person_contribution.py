@@ -1,11 +1,23 @@
-# mypy: disable-error-code="assignment"
+# mypy: disable-error-code="assignment, arg-type"
 
-from typing import Any, Sequence
+from typing import Any, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import EditPersonContribution
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     EditPersonContributionCollection,
 )
@@ -15,64 +27,93 @@ class CommitEditPersonContributionCollectionChanges:
     def __init__(
         self,
         collection: EditPersonContributionCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[EditPersonContribution],
-        clean: Sequence[EditPersonContribution],
-        dirty: Sequence[EditPersonContribution],
+        dirty: Sequence[tuple[EditPersonContribution, Set[str]]],
+        deleted: Sequence[EditPersonContribution],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[EditPersonContribution],
+        dirty: Sequence[tuple[EditPersonContribution, Set[str]]],
         deleted: Sequence[EditPersonContribution],
-    ) -> None:
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._contribution_to_document(contribution))
+            InsertOne(
+                self._contribution_to_document(contribution),
+                namespace=self._collection.full_name,
+            )
             for contribution in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_contribution.id.hex},
+                self._filter(contribution),
                 self._pipeline_to_update_contribution(
-                    clean_contribution,
-                    dirty_contribution,
+                    contribution,
+                    dirty_fields,
                 ),
+                namespace=self._collection.full_name,
             )
-            for clean_contribution, dirty_contribution in zip(clean, dirty)
+            for contribution, dirty_fields in dirty
         ]
         deletes = [
-            DeleteOne({"id": contribution.id.hex}) for contribution in deleted
+            DeleteOne(
+                self._filter(contribution),
+                namespace=self._collection.full_name,
+            )
+            for contribution in deleted
         ]
 
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
-            )
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, contribution: EditPersonContribution) -> dict[str, Any]:
+        """
+        Returns filter that matches document of contribution
+        only if it wasn't changed since contribution was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(contribution.id),
+            **self._model_versions.filter(contribution),
+        }
 
     def _contribution_to_document(
         self,
         contribution: EditPersonContribution,
     ) -> dict[str, Any]:
         document = {
-            "id": contribution.id.hex,
+            "id": self._uuid_codec.encode(contribution.id),
+            "version": 0,
             "status": contribution.status,
-            "author_id": contribution.author_id.hex,
-            "person_id": contribution.person_id.hex,
+            "created_at": contribution.created_at,
+            "author_id": self._uuid_codec.encode(contribution.author_id),
+            "person_id": self._uuid_codec.encode(contribution.person_id),
             "photos_to_add": list(contribution.photos_to_add),
         }
 
         if contribution.status_updated_at:
-            document[
-                "status_updated_at"
-            ] = contribution.status_updated_at.isoformat()
+            document["status_updated_at"] = contribution.status_updated_at
         else:
             document["status_updated_at"] = None
         if contribution.first_name.is_set:
@@ -82,11 +123,13 @@ class CommitEditPersonContributionCollectionChanges:
         if contribution.sex.is_set:
             document["sex"] = contribution.sex.value
         if contribution.birth_date.is_set:
-            document["birth_date"] = contribution.birth_date.value.isoformat()
+            document["birth_date"] = date_to_bson(
+                contribution.birth_date.value,
+            )
         if contribution.death_date.is_set:
             death_date = contribution.death_date.value
             if death_date:
-                document["death_date"] = death_date.isoformat()
+                document["death_date"] = date_to_bson(death_date)
             else:
                 document["death_date"] = None
 
@@ -94,52 +137,52 @@ class CommitEditPersonContributionCollectionChanges:
 
     def _pipeline_to_update_contribution(
         self,
-        clean: EditPersonContribution,
         dirty: EditPersonContribution,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}, "$unset": {}}
 
-        if clean.status != dirty.status:
+        if "status" in dirty_fields:
             pipeline["$set"]["status"] = dirty.status
-        if clean.status_updated_at != dirty.status_updated_at:
+        if "status_updated_at" in dirty_fields:
             if dirty.status_updated_at:
-                pipeline["$set"][
-                    "status_updated_at"
-                ] = dirty.status_updated_at.isoformat()
+                pipeline["$set"]["status_updated_at"] = dirty.status_updated_at
             else:
                 pipeline["$set"]["status_updated_at"] = None
-        if clean.first_name != dirty.first_name:
+        if "first_name" in dirty_fields:
             if dirty.first_name.is_set:
                 pipeline["$set"]["first_name"] = dirty.first_name.value
             else:
                 pipeline["$unset"]["first_name"] = ""
-        if clean.last_name != dirty.last_name:
+        if "last_name" in dirty_fields:
             if dirty.last_name.is_set:
                 pipeline["$set"]["last_name"] = dirty.last_name.value
             else:
                 pipeline["$unset"]["last_name"] = ""
-        if clean.sex != dirty.sex:
+        if "sex" in dirty_fields:
             if dirty.sex.is_set:
                 pipeline["$set"]["sex"] = dirty.sex.value
             else:
                 pipeline["$unset"]["sex"] = ""
-        if clean.birth_date != dirty.birth_date:
+        if "birth_date" in dirty_fields:
             if dirty.birth_date.is_set:
-                pipeline["$set"][
-                    "birth_date"
-                ] = dirty.birth_date.value.isoformat()
+                pipeline["$set"]["birth_date"] = date_to_bson(
+                    dirty.birth_date.value,
+                )
             else:
                 pipeline["$unset"]["birth_date"] = ""
-        if clean.death_date != dirty.death_date:
+        if "death_date" in dirty_fields:
             if dirty.death_date.is_set:
                 death_date = dirty.death_date.value
                 if death_date:
-                    pipeline["$set"]["death_date"] = death_date.isoformat()
+                    pipeline["$set"]["death_date"] = date_to_bson(death_date)
                 else:
                     pipeline["$set"]["death_date"] = None
             else:
                 pipeline["$unset"]["death_date"] = ""
-        if clean.photos_to_add != dirty.photos_to_add:
+        if "photos_to_add" in dirty_fields:
             pipeline["$set"]["photos_to_add"] = list(dirty.photos_to_add)
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
@@ -1,9 +1,24 @@
-from typing import Any, Sequence
+# mypy: disable-error-code="arg-type"
+
+from typing import Any, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import Movie
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+    money_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     MovieCollection,
 )
@@ -13,48 +28,83 @@ class CommitMovieCollectionChanges:
     def __init__(
         self,
         collection: MovieCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[Movie],
-        clean: Sequence[Movie],
-        dirty: Sequence[Movie],
+        dirty: Sequence[tuple[Movie, Set[str]]],
+        deleted: Sequence[Movie],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[Movie],
+        dirty: Sequence[tuple[Movie, Set[str]]],
         deleted: Sequence[Movie],
-    ) -> None:
-        inserts = [InsertOne(self._movie_to_document(movie)) for movie in new]
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
+        inserts = [
+            InsertOne(
+                self._movie_to_document(movie),
+                namespace=self._collection.full_name,
+            )
+            for movie in new
+        ]
         updates = [
             UpdateOne(
-                {"id": clean_movie.id.hex},
-                self._pipeline_to_update_movie(clean_movie, dirty_movie),
+                self._filter(movie),
+                self._pipeline_to_update_movie(movie, dirty_fields),
+                namespace=self._collection.full_name,
             )
-            for clean_movie, dirty_movie in zip(clean, dirty)
-        ]
-        deletes = [DeleteOne({"id": movie.id.hex}) for movie in deleted]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
+            for movie, dirty_fields in dirty
         ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
+        deletes = [
+            DeleteOne(
+                self._filter(movie),
+                namespace=self._collection.full_name,
             )
+            for movie in deleted
+        ]
+
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, movie: Movie) -> dict[str, Any]:
+        """
+        Returns filter that matches document of movie
+        only if it wasn't changed since movie was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(movie.id),
+            **self._model_versions.filter(movie),
+        }
 
     def _movie_to_document(self, movie: Movie) -> dict[str, Any]:
-        document = {
-            "id": movie.id.hex,
+        document: dict[str, Any] = {
+            "id": self._uuid_codec.encode(movie.id),
+            "version": 0,
             "eng_title": movie.eng_title,
             "original_title": movie.original_title,
             "summary": movie.summary,
             "description": movie.description,
-            "release_date": movie.release_date.isoformat(),
+            "release_date": date_to_bson(movie.release_date),
             "countries": list(movie.countries),
             "genres": list(movie.genres),
             "mpaa": movie.mpaa,
@@ -62,18 +112,12 @@ class CommitMovieCollectionChanges:
         }
 
         if movie.budget:
-            document["budget"] = {
-                "amount": str(movie.budget.amount),
-                "currency": movie.budget.currency,
-            }
+            document["budget"] = money_to_bson(movie.budget)
         else:
             document["budget"] = None
 
         if movie.revenue:
-            document["revenue"] = {
-                "amount": str(movie.revenue.amount),
-                "currency": movie.revenue.currency,
-            }
+            document["revenue"] = money_to_bson(movie.revenue)
         else:
             document["revenue"] = None
 
@@ -81,44 +125,40 @@ class CommitMovieCollectionChanges:
 
     def _pipeline_to_update_movie(
         self,
-        clean: Movie,
         dirty: Movie,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.eng_title != dirty.eng_title:
+        if "eng_title" in dirty_fields:
             pipeline["$set"]["eng_title"] = dirty.eng_title
-        if clean.original_title != dirty.original_title:
+        if "original_title" in dirty_fields:
             pipeline["$set"]["original_title"] = dirty.original_title
-        if clean.summary != dirty.summary:
+        if "summary" in dirty_fields:
             pipeline["$set"]["summary"] = dirty.summary
-        if clean.description != dirty.description:
+        if "description" in dirty_fields:
             pipeline["$set"]["description"] = dirty.description
-        if clean.release_date != dirty.release_date:
-            pipeline["$set"]["release_date"] = dirty.release_date.isoformat()
-        if clean.countries != dirty.countries:
+        if "release_date" in dirty_fields:
+            pipeline["$set"]["release_date"] = date_to_bson(dirty.release_date)
+        if "countries" in dirty_fields:
             pipeline["$set"]["countries"] = list(dirty.countries)
-        if clean.genres != dirty.genres:
+        if "genres" in dirty_fields:
             pipeline["$set"]["genres"] = list(dirty.genres)
-        if clean.mpaa != dirty.mpaa:
+        if "mpaa" in dirty_fields:
             pipeline["$set"]["mpaa"] = dirty.mpaa
-        if clean.duration != dirty.duration:
+        if "duration" in dirty_fields:
             pipeline["$set"]["duration"] = dirty.duration
-        if clean.budget != dirty.budget:
+        if "budget" in dirty_fields:
             if dirty.budget:
-                pipeline["$set"]["budget"] = {
-                    "amount": str(dirty.budget.amount),
-                    "currency": dirty.budget.currency,
-                }
+                pipeline["$set"]["budget"] = money_to_bson(dirty.budget)
             else:
                 pipeline["$set"]["budget"] = None
-        if clean.revenue != dirty.revenue:
+        if "revenue" in dirty_fields:
             if dirty.revenue:
-                pipeline["$set"]["revenue"] = {
-                    "amount": str(dirty.revenue.amount),
-                    "currency": dirty.revenue.currency,
-                }
+                pipeline["$set"]["revenue"] = money_to_bson(dirty.revenue)
             else:
                 pipeline["$set"]["revenue"] = None
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
@@ -1,11 +1,23 @@
-# mypy: disable-error-code="assignment"
+# mypy: disable-error-code="assignment, arg-type"
 
-from typing import Any, Sequence
+from typing import Any, Sequence, Set, Union, Optional
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import Person
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     PersonCollection,
 )
@@ -15,53 +27,86 @@ class CommitPersonCollectionChanges:
     def __init__(
         self,
         collection: PersonCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[Person],
-        clean: Sequence[Person],
-        dirty: Sequence[Person],
+        dirty: Sequence[tuple[Person, Set[str]]],
+        deleted: Sequence[Person],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[Person],
+        dirty: Sequence[tuple[Person, Set[str]]],
         deleted: Sequence[Person],
-    ) -> None:
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
         inserts = [
-            InsertOne(self._person_to_document(person)) for person in new
+            InsertOne(
+                self._person_to_document(person),
+                namespace=self._collection.full_name,
+            )
+            for person in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_person.id.hex},
-                self._pipeline_to_update_person(clean_person, dirty_person),
+                self._filter(person),
+                self._pipeline_to_update_person(person, dirty_fields),
+                namespace=self._collection.full_name,
             )
-            for clean_person, dirty_person in zip(clean, dirty)
+            for person, dirty_fields in dirty
         ]
-        deletes = [DeleteOne({"id": person.id.hex}) for person in deleted]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
-        ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
+        deletes = [
+            DeleteOne(
+                self._filter(person),
+                namespace=self._collection.full_name,
             )
+            for person in deleted
+        ]
+
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, person: Person) -> dict[str, Any]:
+        """
+        Returns filter that matches document of person
+        only if it wasn't changed since person was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(person.id),
+            **self._model_versions.filter(person),
+        }
 
     def _person_to_document(self, person: Person) -> dict[str, Any]:
         document = {
-            "id": person.id.hex,
+            "id": self._uuid_codec.encode(person.id),
+            "version": 0,
             "first_name": person.first_name,
             "last_name": person.last_name,
             "sex": person.sex,
-            "birth_date": person.birth_date.isoformat(),
+            "birth_date": date_to_bson(person.birth_date),
         }
 
         if person.death_date:
-            document["death_date"] = person.death_date.isoformat()
+            document["death_date"] = date_to_bson(person.death_date)
         else:
             document["death_date"] = None
 
@@ -69,23 +114,25 @@ class CommitPersonCollectionChanges:
 
     def _pipeline_to_update_person(
         self,
-        clean: Person,
         dirty: Person,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.first_name != dirty.first_name:
+        if "first_name" in dirty_fields:
             pipeline["$set"]["first_name"] = dirty.first_name
-        if clean.last_name != dirty.last_name:
+        if "last_name" in dirty_fields:
             pipeline["$set"]["last_name"] = dirty.last_name
-        if clean.sex != dirty.sex:
+        if "sex" in dirty_fields:
             pipeline["$set"]["sex"] = dirty.sex
-        if clean.birth_date != dirty.birth_date:
-            pipeline["$set"]["birth_date"] = dirty.birth_date.isoformat()
-        if clean.death_date != dirty.death_date:
+        if "birth_date" in dirty_fields:
+            pipeline["$set"]["birth_date"] = date_to_bson(dirty.birth_date)
+        if "death_date" in dirty_fields:
             if dirty.death_date:
-                pipeline["$set"]["death_date"] = dirty.death_date.isoformat()
+                pipeline["$set"]["death_date"] = date_to_bson(dirty.death_date)
             else:
                 pipeline["$set"]["death_date"] = None
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
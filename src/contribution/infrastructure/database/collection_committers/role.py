@@ -1,57 +1,124 @@
-from typing import Any, Sequence
+# mypy: disable-error-code="arg-type"
 
-from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from typing import Any, Sequence, Set, Union, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import Role
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     RoleCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+    embedded_credits_write_models,
+)
 
 
 class CommitRoleCollectionChanges:
     def __init__(
         self,
         collection: RoleCollection,
-        session: AsyncIOMotorClientSession,
+        movie_collection: MovieCollection,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._collection = collection
+        self._movie_collection = movie_collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+
+        # In embedded layout changes are written into
+        # movie documents
+        self._bulk_write_collection: AsyncIOMotorCollection
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._bulk_write_collection = movie_collection
+        else:
+            self._bulk_write_collection = collection
 
     async def __call__(
         self,
         *,
         new: Sequence[Role],
-        clean: Sequence[Role],
-        dirty: Sequence[Role],
+        dirty: Sequence[tuple[Role, Set[str]]],
+        deleted: Sequence[Role],
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._bulk_write_collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[Role],
+        dirty: Sequence[tuple[Role, Set[str]]],
         deleted: Sequence[Role],
-    ) -> None:
-        inserts = [InsertOne(self._role_to_document(role)) for role in new]
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne, DeleteMany]]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            return embedded_credits_write_models(
+                field="roles",
+                namespace=self._movie_collection.full_name,
+                uuid_codec=self._uuid_codec,
+                new=[(role, self._role_to_document(role)) for role in new],
+                dirty=[
+                    (role, self._pipeline_to_update_role(role, dirty_fields))
+                    for role, dirty_fields in dirty
+                ],
+                deleted=deleted,
+            )
+
+        inserts = [
+            InsertOne(
+                self._role_to_document(role),
+                namespace=self._collection.full_name,
+            )
+            for role in new
+        ]
         updates = [
             UpdateOne(
-                {"id": clean_role.id.hex},
-                self._pipeline_to_update_role(clean_role, dirty_role),
+                {"id": self._uuid_codec.query(role.id)},
+                self._pipeline_to_update_role(role, dirty_fields),
+                namespace=self._collection.full_name,
             )
-            for clean_role, dirty_role in zip(clean, dirty)
-        ]
-        deletes = [DeleteOne({"id": role.id.hex}) for role in deleted]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
+            for role, dirty_fields in dirty
         ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
+        # Deleted roles are removed by one indexed
+        # delete of all their ids
+        deletes = []
+        if deleted:
+            deletes.append(
+                DeleteMany(
+                    {
+                        "id": self._uuid_codec.query_many(
+                            role.id for role in deleted
+                        ),
+                    },
+                    namespace=self._collection.full_name,
+                ),
             )
 
+        return [*inserts, *updates, *deletes]
+
     def _role_to_document(self, role: Role) -> dict[str, Any]:
         document = {
-            "id": role.id.hex,
-            "movie_id": role.movie_id.hex,
-            "person_id": role.person_id.hex,
+            "id": self._uuid_codec.encode(role.id),
+            "movie_id": self._uuid_codec.encode(role.movie_id),
+            "person_id": self._uuid_codec.encode(role.person_id),
             "character": role.character,
             "importance": role.importance,
             "is_spoiler": role.is_spoiler,
@@ -60,16 +127,16 @@ class CommitRoleCollectionChanges:
 
     def _pipeline_to_update_role(
         self,
-        clean: Role,
         dirty: Role,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.character != dirty.character:
+        if "character" in dirty_fields:
             pipeline["$set"]["character"] = dirty.character
-        if clean.importance != dirty.importance:
+        if "importance" in dirty_fields:
             pipeline["$set"]["importance"] = dirty.importance
-        if clean.is_spoiler != dirty.is_spoiler:
+        if "is_spoiler" in dirty_fields:
             pipeline["$set"]["is_spoiler"] = dirty.is_spoiler
 
         return pipeline
@@ -1,8 +1,10 @@
-from typing import Any, Sequence, Optional
+# mypy: disable-error-code="arg-type"
+
+from typing import Any, Sequence, Set, Optional, Union, NoReturn
 
 from pymongo import InsertOne, UpdateOne, DeleteOne
+from pymongo.results import BulkWriteResult
 from pymongo.errors import OperationFailure
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import User
 from contribution.application import (
@@ -10,6 +12,15 @@ from contribution.application import (
     UserNameIsAlreadyTakenError,
     UserEmailIsAlreadyTakenError,
 )
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.model_versions import (
+    ModelVersions,
+)
 from contribution.infrastructure.database.collections import (
     UserCollection,
 )
@@ -19,46 +30,81 @@ class CommitUserCollectionChanges:
     def __init__(
         self,
         collection: UserCollection,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._collection = collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
 
     async def __call__(
         self,
         *,
         new: Sequence[User],
-        clean: Sequence[User],
-        dirty: Sequence[User],
+        dirty: Sequence[tuple[User, Set[str]]],
         deleted: Sequence[User],
-    ) -> None:
-        inserts = [InsertOne(self._user_to_document(user)) for user in new]
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        try:
+            return await self._collection.bulk_write(
+                requests=changes,
+                session=await self._session.get(),
+            )
+        except OperationFailure as error:
+            await self.on_write_error(error)
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[User],
+        dirty: Sequence[tuple[User, Set[str]]],
+        deleted: Sequence[User],
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne]]:
+        inserts = [
+            InsertOne(
+                self._user_to_document(user),
+                namespace=self._collection.full_name,
+            )
+            for user in new
+        ]
         updates = [
             UpdateOne(
-                {"id": clean_user.id.hex},
-                self._pipeline_to_update_user(clean_user, dirty_user),
+                self._filter(user),
+                self._pipeline_to_update_user(user, dirty_fields),
+                namespace=self._collection.full_name,
             )
-            for clean_user, dirty_user in zip(clean, dirty)
+            for user, dirty_fields in dirty
         ]
-        deletes = [DeleteOne({"id": user.id.hex}) for user in deleted]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
+        deletes = [
+            DeleteOne(
+                self._filter(user),
+                namespace=self._collection.full_name,
+            )
+            for user in deleted
         ]
-        if changes:
-            try:
-                await self._collection.bulk_write(
-                    requests=changes,
-                    session=self._session,
-                )
-            except OperationFailure as error:
-                await self._on_operation_failure_error(error)
+
+        return [*inserts, *updates, *deletes]
+
+    def _filter(self, user: User) -> dict[str, Any]:
+        """
+        Returns filter that matches document of user
+        only if it wasn't changed since user was acquired
+        in `version` concurrency mode.
+        """
+        return {
+            "id": self._uuid_codec.query(user.id),
+            **self._model_versions.filter(user),
+        }
 
     def _user_to_document(self, user: User) -> dict[str, Any]:
         document = {
-            "id": user.id.hex,
+            "id": self._uuid_codec.encode(user.id),
+            "version": 0,
             "name": user.name,
             "email": user.email,
             "telegram": user.telegram,
@@ -75,42 +121,38 @@ class CommitUserCollectionChanges:
 
     def _pipeline_to_update_user(
         self,
-        clean: User,
         dirty: User,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.name != dirty.name:
+        if "name" in dirty_fields:
             pipeline["$set"]["name"] = dirty.name
-        if clean.email != dirty.email:
+        if "email" in dirty_fields:
             pipeline["$set"]["email"] = dirty.email
-        if clean.telegram != dirty.telegram:
+        if "telegram" in dirty_fields:
             pipeline["$set"]["telegram"] = dirty.telegram
-        if clean.is_active != dirty.is_active:
+        if "is_active" in dirty_fields:
             pipeline["$set"]["is_active"] = dirty.is_active
-        if clean.rating != dirty.rating:
+        if "rating" in dirty_fields:
             pipeline["$set"]["rating"] = dirty.rating
-        if (
-            clean.accepted_contributions_count
-            != dirty.accepted_contributions_count
-        ):
+        if "accepted_contributions_count" in dirty_fields:
             pipeline["$set"][
                 "accepted_contributions_count"
             ] = dirty.accepted_contributions_count
-        if (
-            clean.rejected_contributions_count
-            != dirty.rejected_contributions_count
-        ):
+        if "rejected_contributions_count" in dirty_fields:
             pipeline["$set"][
                 "rejected_contributions_count"
             ] = dirty.rejected_contributions_count
 
+        pipeline["$inc"] = {"version": 1}
+
         return pipeline
 
-    async def _on_operation_failure_error(
+    async def on_write_error(
         self,
         error: OperationFailure,
-    ) -> None:
+    ) -> NoReturn:
         await self._session.abort_transaction()
 
         if not error.details:
@@ -1,71 +1,142 @@
-from typing import Any, Sequence
+# mypy: disable-error-code="arg-type"
 
-from pymongo import InsertOne, UpdateOne, DeleteOne
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from typing import Any, Sequence, Set, Union, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import Writer
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     WriterCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+    embedded_credits_write_models,
+)
 
 
 class CommitWriterCollectionChanges:
     def __init__(
         self,
         collection: WriterCollection,
-        session: AsyncIOMotorClientSession,
+        movie_collection: MovieCollection,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._collection = collection
+        self._movie_collection = movie_collection
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+
+        # In embedded layout changes are written into
+        # movie documents
+        self._bulk_write_collection: AsyncIOMotorCollection
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._bulk_write_collection = movie_collection
+        else:
+            self._bulk_write_collection = collection
 
     async def __call__(
         self,
         *,
         new: Sequence[Writer],
-        clean: Sequence[Writer],
-        dirty: Sequence[Writer],
+        dirty: Sequence[tuple[Writer, Set[str]]],
         deleted: Sequence[Writer],
-    ) -> None:
+    ) -> Optional[BulkWriteResult]:
+        changes = self.write_models(new=new, dirty=dirty, deleted=deleted)
+        if not changes:
+            return None
+
+        return await self._bulk_write_collection.bulk_write(
+            requests=changes,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[Writer],
+        dirty: Sequence[tuple[Writer, Set[str]]],
+        deleted: Sequence[Writer],
+    ) -> list[Union[InsertOne, UpdateOne, DeleteOne, DeleteMany]]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            return embedded_credits_write_models(
+                field="writers",
+                namespace=self._movie_collection.full_name,
+                uuid_codec=self._uuid_codec,
+                new=[
+                    (writer, self._writer_to_document(writer))
+                    for writer in new
+                ],
+                dirty=[
+                    (
+                        writer,
+                        self._pipeline_to_update_writer(writer, dirty_fields),
+                    )
+                    for writer, dirty_fields in dirty
+                ],
+                deleted=deleted,
+            )
+
         inserts = [
-            InsertOne(self._writer_to_document(writer)) for writer in new
+            InsertOne(
+                self._writer_to_document(writer),
+                namespace=self._collection.full_name,
+            )
+            for writer in new
         ]
         updates = [
             UpdateOne(
-                {"id": clean_writer.id.hex},
-                self._pipeline_to_update_writer(clean_writer, dirty_writer),
+                {"id": self._uuid_codec.query(writer.id)},
+                self._pipeline_to_update_writer(writer, dirty_fields),
+                namespace=self._collection.full_name,
             )
-            for clean_writer, dirty_writer in zip(clean, dirty)
-        ]
-        deletes = [DeleteOne({"id": writer.id.hex}) for writer in deleted]
-
-        changes: list[InsertOne, UpdateOne, DeleteOne] = [
-            *inserts,
-            *updates,
-            *deletes,
+            for writer, dirty_fields in dirty
         ]
-        if changes:
-            await self._collection.bulk_write(
-                requests=changes,
-                session=self._session,
+        # Deleted writers are removed by one indexed
+        # delete of all their ids
+        deletes = []
+        if deleted:
+            deletes.append(
+                DeleteMany(
+                    {
+                        "id": self._uuid_codec.query_many(
+                            writer.id for writer in deleted
+                        ),
+                    },
+                    namespace=self._collection.full_name,
+                ),
             )
 
+        return [*inserts, *updates, *deletes]
+
     def _writer_to_document(self, writer: Writer) -> dict[str, Any]:
         document = {
-            "id": writer.id.hex,
-            "movie_id": writer.movie_id.hex,
-            "person_id": writer.person_id.hex,
+            "id": self._uuid_codec.encode(writer.id),
+            "movie_id": self._uuid_codec.encode(writer.movie_id),
+            "person_id": self._uuid_codec.encode(writer.person_id),
             "writing": writer.writing,
         }
         return document
 
     def _pipeline_to_update_writer(
         self,
-        clean: Writer,
         dirty: Writer,
+        dirty_fields: Set[str],
     ) -> dict[str, Any]:
         pipeline = {"$set": {}}
 
-        if clean.writing != dirty.writing:
+        if "writing" in dirty_fields:
             pipeline["$set"]["writing"] = dirty.writing
 
         return pipeline
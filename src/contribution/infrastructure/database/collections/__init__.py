@@ -11,6 +11,11 @@ __all__ = (
     "EditPersonContributionCollection",
     "AchievementCollection",
     "PermissionsCollection",
+    "ModerationQueueCollection",
+    "ModerationQueueCountsCollection",
+    "ProjectorCheckpointCollection",
+    "ProcessedOperationCollection",
+    "OutboxCollection",
     "user_collection_factory",
     "movie_collection_factory",
     "person_collection_factory",
@@ -23,6 +28,11 @@ __all__ = (
     "edit_person_contribution_collection_factory",
     "achievement_collection_factory",
     "permissions_collection_factory",
+    "moderation_queue_collection_factory",
+    "moderation_queue_counts_collection_factory",
+    "projector_checkpoint_collection_factory",
+    "processed_operation_collection_factory",
+    "outbox_collection_factory",
 )
 
 from .user import UserCollection, user_collection_factory
@@ -49,3 +59,18 @@ from .edit_person_contribution import (
 )
 from .achievement import AchievementCollection, achievement_collection_factory
 from .permissions import PermissionsCollection, permissions_collection_factory
+from .moderation_queue import (
+    ModerationQueueCollection,
+    ModerationQueueCountsCollection,
+    moderation_queue_collection_factory,
+    moderation_queue_counts_collection_factory,
+)
+from .projector_checkpoint import (
+    ProjectorCheckpointCollection,
+    projector_checkpoint_collection_factory,
+)
+from .processed_operation import (
+    ProcessedOperationCollection,
+    processed_operation_collection_factory,
+)
+from .outbox import OutboxCollection, outbox_collection_factory
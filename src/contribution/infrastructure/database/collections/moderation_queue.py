@@ -0,0 +1,30 @@
+from typing import NewType
+
+from motor.motor_asyncio import (
+    AsyncIOMotorDatabase,
+    AsyncIOMotorCollection,
+)
+
+
+def moderation_queue_collection_factory(
+    database: AsyncIOMotorDatabase,
+) -> "ModerationQueueCollection":
+    collection = database.get_collection("moderation_queue")
+    return ModerationQueueCollection(collection)
+
+
+def moderation_queue_counts_collection_factory(
+    database: AsyncIOMotorDatabase,
+) -> "ModerationQueueCountsCollection":
+    collection = database.get_collection("moderation_queue_counts")
+    return ModerationQueueCountsCollection(collection)
+
+
+ModerationQueueCollection = NewType(
+    "ModerationQueueCollection",
+    AsyncIOMotorCollection,
+)
+ModerationQueueCountsCollection = NewType(
+    "ModerationQueueCountsCollection",
+    AsyncIOMotorCollection,
+)
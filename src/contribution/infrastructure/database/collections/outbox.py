@@ -0,0 +1,19 @@
+from typing import NewType
+
+from motor.motor_asyncio import (
+    AsyncIOMotorDatabase,
+    AsyncIOMotorCollection,
+)
+
+
+def outbox_collection_factory(
+    database: AsyncIOMotorDatabase,
+) -> "OutboxCollection":
+    collection = database.get_collection("outbox")
+    return OutboxCollection(collection)
+
+
+OutboxCollection = NewType(
+    "OutboxCollection",
+    AsyncIOMotorCollection,
+)
@@ -0,0 +1,19 @@
+from typing import NewType
+
+from motor.motor_asyncio import (
+    AsyncIOMotorDatabase,
+    AsyncIOMotorCollection,
+)
+
+
+def processed_operation_collection_factory(
+    database: AsyncIOMotorDatabase,
+) -> "ProcessedOperationCollection":
+    collection = database.get_collection("processed_operations")
+    return ProcessedOperationCollection(collection)
+
+
+ProcessedOperationCollection = NewType(
+    "ProcessedOperationCollection",
+    AsyncIOMotorCollection,
+)
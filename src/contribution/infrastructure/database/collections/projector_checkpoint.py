@@ -0,0 +1,19 @@
+from typing import NewType
+
+from motor.motor_asyncio import (
+    AsyncIOMotorDatabase,
+    AsyncIOMotorCollection,
+)
+
+
+def projector_checkpoint_collection_factory(
+    database: AsyncIOMotorDatabase,
+) -> "ProjectorCheckpointCollection":
+    collection = database.get_collection("projector_checkpoints")
+    return ProjectorCheckpointCollection(collection)
+
+
+ProjectorCheckpointCollection = NewType(
+    "ProjectorCheckpointCollection",
+    AsyncIOMotorCollection,
+)
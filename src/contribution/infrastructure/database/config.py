@@ -1,24 +1,197 @@
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Final, Optional
 
 from contribution.infrastructure.get_env import env_var_by_key
+from .uuid_codec import UUIDRepresentation
+from .credits_layout import CreditsLayout
 
 
-def mongodb_config_from_env() -> "MongoDBConfig":
+class MongoDBClientProfile(StrEnum):
+    """
+    Type of process MongoDB client is created for. Each
+    profile has its own defaults of client options, which
+    can be overridden by env variables.
+    """
+
+    WEB_API = "web_api"
+    EVENT_CONSUMER = "event_consumer"
+    CLI = "cli"
+    TUI = "tui"
+
+
+@dataclass(frozen=True, slots=True)
+class MongoDBClientOptions:
+    """
+    Options of connection pool, wire compression and
+    default read and write concerns of MongoDB client.
+    None means driver or server default.
+    """
+
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    max_idle_time_ms: Optional[int] = None
+    wait_queue_timeout_ms: Optional[int] = None
+
+    # Compressors in order of preference, e.g. ("zstd", "snappy").
+    # Require optional dependencies from `mongodb_compression` extra
+    compressors: tuple[str, ...] = ()
+
+    read_concern: Optional[str] = None
+    write_concern: Optional[str] = None
+
+
+_DEFAULT_CLIENT_OPTIONS: Final = {
+    # Many concurrent requests per worker, pool is opened
+    # on startup and idle connections are closed after
+    # traffic peaks. Requests fail fast instead of queueing
+    # for connection for long
+    MongoDBClientProfile.WEB_API: MongoDBClientOptions(
+        max_pool_size=100,
+        min_pool_size=10,
+        max_idle_time_ms=60_000,
+        wait_queue_timeout_ms=2_000,
+        read_concern="majority",
+        write_concern="majority",
+    ),
+    # Concurrency is bounded by prefetch count of consumer,
+    # messages can wait for connection longer
+    MongoDBClientProfile.EVENT_CONSUMER: MongoDBClientOptions(
+        max_pool_size=20,
+        min_pool_size=5,
+        max_idle_time_ms=300_000,
+        wait_queue_timeout_ms=10_000,
+        read_concern="majority",
+        write_concern="majority",
+    ),
+    # One operation at a time
+    MongoDBClientProfile.CLI: MongoDBClientOptions(
+        max_pool_size=10,
+        read_concern="local",
+        write_concern="majority",
+    ),
+    MongoDBClientProfile.TUI: MongoDBClientOptions(
+        max_pool_size=10,
+        read_concern="local",
+        write_concern="majority",
+    ),
+}
+
+
+def mongodb_config_from_env(
+    profile: MongoDBClientProfile,
+) -> "MongoDBConfig":
     port_as_str = os.getenv("MONGODB_PORT")
     if port_as_str:
         port = int(port_as_str)
     else:
         port = None
 
+    uuid_representation = UUIDRepresentation(
+        os.getenv("MONGODB_UUID_REPRESENTATION", UUIDRepresentation.HEX),
+    )
+
+    versioned_collections_as_str = os.getenv(
+        "MONGODB_VERSIONED_COLLECTIONS",
+        "",
+    )
+    versioned_collections = frozenset(
+        collection_name.strip()
+        for collection_name in versioned_collections_as_str.split(",")
+        if collection_name.strip()
+    )
+
+    credits_layout = CreditsLayout(
+        os.getenv("MONGODB_CREDITS_LAYOUT", CreditsLayout.COLLECTIONS),
+    )
+
     return MongoDBConfig(
         url=env_var_by_key("MONGODB_URL"),
         port=port,
+        client_options=_client_options_from_env(profile),
+        uuid_representation=uuid_representation,
+        versioned_collections=versioned_collections,
+        credits_layout=credits_layout,
+        transaction_max_attempts=int(
+            os.getenv("MONGODB_TRANSACTION_MAX_ATTEMPTS", "3"),
+        ),
+        transaction_retry_base_delay=float(
+            os.getenv("MONGODB_TRANSACTION_RETRY_BASE_DELAY", "0.01"),
+        ),
+        transaction_retry_max_delay=float(
+            os.getenv("MONGODB_TRANSACTION_RETRY_MAX_DELAY", "0.5"),
+        ),
     )
 
 
+def _client_options_from_env(
+    profile: MongoDBClientProfile,
+) -> MongoDBClientOptions:
+    defaults = _DEFAULT_CLIENT_OPTIONS[profile]
+
+    compressors_as_str = os.getenv("MONGODB_COMPRESSORS")
+    if compressors_as_str is not None:
+        compressors = tuple(
+            compressor.strip()
+            for compressor in compressors_as_str.split(",")
+            if compressor.strip()
+        )
+    else:
+        compressors = defaults.compressors
+
+    return MongoDBClientOptions(
+        max_pool_size=_int_from_env(
+            "MONGODB_MAX_POOL_SIZE",
+            defaults.max_pool_size,
+        ),
+        min_pool_size=_int_from_env(
+            "MONGODB_MIN_POOL_SIZE",
+            defaults.min_pool_size,
+        ),
+        max_idle_time_ms=_int_from_env(
+            "MONGODB_MAX_IDLE_TIME_MS",
+            defaults.max_idle_time_ms,
+        ),
+        wait_queue_timeout_ms=_int_from_env(
+            "MONGODB_WAIT_QUEUE_TIMEOUT_MS",
+            defaults.wait_queue_timeout_ms,
+        ),
+        compressors=compressors,
+        read_concern=os.getenv("MONGODB_READ_CONCERN", defaults.read_concern),
+        write_concern=os.getenv(
+            "MONGODB_WRITE_CONCERN",
+            defaults.write_concern,
+        ),
+    )
+
+
+def _int_from_env[D: Optional[int]](key: str, default: D) -> int | D:
+    value_as_str = os.getenv(key)
+    if not value_as_str:
+        return default
+    return int(value_as_str)
+
+
 @dataclass(frozen=True, slots=True)
 class MongoDBConfig:
     url: str
     port: Optional[int]
+    client_options: MongoDBClientOptions = field(
+        default_factory=MongoDBClientOptions,
+    )
+    uuid_representation: UUIDRepresentation = UUIDRepresentation.HEX
+
+    # Names of collections whose documents are acquired in
+    # `version` concurrency mode instead of `lock` one
+    versioned_collections: frozenset[str] = frozenset()
+
+    # Switching layout of existing database requires
+    # moving credits between collections and movie documents
+    credits_layout: CreditsLayout = CreditsLayout.COLLECTIONS
+
+    # Retries of operations aborted by transient transaction
+    # errors, delays are in seconds
+    transaction_max_attempts: int = 3
+    transaction_retry_base_delay: float = 0.01
+    transaction_retry_max_delay: float = 0.5
@@ -0,0 +1,150 @@
+from collections import defaultdict
+from enum import StrEnum
+from typing import Any, Final, Mapping, Protocol, Sequence, Union
+from uuid import UUID
+
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany
+
+from .uuid_codec import UUIDCodec
+
+
+class CreditsLayout(StrEnum):
+    """
+    Way roles, writers and crew members of movies are
+    stored.
+
+    * `collections` - in `roles`, `writers` and
+      `crew_members` collections, one document per credit.
+      Used by default.
+    * `embedded` - in `roles`, `writers` and `crew` arrays
+      of movie documents. Credits of movie are added and
+      removed by one `$push` or `$pull` update of movie
+      document per movie, credits are found by id using
+      multikey indexes on ids of embedded documents.
+    """
+
+    COLLECTIONS = "collections"
+    EMBEDDED = "embedded"
+
+
+# Movie documents are read without embedded credits,
+# they are loaded by data mappers of credits
+EXCLUDE_EMBEDDED_CREDITS: Final = {
+    "roles": False,
+    "writers": False,
+    "crew": False,
+}
+
+
+class _Credit(Protocol):
+    @property
+    def id(self) -> UUID:
+        ...
+
+    @property
+    def movie_id(self) -> UUID:
+        ...
+
+
+def embedded_credits_pipeline(
+    field: str,
+    filter: Mapping[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Returns aggregation pipeline that finds documents
+    embedded in `field` array of movie documents by filter
+    and returns them in the same shape as documents of
+    separate collection, with `movie_id` field. Condition
+    on `movie_id` is applied to id of movie document.
+    """
+    movie_filter = {}
+    embedded_filter = {}
+    for key, value in filter.items():
+        if key == "movie_id":
+            movie_filter["id"] = value
+        else:
+            embedded_filter[f"{field}.{key}"] = value
+
+    pipeline: list[dict[str, Any]] = [
+        {"$match": {**movie_filter, **embedded_filter}},
+        {"$unwind": f"${field}"},
+    ]
+    if embedded_filter:
+        pipeline.append({"$match": embedded_filter})
+    pipeline.append(
+        {
+            "$replaceWith": {
+                "$mergeObjects": [f"${field}", {"movie_id": "$id"}],
+            },
+        },
+    )
+
+    return pipeline
+
+
+def embedded_credits_write_models(
+    *,
+    field: str,
+    namespace: str,
+    uuid_codec: UUIDCodec,
+    new: Sequence[tuple[_Credit, dict[str, Any]]],
+    dirty: Sequence[tuple[_Credit, dict[str, Any]]],
+    deleted: Sequence[_Credit],
+) -> list[Union[InsertOne, UpdateOne, DeleteOne, DeleteMany]]:
+    """
+    Returns write models that push new credits into and
+    pull deleted credits from `field` array of their movie
+    documents with one update per movie, and update
+    changed credits in place.
+
+    Accepts new credits together with their documents and
+    changed credits together with update pipelines for
+    document of separate collection.
+    """
+    new_documents_by_movie_id = defaultdict(list)
+    for credit, document in new:
+        embedded_document = {
+            key: value for key, value in document.items() if key != "movie_id"
+        }
+        new_documents_by_movie_id[credit.movie_id].append(embedded_document)
+
+    deleted_ids_by_movie_id = defaultdict(list)
+    for credit in deleted:
+        deleted_ids_by_movie_id[credit.movie_id].append(credit.id)
+
+    pushes = [
+        UpdateOne(
+            {"id": uuid_codec.query(movie_id)},
+            {"$push": {field: {"$each": documents}}},
+            namespace=namespace,
+        )
+        for movie_id, documents in new_documents_by_movie_id.items()
+    ]
+    updates = [
+        UpdateOne(
+            {
+                "id": uuid_codec.query(credit.movie_id),
+                f"{field}.id": uuid_codec.query(credit.id),
+            },
+            {
+                operator: {
+                    f"{field}.$.{key}": value for key, value in fields.items()
+                }
+                for operator, fields in pipeline.items()
+            },
+            namespace=namespace,
+        )
+        for credit, pipeline in dirty
+    ]
+    pulls = [
+        UpdateOne(
+            {"id": uuid_codec.query(movie_id)},
+            {"$pull": {field: {"id": uuid_codec.query_many(ids)}}},
+            namespace=namespace,
+        )
+        for movie_id, ids in deleted_ids_by_movie_id.items()
+    ]
+
+    # Only updates of movie documents are returned, union
+    # type matches write models of committers
+    return [*pushes, *updates, *pulls]
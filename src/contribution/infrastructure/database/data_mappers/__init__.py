@@ -11,6 +11,7 @@ __all__ = (
     "EditPersonContributionMapper",
     "AchievementMapper",
     "PermissionsMapper",
+    "ContributionSummaryMapper",
 )
 
 from .user import UserMapper
@@ -25,3 +26,4 @@ from .add_person_contribution import AddPersonContributionMapper
 from .edit_person_contribution import EditPersonContributionMapper
 from .achievement import AchievementMapper
 from .permissions import PermissionsMapper
+from .contribution_summary import ContributionSummaryMapper
@@ -1,8 +1,4 @@
-from datetime import datetime
 from typing import Any, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     Achieved,
@@ -10,6 +6,15 @@ from contribution.domain import (
     UserId,
     Achievement,
 )
+from contribution.infrastructure.database.bson_values import (
+    datetime_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     AchievementCollection,
 )
@@ -27,12 +32,14 @@ class AchievementMapper:
         achievement_map: AchievementMap,
         achievement_collection: AchievementCollection,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
     ):
         self._achievement_map = achievement_map
         self._achievement_collection = achievement_collection
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
 
     async def by_id(self, id: AchievementId) -> Optional[Achievement]:
         achievement_from_map = self._achievement_map.by_id(id)
@@ -40,8 +47,8 @@ class AchievementMapper:
             return achievement_from_map
 
         document = await self._achievement_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             achievement = self._document_to_achievement(document)
@@ -53,15 +60,15 @@ class AchievementMapper:
 
     async def save(self, achievement: Achievement) -> None:
         self._achievement_map.save(achievement)
-        self._unit_of_work.register_clean(achievement)
+        self._unit_of_work.register_new(achievement)
 
     def _document_to_achievement(
         self,
         document: Mapping[str, Any],
     ) -> Achievement:
         return Achievement(
-            id=AchievementId(UUID(document["id"])),
-            user_id=UserId(UUID(document["user_id"])),
+            id=AchievementId(self._uuid_codec.decode(document["id"])),
+            user_id=UserId(self._uuid_codec.decode(document["user_id"])),
             achieved=Achieved(document["achieved"]),
-            achieved_at=datetime.fromisoformat(document["achieved_at"]),
+            achieved_at=datetime_from_bson(document["achieved_at"]),
         )
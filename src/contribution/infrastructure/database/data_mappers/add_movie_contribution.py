@@ -1,9 +1,4 @@
-from datetime import date, datetime
 from typing import Any, Mapping, Optional
-from decimal import Decimal
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     ContributionStatus,
@@ -21,9 +16,19 @@ from contribution.domain import (
     MovieWriter,
     MovieCrewMember,
     PhotoUrl,
-    Money,
     AddMovieContribution,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+    datetime_from_bson,
+    money_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     AddMovieContributionCollection,
 )
@@ -33,6 +38,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -45,13 +54,20 @@ class AddMovieContributionMapper:
         contribution_collection: AddMovieContributionCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._contribution_map = contribution_map
         self._contribution_collection = contribution_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            contribution_collection,
+        )
 
     async def acquire_by_id(
         self,
@@ -63,14 +79,22 @@ class AddMovieContributionMapper:
         ):
             return contribution_from_map
 
-        document = await self._contribution_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._contribution_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._contribution_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             contribution = self._document_to_contribution(document)
             self._contribution_map.save_acquired(contribution)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(contribution, document)
             self._unit_of_work.register_clean(contribution)
             return contribution
 
@@ -88,7 +112,7 @@ class AddMovieContributionMapper:
         document: Mapping[str, Any],
     ) -> AddMovieContribution:
         if document["status_updated_at"]:
-            status_updated_at = datetime.fromisoformat(
+            status_updated_at = datetime_from_bson(
                 document["status_updated_at"],
             )
         else:
@@ -96,27 +120,23 @@ class AddMovieContributionMapper:
 
         budget_as_dict = document["budget"]
         if budget_as_dict:
-            budget = Money(
-                amount=Decimal(budget_as_dict["amount"]),
-                currency=budget_as_dict["currency"],
-            )
+            budget = money_from_bson(budget_as_dict)
         else:
             budget = None
 
         revenue_as_dict = document["revenue"]
         if revenue_as_dict:
-            revenue = Money(
-                amount=Decimal(revenue_as_dict["amount"]),
-                currency=revenue_as_dict["currency"],
-            )
+            revenue = money_from_bson(revenue_as_dict)
         else:
             revenue = None
 
         roles = []
         for role_as_dict in document["roles"]:
             role = MovieRole(
-                id=RoleId(UUID(role_as_dict["id"])),
-                person_id=PersonId(UUID(role_as_dict["person_id"])),
+                id=RoleId(self._uuid_codec.decode(role_as_dict["id"])),
+                person_id=PersonId(
+                    self._uuid_codec.decode(role_as_dict["person_id"]),
+                ),
                 character=document["character"],
                 importance=document["importance"],
                 is_spoiler=document["is_spoiler"],
@@ -126,8 +146,10 @@ class AddMovieContributionMapper:
         writers = []
         for writer_as_dict in document["writers"]:
             writer = MovieWriter(
-                id=WriterId(UUID(writer_as_dict["id"])),
-                person_id=PersonId(UUID(writer_as_dict["person_id"])),
+                id=WriterId(self._uuid_codec.decode(writer_as_dict["id"])),
+                person_id=PersonId(
+                    self._uuid_codec.decode(writer_as_dict["person_id"]),
+                ),
                 writing=Writing(writer_as_dict["writing"]),
             )
             writers.append(writer)
@@ -135,23 +157,27 @@ class AddMovieContributionMapper:
         crew = []
         for crew_member_as_dict in document["crew"]:
             crew_member = MovieCrewMember(
-                id=CrewMemberId(UUID(crew_member_as_dict["id"])),
-                person_id=PersonId(UUID(crew_member_as_dict["person_id"])),
+                id=CrewMemberId(
+                    self._uuid_codec.decode(crew_member_as_dict["id"]),
+                ),
+                person_id=PersonId(
+                    self._uuid_codec.decode(crew_member_as_dict["person_id"]),
+                ),
                 membership=CrewMembership(crew_member_as_dict["membership"]),
             )
             crew.append(crew_member)
 
         return AddMovieContribution(
             status=ContributionStatus(document["status"]),
-            created_at=datetime.fromisoformat(document["created_at"]),
+            created_at=datetime_from_bson(document["created_at"]),
             status_updated_at=status_updated_at,
-            id=AddMovieContributionId(UUID(document["id"])),
-            author_id=UserId(UUID(document["author_id"])),
+            id=AddMovieContributionId(self._uuid_codec.decode(document["id"])),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
             eng_title=document["eng_title"],
             original_title=document["original_title"],
             summary=document["summary"],
             description=document["description"],
-            release_date=date.fromisoformat(document["release_date"]),
+            release_date=date_from_bson(document["release_date"]),
             countries=document["countries"],
             genres=[Genre(genre) for genre in document["genres"]],
             mpaa=MPAA(document["mpaa"]),
@@ -1,8 +1,4 @@
-from datetime import date, datetime
 from typing import Any, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     ContributionStatus,
@@ -12,6 +8,16 @@ from contribution.domain import (
     PhotoUrl,
     AddPersonContribution,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+    datetime_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     AddPersonContributionCollection,
 )
@@ -21,6 +27,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -33,13 +43,20 @@ class AddPersonContributionMapper:
         contribution_collection: AddPersonContributionCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._contribution_map = contribution_map
         self._contribution_collection = contribution_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            contribution_collection,
+        )
 
     async def acquire_by_id(
         self,
@@ -51,14 +68,22 @@ class AddPersonContributionMapper:
         ):
             return contribution_from_map
 
-        document = await self._contribution_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._contribution_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._contribution_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             contribution = self._document_to_contribution(document)
             self._contribution_map.save_acquired(contribution)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(contribution, document)
             self._unit_of_work.register_clean(contribution)
             return contribution
 
@@ -76,27 +101,29 @@ class AddPersonContributionMapper:
         document: Mapping[str, Any],
     ) -> AddPersonContribution:
         if document["status_updated_at"]:
-            status_updated_at = datetime.fromisoformat(
+            status_updated_at = datetime_from_bson(
                 document["status_updated_at"],
             )
         else:
             status_updated_at = None
 
         if document["death_date"]:
-            death_date = date.fromisoformat(document["death_date"])
+            death_date = date_from_bson(document["death_date"])
         else:
             death_date = None
 
         return AddPersonContribution(
             status=ContributionStatus(document["status"]),
-            created_at=datetime.fromisoformat(document["created_at"]),
+            created_at=datetime_from_bson(document["created_at"]),
             status_updated_at=status_updated_at,
-            id=AddPersonContributionId(UUID(document["id"])),
-            author_id=UserId(UUID(document["author_id"])),
+            id=AddPersonContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
             first_name=document["first_name"],
             last_name=document["last_name"],
             sex=Sex(document["sex"]),
-            birth_date=date.fromisoformat(document["birth_date"]),
+            birth_date=date_from_bson(document["birth_date"]),
             death_date=death_date,
             photos=[PhotoUrl(photo_url) for photo_url in document["photos"]],
         )
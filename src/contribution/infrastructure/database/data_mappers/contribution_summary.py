@@ -0,0 +1,339 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Final, Mapping, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from contribution.domain import (
+    ContributionStatus,
+    AddMovieContributionId,
+    EditMovieContributionId,
+    AddPersonContributionId,
+    EditPersonContributionId,
+    UserId,
+    MovieId,
+    PersonId,
+)
+from contribution.application import (
+    InvalidContributionCursorError,
+    ContributionSummary,
+    AddMovieContributionSummary,
+    EditMovieContributionSummary,
+    AddPersonContributionSummary,
+    EditPersonContributionSummary,
+    ContributionPage,
+)
+from contribution.infrastructure.database.bson_values import (
+    datetime_from_bson,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
+from contribution.infrastructure.database.collections import (
+    AddMovieContributionCollection,
+    EditMovieContributionCollection,
+    AddPersonContributionCollection,
+    EditPersonContributionCollection,
+)
+
+
+# Newest first, `_id` makes order total for contributions
+# created at the same millisecond
+CONTRIBUTION_PAGE_SORT: Final = [("created_at", -1), ("_id", -1)]
+
+_SUMMARY_PROJECTION: Final = {
+    "_id": True,
+    "id": True,
+    "author_id": True,
+    "status": True,
+    "created_at": True,
+    "status_updated_at": True,
+}
+
+
+class ContributionSummaryMapper:
+    """
+    Reads pages of contribution summaries using keyset
+    pagination: next page continues after `created_at`
+    and `_id` of last document of previous page, so
+    reading any page costs the same as reading the first
+    one. Filters and sort are served by compound indexes
+    created by `ensure_indexes`.
+
+    Documents are read with projection of summary fields,
+    so movie credits and photos of contributions are
+    neither sent by server nor decoded.
+    """
+
+    def __init__(
+        self,
+        add_movie_contribution_collection: AddMovieContributionCollection,
+        edit_movie_contribution_collection: EditMovieContributionCollection,
+        add_person_contribution_collection: AddPersonContributionCollection,
+        edit_person_contribution_collection: EditPersonContributionCollection,
+        uuid_codec: UUIDCodec,
+    ):
+        self._add_movie_contribution_collection = (
+            add_movie_contribution_collection
+        )
+        self._edit_movie_contribution_collection = (
+            edit_movie_contribution_collection
+        )
+        self._add_person_contribution_collection = (
+            add_person_contribution_collection
+        )
+        self._edit_person_contribution_collection = (
+            edit_person_contribution_collection
+        )
+        self._uuid_codec = uuid_codec
+
+    async def list_add_movie_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[AddMovieContributionSummary]:
+        return await self._page(
+            collection=self._add_movie_contribution_collection,
+            fields=("eng_title", "original_title"),
+            document_to_summary=self._document_to_add_movie_summary,
+            author_id=author_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def list_edit_movie_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[EditMovieContributionSummary]:
+        return await self._page(
+            collection=self._edit_movie_contribution_collection,
+            fields=("movie_id",),
+            document_to_summary=self._document_to_edit_movie_summary,
+            author_id=author_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def list_add_person_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[AddPersonContributionSummary]:
+        return await self._page(
+            collection=self._add_person_contribution_collection,
+            fields=("first_name", "last_name"),
+            document_to_summary=self._document_to_add_person_summary,
+            author_id=author_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def list_edit_person_contributions(
+        self,
+        *,
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[EditPersonContributionSummary]:
+        return await self._page(
+            collection=self._edit_person_contribution_collection,
+            fields=("person_id",),
+            document_to_summary=self._document_to_edit_person_summary,
+            author_id=author_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def _page[S: ContributionSummary](
+        self,
+        *,
+        collection: AsyncIOMotorCollection,
+        fields: tuple[str, ...],
+        document_to_summary: Callable[[Mapping[str, Any]], S],
+        author_id: Optional[UserId],
+        status: Optional[ContributionStatus],
+        limit: int,
+        cursor: Optional[str],
+    ) -> ContributionPage[S]:
+        filter = contribution_page_filter(
+            author_id=(
+                self._uuid_codec.query(author_id) if author_id else None
+            ),
+            status=status,
+            cursor=cursor,
+        )
+        projection = {**_SUMMARY_PROJECTION, **dict.fromkeys(fields, True)}
+
+        # One extra document tells whether next page exists
+        documents = (
+            await collection.find(filter, projection)
+            .sort(CONTRIBUTION_PAGE_SORT)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        if len(documents) > limit:
+            documents = documents[:limit]
+            next_cursor = encode_contribution_cursor(documents[-1])
+        else:
+            next_cursor = None
+
+        return ContributionPage(
+            summaries=[
+                document_to_summary(document) for document in documents
+            ],
+            next_cursor=next_cursor,
+        )
+
+    def _document_to_add_movie_summary(
+        self,
+        document: Mapping[str, Any],
+    ) -> AddMovieContributionSummary:
+        return AddMovieContributionSummary(
+            status=ContributionStatus(document["status"]),
+            created_at=datetime_from_bson(document["created_at"]),
+            status_updated_at=self._status_updated_at(document),
+            id=AddMovieContributionId(self._uuid_codec.decode(document["id"])),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            eng_title=document["eng_title"],
+            original_title=document["original_title"],
+        )
+
+    def _document_to_edit_movie_summary(
+        self,
+        document: Mapping[str, Any],
+    ) -> EditMovieContributionSummary:
+        return EditMovieContributionSummary(
+            status=ContributionStatus(document["status"]),
+            created_at=datetime_from_bson(document["created_at"]),
+            status_updated_at=self._status_updated_at(document),
+            id=EditMovieContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            movie_id=MovieId(self._uuid_codec.decode(document["movie_id"])),
+        )
+
+    def _document_to_add_person_summary(
+        self,
+        document: Mapping[str, Any],
+    ) -> AddPersonContributionSummary:
+        return AddPersonContributionSummary(
+            status=ContributionStatus(document["status"]),
+            created_at=datetime_from_bson(document["created_at"]),
+            status_updated_at=self._status_updated_at(document),
+            id=AddPersonContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            first_name=document["first_name"],
+            last_name=document["last_name"],
+        )
+
+    def _document_to_edit_person_summary(
+        self,
+        document: Mapping[str, Any],
+    ) -> EditPersonContributionSummary:
+        return EditPersonContributionSummary(
+            status=ContributionStatus(document["status"]),
+            created_at=datetime_from_bson(document["created_at"]),
+            status_updated_at=self._status_updated_at(document),
+            id=EditPersonContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            person_id=PersonId(
+                self._uuid_codec.decode(document["person_id"]),
+            ),
+        )
+
+    def _status_updated_at(
+        self,
+        document: Mapping[str, Any],
+    ) -> Optional[datetime]:
+        if document["status_updated_at"]:
+            return datetime_from_bson(document["status_updated_at"])
+        return None
+
+
+def contribution_page_filter(
+    *,
+    author_id: Any,
+    status: Optional[ContributionStatus],
+    cursor: Optional[str],
+) -> dict[str, Any]:
+    """
+    Returns filter of page of contributions. Accepts
+    author id already converted by `UUIDCodec.query`.
+
+    Status is always part of filter, so `(author_id,
+    status, created_at, _id)` and `(status, created_at,
+    _id)` indexes serve all combinations of filters:
+    without status, server merges sorted index ranges of
+    every status instead of sorting documents in memory.
+    """
+    filter: dict[str, Any] = {}
+    if author_id is not None:
+        filter["author_id"] = author_id
+    if status:
+        filter["status"] = status
+    else:
+        filter["status"] = {"$in": list(ContributionStatus)}
+
+    if cursor:
+        created_at, object_id = decode_contribution_cursor(cursor)
+        filter["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": object_id}},
+        ]
+
+    return filter
+
+
+def encode_contribution_cursor(document: Mapping[str, Any]) -> str:
+    """
+    Returns opaque cursor pointing right after document.
+    """
+    cursor_as_dict = {
+        "created_at": document["created_at"].isoformat(),
+        "_id": str(document["_id"]),
+    }
+    cursor_as_json = json.dumps(cursor_as_dict, separators=(",", ":"))
+    return base64.urlsafe_b64encode(cursor_as_json.encode()).decode()
+
+
+def decode_contribution_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    try:
+        cursor_as_json = base64.urlsafe_b64decode(cursor.encode())
+        cursor_as_dict = json.loads(cursor_as_json)
+        created_at = datetime.fromisoformat(cursor_as_dict["created_at"])
+        object_id = ObjectId(cursor_as_dict["_id"])
+    except (
+        binascii.Error,
+        UnicodeError,
+        ValueError,
+        TypeError,
+        KeyError,
+        InvalidId,
+    ):
+        raise InvalidContributionCursorError()
+
+    return created_at, object_id
@@ -1,7 +1,4 @@
 from typing import Any, Iterable, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     CrewMembership,
@@ -10,9 +7,22 @@ from contribution.domain import (
     PersonId,
     CrewMember,
 )
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     CrewMemberCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+)
 from contribution.infrastructure.database.identity_maps import (
     CrewMemberMap,
 )
@@ -26,22 +36,50 @@ class CrewMemberMapper:
         self,
         crew_member_map: CrewMemberMap,
         crew_member_collection: CrewMemberCollection,
+        movie_collection: MovieCollection,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._crew_member_map = crew_member_map
         self._crew_member_collection = crew_member_collection
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._batch_loader = BatchLoader(
+                identity_map=crew_member_map,
+                collection=movie_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_crew_member,
+                embedded_field="crew",
+            )
+        else:
+            self._batch_loader = BatchLoader(
+                identity_map=crew_member_map,
+                collection=crew_member_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_crew_member,
+            )
 
     async def by_id(self, id: CrewMemberId) -> Optional[CrewMember]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            crew_members = await self._batch_loader.load([id])
+            return crew_members[0] if crew_members else None
+
         crew_member_from_map = self._crew_member_map.by_id(id)
         if crew_member_from_map:
             return crew_member_from_map
 
         document = await self._crew_member_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             role = self._document_to_crew_member(document)
@@ -55,28 +93,20 @@ class CrewMemberMapper:
         self,
         ids: Iterable[CrewMemberId],
     ) -> list[CrewMember]:
-        crew_members_from_map = []
-        for id in ids:
-            crew_member_from_map = self._crew_member_map.by_id(id)
-            if not crew_member_from_map:
-                break
-            crew_members_from_map.append(crew_member_from_map)
-        else:
-            return crew_members_from_map
+        return await self._batch_loader.load(ids)
 
-        documents = await self._crew_member_collection.find(
-            {"id": {"$in": [id.hex for id in ids]}},
-            session=self._session,
-        ).to_list(None)
-
-        crew_members = []
-        for document in documents:
-            role = self._document_to_crew_member(document)
-            self._crew_member_map.save(role)
-            self._unit_of_work.register_clean(role)
-            crew_members.append(role)
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[CrewMember]:
+        return await self._batch_loader.load_matching(
+            {"movie_id": self._uuid_codec.query(movie_id)},
+        )
 
-        return crew_members
+    async def list_by_person_id(
+        self,
+        person_id: PersonId,
+    ) -> list[CrewMember]:
+        return await self._batch_loader.load_matching(
+            {"person_id": self._uuid_codec.query(person_id)},
+        )
 
     async def save_many(self, crew_members: Iterable[CrewMember]) -> None:
         for crew_member in crew_members:
@@ -95,8 +125,8 @@ class CrewMemberMapper:
         document: Mapping[str, Any],
     ) -> CrewMember:
         return CrewMember(
-            id=CrewMemberId(UUID(document["id"])),
-            movie_id=MovieId(UUID(document["movie_id"])),
-            person_id=PersonId(UUID(document["person_id"])),
+            id=CrewMemberId(self._uuid_codec.decode(document["id"])),
+            movie_id=MovieId(self._uuid_codec.decode(document["movie_id"])),
+            person_id=PersonId(self._uuid_codec.decode(document["person_id"])),
             membership=CrewMembership(document["membership"]),
         )
@@ -1,9 +1,5 @@
-from datetime import date, datetime
-from typing import Any, Iterable, Mapping, Optional, cast
-from decimal import Decimal
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from datetime import date
+from typing import Any, Iterable, Mapping, Optional
 
 from contribution.domain import (
     ContributionStatus,
@@ -22,12 +18,22 @@ from contribution.domain import (
     MovieWriter,
     MovieCrewMember,
     Country,
-    Currency,
     PhotoUrl,
     Money,
     EditMovieContribution,
     Maybe,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+    datetime_from_bson,
+    money_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     EditMovieContributionCollection,
 )
@@ -37,6 +43,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -49,13 +59,20 @@ class EditMovieContributionMapper:
         contribution_collection: EditMovieContributionCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._contribution_map = contribution_map
         self._contribution_collection = contribution_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            contribution_collection,
+        )
 
     async def acquire_by_id(
         self,
@@ -67,14 +84,22 @@ class EditMovieContributionMapper:
         ):
             return contribution_from_map
 
-        document = await self._contribution_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._contribution_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._contribution_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             contribution = self._document_to_contribution(document)
             self._contribution_map.save_acquired(contribution)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(contribution, document)
             self._unit_of_work.register_clean(contribution)
             return contribution
 
@@ -92,7 +117,7 @@ class EditMovieContributionMapper:
         document: Mapping[str, Any],
     ) -> EditMovieContribution:
         if document["status_updated_at"]:
-            status_updated_at = datetime.fromisoformat(
+            status_updated_at = datetime_from_bson(
                 document["status_updated_at"],
             )
         else:
@@ -117,7 +142,7 @@ class EditMovieContributionMapper:
         maybe_release_date = Maybe[date].from_mapping_by_key(
             mapping=document,
             key="release_date",
-            value_factory=date.fromisoformat,
+            value_factory=date_from_bson,
         )
         maybe_countries = Maybe[list[Country]].from_mapping_by_key(
             mapping=document,
@@ -140,19 +165,21 @@ class EditMovieContributionMapper:
         maybe_budget = Maybe[Optional[Money]].from_mapping_by_key(
             mapping=document,
             key="budget",
-            value_factory=self._budget_factory,
+            value_factory=self._money_factory,
         )
         maybe_revenue = Maybe[Optional[Money]].from_mapping_by_key(
             mapping=document,
             key="revenue",
-            value_factory=self._revenue_factory,
+            value_factory=self._money_factory,
         )
 
         roles_to_add = []
         for role_as_dict in document["roles_to_add"]:
             role = MovieRole(
-                id=RoleId(UUID(role_as_dict["id"])),
-                person_id=PersonId(UUID(role_as_dict["person_id"])),
+                id=RoleId(self._uuid_codec.decode(role_as_dict["id"])),
+                person_id=PersonId(
+                    self._uuid_codec.decode(role_as_dict["person_id"]),
+                ),
                 character=document["character"],
                 importance=document["importance"],
                 is_spoiler=document["is_spoiler"],
@@ -162,8 +189,10 @@ class EditMovieContributionMapper:
         writers_to_add = []
         for writer_as_dict in document["writers"]:
             writer = MovieWriter(
-                id=WriterId(UUID(writer_as_dict["id"])),
-                person_id=PersonId(UUID(writer_as_dict["person_id"])),
+                id=WriterId(self._uuid_codec.decode(writer_as_dict["id"])),
+                person_id=PersonId(
+                    self._uuid_codec.decode(writer_as_dict["person_id"]),
+                ),
                 writing=Writing(writer_as_dict["writing"]),
             )
             writers_to_add.append(writer)
@@ -171,19 +200,25 @@ class EditMovieContributionMapper:
         crew_to_add = []
         for crew_member_as_dict in document["crew"]:
             crew_member = MovieCrewMember(
-                id=CrewMemberId(UUID(crew_member_as_dict["id"])),
-                person_id=PersonId(UUID(crew_member_as_dict["person_id"])),
+                id=CrewMemberId(
+                    self._uuid_codec.decode(crew_member_as_dict["id"]),
+                ),
+                person_id=PersonId(
+                    self._uuid_codec.decode(crew_member_as_dict["person_id"]),
+                ),
                 membership=CrewMembership(crew_member_as_dict["membership"]),
             )
             crew_to_add.append(crew_member)
 
         return EditMovieContribution(
             status=ContributionStatus(document["status"]),
-            created_at=datetime.fromisoformat(document["created_at"]),
+            created_at=datetime_from_bson(document["created_at"]),
             status_updated_at=status_updated_at,
-            id=EditMovieContributionId(UUID(document["id"])),
-            author_id=UserId(UUID(document["author_id"])),
-            movie_id=MovieId(UUID(document["movie_id"])),
+            id=EditMovieContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            movie_id=MovieId(self._uuid_codec.decode(document["movie_id"])),
             eng_title=maybe_eng_title,
             original_title=maybe_original_title,
             summary=maybe_summary,
@@ -197,17 +232,17 @@ class EditMovieContributionMapper:
             revenue=maybe_revenue,
             roles_to_add=roles_to_add,
             roles_to_remove=[
-                RoleId(UUID(role_id))
+                RoleId(self._uuid_codec.decode(role_id))
                 for role_id in document["roles_to_remove"]
             ],
             writers_to_add=writers_to_add,
             writers_to_remove=[
-                WriterId(UUID(writer_id))
+                WriterId(self._uuid_codec.decode(writer_id))
                 for writer_id in document["writers_to_remove"]
             ],
             crew_to_add=crew_to_add,
             crew_to_remove=[
-                CrewMemberId(UUID(crew_member_id))
+                CrewMemberId(self._uuid_codec.decode(crew_member_id))
                 for crew_member_id in document["crew_to_remove"]
             ],
             photos_to_add=[
@@ -218,14 +253,10 @@ class EditMovieContributionMapper:
     def _genres_factory(self, genre_values: Iterable[str]) -> list[Genre]:
         return [Genre(genre_value) for genre_value in genre_values]
 
-    def _budget_factory(self, budget_as_dict: dict[str, str]) -> Money:
-        return Money(
-            amount=Decimal(budget_as_dict["amount"]),
-            currency=cast(Currency, budget_as_dict["currency"]),
-        )
-
-    def _revenue_factory(self, revenue_as_dict: dict[str, str]) -> Money:
-        return Money(
-            amount=Decimal(revenue_as_dict["amount"]),
-            currency=cast(Currency, revenue_as_dict["currency"]),
-        )
+    def _money_factory(
+        self,
+        money_as_dict: Optional[Mapping[str, Any]],
+    ) -> Optional[Money]:
+        if money_as_dict:
+            return money_from_bson(money_as_dict)
+        return None
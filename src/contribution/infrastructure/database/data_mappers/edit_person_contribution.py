@@ -1,8 +1,5 @@
-from datetime import date, datetime
+from datetime import date
 from typing import Any, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     ContributionStatus,
@@ -14,6 +11,16 @@ from contribution.domain import (
     EditPersonContribution,
     Maybe,
 )
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+    datetime_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     EditPersonContributionCollection,
 )
@@ -23,6 +30,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -35,13 +46,20 @@ class EditPersonContributionMapper:
         contribution_collection: EditPersonContributionCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._contribution_map = contribution_map
         self._contribution_collection = contribution_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            contribution_collection,
+        )
 
     async def acquire_by_id(
         self,
@@ -53,14 +71,22 @@ class EditPersonContributionMapper:
         ):
             return contribution_from_map
 
-        document = await self._contribution_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._contribution_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._contribution_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             contribution = self._document_to_contribution(document)
             self._contribution_map.save_acquired(contribution)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(contribution, document)
             self._unit_of_work.register_clean(contribution)
             return contribution
 
@@ -78,7 +104,7 @@ class EditPersonContributionMapper:
         document: Mapping[str, Any],
     ) -> EditPersonContribution:
         if document["status_updated_at"]:
-            status_updated_at = datetime.fromisoformat(
+            status_updated_at = datetime_from_bson(
                 document["status_updated_at"],
             )
         else:
@@ -100,7 +126,7 @@ class EditPersonContributionMapper:
         maybe_birth_date = Maybe[date].from_mapping_by_key(
             mapping=document,
             key="birth_date",
-            value_factory=date.fromisoformat,
+            value_factory=date_from_bson,
         )
         maybe_death_date = Maybe[date].from_mapping_by_key(
             mapping=document,
@@ -110,11 +136,13 @@ class EditPersonContributionMapper:
 
         return EditPersonContribution(
             status=ContributionStatus(document["status"]),
-            created_at=datetime.fromisoformat(document["created_at"]),
+            created_at=datetime_from_bson(document["created_at"]),
             status_updated_at=status_updated_at,
-            id=EditPersonContributionId(UUID(document["id"])),
-            author_id=UserId(UUID(document["author_id"])),
-            person_id=PersonId(UUID(document["person_id"])),
+            id=EditPersonContributionId(
+                self._uuid_codec.decode(document["id"]),
+            ),
+            author_id=UserId(self._uuid_codec.decode(document["author_id"])),
+            person_id=PersonId(self._uuid_codec.decode(document["person_id"])),
             first_name=maybe_first_name,
             last_name=maybe_last_name,
             sex=maybe_sex,
@@ -130,5 +158,5 @@ class EditPersonContributionMapper:
         date_string: Optional[str],
     ) -> Optional[date]:
         if date_string:
-            return date.fromisoformat(date_string)
+            return date_from_bson(date_string)
         return None
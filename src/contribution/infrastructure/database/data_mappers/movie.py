@@ -1,26 +1,40 @@
-from typing import Any, Mapping, Optional
-from decimal import Decimal
-from datetime import date
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from typing import Any, Iterable, Mapping, Optional
 
 from contribution.domain import (
     Genre,
     MPAA,
     MovieId,
-    Money,
     Movie,
 )
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+    money_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     MovieCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    EXCLUDE_EMBEDDED_CREDITS,
+)
 from contribution.infrastructure.database.identity_maps import (
     MovieMap,
 )
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -33,13 +47,29 @@ class MovieMapper:
         movie_collection: MovieCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._movie_map = movie_map
         self._movie_collection = movie_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            movie_collection,
+        )
+        self._batch_loader = BatchLoader(
+            identity_map=movie_map,
+            collection=movie_collection,
+            unit_of_work=unit_of_work,
+            session=session,
+            uuid_codec=uuid_codec,
+            document_to_model=self._document_to_movie,
+            projection=EXCLUDE_EMBEDDED_CREDITS,
+        )
 
     async def by_id(self, id: MovieId) -> Optional[Movie]:
         movie_from_map = self._movie_map.by_id(id)
@@ -47,8 +77,9 @@ class MovieMapper:
             return movie_from_map
 
         document = await self._movie_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            EXCLUDE_EMBEDDED_CREDITS,
+            session=await self._session.get(),
         )
         if document:
             movie = self._document_to_movie(document)
@@ -63,19 +94,32 @@ class MovieMapper:
         if movie_from_map and self._movie_map.is_acquired(movie_from_map):
             return movie_from_map
 
-        document = await self._movie_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._movie_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                EXCLUDE_EMBEDDED_CREDITS,
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._movie_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                EXCLUDE_EMBEDDED_CREDITS,
+                session=await self._session.get(),
+            )
         if document:
             movie = self._document_to_movie(document)
             self._movie_map.save_acquired(movie)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(movie, document)
             self._unit_of_work.register_clean(movie)
             return movie
 
         return None
 
+    async def list_by_ids(self, ids: Iterable[MovieId]) -> list[Movie]:
+        return await self._batch_loader.load(ids)
+
     async def save(self, movie: Movie) -> None:
         self._movie_map.save(movie)
         self._unit_of_work.register_new(movie)
@@ -86,29 +130,23 @@ class MovieMapper:
     def _document_to_movie(self, document: Mapping[str, Any]) -> Movie:
         budget_as_dict = document["budget"]
         if budget_as_dict:
-            budget = Money(
-                amount=Decimal(budget_as_dict["amount"]),
-                currency=budget_as_dict["currency"],
-            )
+            budget = money_from_bson(budget_as_dict)
         else:
             budget = None
 
         revenue_as_dict = document["revenue"]
         if revenue_as_dict:
-            revenue = Money(
-                amount=Decimal(revenue_as_dict["amount"]),
-                currency=revenue_as_dict["currency"],
-            )
+            revenue = money_from_bson(revenue_as_dict)
         else:
             revenue = None
 
         return Movie(
-            id=MovieId(UUID(document["id"])),
+            id=MovieId(self._uuid_codec.decode(document["id"])),
             eng_title=document["eng_title"],
             original_title=document["original_title"],
             summary=document["summary"],
             description=document["description"],
-            release_date=date.fromisoformat(document["release_date"]),
+            release_date=date_from_bson(document["release_date"]),
             countries=document["countries"],
             genres=[Genre(genre) for genre in document["genres"]],
             mpaa=MPAA(document["mpaa"]),
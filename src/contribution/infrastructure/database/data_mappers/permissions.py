@@ -1,26 +1,33 @@
 from typing import Optional
 
-from motor.motor_asyncio import AsyncIOMotorClientSession
-
 from contribution.domain import UserId
 from contribution.infrastructure.database.collections import (
     PermissionsCollection,
 )
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 
 
 class PermissionsMapper:
+    """
+    Permissions are read and written outside of the
+    transaction of unit of work: reading them must not
+    start a transaction for requests that are denied
+    or only read data.
+    """
+
     def __init__(
         self,
         permissions_collection: PermissionsCollection,
-        session: AsyncIOMotorClientSession,
+        uuid_codec: UUIDCodec,
     ):
         self._permissions_collection = permissions_collection
-        self._session = session
+        self._uuid_codec = uuid_codec
 
     async def get(self, user_id: UserId) -> Optional[int]:
         document = await self._permissions_collection.find_one(
-            {"user_id": user_id.hex},
-            session=self._session,
+            {"user_id": self._uuid_codec.query(user_id)},
         )
         if document:
             permissions = document["permissions"]
@@ -29,6 +36,8 @@ class PermissionsMapper:
         return None
 
     async def save(self, user_id: UserId, permissions: int) -> None:
-        document = {"user_id": user_id.hex, "permissions": permissions}
+        document = {
+            "user_id": self._uuid_codec.encode(user_id),
+            "permissions": permissions,
+        }
         await self._permissions_collection.insert_one(document)
-        await self._session.commit_transaction()
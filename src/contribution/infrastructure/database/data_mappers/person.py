@@ -1,10 +1,18 @@
 from typing import Any, Iterable, Mapping, Optional
-from datetime import date
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import PersonId, Sex, Person
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.bson_values import (
+    date_from_bson,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     PersonCollection,
 )
@@ -14,6 +22,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -26,13 +38,28 @@ class PersonMapper:
         person_collection: PersonCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._person_map = person_map
         self._person_collection = person_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            person_collection,
+        )
+        self._batch_loader = BatchLoader(
+            identity_map=person_map,
+            collection=person_collection,
+            unit_of_work=unit_of_work,
+            session=session,
+            uuid_codec=uuid_codec,
+            document_to_model=self._document_to_person,
+        )
 
     async def by_id(self, id: PersonId) -> Optional[Person]:
         person_from_map = self._person_map.by_id(id)
@@ -40,8 +67,8 @@ class PersonMapper:
             return person_from_map
 
         document = await self._person_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             person = self._document_to_person(document)
@@ -56,14 +83,22 @@ class PersonMapper:
         if person_from_map and self._person_map.is_acquired(person_from_map):
             return person_from_map
 
-        document = await self._person_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._person_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._person_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             person = self._document_to_person(document)
             self._person_map.save_acquired(person)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(person, document)
             self._unit_of_work.register_clean(person)
             return person
 
@@ -73,28 +108,7 @@ class PersonMapper:
         self,
         ids: Iterable[PersonId],
     ) -> list[Person]:
-        persons_from_map = []
-        for id in ids:
-            person_from_map = self._person_map.by_id(id)
-            if not person_from_map:
-                break
-            persons_from_map.append(person_from_map)
-        else:
-            return persons_from_map
-
-        documents = await self._person_collection.find(
-            {"$in": list(ids)},
-            session=self._session,
-        ).to_list(None)
-
-        persons = []
-        for document in documents:
-            person = self._document_to_person(document)
-            self._person_map.save(person)
-            self._unit_of_work.register_clean(person)
-            persons.append(person)
-
-        return persons
+        return await self._batch_loader.load(ids)
 
     async def save(self, person: Person) -> None:
         self._person_map.save(person)
@@ -106,15 +120,15 @@ class PersonMapper:
     def _document_to_person(self, document: Mapping[str, Any]) -> Person:
         death_date_or_none = document["death_date"]
         if death_date_or_none:
-            death_date = date.fromisoformat(death_date_or_none)
+            death_date = date_from_bson(death_date_or_none)
         else:
             death_date = None
 
         return Person(
-            id=PersonId(UUID(document["id"])),
+            id=PersonId(self._uuid_codec.decode(document["id"])),
             first_name=document["first_name"],
             last_name=document["last_name"],
             sex=Sex(document["sex"]),
-            birth_date=date.fromisoformat(document["birth_date"]),
+            birth_date=date_from_bson(document["birth_date"]),
             death_date=death_date,
         )
@@ -1,12 +1,22 @@
 from typing import Any, Iterable, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import RoleId, MovieId, PersonId, Role
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     RoleCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+)
 from contribution.infrastructure.database.identity_maps import (
     RoleMap,
 )
@@ -20,22 +30,50 @@ class RoleMapper:
         self,
         role_map: RoleMap,
         role_collection: RoleCollection,
+        movie_collection: MovieCollection,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._role_map = role_map
         self._role_collection = role_collection
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._batch_loader = BatchLoader(
+                identity_map=role_map,
+                collection=movie_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_role,
+                embedded_field="roles",
+            )
+        else:
+            self._batch_loader = BatchLoader(
+                identity_map=role_map,
+                collection=role_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_role,
+            )
 
     async def by_id(self, id: RoleId) -> Optional[Role]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            roles = await self._batch_loader.load([id])
+            return roles[0] if roles else None
+
         role_from_map = self._role_map.by_id(id)
         if role_from_map:
             return role_from_map
 
         document = await self._role_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             role = self._document_to_role(document)
@@ -49,28 +87,17 @@ class RoleMapper:
         self,
         ids: Iterable[RoleId],
     ) -> list[Role]:
-        roles_from_map = []
-        for id in ids:
-            role_from_map = self._role_map.by_id(id)
-            if not role_from_map:
-                break
-            roles_from_map.append(role_from_map)
-        else:
-            return roles_from_map
-
-        documents = await self._role_collection.find(
-            {"id": {"$in": [id.hex for id in ids]}},
-            session=self._session,
-        ).to_list(None)
+        return await self._batch_loader.load(ids)
 
-        roles = []
-        for document in documents:
-            role = self._document_to_role(document)
-            self._role_map.save(role)
-            self._unit_of_work.register_clean(role)
-            roles.append(role)
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[Role]:
+        return await self._batch_loader.load_matching(
+            {"movie_id": self._uuid_codec.query(movie_id)},
+        )
 
-        return roles
+    async def list_by_person_id(self, person_id: PersonId) -> list[Role]:
+        return await self._batch_loader.load_matching(
+            {"person_id": self._uuid_codec.query(person_id)},
+        )
 
     async def save_many(self, roles: Iterable[Role]) -> None:
         for role in roles:
@@ -86,9 +113,9 @@ class RoleMapper:
 
     def _document_to_role(self, document: Mapping[str, Any]) -> Role:
         return Role(
-            id=RoleId(UUID(document["id"])),
-            movie_id=MovieId(UUID(document["movie_id"])),
-            person_id=PersonId(UUID(document["person_id"])),
+            id=RoleId(self._uuid_codec.decode(document["id"])),
+            movie_id=MovieId(self._uuid_codec.decode(document["movie_id"])),
+            person_id=PersonId(self._uuid_codec.decode(document["person_id"])),
             character=document["character"],
             importance=document["importance"],
             is_spoiler=document["is_spoiler"],
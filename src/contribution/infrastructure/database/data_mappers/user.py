@@ -1,9 +1,15 @@
-from typing import Any, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from typing import Any, Iterable, Mapping, Optional
 
 from contribution.domain import UserId, User
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
     UserCollection,
 )
@@ -13,6 +19,10 @@ from contribution.infrastructure.database.identity_maps import (
 from contribution.infrastructure.database.lock_factory import (
     MongoDBLockFactory,
 )
+from contribution.infrastructure.database.model_versions import (
+    ConcurrencyMode,
+    ModelVersions,
+)
 from contribution.infrastructure.database.unit_of_work import (
     MongoDBUnitOfWork,
 )
@@ -25,13 +35,28 @@ class UserMapper:
         user_collection: UserCollection,
         lock_factory: MongoDBLockFactory,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        model_versions: ModelVersions,
     ):
         self._user_map = user_map
         self._user_collection = user_collection
         self._lock_factory = lock_factory
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._model_versions = model_versions
+        self._concurrency_mode = model_versions.concurrency_mode(
+            user_collection,
+        )
+        self._batch_loader = BatchLoader(
+            identity_map=user_map,
+            collection=user_collection,
+            unit_of_work=unit_of_work,
+            session=session,
+            uuid_codec=uuid_codec,
+            document_to_model=self._document_to_user,
+        )
 
     async def by_id(self, id: UserId) -> Optional[User]:
         user_from_map = self._user_map.by_id(id)
@@ -39,8 +64,8 @@ class UserMapper:
             return user_from_map
 
         document = await self._user_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             user = self._document_to_user(document)
@@ -57,7 +82,7 @@ class UserMapper:
 
         document = await self._user_collection.find_one(
             {"name": name},
-            session=self._session,
+            session=await self._session.get(),
         )
         if document:
             user = self._document_to_user(document)
@@ -74,7 +99,7 @@ class UserMapper:
 
         document = await self._user_collection.find_one(
             {"email": email},
-            session=self._session,
+            session=await self._session.get(),
         )
         if document:
             user = self._document_to_user(document)
@@ -91,7 +116,7 @@ class UserMapper:
 
         document = await self._user_collection.find_one(
             {"telegram": telegram},
-            session=self._session,
+            session=await self._session.get(),
         )
         if document:
             user = self._document_to_user(document)
@@ -101,19 +126,48 @@ class UserMapper:
 
         return None
 
+    async def list_by_ids(self, ids: Iterable[UserId]) -> list[User]:
+        return await self._batch_loader.load(ids)
+
+    async def list_by_names(self, names: Iterable[str]) -> list[User]:
+        return await self._batch_loader.load_matching(
+            {"name": {"$in": list(names)}},
+        )
+
+    async def list_by_emails(self, emails: Iterable[str]) -> list[User]:
+        return await self._batch_loader.load_matching(
+            {"email": {"$in": list(emails)}},
+        )
+
+    async def list_by_telegrams(
+        self,
+        telegrams: Iterable[str],
+    ) -> list[User]:
+        return await self._batch_loader.load_matching(
+            {"telegram": {"$in": list(telegrams)}},
+        )
+
     async def acquire_by_id(self, id: UserId) -> Optional[User]:
         user_from_map = self._user_map.by_id(id)
         if user_from_map and self._user_map.is_acquired(user_from_map):
             return user_from_map
 
-        document = await self._user_collection.find_one_and_update(
-            {"id": id.hex},
-            {"$set": {"lock": self._lock_factory()}},
-            session=self._session,
-        )
+        if self._concurrency_mode is ConcurrencyMode.VERSION:
+            document = await self._user_collection.find_one(
+                {"id": self._uuid_codec.query(id)},
+                session=await self._session.get(),
+            )
+        else:
+            document = await self._user_collection.find_one_and_update(
+                {"id": self._uuid_codec.query(id)},
+                {"$set": {"lock": self._lock_factory()}},
+                session=await self._session.get(),
+            )
         if document:
             user = self._document_to_user(document)
             self._user_map.save_acquired(user)
+            if self._concurrency_mode is ConcurrencyMode.VERSION:
+                self._model_versions.save(user, document)
             self._unit_of_work.register_clean(user)
             return user
 
@@ -128,7 +182,7 @@ class UserMapper:
 
     def _document_to_user(self, document: Mapping[str, Any]) -> User:
         return User(
-            id=UserId(UUID(document["id"])),
+            id=UserId(self._uuid_codec.decode(document["id"])),
             name=document["name"],
             email=document["email"],
             telegram=document["telegram"],
@@ -1,7 +1,4 @@
 from typing import Any, Iterable, Mapping, Optional
-from uuid import UUID
-
-from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from contribution.domain import (
     Writing,
@@ -10,9 +7,22 @@ from contribution.domain import (
     PersonId,
     Writer,
 )
+from contribution.infrastructure.database.batch_loader import (
+    BatchLoader,
+)
+from contribution.infrastructure.database.session import (
+    MongoDBSession,
+)
+from contribution.infrastructure.database.uuid_codec import (
+    UUIDCodec,
+)
 from contribution.infrastructure.database.collections import (
+    MovieCollection,
     WriterCollection,
 )
+from contribution.infrastructure.database.credits_layout import (
+    CreditsLayout,
+)
 from contribution.infrastructure.database.identity_maps import (
     WriterMap,
 )
@@ -26,22 +36,50 @@ class WriterMapper:
         self,
         writer_map: WriterMap,
         writer_collection: WriterCollection,
+        movie_collection: MovieCollection,
         unit_of_work: MongoDBUnitOfWork,
-        session: AsyncIOMotorClientSession,
+        session: MongoDBSession,
+        uuid_codec: UUIDCodec,
+        credits_layout: CreditsLayout,
     ):
         self._writer_map = writer_map
         self._writer_collection = writer_collection
         self._unit_of_work = unit_of_work
         self._session = session
+        self._uuid_codec = uuid_codec
+        self._credits_layout = credits_layout
+        if credits_layout is CreditsLayout.EMBEDDED:
+            self._batch_loader = BatchLoader(
+                identity_map=writer_map,
+                collection=movie_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_writer,
+                embedded_field="writers",
+            )
+        else:
+            self._batch_loader = BatchLoader(
+                identity_map=writer_map,
+                collection=writer_collection,
+                unit_of_work=unit_of_work,
+                session=session,
+                uuid_codec=uuid_codec,
+                document_to_model=self._document_to_writer,
+            )
 
     async def by_id(self, id: WriterId) -> Optional[Writer]:
+        if self._credits_layout is CreditsLayout.EMBEDDED:
+            writers = await self._batch_loader.load([id])
+            return writers[0] if writers else None
+
         writer_from_map = self._writer_map.by_id(id)
         if writer_from_map:
             return writer_from_map
 
         document = await self._writer_collection.find_one(
-            {"id": id.hex},
-            session=self._session,
+            {"id": self._uuid_codec.query(id)},
+            session=await self._session.get(),
         )
         if document:
             role = self._document_to_writer(document)
@@ -55,28 +93,17 @@ class WriterMapper:
         self,
         ids: Iterable[WriterId],
     ) -> list[Writer]:
-        writers_from_map = []
-        for id in ids:
-            writer_from_map = self._writer_map.by_id(id)
-            if not writer_from_map:
-                break
-            writers_from_map.append(writer_from_map)
-        else:
-            return writers_from_map
-
-        documents = await self._writer_collection.find(
-            {"id": {"$in": [id.hex for id in ids]}},
-            session=self._session,
-        ).to_list(None)
+        return await self._batch_loader.load(ids)
 
-        writers = []
-        for document in documents:
-            role = self._document_to_writer(document)
-            self._writer_map.save(role)
-            self._unit_of_work.register_clean(role)
-            writers.append(role)
+    async def list_by_movie_id(self, movie_id: MovieId) -> list[Writer]:
+        return await self._batch_loader.load_matching(
+            {"movie_id": self._uuid_codec.query(movie_id)},
+        )
 
-        return writers
+    async def list_by_person_id(self, person_id: PersonId) -> list[Writer]:
+        return await self._batch_loader.load_matching(
+            {"person_id": self._uuid_codec.query(person_id)},
+        )
 
     async def save_many(self, writers: Iterable[Writer]) -> None:
         for writer in writers:
@@ -92,8 +119,8 @@ class WriterMapper:
 
     def _document_to_writer(self, document: Mapping[str, Any]) -> Writer:
         return Writer(
-            id=WriterId(UUID(document["id"])),
-            movie_id=MovieId(UUID(document["movie_id"])),
-            person_id=PersonId(UUID(document["person_id"])),
+            id=WriterId(self._uuid_codec.decode(document["id"])),
+            movie_id=MovieId(self._uuid_codec.decode(document["movie_id"])),
+            person_id=PersonId(self._uuid_codec.decode(document["person_id"])),
             writing=Writing(document["writing"]),
         )
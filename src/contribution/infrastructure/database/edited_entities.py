@@ -0,0 +1,61 @@
+from typing import Optional
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from .collections import (
+    EditMovieContributionCollection,
+    EditPersonContributionCollection,
+)
+from .uuid_codec import UUIDCodec
+
+
+class EditedEntities:
+    """
+    Finds ids of movies and persons changed by editing
+    contributions. Contribution is found by unique index
+    on `id` and only id of entity is read, which never
+    changes, so lookup needs neither transaction nor lock.
+    """
+
+    def __init__(
+        self,
+        edit_movie_contribution_collection: EditMovieContributionCollection,
+        edit_person_contribution_collection: EditPersonContributionCollection,
+        uuid_codec: UUIDCodec,
+    ):
+        self._edit_movie_contribution_collection = (
+            edit_movie_contribution_collection
+        )
+        self._edit_person_contribution_collection = (
+            edit_person_contribution_collection
+        )
+        self._uuid_codec = uuid_codec
+
+    async def movie_id_of(self, contribution_id: UUID) -> Optional[UUID]:
+        return await self._entity_id_of(
+            self._edit_movie_contribution_collection,
+            "movie_id",
+            contribution_id,
+        )
+
+    async def person_id_of(self, contribution_id: UUID) -> Optional[UUID]:
+        return await self._entity_id_of(
+            self._edit_person_contribution_collection,
+            "person_id",
+            contribution_id,
+        )
+
+    async def _entity_id_of(
+        self,
+        collection: AsyncIOMotorCollection,
+        field: str,
+        contribution_id: UUID,
+    ) -> Optional[UUID]:
+        document = await collection.find_one(
+            {"id": self._uuid_codec.query(contribution_id)},
+            {"_id": False, field: True},
+        )
+        if not document or document.get(field) is None:
+            return None
+        return self._uuid_codec.decode(document[field])
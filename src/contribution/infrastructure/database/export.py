@@ -0,0 +1,294 @@
+"""
+Export of collections into NDJSON files, one document
+per line in MongoDB Extended JSON (relaxed mode), so
+dates, binary ids and decimals survive round trip
+through `mongoimport`.
+"""
+
+import asyncio
+import gzip
+import io
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Final,
+    Iterator,
+    Mapping,
+    Optional,
+    TextIO,
+)
+
+from bson import SON, Timestamp
+from bson.json_util import RELAXED_JSON_OPTIONS, dumps
+from motor.motor_asyncio import (
+    AsyncIOMotorClientSession,
+    AsyncIOMotorDatabase,
+)
+
+from .collections import (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    permissions_collection_factory,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 1000
+
+_GZIP_LEVEL: Final = 6
+_ZSTD_LEVEL: Final = 3
+
+_COLLECTION_FACTORIES: Final = (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    permissions_collection_factory,
+)
+
+
+class ExportCompression(StrEnum):
+    """
+    * `gzip` - readable by any tool, used by default.
+    * `zstd` - several times faster at the same ratio,
+      requires `zstandard` package.
+    * `none` - plain NDJSON.
+    """
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    NONE = "none"
+
+    @property
+    def file_extension(self) -> str:
+        return {
+            ExportCompression.GZIP: ".ndjson.gz",
+            ExportCompression.ZSTD: ".ndjson.zst",
+            ExportCompression.NONE: ".ndjson",
+        }[self]
+
+
+class SnapshotIsNotSupportedError(Exception):
+    """
+    Raised when cluster time can not be obtained, i.e.
+    MongoDB is standalone server rather than replica set.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ExportResult:
+    collection_name: str
+    path: Path
+    documents: int
+    file_size: int
+
+
+def exported_collection_names(database: AsyncIOMotorDatabase) -> list[str]:
+    return [
+        collection_factory(database).name
+        for collection_factory in _COLLECTION_FACTORIES
+    ]
+
+
+async def snapshot_cluster_time(database: AsyncIOMotorDatabase) -> Timestamp:
+    """
+    Returns current cluster time. Exports given the same
+    cluster time read collections at the same point in
+    time, even if they are run by different processes.
+    """
+    reply = await database.command("ping")
+    operation_time = reply.get("operationTime")
+    if not isinstance(operation_time, Timestamp):
+        message = "Snapshot reads require MongoDB replica set"
+        raise SnapshotIsNotSupportedError(message)
+    return operation_time
+
+
+async def export_collection(
+    database: AsyncIOMotorDatabase,
+    collection_name: str,
+    directory: Path,
+    *,
+    compression: ExportCompression = ExportCompression.GZIP,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cluster_time: Optional[Timestamp] = None,
+) -> ExportResult:
+    """
+    Streams all documents of collection into
+    `<directory>/<collection_name><extension>`, holding no
+    more than two batches in memory: next batch is fetched
+    while current one is being serialized and compressed.
+    File is written under temporary name and renamed once
+    export is finished, so existing file is replaced only
+    by complete one.
+
+    If cluster time is passed, collection is read with
+    `snapshot` read concern at that time. MongoDB keeps
+    snapshot history for `minSnapshotHistoryWindowInSeconds`
+    (5 minutes by default), exports that take longer fail
+    with `SnapshotTooOld` error.
+    """
+    path = directory / f"{collection_name}{compression.file_extension}"
+    temporary_path = path.with_name(f"{path.name}.tmp")
+
+    documents = 0
+    with _open_ndjson(temporary_path, compression) as ndjson_file:
+        async for batch in _batches(
+            database,
+            collection_name,
+            batch_size=batch_size,
+            cluster_time=cluster_time,
+        ):
+            ndjson_file.writelines(
+                f"{dumps(document, json_options=RELAXED_JSON_OPTIONS)}\n"
+                for document in batch
+            )
+            documents += len(batch)
+            logger.debug(
+                "Batch of collection exported",
+                extra={
+                    "collection_name": collection_name,
+                    "documents": documents,
+                },
+            )
+
+    os.replace(temporary_path, path)
+
+    return ExportResult(
+        collection_name=collection_name,
+        path=path,
+        documents=documents,
+        file_size=path.stat().st_size,
+    )
+
+
+async def _batches(
+    database: AsyncIOMotorDatabase,
+    collection_name: str,
+    *,
+    batch_size: int,
+    cluster_time: Optional[Timestamp],
+) -> AsyncIterator[list[Mapping[str, Any]]]:
+    """
+    Yields batches of documents read by `find` and
+    `getMore` commands. Commands are sent directly,
+    because cursors of driver can't be given cluster time
+    of snapshot.
+    """
+    find_command = SON(
+        [("find", collection_name), ("batchSize", batch_size)],
+    )
+    if cluster_time is not None:
+        find_command["readConcern"] = {
+            "level": "snapshot",
+            "atClusterTime": cluster_time,
+        }
+
+    # Cursor can be continued only in session it was
+    # created in
+    async with await database.client.start_session(
+        causal_consistency=False,
+    ) as session:
+        reply = await database.command(find_command, session=session)
+        cursor = reply["cursor"]
+        batch = cursor["firstBatch"]
+
+        while True:
+            next_reply = None
+            if cursor["id"]:
+                next_reply = asyncio.ensure_future(
+                    _get_more(
+                        database,
+                        session,
+                        collection_name=collection_name,
+                        cursor_id=cursor["id"],
+                        batch_size=batch_size,
+                    ),
+                )
+            try:
+                if batch:
+                    yield batch
+            except BaseException:
+                if next_reply is not None:
+                    next_reply.cancel()
+                raise
+
+            if next_reply is None:
+                break
+            cursor = (await next_reply)["cursor"]
+            batch = cursor["nextBatch"]
+
+
+async def _get_more(
+    database: AsyncIOMotorDatabase,
+    session: AsyncIOMotorClientSession,
+    *,
+    collection_name: str,
+    cursor_id: int,
+    batch_size: int,
+) -> Mapping[str, Any]:
+    return await database.command(
+        SON(
+            [
+                ("getMore", cursor_id),
+                ("collection", collection_name),
+                ("batchSize", batch_size),
+            ],
+        ),
+        session=session,
+    )
+
+
+@contextmanager
+def _open_ndjson(
+    path: Path,
+    compression: ExportCompression,
+) -> Iterator[TextIO]:
+    if compression is ExportCompression.GZIP:
+        with gzip.open(
+            path,
+            "wt",
+            encoding="utf-8",
+            compresslevel=_GZIP_LEVEL,
+        ) as gzip_file:
+            yield gzip_file
+
+    elif compression is ExportCompression.ZSTD:
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+        with (
+            path.open("wb") as raw_file,
+            io.TextIOWrapper(
+                compressor.stream_writer(raw_file),
+                encoding="utf-8",
+            ) as zstd_file,
+        ):
+            yield zstd_file
+
+    else:
+        with path.open("w", encoding="utf-8") as ndjson_file:
+            yield ndjson_file
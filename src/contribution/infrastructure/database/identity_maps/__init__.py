@@ -1,4 +1,5 @@
 __all__ = (
+    "IdentityMap",
     "MovieMap",
     "UserMap",
     "PersonMap",
@@ -12,6 +13,7 @@ __all__ = (
     "EditPersonContributionMap",
 )
 
+from .identity_map import IdentityMap
 from .movie import MovieMap
 from .user import UserMap
 from .person import PersonMap
@@ -0,0 +1,77 @@
+from typing import Hashable, Optional, Protocol
+
+
+class _Identifiable[K: Hashable](Protocol):
+    @property
+    def id(self) -> K:
+        raise NotImplementedError
+
+
+class IdentityMap[K: Hashable, M: _Identifiable]:
+    """
+    Identity map that keeps models by their ids and
+    tracks which of them are acquired.
+
+    Example of usage::
+
+        class MovieMap(IdentityMap[MovieId, Movie]):
+            ...
+
+        movie_map = MovieMap()
+        movie_map.save_acquired(movie)
+
+        movie_map.by_id(movie.id)  # movie
+        movie_map.is_acquired(movie)  # True
+    """
+
+    __slots__ = ("_models", "_acquired_ids")
+
+    def __init__(self):
+        self._models: dict[K, M] = {}
+        self._acquired_ids: set[K] = set()
+
+    def by_id(self, id: K) -> Optional[M]:
+        return self._models.get(id)
+
+    def save(self, model: M) -> None:
+        """
+        Saves model in identity map if model doesn't
+        exist, otherwise raises Exception.
+        """
+        if model.id in self._models:
+            message = f"{type(model).__name__} already exists in identity map"
+            raise Exception(message)
+        self._models[model.id] = model
+
+    def save_acquired(self, model: M) -> None:
+        """
+        Saves model as acquired in identity map if model
+        doesn't exist or already exist and not marked as
+        acquired, otherwise raises Exception.
+        """
+        if model.id in self._acquired_ids:
+            message = (
+                f"{type(model).__name__} already exists in identity map "
+                "and marked as acquired"
+            )
+            raise Exception(message)
+
+        self._models.setdefault(model.id, model)
+        self._acquired_ids.add(model.id)
+
+    def is_acquired(self, model: M) -> bool:
+        """
+        Returns whether model is acquired if model exists
+        in identity map, otherwise raises Exception.
+        """
+        if model.id not in self._models:
+            message = f"{type(model).__name__} doesn't exist in identity map"
+            raise Exception(message)
+        return model.id in self._acquired_ids
+
+    def clear(self) -> None:
+        self._models.clear()
+        self._acquired_ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -0,0 +1,210 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from .collections import (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    moderation_queue_collection_factory,
+    processed_operation_collection_factory,
+    outbox_collection_factory,
+)
+from .processed_operations import PROCESSED_OPERATION_TTL
+from .outbox import SENT_OUTBOX_MESSAGE_TTL
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase) -> None:
+    """
+    Creates indexes of all collections if they don't
+    exist. Should be called once per process on startup,
+    collections returned by collection factories
+    expect indexes to be already created.
+    """
+    user_collection = user_collection_factory(database)
+    await user_collection.create_indexes(
+        [
+            IndexModel(["id", "name", "email"], unique=True),
+            # Serve uniqueness checks of names, emails and
+            # telegrams of new users
+            IndexModel(["name"]),
+            IndexModel(
+                ["email"],
+                partialFilterExpression={"email": {"$type": "string"}},
+            ),
+            IndexModel(
+                ["telegram"],
+                partialFilterExpression={"telegram": {"$type": "string"}},
+            ),
+        ],
+    )
+
+    movie_collection = movie_collection_factory(database)
+    await movie_collection.create_indexes(
+        [
+            IndexModel(["id"], unique=True),
+            *_embedded_credit_indexes("roles"),
+            *_embedded_credit_indexes("writers"),
+            *_embedded_credit_indexes("crew"),
+        ],
+    )
+
+    person_collection = person_collection_factory(database)
+    await person_collection.create_indexes([IndexModel(["id"], unique=True)])
+
+    role_collection = role_collection_factory(database)
+    await role_collection.create_indexes(
+        [
+            IndexModel(["id"], unique=True),
+            IndexModel(["character", "person_id"], unique=True),
+            IndexModel(["movie_id"]),
+            IndexModel(["person_id"]),
+        ],
+    )
+
+    writer_collection = writer_collection_factory(database)
+    await writer_collection.create_indexes(
+        [
+            IndexModel(["id"], unique=True),
+            # Also serves lookups by person id
+            IndexModel(["person_id", "movie_id", "writing"], unique=True),
+            IndexModel(["movie_id"]),
+        ],
+    )
+
+    crew_member_collection = crew_member_collection_factory(database)
+    await crew_member_collection.create_indexes(
+        [
+            IndexModel(["id"], unique=True),
+            IndexModel(["movie_id"]),
+            IndexModel(["person_id"]),
+        ],
+    )
+
+    add_movie_contribution_collection = (
+        add_movie_contribution_collection_factory(database)
+    )
+    await add_movie_contribution_collection.create_indexes(
+        [IndexModel(["id"], unique=True), *_contribution_page_indexes()],
+    )
+
+    edit_movie_contribution_collection = (
+        edit_movie_contribution_collection_factory(database)
+    )
+    await edit_movie_contribution_collection.create_indexes(
+        [IndexModel(["id"], unique=True), *_contribution_page_indexes()],
+    )
+
+    add_person_contribution_collection = (
+        add_person_contribution_collection_factory(database)
+    )
+    await add_person_contribution_collection.create_indexes(
+        [IndexModel(["id"], unique=True), *_contribution_page_indexes()],
+    )
+
+    edit_person_contribution_collection = (
+        edit_person_contribution_collection_factory(database)
+    )
+    await edit_person_contribution_collection.create_indexes(
+        [IndexModel(["id"], unique=True), *_contribution_page_indexes()],
+    )
+
+    moderation_queue_collection = moderation_queue_collection_factory(
+        database,
+    )
+    await moderation_queue_collection.create_indexes(
+        [IndexModel(["created_at"]), IndexModel(["kind", "created_at"])],
+    )
+
+    achievement_collection = achievement_collection_factory(database)
+    await achievement_collection.create_indexes(
+        [
+            IndexModel(["id"], unique=True),
+            IndexModel(["user_id", "achieved"], unique=True),
+        ],
+    )
+
+    processed_operation_collection = processed_operation_collection_factory(
+        database,
+    )
+    await processed_operation_collection.create_indexes(
+        [
+            IndexModel(
+                ["processed_at"],
+                expireAfterSeconds=int(
+                    PROCESSED_OPERATION_TTL.total_seconds(),
+                ),
+            ),
+        ],
+    )
+
+    outbox_collection = outbox_collection_factory(database)
+    await outbox_collection.create_indexes(
+        [
+            # Serves polling of relay
+            IndexModel(
+                ["created_at"],
+                partialFilterExpression={"sent": False},
+            ),
+            IndexModel(
+                ["sent_at"],
+                expireAfterSeconds=int(
+                    SENT_OUTBOX_MESSAGE_TTL.total_seconds(),
+                ),
+            ),
+        ],
+    )
+
+
+def _contribution_page_indexes() -> list[IndexModel]:
+    """
+    Returns indexes of contribution listing. Equality
+    fields go first and sort fields last, so pages are
+    read from index in order without in memory sort.
+    """
+    return [
+        IndexModel(
+            [
+                ("author_id", ASCENDING),
+                ("status", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ],
+        ),
+        IndexModel(
+            [
+                ("status", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ],
+        ),
+    ]
+
+
+def _embedded_credit_indexes(field: str) -> list[IndexModel]:
+    """
+    Returns indexes of credits embedded in movie documents
+    in `embedded` credits layout. Credits of movie are
+    found by unique index of movie ids. Indexes are partial,
+    so they stay empty in `collections` layout.
+    """
+    return [
+        IndexModel(
+            [f"{field}.id"],
+            unique=True,
+            partialFilterExpression={f"{field}.id": {"$exists": True}},
+        ),
+        IndexModel(
+            [f"{field}.person_id"],
+            partialFilterExpression={
+                f"{field}.person_id": {"$exists": True},
+            },
+        ),
+    ]
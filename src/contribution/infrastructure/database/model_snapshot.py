@@ -0,0 +1,64 @@
+import dataclasses
+from typing import Any, Final
+
+from contribution.domain.maybe import Maybe
+
+
+_MAYBE_WITHOUT_VALUE: Final = object()
+
+
+class ModelSnapshot:
+    """
+    Immutable snapshot of model's fields used by unit
+    of work to find out which fields of model were
+    changed since model was registered as clean.
+
+    Unlike deep copy of model, snapshot doesn't create
+    new model and new instances of nested immutable
+    values, it only stores references to field values,
+    converting mutable containers into tuples.
+    """
+
+    __slots__ = ("_field_names", "_values")
+
+    _field_names_by_model_type: dict[type, tuple[str, ...]] = {}
+
+    def __init__(self, model: Any) -> None:
+        self._field_names = self._get_field_names(type(model))
+        self._values = tuple(
+            _freeze(getattr(model, field_name))
+            for field_name in self._field_names
+        )
+
+    def changed_fields(self, model: Any) -> frozenset[str]:
+        """
+        Returns names of fields of model whose values
+        differ from ones stored in snapshot.
+        """
+        return frozenset(
+            field_name
+            for field_name, value in zip(self._field_names, self._values)
+            if _freeze(getattr(model, field_name)) != value
+        )
+
+    @classmethod
+    def _get_field_names(cls, model_type: type) -> tuple[str, ...]:
+        field_names = cls._field_names_by_model_type.get(model_type)
+        if field_names is None:
+            field_names = tuple(
+                field.name for field in dataclasses.fields(model_type)
+            )
+            cls._field_names_by_model_type[model_type] = field_names
+        return field_names
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Maybe):
+        if not value.is_set:
+            return _MAYBE_WITHOUT_VALUE
+        return (Maybe, _freeze(value.value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
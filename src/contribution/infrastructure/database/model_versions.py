@@ -0,0 +1,107 @@
+from enum import StrEnum
+from typing import Any, Mapping, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+class ConcurrencyMode(StrEnum):
+    """
+    Way data mappers protect acquired documents from
+    concurrent changes.
+
+    * `lock` - `acquire_by_id` writes lock field into
+      document, so concurrent transactions acquiring the
+      same document abort with write conflict right away.
+      Used by default.
+    * `version` - `acquire_by_id` only reads document and
+      remembers its `version` field. Committers update and
+      delete document only if version is unchanged and
+      increment it, unit of work raises
+      `ConcurrentModificationError` otherwise.
+    """
+
+    LOCK = "lock"
+    VERSION = "version"
+
+
+class ModelVersions:
+    """
+    Versions of models acquired in `version` concurrency
+    mode during one unit of work.
+
+    Example of usage::
+
+        class FooMapper:
+            def __init__(self, model_versions: ModelVersions, ...):
+                self._model_versions = model_versions
+                self._concurrency_mode = model_versions.concurrency_mode(
+                    foo_collection,
+                )
+                ...
+
+            async def acquire_by_id(self, id: FooId):
+                if self._concurrency_mode is ConcurrencyMode.VERSION:
+                    document = await self._collection.find_one(...)
+                else:
+                    document = await self._collection.find_one_and_update(
+                        ...,
+                        {"$set": {"lock": self._lock_factory()}},
+                    )
+                foo = self._document_to_foo(document)
+                if self._concurrency_mode is ConcurrencyMode.VERSION:
+                    self._model_versions.save(foo, document)
+                ...
+
+        class CommitFooCollectionChanges:
+            def write_models(self, *, dirty, ...):
+                updates = [
+                    UpdateOne(
+                        {"id": foo.id, **self._model_versions.filter(foo)},
+                        {"$set": {...}, "$inc": {"version": 1}},
+                    )
+                    for foo, dirty_fields in dirty
+                ]
+                ...
+    """
+
+    __slots__ = ("_versioned_collection_names", "_versions")
+
+    def __init__(
+        self,
+        versioned_collection_names: frozenset[str] = frozenset(),
+    ):
+        self._versioned_collection_names = versioned_collection_names
+        self._versions: dict[int, Optional[int]] = {}
+
+    def concurrency_mode(
+        self,
+        collection: AsyncIOMotorCollection,
+    ) -> ConcurrencyMode:
+        if collection.name in self._versioned_collection_names:
+            return ConcurrencyMode.VERSION
+        return ConcurrencyMode.LOCK
+
+    def save(self, model: object, document: Mapping[str, Any]) -> None:
+        """
+        Remembers version of document model was read from.
+        Documents written before versioning have no version
+        and are remembered with None version.
+        """
+        self._versions[id(model)] = document.get("version")
+
+    def is_versioned(self, model: object) -> bool:
+        return id(model) in self._versions
+
+    def filter(self, model: object) -> dict[str, Optional[int]]:
+        """
+        Returns condition that matches document of model
+        only if its version is unchanged, or empty filter if
+        model wasn't acquired in `version` mode. Condition
+        for None version matches documents without version.
+        """
+        if id(model) not in self._versions:
+            return {}
+        return {"version": self._versions[id(model)]}
+
+    def clear(self) -> None:
+        self._versions.clear()
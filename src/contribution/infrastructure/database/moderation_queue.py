@@ -0,0 +1,379 @@
+# mypy: disable-error-code="truthy-function"
+
+"""
+Moderation queue read model. Keeps one compact document
+per pending contribution in `moderation_queue` collection
+and numbers of contributions per status in
+`moderation_queue_counts` collection, projecting changes
+of contribution collections read from MongoDB change
+stream. Change streams require replica set.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Final, Mapping, Optional
+
+from motor.motor_asyncio import (
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo import ReplaceOne
+
+from contribution.domain import ContributionStatus
+from .collections import (
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    moderation_queue_collection_factory,
+    moderation_queue_counts_collection_factory,
+    projector_checkpoint_collection_factory,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 1000
+DEFAULT_CHECKPOINT_INTERVAL: Final = 100
+
+_PROJECTOR_NAME: Final = "moderation_queue"
+_MAX_AWAIT_TIME_MS: Final = 1000
+
+_COMMON_FIELDS: Final = ("id", "author_id", "status", "created_at")
+
+
+@dataclass(frozen=True, slots=True)
+class _Source:
+    kind: str
+    collection_factory: Callable[
+        [AsyncIOMotorDatabase],
+        AsyncIOMotorCollection,
+    ]
+    fields: tuple[str, ...]
+
+
+_SOURCES: Final = (
+    _Source(
+        kind="add_movie",
+        collection_factory=add_movie_contribution_collection_factory,
+        fields=("eng_title", "original_title"),
+    ),
+    _Source(
+        kind="edit_movie",
+        collection_factory=edit_movie_contribution_collection_factory,
+        fields=("movie_id",),
+    ),
+    _Source(
+        kind="add_person",
+        collection_factory=add_person_contribution_collection_factory,
+        fields=("first_name", "last_name"),
+    ),
+    _Source(
+        kind="edit_person",
+        collection_factory=edit_person_contribution_collection_factory,
+        fields=("person_id",),
+    ),
+)
+
+
+class ModerationQueueProjector:
+    """
+    Tails change stream of contribution collections and
+    applies changes to moderation queue, storing resume
+    token of last applied change every
+    `checkpoint_interval` changes and whenever stream is
+    idle. After restart changes are resumed from stored
+    token, so some of them may be applied twice: applying
+    change is idempotent, because queue documents are
+    upserted from current state of contributions and counts
+    are changed only when document enters or leaves queue.
+
+    Deleted contributions leave queue, but counts of
+    statuses other than pending don't change, since status
+    of deleted document is unknown. Contributions are never
+    deleted by application.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        self._database = database
+        self._batch_size = batch_size
+        self._checkpoint_interval = checkpoint_interval
+
+        self._queue_collection = moderation_queue_collection_factory(database)
+        self._counts_collection = moderation_queue_counts_collection_factory(
+            database,
+        )
+        self._checkpoint_collection = projector_checkpoint_collection_factory(
+            database,
+        )
+        self._sources_by_collection_name = {
+            source.collection_factory(database).name: source
+            for source in _SOURCES
+        }
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Applies changes until stop event is set. Rebuilds
+        queue first if there is no stored resume token, see
+        `rebuild` for why it should be done while
+        contributions are not changed.
+        """
+        resume_token = await self._load_resume_token()
+        if resume_token is None:
+            logger.info("Moderation queue has no checkpoint, rebuilding it")
+            resume_token = await self.rebuild()
+
+        logger.info("Moderation queue projector started")
+
+        async with self._database.watch(
+            self._pipeline(),
+            full_document="updateLookup",
+            resume_after=resume_token,
+            max_await_time_ms=_MAX_AWAIT_TIME_MS,
+            batch_size=self._batch_size,
+        ) as change_stream:
+            applied_changes = 0
+            while not stop_event.is_set() and change_stream.alive:
+                change = await change_stream.try_next()
+                if change is not None:
+                    await self.apply(change)
+                    applied_changes += 1
+
+                stream_is_idle = change is None
+                if applied_changes >= self._checkpoint_interval or (
+                    stream_is_idle
+                    and change_stream.resume_token != resume_token
+                ):
+                    resume_token = change_stream.resume_token
+                    await self._save_resume_token(resume_token)
+                    applied_changes = 0
+
+            if change_stream.resume_token != resume_token:
+                await self._save_resume_token(change_stream.resume_token)
+
+        logger.info("Moderation queue projector stopped")
+
+    async def rebuild(self) -> Optional[Mapping[str, Any]]:
+        """
+        Recreates queue and counts from contribution
+        collections, reading pending contributions in
+        batches, and returns stored resume token. Token is
+        taken before collections are read, so next `run`
+        applies changes made during rebuild again. Queue
+        documents stay correct, but counts don't: status
+        change already seen by `count_documents` is counted
+        twice. Rebuild should be run while contributions
+        are not changed, e.g. with web API and event
+        consumer stopped.
+        """
+        async with self._database.watch(
+            self._pipeline(),
+            max_await_time_ms=1,
+        ) as change_stream:
+            await change_stream.try_next()
+            resume_token = change_stream.resume_token
+
+        await self._queue_collection.delete_many({})
+        await self._counts_collection.delete_many({})
+
+        for source in _SOURCES:
+            await self._rebuild_source(source)
+
+        await self._save_resume_token(resume_token)
+        logger.info("Moderation queue rebuilt")
+
+        return resume_token
+
+    async def apply(self, change: Mapping[str, Any]) -> None:
+        source = self._sources_by_collection_name[change["ns"]["coll"]]
+        document_id = change["documentKey"]["_id"]
+        document = change.get("fullDocument")
+
+        # Full document is None if contribution was deleted
+        # before update was looked up
+        if change["operationType"] == "delete" or document is None:
+            delete_result = await self._queue_collection.delete_one(
+                {"_id": document_id},
+            )
+            if delete_result.deleted_count:
+                await self._increment_counts(
+                    source,
+                    {ContributionStatus.PENDING: -1},
+                )
+            return
+
+        status = ContributionStatus(document["status"])
+        if status is ContributionStatus.PENDING:
+            update_result = await self._queue_collection.replace_one(
+                {"_id": document_id},
+                _queue_document(source, document),
+                upsert=True,
+            )
+            if update_result.upserted_id is not None:
+                await self._increment_counts(source, {status: 1})
+            return
+
+        delete_result = await self._queue_collection.delete_one(
+            {"_id": document_id},
+        )
+        if delete_result.deleted_count:
+            await self._increment_counts(
+                source,
+                {ContributionStatus.PENDING: -1, status: 1},
+            )
+        elif change["operationType"] == "insert":
+            await self._increment_counts(source, {status: 1})
+
+    async def _rebuild_source(self, source: _Source) -> None:
+        collection = source.collection_factory(self._database)
+        projection = dict.fromkeys(
+            ("_id", *_COMMON_FIELDS, *source.fields),
+            True,
+        )
+
+        # Pending contributions are read in order of
+        # `(status, created_at, _id)` index of listing
+        queued = 0
+        last_document: Optional[Mapping[str, Any]] = None
+        while True:
+            filter: dict[str, Any] = {"status": ContributionStatus.PENDING}
+            if last_document is not None:
+                filter["$or"] = [
+                    {"created_at": {"$gt": last_document["created_at"]}},
+                    {
+                        "created_at": last_document["created_at"],
+                        "_id": {"$gt": last_document["_id"]},
+                    },
+                ]
+
+            cursor = collection.find(
+                filter,
+                projection,
+                sort=[("created_at", 1), ("_id", 1)],
+                limit=self._batch_size,
+            )
+            documents = await cursor.to_list(None)
+            if not documents:
+                break
+
+            last_document = documents[-1]
+            await self._queue_collection.bulk_write(
+                [
+                    ReplaceOne(
+                        {"_id": document["_id"]},
+                        _queue_document(source, document),
+                        upsert=True,
+                    )
+                    for document in documents
+                ],
+                ordered=False,
+            )
+            queued += len(documents)
+
+        counts: dict[str, int] = {
+            status: await collection.count_documents({"status": status})
+            for status in ContributionStatus
+        }
+        await self._counts_collection.replace_one(
+            {"_id": source.kind},
+            counts,
+            upsert=True,
+        )
+
+        logger.debug(
+            "Contributions of moderation queue rebuilt",
+            extra={"kind": source.kind, "queued": queued, "counts": counts},
+        )
+
+    async def _increment_counts(
+        self,
+        source: _Source,
+        increments: Mapping[ContributionStatus, int],
+    ) -> None:
+        await self._counts_collection.update_one(
+            {"_id": source.kind},
+            {"$inc": dict(increments)},
+            upsert=True,
+        )
+
+    async def _load_resume_token(self) -> Optional[Mapping[str, Any]]:
+        checkpoint = await self._checkpoint_collection.find_one(
+            {"_id": _PROJECTOR_NAME},
+        )
+        if checkpoint:
+            return checkpoint["resume_token"]
+        return None
+
+    async def _save_resume_token(
+        self,
+        resume_token: Optional[Mapping[str, Any]],
+    ) -> None:
+        await self._checkpoint_collection.replace_one(
+            {"_id": _PROJECTOR_NAME},
+            {
+                "resume_token": resume_token,
+                "updated_at": datetime.now(timezone.utc),
+            },
+            upsert=True,
+        )
+        logger.debug(
+            "Moderation queue checkpoint saved",
+            extra={"resume_token": resume_token},
+        )
+
+    def _pipeline(self) -> list[dict[str, Any]]:
+        """
+        Returns change stream pipeline that passes only
+        changes of contribution documents with fields of
+        queue documents, so movie credits and photos are
+        not sent to projector.
+        """
+        fields = {
+            field for source in _SOURCES for field in source.fields
+        }.union(_COMMON_FIELDS)
+
+        return [
+            {
+                "$match": {
+                    "ns.coll": {"$in": list(self._sources_by_collection_name)},
+                    "operationType": {
+                        "$in": ["insert", "update", "replace", "delete"],
+                    },
+                },
+            },
+            {
+                "$project": {
+                    "operationType": True,
+                    "ns": True,
+                    "documentKey": True,
+                    **{
+                        f"fullDocument.{field}": True
+                        for field in sorted(fields)
+                    },
+                },
+            },
+        ]
+
+
+def _queue_document(
+    source: _Source,
+    document: Mapping[str, Any],
+) -> dict[str, Any]:
+    queue_document = {
+        "kind": source.kind,
+        "contribution_id": document["id"],
+        "author_id": document["author_id"],
+        "created_at": document["created_at"],
+    }
+    for field in source.fields:
+        queue_document[field] = document.get(field)
+
+    return queue_document
@@ -1,32 +1,79 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
-    AsyncIOMotorClientSession,
     AsyncIOMotorDatabase,
 )
 
-from .config import MongoDBConfig
+from contribution.infrastructure.operation_id.round_trips import (
+    MongoDBCommandCounter,
+)
+from .config import MongoDBConfig, MongoDBClientOptions
+from .pool_metrics import MongoDBPoolMetrics
+from .session import MongoDBSession
+from .uuid_codec import UUIDCodec
+from .model_versions import ModelVersions
+from .credits_layout import CreditsLayout
 
 
 def motor_client_factory(
     mongodb_config: MongoDBConfig,
+    pool_metrics: MongoDBPoolMetrics,
 ) -> AsyncIOMotorClient:
     return AsyncIOMotorClient(
         host=mongodb_config.url,
         port=mongodb_config.port,
+        event_listeners=[MongoDBCommandCounter(), pool_metrics],
+        **_client_options_to_kwargs(mongodb_config.client_options),
     )
 
 
 async def motor_session_factory(
     motor_client: AsyncIOMotorClient,
-) -> AsyncGenerator[AsyncIOMotorClientSession, None]:
-    async with await motor_client.start_session() as motor_session:
-        async with motor_session.start_transaction():
-            yield motor_session
+) -> AsyncGenerator[MongoDBSession, None]:
+    session = MongoDBSession(motor_client)
+    try:
+        yield session
+    finally:
+        await session.end()
 
 
 def motor_database_factory(
-    motor_session: AsyncIOMotorClientSession,
+    motor_client: AsyncIOMotorClient,
 ) -> AsyncIOMotorDatabase:
-    return motor_session.client.get_database("contribution")
+    return motor_client.get_database("contribution")
+
+
+def uuid_codec_factory(mongodb_config: MongoDBConfig) -> UUIDCodec:
+    return UUIDCodec(mongodb_config.uuid_representation)
+
+
+def model_versions_factory(mongodb_config: MongoDBConfig) -> ModelVersions:
+    return ModelVersions(mongodb_config.versioned_collections)
+
+
+def credits_layout_factory(mongodb_config: MongoDBConfig) -> CreditsLayout:
+    return mongodb_config.credits_layout
+
+
+def _client_options_to_kwargs(
+    client_options: MongoDBClientOptions,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "maxPoolSize": client_options.max_pool_size,
+        "minPoolSize": client_options.min_pool_size,
+    }
+    if client_options.max_idle_time_ms is not None:
+        kwargs["maxIdleTimeMS"] = client_options.max_idle_time_ms
+    if client_options.wait_queue_timeout_ms is not None:
+        kwargs["waitQueueTimeoutMS"] = client_options.wait_queue_timeout_ms
+    if client_options.compressors:
+        kwargs["compressors"] = ",".join(client_options.compressors)
+    if client_options.read_concern is not None:
+        kwargs["readConcernLevel"] = client_options.read_concern
+    if client_options.write_concern is not None:
+        write_concern = client_options.write_concern
+        kwargs["w"] = (
+            int(write_concern) if write_concern.isdigit() else write_concern
+        )
+    return kwargs
@@ -0,0 +1,75 @@
+# mypy: disable-error-code="arg-type"
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Final, Iterable, Optional
+
+from pymongo import InsertOne
+from pymongo.results import BulkWriteResult
+
+from contribution.application import OperationId
+from .collections import OutboxCollection
+from .session import MongoDBSession
+
+
+# Sent messages are kept for a while to investigate
+# deliveries, unsent messages never expire
+SENT_OUTBOX_MESSAGE_TTL: Final = timedelta(days=1)
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    routing_key: str
+    body: str
+    operation_id: OperationId
+    created_at: datetime
+
+
+class Outbox:
+    """
+    Writes messages of operation into `outbox` collection.
+    Messages are written by unit of work in transaction of
+    changes of operation and published by outbox relay
+    after commit, so messages of rolled back operations
+    are never published.
+    """
+
+    def __init__(
+        self,
+        collection: OutboxCollection,
+        session: MongoDBSession,
+    ):
+        self._collection = collection
+        self._session = session
+
+    async def record(
+        self,
+        messages: Iterable[OutboxMessage],
+    ) -> Optional[BulkWriteResult]:
+        write_models = self.write_models(messages)
+        if not write_models:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=write_models,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        messages: Iterable[OutboxMessage],
+    ) -> list[InsertOne]:
+        return [
+            InsertOne(
+                {
+                    "routing_key": message.routing_key,
+                    "body": message.body,
+                    "operation_id": message.operation_id,
+                    "created_at": message.created_at,
+                    "sent": False,
+                    "sent_at": None,
+                },
+                namespace=self._collection.full_name,
+            )
+            for message in messages
+        ]
@@ -0,0 +1,176 @@
+import bisect
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Final
+
+from pymongo.monitoring import (
+    ConnectionPoolListener,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionReadyEvent,
+    ConnectionClosedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckedInEvent,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of checkout wait time buckets in milliseconds,
+# waits longer than the last bound go to the overflow bucket
+CHECKOUT_WAIT_BUCKETS_MS: Final = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+_SLOW_CHECKOUT_MS: Final = 100
+
+
+@dataclass(frozen=True, slots=True)
+class MongoDBPoolStats:
+    checkouts: int
+    failed_checkouts: dict[str, int]
+    total_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+
+    # Counts of checkouts per bucket of `CHECKOUT_WAIT_BUCKETS_MS`,
+    # last count is for waits longer than the last bound
+    checkout_wait_histogram: tuple[int, ...]
+
+    open_connections: int
+    checked_out_connections: int
+
+    @property
+    def mean_checkout_wait_ms(self) -> float:
+        if not self.checkouts:
+            return 0
+        return self.total_checkout_wait_ms / self.checkouts
+
+
+class MongoDBPoolMetrics(ConnectionPoolListener):
+    """
+    Collects how long operations wait for connection from
+    MongoDB client pool. Growing waits and failed checkouts
+    mean pool is too small for load of process.
+
+    Events are published from driver threads, so
+    counters are guarded by lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._failed_checkouts: Counter[str] = Counter()
+        self._total_checkout_wait_ms = 0.0
+        self._max_checkout_wait_ms = 0.0
+        self._checkout_wait_histogram = [0] * (
+            len(CHECKOUT_WAIT_BUCKETS_MS) + 1
+        )
+        self._open_connections = 0
+        self._checked_out_connections = 0
+
+    def stats(self) -> MongoDBPoolStats:
+        with self._lock:
+            return MongoDBPoolStats(
+                checkouts=self._checkouts,
+                failed_checkouts=dict(self._failed_checkouts),
+                total_checkout_wait_ms=self._total_checkout_wait_ms,
+                max_checkout_wait_ms=self._max_checkout_wait_ms,
+                checkout_wait_histogram=tuple(self._checkout_wait_histogram),
+                open_connections=self._open_connections,
+                checked_out_connections=self._checked_out_connections,
+            )
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(
+            "MongoDB pool stats",
+            extra={
+                "checkouts": stats.checkouts,
+                "failed_checkouts": stats.failed_checkouts,
+                "mean_checkout_wait_ms": stats.mean_checkout_wait_ms,
+                "max_checkout_wait_ms": stats.max_checkout_wait_ms,
+                "checkout_wait_buckets_ms": CHECKOUT_WAIT_BUCKETS_MS,
+                "checkout_wait_histogram": stats.checkout_wait_histogram,
+                "open_connections": stats.open_connections,
+            },
+        )
+
+    def connection_checked_out(
+        self,
+        event: ConnectionCheckedOutEvent,
+    ) -> None:
+        wait_ms = (event.duration or 0) * 1000
+        bucket = bisect.bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)
+
+        with self._lock:
+            self._checkouts += 1
+            self._checked_out_connections += 1
+            self._total_checkout_wait_ms += wait_ms
+            self._max_checkout_wait_ms = max(
+                self._max_checkout_wait_ms,
+                wait_ms,
+            )
+            self._checkout_wait_histogram[bucket] += 1
+
+        if wait_ms >= _SLOW_CHECKOUT_MS:
+            logger.debug(
+                "Slow MongoDB connection checkout",
+                extra={
+                    "address": event.address,
+                    "wait_ms": wait_ms,
+                },
+            )
+
+    def connection_check_out_failed(
+        self,
+        event: ConnectionCheckOutFailedEvent,
+    ) -> None:
+        with self._lock:
+            self._failed_checkouts[event.reason] += 1
+
+        logger.warning(
+            "MongoDB connection checkout failed",
+            extra={
+                "address": event.address,
+                "reason": event.reason,
+                "wait_ms": (event.duration or 0) * 1000,
+            },
+        )
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._checked_out_connections -= 1
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._open_connections += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._open_connections -= 1
+
+    def connection_check_out_started(
+        self,
+        event: ConnectionCheckOutStartedEvent,
+    ) -> None:
+        ...
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None:
+        ...
+
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        ...
+
+    def pool_ready(self, event: PoolReadyEvent) -> None:
+        ...
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        ...
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        ...
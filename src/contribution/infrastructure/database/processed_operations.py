@@ -0,0 +1,78 @@
+# mypy: disable-error-code="arg-type"
+
+from datetime import datetime, timedelta, timezone
+from typing import Final, Iterable, Optional
+
+from pymongo import InsertOne
+from pymongo.results import BulkWriteResult
+
+from .collections import ProcessedOperationCollection
+from .session import MongoDBSession
+
+
+# Redelivered messages are expected within minutes, ledger
+# keeps operations much longer to cover outages of consumer
+PROCESSED_OPERATION_TTL: Final = timedelta(days=7)
+
+
+class ProcessedOperations:
+    """
+    Ledger of consumed messages whose changes were
+    committed. Messages are recorded by id of message, not
+    by operation id, because one operation can publish
+    several messages. Messages are recorded by unit of work
+    in transaction of their changes and expire after
+    `PROCESSED_OPERATION_TTL`, so redelivered message can
+    be skipped after one lookup by `_id`.
+    """
+
+    def __init__(
+        self,
+        collection: ProcessedOperationCollection,
+        session: MongoDBSession,
+    ):
+        self._collection = collection
+        self._session = session
+
+    async def is_processed(self, message_id: str) -> bool:
+        document = await self._collection.find_one(
+            {"_id": message_id},
+            projection={"_id": True},
+        )
+        return document is not None
+
+    async def processed_among(
+        self,
+        message_ids: Iterable[str],
+    ) -> set[str]:
+        cursor = self._collection.find(
+            {"_id": {"$in": list(message_ids)}},
+            projection={"_id": True},
+        )
+        return {document["_id"] async for document in cursor}
+
+    async def record(
+        self,
+        message_ids: Iterable[str],
+    ) -> Optional[BulkWriteResult]:
+        write_models = self.write_models(message_ids)
+        if not write_models:
+            return None
+
+        return await self._collection.bulk_write(
+            requests=write_models,
+            session=await self._session.get(),
+        )
+
+    def write_models(
+        self,
+        message_ids: Iterable[str],
+    ) -> list[InsertOne]:
+        processed_at = datetime.now(timezone.utc)
+        return [
+            InsertOne(
+                {"_id": message_id, "processed_at": processed_at},
+                namespace=self._collection.full_name,
+            )
+            for message_id in message_ids
+        ]
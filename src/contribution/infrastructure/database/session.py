@@ -0,0 +1,86 @@
+# mypy: disable-error-code="truthy-function, unreachable"
+
+from typing import Optional
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorClientSession,
+)
+
+
+class MongoDBSession:
+    """
+    Lazy MongoDB session. Session and transaction are
+    started on first call of `get` method, so requests
+    that fail early or only read data outside of the
+    transaction don't start them at all.
+
+    Example of usage::
+
+        class FooMapper:
+            def __init__(
+                self,
+                collection: AsyncIOMotorCollection,
+                session: MongoDBSession,
+            ):
+                self._collection = collection
+                self._session = session
+
+            async def by_id(self, id: int):
+                document = await self._collection.find_one(
+                    {"id": id},
+                    session=await self._session.get(),
+                )
+                ...
+    """
+
+    def __init__(self, motor_client: AsyncIOMotorClient):
+        self._motor_client = motor_client
+        self._motor_session: Optional[AsyncIOMotorClientSession] = None
+
+    @property
+    def client(self) -> AsyncIOMotorClient:
+        return self._motor_client
+
+    async def get(self) -> AsyncIOMotorClientSession:
+        """
+        Returns motor session, starting session and
+        transaction if they were not started yet or
+        starting new transaction if previous one was
+        committed or aborted.
+        """
+        if not self._motor_session:
+            self._motor_session = await self._motor_client.start_session()
+        if not self._motor_session.in_transaction:
+            self._motor_session.start_transaction()
+        return self._motor_session
+
+    async def commit_transaction(self) -> None:
+        if self._motor_session and self._motor_session.in_transaction:
+            await self._motor_session.commit_transaction()
+
+    async def retry_commit_transaction(self) -> None:
+        """
+        Commits last transaction again after its commit
+        failed with unknown result. MongoDB applies
+        transaction only once, so retrying commit of
+        already applied transaction is safe.
+        """
+        if self._motor_session:
+            await self._motor_session.commit_transaction()
+
+    async def abort_transaction(self) -> None:
+        if self._motor_session and self._motor_session.in_transaction:
+            await self._motor_session.abort_transaction()
+
+    async def end(self) -> None:
+        """
+        Aborts transaction if it wasn't committed and
+        ends session.
+        """
+        if not self._motor_session:
+            return
+
+        await self.abort_transaction()
+        await self._motor_session.end_session()
+        self._motor_session = None
@@ -0,0 +1,122 @@
+import logging
+import random
+from collections import Counter
+from typing import Final, Optional
+
+from pymongo.errors import PyMongoError
+
+from contribution.application import ConcurrentModificationError
+from .config import MongoDBConfig
+
+
+logger = logging.getLogger(__name__)
+
+_TRANSIENT_TRANSACTION_ERROR_LABEL: Final = "TransientTransactionError"
+_UNKNOWN_COMMIT_RESULT_ERROR_LABEL: Final = "UnknownTransactionCommitResult"
+
+
+class TransactionRetryMetrics:
+    """
+    Counters of transaction retries by reason, shared by
+    all operations of process. Growing counters show
+    contention on documents.
+    """
+
+    __slots__ = ("retries", "exhausted")
+
+    def __init__(self):
+        self.retries: Counter[str] = Counter()
+        self.exhausted: Counter[str] = Counter()
+
+
+class MongoDBTransactionRetryPolicy:
+    """
+    Retries operations aborted with `TransientTransactionError`
+    label or `ConcurrentModificationError`, and commits
+    failed with `UnknownTransactionCommitResult` label, as
+    MongoDB drivers recommend. Delays grow exponentially
+    from base delay up to max delay and are fully jittered,
+    so conflicting operations don't retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        metrics: TransactionRetryMetrics,
+    ):
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._metrics = metrics
+
+    def operation_retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+    ) -> Optional[float]:
+        if isinstance(error, ConcurrentModificationError):
+            reason = "concurrent_modification"
+        elif _has_error_label(error, _TRANSIENT_TRANSACTION_ERROR_LABEL):
+            reason = "transient_transaction_error"
+        else:
+            return None
+
+        return self._retry_delay(reason, attempt)
+
+    def commit_retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+    ) -> Optional[float]:
+        if not _has_error_label(error, _UNKNOWN_COMMIT_RESULT_ERROR_LABEL):
+            return None
+
+        return self._retry_delay("unknown_transaction_commit_result", attempt)
+
+    def _retry_delay(self, reason: str, attempt: int) -> Optional[float]:
+        if attempt >= self._max_attempts:
+            self._metrics.exhausted[reason] += 1
+            logger.warning(
+                "Transaction retry attempts exhausted",
+                extra={
+                    "reason": reason,
+                    "attempts": attempt,
+                    "exhausted_total": self._metrics.exhausted[reason],
+                },
+            )
+            return None
+
+        max_delay = min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, max_delay)  # noqa: S311
+
+        self._metrics.retries[reason] += 1
+        logger.debug(
+            "Transaction will be retried",
+            extra={
+                "reason": reason,
+                "attempt": attempt,
+                "delay_ms": delay * 1000,
+                "retries_total": self._metrics.retries[reason],
+            },
+        )
+
+        return delay
+
+
+def transaction_retry_policy_factory(
+    mongodb_config: MongoDBConfig,
+    metrics: TransactionRetryMetrics,
+) -> MongoDBTransactionRetryPolicy:
+    return MongoDBTransactionRetryPolicy(
+        max_attempts=mongodb_config.transaction_max_attempts,
+        base_delay=mongodb_config.transaction_retry_base_delay,
+        max_delay=mongodb_config.transaction_retry_max_delay,
+        metrics=metrics,
+    )
+
+
+def _has_error_label(error: Exception, label: str) -> bool:
+    return isinstance(error, PyMongoError) and error.has_error_label(label)
@@ -1,9 +1,20 @@
-# mypy: disable-error-code="arg-type"
+# mypy: disable-error-code="arg-type, attr-defined"
 
-import copy
-from typing import Protocol, Sequence, Union
+import time
+import logging
+from typing import (
+    Final,
+    NoReturn,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Union,
+)
 
-from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany
+from pymongo.errors import ClientBulkWriteException
+from pymongo.results import BulkWriteResult
 
 from contribution.domain import (
     Movie,
@@ -19,6 +30,29 @@ from contribution.domain import (
     EditPersonContribution,
     Achievement,
 )
+from contribution.application import (
+    OperationId,
+    ConcurrentModificationError,
+)
+from .model_snapshot import ModelSnapshot
+from .session import MongoDBSession
+from .processed_operations import ProcessedOperations
+from .outbox import Outbox, OutboxMessage
+from .model_versions import ModelVersions
+from .identity_maps import (
+    IdentityMap,
+    UserMap,
+    MovieMap,
+    PersonMap,
+    RoleMap,
+    WriterMap,
+    CrewMemberMap,
+    AddMovieContributionMap,
+    EditMovieContributionMap,
+    AddPersonContributionMap,
+    EditPersonContributionMap,
+    AchievementMap,
+)
 from .collection_committers import (
     CommitUserCollectionChanges,
     CommitMovieCollectionChanges,
@@ -34,6 +68,12 @@ from .collection_committers import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Client level bulk write was added in MongoDB 8.0
+_CLIENT_BULK_WRITE_MIN_WIRE_VERSION: Final = 25
+
+
 type AnyModel = Union[
     Movie,
     User,
@@ -49,19 +89,47 @@ type AnyModel = Union[
     Achievement,
 ]
 
+# New, changed and deleted models of one type
+type _ModelChanges = tuple[
+    list[AnyModel],
+    list[tuple[AnyModel, frozenset[str]]],
+    list[AnyModel],
+]
+
 
 class CommitCollectionChanges[M: AnyModel](Protocol):
     async def __call__(
         self,
         *,
         new: Sequence[M],
-        clean: Sequence[M],
-        dirty: Sequence[M],
+        dirty: Sequence[tuple[M, Set[str]]],
         deleted: Sequence[M],
-    ) -> None:
+    ) -> Optional[BulkWriteResult]:
+        raise NotImplementedError
+
+    def write_models(
+        self,
+        *,
+        new: Sequence[M],
+        dirty: Sequence[tuple[M, Set[str]]],
+        deleted: Sequence[M],
+    ) -> Sequence[Union[InsertOne, UpdateOne, DeleteOne, DeleteMany]]:
+        """
+        Returns write models with namespace of committer's
+        collection, so they can be sent both by collection
+        and client level bulk write.
+        """
         raise NotImplementedError
 
 
+class DeferredCommitsAreRolledBackError(Exception):
+    """
+    Raised on rollback of unit of work with deferred
+    commits, because changes of previous operations are
+    discarded together with changes of failed one.
+    """
+
+
 class MongoDBUnitOfWork:
     def __init__(
         self,
@@ -88,7 +156,22 @@ class MongoDBUnitOfWork:
         commit_achievement_collection_changes: (
             CommitAchievementCollectionChanges
         ),
-        session: AsyncIOMotorClientSession,
+        user_map: UserMap,
+        movie_map: MovieMap,
+        person_map: PersonMap,
+        role_map: RoleMap,
+        writer_map: WriterMap,
+        crew_member_map: CrewMemberMap,
+        add_movie_contribution_map: AddMovieContributionMap,
+        edit_movie_contribution_map: EditMovieContributionMap,
+        add_person_contribution_map: AddPersonContributionMap,
+        edit_person_contribution_map: EditPersonContributionMap,
+        achievement_map: AchievementMap,
+        processed_operations: ProcessedOperations,
+        outbox: Outbox,
+        session: MongoDBSession,
+        operation_id: OperationId,
+        model_versions: ModelVersions,
     ):
         self._collection_changes_commiters: dict[
             type[AnyModel],
@@ -114,10 +197,39 @@ class MongoDBUnitOfWork:
             ),
             Achievement: commit_achievement_collection_changes,
         }
+        self._write_error_handlers = {
+            User: commit_user_collection_changes.on_write_error,
+        }
+        self._identity_maps: tuple[IdentityMap, ...] = (
+            user_map,
+            movie_map,
+            person_map,
+            role_map,
+            writer_map,
+            crew_member_map,
+            add_movie_contribution_map,
+            edit_movie_contribution_map,
+            add_person_contribution_map,
+            edit_person_contribution_map,
+            achievement_map,
+        )
+        self._processed_operations = processed_operations
+        self._outbox = outbox
         self._session = session
+        self._operation_id = operation_id
+        self._model_versions = model_versions
+
+        # Changes are written, but commit of transaction
+        # failed with unknown result
+        self._commit_is_pending = False
+        self._commits_are_deferred = False
+        # Survive rollbacks, because operations are
+        # processed again after them
+        self._processed_message_ids: list[str] = []
+        self._outbox_messages: list[OutboxMessage] = []
 
         self._new: dict[type[AnyModel], dict[int, AnyModel]] = {}
-        self._clean: dict[type[AnyModel], dict[int, AnyModel]] = {}
+        self._clean: dict[type[AnyModel], dict[int, ModelSnapshot]] = {}
         self._dirty: dict[type[AnyModel], dict[int, AnyModel]] = {}
         self._deleted: dict[type[AnyModel], dict[int, AnyModel]] = {}
 
@@ -137,7 +249,7 @@ class MongoDBUnitOfWork:
         if not clean_models:
             self._clean[type(model)] = {}
 
-        self._clean[type(model)][model_id] = copy.deepcopy(model)
+        self._clean[type(model)][model_id] = ModelSnapshot(model)
 
     def register_dirty(self, model: AnyModel) -> None:
         model_id = id(model)
@@ -178,28 +290,370 @@ class MongoDBUnitOfWork:
 
         self._deleted[type(model)][model_id] = model
 
+    def register_processed_message(self, message_id: str) -> None:
+        """
+        Makes next commit record consumed message in ledger
+        of processed operations in the same transaction as
+        changes made by message.
+        """
+        self._processed_message_ids.append(message_id)
+
+    def register_outbox_message(self, message: OutboxMessage) -> None:
+        """
+        Makes next commit write message into outbox in the
+        same transaction as changes of operation. Messages
+        are forgotten on rollback, because they are
+        registered again when operation is processed again.
+        """
+        self._outbox_messages.append(message)
+
+    def defer_commits(self) -> None:
+        """
+        Makes `commit` keep registered changes until
+        `commit_deferred` is called, so changes of several
+        operations are written in one transaction. Rollback
+        of any of operations raises
+        `DeferredCommitsAreRolledBackError`.
+        """
+        self._commits_are_deferred = True
+
+    async def commit_deferred(self) -> None:
+        self._commits_are_deferred = False
+        await self.commit()
+
     async def commit(self) -> None:
-        model_types = (
-            User,
-            Movie,
-            Person,
-            Role,
-            Writer,
-            CrewMember,
-            AddMovieContribution,
-            EditMovieContribution,
-            AddPersonContribution,
-            EditPersonContribution,
-            Achievement,
-        )
-        for model_type in model_types:
-            await self._collection_changes_commiters[model_type](
-                new=self._new.get(model_type, {}).values(),
-                clean=self._clean.get(model_type, {}).values(),
-                dirty=self._dirty.get(model_type, {}).values(),
-                deleted=self._deleted.get(model_type, {}).values(),
+        """
+        Writes changes of all collections in one client
+        level bulk write if every known server supports it,
+        otherwise writes changes of each collection in
+        separate bulk write. Collections without changes
+        are skipped.
+
+        Raises `ConcurrentModificationError` if some of
+        models acquired in `version` concurrency mode were
+        changed or deleted by another operation.
+
+        If previous commit wrote changes but failed to
+        commit transaction, only commits transaction again.
+        """
+        if self._commits_are_deferred:
+            return
+
+        if self._commit_is_pending:
+            await self._session.retry_commit_transaction()
+            self._commit_is_pending = False
+            self._processed_message_ids.clear()
+            self._outbox_messages.clear()
+            return
+
+        changes: dict[type[AnyModel], _ModelChanges] = {}
+        for model_type in self._collection_changes_commiters:
+            new = list(self._new.get(model_type, {}).values())
+            dirty = self._changed_models(model_type)
+            deleted = list(self._deleted.get(model_type, {}).values())
+
+            if new or dirty or deleted:
+                changes[model_type] = (new, dirty, deleted)
+
+        versioned_model_types = self._versioned_model_types(changes)
+
+        if self._supports_client_bulk_write():
+            (
+                durations,
+                matched_counts,
+            ) = await self._write_changes_in_one_bulk_write(
+                changes,
+                count_matches=bool(versioned_model_types),
             )
+        else:
+            (
+                durations,
+                matched_counts,
+            ) = await self._write_changes_by_collection(changes)
+
+        await self._ensure_versioned_models_matched(
+            changes,
+            versioned_model_types,
+            matched_counts,
+        )
+
+        self._commit_is_pending = True
+        started_at = time.perf_counter()
         await self._session.commit_transaction()
+        commit_duration = time.perf_counter() - started_at
+        self._commit_is_pending = False
+        self._processed_message_ids.clear()
+        outbox_messages_count = len(self._outbox_messages)
+        self._outbox_messages.clear()
+
+        logger.debug(
+            "Unit of work changes committed",
+            extra={
+                "operation_id": self._operation_id,
+                "collections": {
+                    model_type.__name__: {
+                        "new": len(new),
+                        "dirty": len(dirty),
+                        "deleted": len(deleted),
+                    }
+                    for model_type, (new, dirty, deleted) in changes.items()
+                },
+                "write_durations_ms": durations,
+                "commit_transaction_duration_ms": commit_duration * 1000,
+                "outbox_messages": outbox_messages_count,
+            },
+        )
+
+    async def rollback(self) -> None:
+        """
+        Aborts transaction and forgets registered changes,
+        models in identity maps and their versions, so next
+        attempt of operation reads documents again in new
+        transaction.
+        """
+        await self._session.abort_transaction()
+
+        self._new.clear()
+        self._clean.clear()
+        self._dirty.clear()
+        self._deleted.clear()
+        self._outbox_messages.clear()
+        self._model_versions.clear()
+        for identity_map in self._identity_maps:
+            identity_map.clear()
+
+        self._commit_is_pending = False
+
+        if self._commits_are_deferred:
+            raise DeferredCommitsAreRolledBackError()
+
+    async def _write_changes_in_one_bulk_write(
+        self,
+        changes: dict[type[AnyModel], _ModelChanges],
+        *,
+        count_matches: bool,
+    ) -> tuple[dict[str, float], dict[type[AnyModel], int]]:
+        """
+        Returns durations of writes and numbers of documents
+        matched by updates and deletes of each model type.
+        Matches are counted only if `count_matches` is
+        true, because they require results of every write.
+        """
+        write_models = []
+        write_model_types = []
+
+        for model_type, (new, dirty, deleted) in changes.items():
+            commit_collection_changes = self._collection_changes_commiters[
+                model_type
+            ]
+            collection_write_models = commit_collection_changes.write_models(
+                new=new,
+                dirty=dirty,
+                deleted=deleted,
+            )
+            write_models.extend(collection_write_models)
+            write_model_types.extend(
+                [model_type] * len(collection_write_models),
+            )
+
+        write_models.extend(
+            self._processed_operations.write_models(
+                self._processed_message_ids,
+            ),
+        )
+        write_models.extend(self._outbox.write_models(self._outbox_messages))
+
+        if not write_models:
+            return {}, {}
+
+        started_at = time.perf_counter()
+        try:
+            result = await self._session.client.bulk_write(
+                write_models,
+                session=await self._session.get(),
+                verbose_results=count_matches,
+            )
+        except ClientBulkWriteException as error:
+            await self._on_client_bulk_write_error(error, write_model_types)
+        duration = time.perf_counter() - started_at
+
+        matched_counts: dict[type[AnyModel], int] = {}
+        if count_matches:
+            # Results are keyed by index of write model,
+            # writes of processed operations and outbox
+            # messages are inserts and have no results here
+            write_results = [
+                *(
+                    (index, update_result.matched_count)
+                    for index, update_result in result.update_results.items()
+                ),
+                *(
+                    (index, delete_result.deleted_count)
+                    for index, delete_result in result.delete_results.items()
+                ),
+            ]
+            for index, count in write_results:
+                model_type = write_model_types[index]
+                matched_counts[model_type] = (
+                    matched_counts.get(model_type, 0) + count
+                )
+
+        return {"client_bulk_write": duration * 1000}, matched_counts
+
+    async def _write_changes_by_collection(
+        self,
+        changes: dict[type[AnyModel], _ModelChanges],
+    ) -> tuple[dict[str, float], dict[type[AnyModel], int]]:
+        """
+        Returns durations of writes and numbers of documents
+        matched by updates and deletes of each model type.
+        """
+        durations = {}
+        matched_counts: dict[type[AnyModel], int] = {}
+
+        for model_type, (new, dirty, deleted) in changes.items():
+            started_at = time.perf_counter()
+            result = await self._collection_changes_commiters[model_type](
+                new=new,
+                dirty=dirty,
+                deleted=deleted,
+            )
+            duration = time.perf_counter() - started_at
+            durations[model_type.__name__] = duration * 1000
+
+            if result:
+                matched_counts[model_type] = (
+                    result.matched_count + result.deleted_count
+                )
+
+        if self._processed_message_ids:
+            started_at = time.perf_counter()
+            await self._processed_operations.record(
+                self._processed_message_ids,
+            )
+            duration = time.perf_counter() - started_at
+            durations["processed_operations"] = duration * 1000
+
+        if self._outbox_messages:
+            started_at = time.perf_counter()
+            await self._outbox.record(self._outbox_messages)
+            duration = time.perf_counter() - started_at
+            durations["outbox"] = duration * 1000
+
+        return durations, matched_counts
+
+    def _versioned_model_types(
+        self,
+        changes: dict[type[AnyModel], _ModelChanges],
+    ) -> set[type[AnyModel]]:
+        """
+        Returns types of models with updates or deletes
+        conditional on version.
+        """
+        return {
+            model_type
+            for model_type, (_, dirty, deleted) in changes.items()
+            if any(
+                self._model_versions.is_versioned(model)
+                for model in [*(model for model, _ in dirty), *deleted]
+            )
+        }
+
+    async def _ensure_versioned_models_matched(
+        self,
+        changes: dict[type[AnyModel], _ModelChanges],
+        versioned_model_types: set[type[AnyModel]],
+        matched_counts: dict[type[AnyModel], int],
+    ) -> None:
+        """
+        Aborts transaction and raises
+        `ConcurrentModificationError` if updates and deletes
+        of model type with versioned models matched fewer
+        documents than were sent. Collections of versioned
+        models are changed by one update or delete per
+        model, so every write must match one document.
+        Models changed without version condition are
+        acquired with lock in the same transaction, so
+        missing matches are caused by moved versions.
+        """
+        for model_type in versioned_model_types:
+            _, dirty, deleted = changes[model_type]
+            expected_matched_count = len(dirty) + len(deleted)
+            matched_count = matched_counts.get(model_type, 0)
+            if matched_count >= expected_matched_count:
+                continue
+
+            await self._session.abort_transaction()
+
+            logger.debug(
+                "Versioned models were changed concurrently",
+                extra={
+                    "operation_id": self._operation_id,
+                    "model_type": model_type.__name__,
+                    "expected_matched_count": expected_matched_count,
+                    "matched_count": matched_count,
+                },
+            )
+
+            raise ConcurrentModificationError()
+
+    async def _on_client_bulk_write_error(
+        self,
+        error: ClientBulkWriteException,
+        write_model_types: list[type[AnyModel]],
+    ) -> NoReturn:
+        if not error.write_errors:
+            raise error
+
+        failed_write_model_index = error.details["writeErrors"][0]["idx"]
+        # Writes of processed operations and outbox messages
+        # follow writes of models and have no handlers
+        if failed_write_model_index >= len(write_model_types):
+            raise error
+        failed_model_type = write_model_types[failed_write_model_index]
+
+        on_write_error = self._write_error_handlers.get(failed_model_type)
+        if not on_write_error:
+            raise error
+
+        await on_write_error(error)
+
+    def _supports_client_bulk_write(self) -> bool:
+        known_servers = self._session.client.topology_description.known_servers
+        if not known_servers:
+            return False
+
+        return all(
+            server.max_wire_version >= _CLIENT_BULK_WRITE_MIN_WIRE_VERSION
+            for server in known_servers
+        )
+
+    def _changed_models(
+        self,
+        model_type: type[AnyModel],
+    ) -> list[tuple[AnyModel, frozenset[str]]]:
+        """
+        Returns dirty models of model type whose fields
+        were actually changed, together with names of
+        changed fields.
+        """
+        clean_models = self._clean.get(model_type, {})
+        changed_models = []
+
+        for model_id, model in self._dirty.get(model_type, {}).items():
+            snapshot = clean_models.get(model_id)
+            if not snapshot:
+                message = (
+                    f"{model_type.__name__} was registered as dirty "
+                    "without being registered as clean"
+                )
+                raise Exception(message)
+
+            changed_fields = snapshot.changed_fields(model)
+            if changed_fields:
+                changed_models.append((model, changed_fields))
+
+        return changed_models
 
     def __repr__(self) -> str:
         return (
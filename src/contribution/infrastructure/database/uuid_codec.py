@@ -0,0 +1,92 @@
+from enum import StrEnum
+from typing import Any, Iterable, Union
+from uuid import UUID
+
+from bson import Binary
+
+
+class UUIDRepresentation(StrEnum):
+    """
+    Representation of UUIDs in MongoDB documents.
+
+    * `hex` - 32-char hex strings, used by default.
+    * `binary` - BSON binary subtype 4, takes 16 bytes
+      instead of 32 in documents and index keys.
+    * `mixed` - writes UUIDs as BSON binary but matches
+      both representations in queries. Should be used
+      while existing documents are being migrated with
+      `contribution migrate-uuids` command.
+    """
+
+    HEX = "hex"
+    BINARY = "binary"
+    MIXED = "mixed"
+
+
+class UUIDCodec:
+    """
+    Converts UUIDs to values stored in MongoDB documents
+    and back. Decoding accepts both representations, so
+    documents written before changing representation are
+    still read.
+
+    Example of usage::
+
+        class FooMapper:
+            def __init__(self, uuid_codec: UUIDCodec, ...):
+                self._uuid_codec = uuid_codec
+                ...
+
+            async def by_id(self, id: FooId):
+                document = await self._collection.find_one(
+                    {"id": self._uuid_codec.query(id)},
+                )
+                ...
+                return Foo(id=FooId(self._uuid_codec.decode(document["id"])))
+    """
+
+    __slots__ = ("_representation",)
+
+    def __init__(
+        self,
+        representation: UUIDRepresentation = UUIDRepresentation.HEX,
+    ):
+        self._representation = representation
+
+    @property
+    def representation(self) -> UUIDRepresentation:
+        return self._representation
+
+    def encode(self, uuid: UUID) -> Union[str, Binary]:
+        if self._representation is UUIDRepresentation.HEX:
+            return uuid.hex
+        return Binary.from_uuid(uuid)
+
+    def decode(self, value: Union[str, Binary, UUID]) -> UUID:
+        if isinstance(value, str):
+            return UUID(hex=value)
+        if isinstance(value, Binary):
+            return value.as_uuid()
+        return value
+
+    def query(self, uuid: UUID) -> Any:
+        """
+        Returns value that matches documents with uuid in
+        equality conditions of filters.
+        """
+        if self._representation is UUIDRepresentation.MIXED:
+            return {"$in": [Binary.from_uuid(uuid), uuid.hex]}
+        return self.encode(uuid)
+
+    def query_many(self, uuids: Iterable[UUID]) -> dict[str, list[Any]]:
+        """
+        Returns `$in` condition that matches documents with
+        any of uuids.
+        """
+        if self._representation is UUIDRepresentation.MIXED:
+            values: list[Any] = []
+            for uuid in uuids:
+                values.append(Binary.from_uuid(uuid))
+                values.append(uuid.hex)
+            return {"$in": values}
+        return {"$in": [self.encode(uuid) for uuid in uuids]}
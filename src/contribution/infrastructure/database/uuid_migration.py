@@ -0,0 +1,259 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Final, Mapping, Optional
+
+from bson import Binary
+from motor.motor_asyncio import (
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo import UpdateOne
+
+from .collections import (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    permissions_collection_factory,
+)
+from .uuid_codec import UUIDCodec
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 1000
+
+_UUID_FIELD_NAMES: Final = frozenset(
+    ["id", "user_id", "movie_id", "person_id", "author_id"],
+)
+_UUID_LIST_FIELD_NAMES: Final = frozenset(
+    ["roles_to_remove", "writers_to_remove", "crew_to_remove"],
+)
+_COLLECTION_FACTORIES: Final = (
+    user_collection_factory,
+    movie_collection_factory,
+    person_collection_factory,
+    role_collection_factory,
+    writer_collection_factory,
+    crew_member_collection_factory,
+    add_movie_contribution_collection_factory,
+    edit_movie_contribution_collection_factory,
+    add_person_contribution_collection_factory,
+    edit_person_contribution_collection_factory,
+    achievement_collection_factory,
+    permissions_collection_factory,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionSize:
+    name: str
+    documents: int
+    average_document_size: int
+    data_size: int
+    index_sizes: Mapping[str, int]
+
+    @property
+    def total_index_size(self) -> int:
+        return sum(self.index_sizes.values())
+
+
+@dataclass(frozen=True, slots=True)
+class UUIDMigrationResult:
+    collection_name: str
+    scanned: int
+    converted: int
+    skipped: int
+
+
+async def collection_sizes(
+    database: AsyncIOMotorDatabase,
+) -> list[CollectionSize]:
+    """
+    Returns document and index sizes of existing
+    collections in bytes.
+    """
+    existing_collection_names = await database.list_collection_names()
+
+    sizes = []
+    for collection_factory in _COLLECTION_FACTORIES:
+        collection = collection_factory(database)
+        if collection.name not in existing_collection_names:
+            continue
+
+        cursor = collection.aggregate([{"$collStats": {"storageStats": {}}}])
+        collection_stats = await cursor.to_list(None)
+        storage_stats = collection_stats[0]["storageStats"]
+
+        size = CollectionSize(
+            name=collection.name,
+            documents=storage_stats["count"],
+            average_document_size=storage_stats.get("avgObjSize", 0),
+            data_size=storage_stats["size"],
+            index_sizes=storage_stats["indexSizes"],
+        )
+        sizes.append(size)
+
+    return sizes
+
+
+async def migrate_uuids(
+    database: AsyncIOMotorDatabase,
+    *,
+    uuid_codec: UUIDCodec,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause: float = 0,
+) -> list[UUIDMigrationResult]:
+    """
+    Rewrites UUIDs of all collections into representation
+    of uuid codec. Documents are read in batches ordered by
+    `_id` and updated by one unordered bulk write per batch
+    outside of transaction, so migration can run while
+    application is serving requests.
+
+    Every update is conditional on converted fields being
+    unchanged since they were read. Documents changed in
+    the meantime are skipped and counted, running migration
+    again converts them. Application should use `mixed`
+    UUID representation until migration is finished.
+    """
+    results = []
+    for collection_factory in _COLLECTION_FACTORIES:
+        result = await _migrate_collection(
+            collection_factory(database),
+            uuid_codec=uuid_codec,
+            batch_size=batch_size,
+            pause=pause,
+        )
+        results.append(result)
+
+    return results
+
+
+async def _migrate_collection(
+    collection: AsyncIOMotorCollection,
+    *,
+    uuid_codec: UUIDCodec,
+    batch_size: int,
+    pause: float,
+) -> UUIDMigrationResult:
+    scanned = 0
+    converted = 0
+    skipped = 0
+    last_document_id: Optional[Any] = None
+
+    while True:
+        if last_document_id is None:
+            filter = {}
+        else:
+            filter = {"_id": {"$gt": last_document_id}}
+
+        cursor = collection.find(filter, sort=[("_id", 1)], limit=batch_size)
+        documents = await cursor.to_list(None)
+        if not documents:
+            break
+
+        scanned += len(documents)
+        last_document_id = documents[-1]["_id"]
+
+        updates = []
+        for document in documents:
+            converted_fields = _converted_fields(document, uuid_codec)
+            if not converted_fields:
+                continue
+            update_filter = {"_id": document["_id"]}
+            for field_name in converted_fields:
+                update_filter[field_name] = document[field_name]
+            updates.append(
+                UpdateOne(update_filter, {"$set": converted_fields}),
+            )
+
+        if updates:
+            bulk_write_result = await collection.bulk_write(
+                updates,
+                ordered=False,
+            )
+            converted += bulk_write_result.modified_count
+            skipped += len(updates) - bulk_write_result.matched_count
+
+        logger.debug(
+            "Batch of documents migrated",
+            extra={
+                "collection": collection.name,
+                "scanned": scanned,
+                "converted": converted,
+                "skipped": skipped,
+            },
+        )
+
+        if pause:
+            await asyncio.sleep(pause)
+
+    return UUIDMigrationResult(
+        collection_name=collection.name,
+        scanned=scanned,
+        converted=converted,
+        skipped=skipped,
+    )
+
+
+def _converted_fields(
+    document: Mapping[str, Any],
+    uuid_codec: UUIDCodec,
+) -> dict[str, Any]:
+    """
+    Returns top level fields of document whose values
+    contain UUIDs in other representation, converted
+    into representation of uuid codec.
+    """
+    converted_fields = {}
+    for field_name, value in document.items():
+        if field_name == "_id":
+            continue
+        converted_value = _convert_value(field_name, value, uuid_codec)
+        if converted_value != value:
+            converted_fields[field_name] = converted_value
+
+    return converted_fields
+
+
+def _convert_value(
+    field_name: Optional[str],
+    value: Any,
+    uuid_codec: UUIDCodec,
+) -> Any:
+    if field_name in _UUID_FIELD_NAMES and _is_uuid(value):
+        return uuid_codec.encode(uuid_codec.decode(value))
+    if field_name in _UUID_LIST_FIELD_NAMES and isinstance(value, list):
+        return [
+            uuid_codec.encode(uuid_codec.decode(item))
+            if _is_uuid(item)
+            else item
+            for item in value
+        ]
+    if isinstance(value, list):
+        return [_convert_value(None, item, uuid_codec) for item in value]
+    if isinstance(value, dict):
+        return {
+            nested_field_name: _convert_value(
+                nested_field_name,
+                nested_value,
+                uuid_codec,
+            )
+            for nested_field_name, nested_value in value.items()
+        }
+    return value
+
+
+def _is_uuid(value: Any) -> bool:
+    if isinstance(value, Binary):
+        return value.subtype == 4
+    return isinstance(value, str) and len(value) == 32
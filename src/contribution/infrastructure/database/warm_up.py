@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import time
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from .config import MongoDBConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_motor_client(
+    motor_client: AsyncIOMotorClient,
+    mongodb_config: MongoDBConfig,
+) -> None:
+    """
+    Opens min pool size connections by running as many
+    concurrent pings, so first requests after startup
+    don't pay for server selection, TCP and TLS handshakes
+    and authentication. Should be awaited before process
+    reports it is ready.
+    """
+    connections = max(mongodb_config.client_options.min_pool_size, 1)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(motor_client.admin.command("ping") for _ in range(connections)),
+    )
+    duration = time.perf_counter() - started_at
+
+    logger.info(
+        "MongoDB client warmed up",
+        extra={
+            "connections": connections,
+            "duration_ms": duration * 1000,
+        },
+    )
@@ -11,6 +11,8 @@ from contribution.infrastructure.di.common_providers import (
     unit_of_work_provider_factory,
     data_mappers_provider_factory,
     application_services_provider_factory,
+    round_trips_provider_factory,
+    aio_pika_provider_factory,
 )
 from .providers import (
     cli_configs_provider_factory,
@@ -32,6 +34,8 @@ def cli_ioc_container_factory() -> AsyncContainer:
         unit_of_work_provider_factory(),
         data_mappers_provider_factory(),
         cli_operation_id_provider_factory(),
+        round_trips_provider_factory(),
+        aio_pika_provider_factory(),
         application_services_provider_factory(),
         cli_command_processors_provider_factory(),
     )
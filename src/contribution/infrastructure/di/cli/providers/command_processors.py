@@ -8,6 +8,9 @@ from contribution.application import (
     update_movie_factory,
     create_person_factory,
     update_person_factory,
+    import_users_factory,
+    import_movies_factory,
+    import_persons_factory,
 )
 
 
@@ -20,5 +23,8 @@ def cli_command_processors_provider_factory() -> Provider:
     provider.provide(update_movie_factory)
     provider.provide(create_person_factory)
     provider.provide(update_person_factory)
+    provider.provide(import_users_factory)
+    provider.provide(import_movies_factory)
+    provider.provide(import_persons_factory)
 
     return provider
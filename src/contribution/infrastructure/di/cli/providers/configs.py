@@ -1,11 +1,21 @@
 from dishka import Provider, Scope
 
-from contribution.infrastructure.database import mongodb_config_from_env
+from contribution.infrastructure.database import (
+    MongoDBClientProfile,
+    MongoDBConfig,
+    mongodb_config_from_env,
+)
+from contribution.infrastructure.message_broker import rabbitmq_config_from_env
 
 
 def cli_configs_provider_factory() -> Provider:
     provider = Provider(Scope.APP)
 
-    provider.provide(mongodb_config_from_env)
+    provider.provide(_mongodb_config_factory)
+    provider.provide(rabbitmq_config_from_env)
 
     return provider
+
+
+def _mongodb_config_factory() -> MongoDBConfig:
+    return mongodb_config_from_env(MongoDBClientProfile.CLI)
@@ -15,6 +15,7 @@ __all__ = (
     "web_api_identity_provider_provider_factory",
     "event_publishers_provider_factory",
     "application_services_provider_factory",
+    "round_trips_provider_factory",
 )
 
 from .domain_validators import domain_validators_provider_factory
@@ -32,3 +33,4 @@ from .cache import cache_provider_factory
 from .permissions_storage import permissions_storage_provider_factory
 from .event_publishers import event_publishers_provider_factory
 from .application_services import application_services_provider_factory
+from .round_trips import round_trips_provider_factory
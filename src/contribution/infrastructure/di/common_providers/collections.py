@@ -13,11 +13,13 @@ from contribution.infrastructure.database import (
     edit_person_contribution_collection_factory,
     achievement_collection_factory,
     permissions_collection_factory,
+    processed_operation_collection_factory,
+    outbox_collection_factory,
 )
 
 
 def collections_provider_factory() -> Provider:
-    provider = Provider(Scope.REQUEST)
+    provider = Provider(Scope.APP)
 
     provider.provide(user_collection_factory)
     provider.provide(movie_collection_factory)
@@ -31,5 +33,7 @@ def collections_provider_factory() -> Provider:
     provider.provide(edit_person_contribution_collection_factory)
     provider.provide(achievement_collection_factory)
     provider.provide(permissions_collection_factory)
+    provider.provide(processed_operation_collection_factory)
+    provider.provide(outbox_collection_factory)
 
     return provider
@@ -12,6 +12,7 @@ from contribution.application import (
     EditMovieContributionGateway,
     AddPersonContributionGateway,
     EditPersonContributionGateway,
+    ContributionSummaryGateway,
 )
 from contribution.infrastructure.database import (
     UserMapper,
@@ -26,6 +27,7 @@ from contribution.infrastructure.database import (
     EditPersonContributionMapper,
     AchievementMapper,
     PermissionsMapper,
+    ContributionSummaryMapper,
 )
 
 
@@ -56,5 +58,9 @@ def data_mappers_provider_factory() -> Provider:
     )
     provider.provide(AchievementMapper, provides=AchievementGateway)
     provider.provide(PermissionsMapper)
+    provider.provide(
+        ContributionSummaryMapper,
+        provides=ContributionSummaryGateway,
+    )
 
     return provider
@@ -1,17 +1,25 @@
 from dishka import Provider, Scope
 
 from contribution.infrastructure.database import (
+    MongoDBPoolMetrics,
     motor_client_factory,
     motor_session_factory,
     motor_database_factory,
+    uuid_codec_factory,
+    model_versions_factory,
+    credits_layout_factory,
 )
 
 
 def motor_provider_factory() -> Provider:
     provider = Provider(Scope.REQUEST)
 
+    provider.provide(MongoDBPoolMetrics, scope=Scope.APP)
     provider.provide(motor_client_factory, scope=Scope.APP)
+    provider.provide(motor_database_factory, scope=Scope.APP)
+    provider.provide(uuid_codec_factory, scope=Scope.APP)
+    provider.provide(credits_layout_factory, scope=Scope.APP)
+    provider.provide(model_versions_factory)
     provider.provide(motor_session_factory)
-    provider.provide(motor_database_factory)
 
     return provider
@@ -0,0 +1,13 @@
+from dishka import Provider, Scope
+
+from contribution.infrastructure.operation_id.round_trips import (
+    count_operation_round_trips,
+)
+
+
+def round_trips_provider_factory() -> Provider:
+    provider = Provider(Scope.REQUEST)
+
+    provider.decorate(count_operation_round_trips)
+
+    return provider
@@ -1,7 +1,14 @@
 from dishka import Provider, Scope, AnyOf
 
-from contribution.application import UnitOfWork
-from contribution.infrastructure.database import MongoDBUnitOfWork
+from contribution.application import UnitOfWork, TransactionRetryPolicy
+from contribution.infrastructure.database import (
+    MongoDBUnitOfWork,
+    ProcessedOperations,
+    Outbox,
+    TransactionRetryMetrics,
+    MongoDBTransactionRetryPolicy,
+    transaction_retry_policy_factory,
+)
 
 
 def unit_of_work_provider_factory() -> Provider:
@@ -11,5 +18,13 @@ def unit_of_work_provider_factory() -> Provider:
         MongoDBUnitOfWork,
         provides=AnyOf[UnitOfWork, MongoDBUnitOfWork],
     )
+    provider.provide(ProcessedOperations)
+    provider.provide(Outbox)
+    provider.provide(TransactionRetryMetrics, scope=Scope.APP)
+    provider.provide(
+        transaction_retry_policy_factory,
+        scope=Scope.APP,
+        provides=AnyOf[TransactionRetryPolicy, MongoDBTransactionRetryPolicy],
+    )
 
     return provider
@@ -13,12 +13,14 @@ from contribution.infrastructure.di.common_providers import (
     data_mappers_provider_factory,
     event_publishers_provider_factory,
     application_services_provider_factory,
+    round_trips_provider_factory,
 )
 from .providers import (
     event_consumer_configs_provider_factory,
     faststream_provider_factory,
     event_consumer_operation_id_provider_factory,
     event_consumer_command_processors_provider_factory,
+    event_consumer_lanes_provider_factory,
 )
 
 
@@ -37,8 +39,10 @@ def event_consumer_ioc_container_factory() -> AsyncContainer:
         data_mappers_provider_factory(),
         faststream_provider_factory(),
         event_consumer_operation_id_provider_factory(),
+        round_trips_provider_factory(),
         event_publishers_provider_factory(),
         application_services_provider_factory(),
         event_consumer_command_processors_provider_factory(),
+        event_consumer_lanes_provider_factory(),
     )
     return ioc_container
@@ -3,6 +3,7 @@ __all__ = (
     "faststream_provider_factory",
     "event_consumer_operation_id_provider_factory",
     "event_consumer_command_processors_provider_factory",
+    "event_consumer_lanes_provider_factory",
 )
 
 from .configs import event_consumer_configs_provider_factory
@@ -11,3 +12,4 @@ from .operation_id import event_consumer_operation_id_provider_factory
 from .command_providers import (
     event_consumer_command_processors_provider_factory,
 )
+from .lanes import event_consumer_lanes_provider_factory
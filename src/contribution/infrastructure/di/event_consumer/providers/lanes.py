@@ -0,0 +1,11 @@
+from dishka import Provider, Scope
+
+from contribution.infrastructure.database import EditedEntities
+
+
+def event_consumer_lanes_provider_factory() -> Provider:
+    provider = Provider(Scope.APP)
+
+    provider.provide(EditedEntities)
+
+    return provider
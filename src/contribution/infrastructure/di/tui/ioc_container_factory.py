@@ -11,6 +11,7 @@ from contribution.infrastructure.di.common_providers import (
     unit_of_work_provider_factory,
     data_mappers_provider_factory,
     application_services_provider_factory,
+    round_trips_provider_factory,
 )
 from .providers import (
     tui_configs_provider_factory,
@@ -32,6 +33,7 @@ def tui_ioc_container_factory() -> AsyncContainer:
         unit_of_work_provider_factory(),
         data_mappers_provider_factory(),
         tui_operation_id_provider_factory(),
+        round_trips_provider_factory(),
         application_services_provider_factory(),
         tui_command_processors_provider_factory(),
     )
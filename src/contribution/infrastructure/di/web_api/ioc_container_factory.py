@@ -16,6 +16,7 @@ from contribution.infrastructure.di.common_providers import (
     permissions_storage_provider_factory,
     event_publishers_provider_factory,
     application_services_provider_factory,
+    round_trips_provider_factory,
 )
 from .providers import (
     web_api_configs_provider_factory,
@@ -45,6 +46,7 @@ def web_api_ioc_container_factory() -> AsyncContainer:
         fastapi_provider_factory(),
         web_api_identity_provider_provider_factory(),
         web_api_operation_id_provider_factory(),
+        round_trips_provider_factory(),
         event_publishers_provider_factory(),
         application_services_provider_factory(),
         web_api_command_processors_provider_factory(),
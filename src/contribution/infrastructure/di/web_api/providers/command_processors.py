@@ -2,9 +2,15 @@ from dishka import Provider, Scope
 
 from contribution.application import (
     add_movie_factory,
+    add_movies_factory,
     edit_movie_factory,
     add_person_factory,
+    add_persons_factory,
     edit_person_factory,
+    list_add_movie_contributions_factory,
+    list_edit_movie_contributions_factory,
+    list_add_person_contributions_factory,
+    list_edit_person_contributions_factory,
 )
 
 
@@ -12,8 +18,14 @@ def web_api_command_processors_provider_factory() -> Provider:
     provider = Provider(Scope.REQUEST)
 
     provider.provide(add_movie_factory)
+    provider.provide(add_movies_factory)
     provider.provide(edit_movie_factory)
     provider.provide(add_person_factory)
+    provider.provide(add_persons_factory)
     provider.provide(edit_person_factory)
+    provider.provide(list_add_movie_contributions_factory)
+    provider.provide(list_edit_movie_contributions_factory)
+    provider.provide(list_add_person_contributions_factory)
+    provider.provide(list_edit_person_contributions_factory)
 
     return provider
@@ -1,6 +1,10 @@
 from dishka import Provider, Scope
 
-from contribution.infrastructure.database import mongodb_config_from_env
+from contribution.infrastructure.database import (
+    MongoDBClientProfile,
+    MongoDBConfig,
+    mongodb_config_from_env,
+)
 from contribution.infrastructure.cache import redis_config_from_env
 from contribution.infrastructure.message_broker import rabbitmq_config_from_env
 
@@ -8,8 +12,12 @@ from contribution.infrastructure.message_broker import rabbitmq_config_from_env
 def web_api_configs_provider_factory() -> Provider:
     provider = Provider(Scope.APP)
 
-    provider.provide(mongodb_config_from_env)
+    provider.provide(_mongodb_config_factory)
     provider.provide(redis_config_from_env)
     provider.provide(rabbitmq_config_from_env)
 
     return provider
+
+
+def _mongodb_config_factory() -> MongoDBConfig:
+    return mongodb_config_from_env(MongoDBClientProfile.WEB_API)
@@ -28,6 +28,9 @@ class RawIdentityProvider:
     async def for_contribution(self) -> int:
         return 2
 
+    async def for_moderation(self) -> int:
+        return 4
+
     def _ensure_user_is_authenticated(self) -> UserId:
         if not self._user_id:
             raise UserIsNotAuthenticatedError()
@@ -44,3 +44,6 @@ class PermissionsStorage:
 
     async def for_contribution(self) -> int:
         return 2
+
+    async def for_moderation(self) -> int:
+        return 4
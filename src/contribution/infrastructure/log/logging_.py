@@ -7,9 +7,11 @@ from .json_formatter import JsonFormatter
 def setup_logging() -> None:
     loggers: list[logging.Logger] = []
     for logger_name in logging.root.manager.loggerDict:
-        if _is_command_processor_logger(
-            logger_name,
-        ) or _is_operation_id_factory_logger(logger_name):
+        if (
+            _is_command_processor_logger(logger_name)
+            or _is_operation_id_factory_logger(logger_name)
+            or _is_database_logger(logger_name)
+        ):
             logger = logging.getLogger(logger_name)
             loggers.append(logger)
 
@@ -32,3 +34,9 @@ def _is_operation_id_factory_logger(logger_name: str) -> bool:
     return logger_name.startswith(
         "contribution.infrastructure.operation_id.",
     )
+
+
+def _is_database_logger(logger_name: str) -> bool:
+    return logger_name.startswith(
+        "contribution.infrastructure.database.",
+    )
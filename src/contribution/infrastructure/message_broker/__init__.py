@@ -3,9 +3,28 @@ from .event_publishers import *
 from .config import (
     RabbitMQConfig as RabbitMQConfig,
     rabbitmq_config_from_env as rabbitmq_config_from_env,
+    EventBatchingConfig as EventBatchingConfig,
+    event_batching_config_from_env as event_batching_config_from_env,
+    EventConsumptionConfig as EventConsumptionConfig,
+    event_consumption_config_from_env as event_consumption_config_from_env,
 )
 from .aio_pika_ import (
     aio_pika_connection_factory as aio_pika_connection_factory,
-    aio_pika_channel_factory as aio_pika_channel_factory,
-    aio_pika_exchange_factory as aio_pika_exchange_factory,
+    aio_pika_channel_pool_factory as aio_pika_channel_pool_factory,
+)
+from .channel_pool import (
+    PooledChannel as PooledChannel,
+    AioPikaChannelPoolStats as AioPikaChannelPoolStats,
+    AioPikaChannelPoolMetrics as AioPikaChannelPoolMetrics,
+    AioPikaChannelPool as AioPikaChannelPool,
+)
+from .confirming_publisher import (
+    ConfirmMode as ConfirmMode,
+    OutgoingMessage as OutgoingMessage,
+    PublishOutcome as PublishOutcome,
+    ConfirmingPublisher as ConfirmingPublisher,
+)
+from .outbox_relay import (
+    OutboxRelayMetrics as OutboxRelayMetrics,
+    OutboxRelay as OutboxRelay,
 )
@@ -1,27 +1,33 @@
 from typing import AsyncGenerator
 
-from aio_pika import Connection, Channel, Exchange, connect_robust
+from aio_pika import connect_robust
+from aio_pika.abc import AbstractRobustConnection
 
 from .config import RabbitMQConfig
+from .channel_pool import AioPikaChannelPoolMetrics, AioPikaChannelPool
 
 
 async def aio_pika_connection_factory(
     rabbitmq_config: RabbitMQConfig,
-) -> Connection:
-    return await connect_robust(url=rabbitmq_config.url)
-
-
-async def aio_pika_channel_factory(
-    aio_pika_connection: Connection,
-) -> AsyncGenerator[Channel, None]:
-    channel = await aio_pika_connection.channel()
+) -> AsyncGenerator[AbstractRobustConnection, None]:
+    connection = await connect_robust(url=rabbitmq_config.url)
     try:
-        yield channel
+        yield connection
     finally:
-        await channel.close()
+        await connection.close()
 
 
-async def aio_pika_exchange_factory(
-    aio_pika_channel: Channel,
-) -> Exchange:
-    return await aio_pika_channel.get_exchange("contribution")
+async def aio_pika_channel_pool_factory(
+    aio_pika_connection: AbstractRobustConnection,
+    rabbitmq_config: RabbitMQConfig,
+    metrics: AioPikaChannelPoolMetrics,
+) -> AsyncGenerator[AioPikaChannelPool, None]:
+    channel_pool = AioPikaChannelPool(
+        connection=aio_pika_connection,
+        metrics=metrics,
+        max_size=rabbitmq_config.channel_pool_size,
+    )
+    try:
+        yield channel_pool
+    finally:
+        await channel_pool.close()
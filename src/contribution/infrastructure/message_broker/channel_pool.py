@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Final
+
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractRobustConnection,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL_POOL_SIZE: Final = 8
+
+_SLOW_CHECKOUT_MS: Final = 100
+
+
+@dataclass(frozen=True, slots=True)
+class PooledChannel:
+    channel: AbstractChannel
+    # Exchange is declared once per channel and cached
+    # together with it
+    exchange: AbstractExchange
+
+
+@dataclass(frozen=True, slots=True)
+class AioPikaChannelPoolStats:
+    checkouts: int
+    total_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+    open_channels: int
+    replaced_channels: int
+
+    @property
+    def mean_checkout_wait_ms(self) -> float:
+        if not self.checkouts:
+            return 0
+        return self.total_checkout_wait_ms / self.checkouts
+
+
+class AioPikaChannelPoolMetrics:
+    """
+    Collects how long publishers wait for channel from
+    channel pool and how many closed channels were
+    replaced. Growing waits mean pool is too small,
+    growing replacements mean channels are closed by
+    broker, e.g. on publishing to missing exchange.
+    """
+
+    def __init__(self):
+        self._checkouts = 0
+        self._total_checkout_wait_ms = 0.0
+        self._max_checkout_wait_ms = 0.0
+        self._open_channels = 0
+        self._replaced_channels = 0
+
+    def stats(self) -> AioPikaChannelPoolStats:
+        return AioPikaChannelPoolStats(
+            checkouts=self._checkouts,
+            total_checkout_wait_ms=self._total_checkout_wait_ms,
+            max_checkout_wait_ms=self._max_checkout_wait_ms,
+            open_channels=self._open_channels,
+            replaced_channels=self._replaced_channels,
+        )
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(
+            "RabbitMQ channel pool stats",
+            extra={
+                "checkouts": stats.checkouts,
+                "mean_checkout_wait_ms": stats.mean_checkout_wait_ms,
+                "max_checkout_wait_ms": stats.max_checkout_wait_ms,
+                "open_channels": stats.open_channels,
+                "replaced_channels": stats.replaced_channels,
+            },
+        )
+
+    def channel_checked_out(self, wait_ms: float) -> None:
+        self._checkouts += 1
+        self._total_checkout_wait_ms += wait_ms
+        self._max_checkout_wait_ms = max(self._max_checkout_wait_ms, wait_ms)
+
+        if wait_ms >= _SLOW_CHECKOUT_MS:
+            logger.debug(
+                "Slow RabbitMQ channel checkout",
+                extra={"wait_ms": wait_ms},
+            )
+
+    def channel_opened(self) -> None:
+        self._open_channels += 1
+
+    def channel_closed(self) -> None:
+        self._open_channels -= 1
+
+    def channel_replaced(self) -> None:
+        self._replaced_channels += 1
+
+
+class AioPikaChannelPool:
+    """
+    Bounded pool of long lived channels of one connection,
+    so publishing doesn't open channel and declare exchange
+    per request. At most `max_size` channels are checked
+    out at a time, other publishers wait for returned one.
+
+    Channels are opened lazily with publisher confirms.
+    Channel closed by broker or by lost connection is
+    dropped on checkout or return and replaced by new one
+    on next checkout.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection: AbstractRobustConnection,
+        metrics: AioPikaChannelPoolMetrics,
+        exchange_name: str = "contribution",
+        max_size: int = DEFAULT_CHANNEL_POOL_SIZE,
+    ):
+        self._connection = connection
+        self._metrics = metrics
+        self._exchange_name = exchange_name
+        self._max_size = max_size
+
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._idle_channels: list[PooledChannel] = []
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledChannel]:
+        checkout_started_at = time.perf_counter()
+        async with self._semaphore:
+            self._metrics.channel_checked_out(
+                (time.perf_counter() - checkout_started_at) * 1000,
+            )
+
+            pooled_channel = await self._take_channel()
+            try:
+                yield pooled_channel
+            finally:
+                self._return_channel(pooled_channel)
+
+    async def close(self) -> None:
+        idle_channels = self._idle_channels
+        self._idle_channels = []
+
+        for pooled_channel in idle_channels:
+            self._metrics.channel_closed()
+            if not pooled_channel.channel.is_closed:
+                await pooled_channel.channel.close()
+
+    async def _take_channel(self) -> PooledChannel:
+        while self._idle_channels:
+            # Last returned channel is taken first, so extra
+            # channels stay idle instead of being rotated
+            pooled_channel = self._idle_channels.pop()
+            if not pooled_channel.channel.is_closed:
+                return pooled_channel
+
+            self._drop_closed_channel()
+
+        return await self._open_channel()
+
+    def _return_channel(self, pooled_channel: PooledChannel) -> None:
+        if pooled_channel.channel.is_closed:
+            self._drop_closed_channel()
+            return
+        self._idle_channels.append(pooled_channel)
+
+    async def _open_channel(self) -> PooledChannel:
+        channel = await self._connection.channel()
+        try:
+            exchange = await channel.get_exchange(self._exchange_name)
+        except Exception:
+            await channel.close()
+            raise
+
+        self._metrics.channel_opened()
+        return PooledChannel(channel=channel, exchange=exchange)
+
+    def _drop_closed_channel(self) -> None:
+        self._metrics.channel_closed()
+        self._metrics.channel_replaced()
+        logger.warning(
+            "Closed RabbitMQ channel is dropped from pool",
+            extra={"exchange": self._exchange_name},
+        )
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from typing import Optional
 
 from contribution.infrastructure.get_env import env_var_by_key
 
@@ -6,9 +8,89 @@ from contribution.infrastructure.get_env import env_var_by_key
 def rabbitmq_config_from_env() -> "RabbitMQConfig":
     return RabbitMQConfig(
         url=env_var_by_key("RABBITMQ_URL"),
+        channel_pool_size=int(os.getenv("RABBITMQ_CHANNEL_POOL_SIZE", "8")),
     )
 
 
 @dataclass(frozen=True, slots=True)
 class RabbitMQConfig:
     url: str
+    # Max number of channels used for publishing at a time
+    channel_pool_size: int = 8
+
+
+def event_batching_config_from_env() -> Optional["EventBatchingConfig"]:
+    """
+    Returns config of batching of event consumer if
+    EVENT_CONSUMER_BATCH_SIZE is set, batching is disabled
+    otherwise.
+    """
+    max_size_as_str = os.getenv("EVENT_CONSUMER_BATCH_SIZE")
+    if not max_size_as_str:
+        return None
+
+    return EventBatchingConfig(
+        max_size=int(max_size_as_str),
+        max_delay_ms=int(os.getenv("EVENT_CONSUMER_BATCH_DELAY_MS", "50")),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EventBatchingConfig:
+    # Batch is processed once it has `max_size` messages
+    # or `max_delay_ms` after its first message arrived
+    max_size: int
+    max_delay_ms: int = 50
+
+
+_PREFETCH_COUNT_ENV_VAR = "EVENT_CONSUMER_PREFETCH_COUNT"
+_LANES_ENV_VAR = "EVENT_CONSUMER_LANES"
+
+
+def event_consumption_config_from_env() -> "EventConsumptionConfig":
+    """
+    Returns config of concurrency of event consumer.
+    EVENT_CONSUMER_PREFETCH_COUNT and EVENT_CONSUMER_LANES
+    set defaults, which are overridden for one subscriber
+    by EVENT_CONSUMER_PREFETCH_COUNT_<ROUTING_KEY> and for
+    one group of lanes by EVENT_CONSUMER_LANES_<GROUP>,
+    e.g. EVENT_CONSUMER_PREFETCH_COUNT_MOVIE_UPDATED=64 or
+    EVENT_CONSUMER_LANES_MOVIE=16.
+    """
+    return EventConsumptionConfig(
+        prefetch_count=int(os.getenv(_PREFETCH_COUNT_ENV_VAR, "32")),
+        lanes=int(os.getenv(_LANES_ENV_VAR, "8")),
+        subscriber_prefetch_counts=_overrides_from_env(
+            _PREFETCH_COUNT_ENV_VAR,
+        ),
+        group_lanes=_overrides_from_env(_LANES_ENV_VAR),
+    )
+
+
+def _overrides_from_env(env_var: str) -> dict[str, int]:
+    prefix = f"{env_var}_"
+    return {
+        key.removeprefix(prefix).lower(): int(value)
+        for key, value in os.environ.items()
+        if key.startswith(prefix)
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class EventConsumptionConfig:
+    # Number of unacked messages of subscriber
+    prefetch_count: int = 32
+    # Number of lanes of group, messages with the same key
+    # are processed one by one in the same lane
+    lanes: int = 8
+    subscriber_prefetch_counts: dict[str, int] = field(default_factory=dict)
+    group_lanes: dict[str, int] = field(default_factory=dict)
+
+    def prefetch_count_of(self, routing_key: str) -> int:
+        return self.subscriber_prefetch_counts.get(
+            routing_key,
+            self.prefetch_count,
+        )
+
+    def lanes_of(self, group: str) -> int:
+        return self.group_lanes.get(group, self.lanes)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Final, Sequence
+
+from aio_pika import Message
+from aio_pika.abc import AbstractExchange
+from pamqp.commands import Basic
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT: Final = 256
+DEFAULT_MAX_ATTEMPTS: Final = 3
+
+
+class ConfirmMode(Enum):
+    # Next message is published after previous one is
+    # confirmed, one round trip per message
+    SINGLE = "single"
+    # Up to `max_in_flight` messages are published without
+    # waiting for confirms of each other
+    WINDOWED = "windowed"
+
+
+@dataclass(frozen=True, slots=True)
+class OutgoingMessage:
+    routing_key: str
+    message: Message
+
+
+@dataclass(frozen=True, slots=True)
+class PublishOutcome:
+    # Confirmation frame of last attempt or its error
+    confirmation: Any
+    attempts: int
+
+    @property
+    def confirmed(self) -> bool:
+        return isinstance(self.confirmation, Basic.Ack)
+
+
+class ConfirmingPublisher:
+    """
+    Publishes messages on channel with publisher confirms
+    and returns outcome of each message in order of
+    messages.
+
+    In windowed mode publishes are pipelined, so channel
+    has up to `max_in_flight` unconfirmed messages, and
+    slot of window is taken by next message as soon as
+    any message is confirmed. Nacked or failed message is
+    published again, up to `max_attempts` times, without
+    holding its slot between attempts, so it doesn't block
+    other messages; message that is still not confirmed
+    is returned with outcome of last attempt to be
+    reported by caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: ConfirmMode = ConfirmMode.WINDOWED,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self._mode = mode
+        self._max_in_flight = max_in_flight
+        self._max_attempts = max_attempts
+
+    async def publish(
+        self,
+        exchange: AbstractExchange,
+        messages: Sequence[OutgoingMessage],
+    ) -> list[PublishOutcome]:
+        if self._mode is ConfirmMode.SINGLE:
+            window = asyncio.Semaphore(1)
+            return [
+                await self._publish_confirmed(exchange, message, window)
+                for message in messages
+            ]
+
+        window = asyncio.Semaphore(self._max_in_flight)
+        return await asyncio.gather(
+            *(
+                self._publish_confirmed(exchange, message, window)
+                for message in messages
+            ),
+        )
+
+    async def _publish_confirmed(
+        self,
+        exchange: AbstractExchange,
+        message: OutgoingMessage,
+        window: asyncio.Semaphore,
+    ) -> PublishOutcome:
+        attempt = 1
+        while True:
+            async with window:
+                try:
+                    confirmation: Any = await exchange.publish(
+                        message=message.message,
+                        routing_key=message.routing_key,
+                    )
+                except Exception as error:
+                    confirmation = error
+
+            outcome = PublishOutcome(
+                confirmation=confirmation,
+                attempts=attempt,
+            )
+            if outcome.confirmed or attempt >= self._max_attempts:
+                return outcome
+
+            logger.info(
+                "Message was not confirmed by broker, publishing again",
+                extra={
+                    "message_id": message.message.message_id,
+                    "routing_key": message.routing_key,
+                    "attempt": attempt,
+                    "confirmation": repr(confirmation),
+                },
+            )
+            attempt += 1
@@ -1,16 +1,19 @@
 import json
-
-from aio_pika import Exchange, Message
+from datetime import datetime, timezone
 
 from contribution.application import OperationId, PersonAddedEvent
+from contribution.infrastructure.database import (
+    MongoDBUnitOfWork,
+    OutboxMessage,
+)
 
 
 def publish_person_added_event_factory(
-    exchange: Exchange,
+    unit_of_work: MongoDBUnitOfWork,
     operation_id: OperationId,
 ) -> "PublishPersonAddedEvent":
     return PublishPersonAddedEvent(
-        exchange=exchange,
+        unit_of_work=unit_of_work,
         routing_key="contribution.person_added",
         operation_id=operation_id,
     )
@@ -19,19 +22,22 @@ def publish_person_added_event_factory(
 class PublishPersonAddedEvent:
     def __init__(
         self,
-        exchange: Exchange,
+        unit_of_work: MongoDBUnitOfWork,
         routing_key: str,
         operation_id: OperationId,
     ):
-        self._exchange = exchange
+        self._unit_of_work = unit_of_work
         self._routing_key = routing_key
         self._operation_id = operation_id
 
     async def __call__(self, event: PersonAddedEvent) -> None:
-        await self._exchange.publish(
-            message=Message(self._event_to_json(event).encode()),
+        message = OutboxMessage(
             routing_key=self._routing_key,
+            body=self._event_to_json(event),
+            operation_id=self._operation_id,
+            created_at=datetime.now(timezone.utc),
         )
+        self._unit_of_work.register_outbox_message(message)
 
     def _event_to_json(self, event: PersonAddedEvent) -> str:
         if event.death_date:
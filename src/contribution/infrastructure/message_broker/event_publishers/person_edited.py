@@ -1,18 +1,21 @@
 # mypy: disable-error-code="assignment"
 
 import json
-
-from aio_pika import Exchange, Message
+from datetime import datetime, timezone
 
 from contribution.application import OperationId, PersonEditedEvent
+from contribution.infrastructure.database import (
+    MongoDBUnitOfWork,
+    OutboxMessage,
+)
 
 
 def publish_person_edited_event_factory(
-    exchange: Exchange,
+    unit_of_work: MongoDBUnitOfWork,
     operation_id: OperationId,
 ) -> "PublishPersonEditedEvent":
     return PublishPersonEditedEvent(
-        exchange=exchange,
+        unit_of_work=unit_of_work,
         routing_key="contribution.person_edited",
         operation_id=operation_id,
     )
@@ -21,19 +24,22 @@ def publish_person_edited_event_factory(
 class PublishPersonEditedEvent:
     def __init__(
         self,
-        exchange: Exchange,
+        unit_of_work: MongoDBUnitOfWork,
         routing_key: str,
         operation_id: OperationId,
     ):
-        self._exchange = exchange
+        self._unit_of_work = unit_of_work
         self._routing_key = routing_key
         self._operation_id = operation_id
 
     async def __call__(self, event: PersonEditedEvent) -> None:
-        await self._exchange.publish(
-            message=Message(self._event_to_json(event).encode()),
+        message = OutboxMessage(
             routing_key=self._routing_key,
+            body=self._event_to_json(event),
+            operation_id=self._operation_id,
+            created_at=datetime.now(timezone.utc),
         )
+        self._unit_of_work.register_outbox_message(message)
 
     def _event_to_json(self, event: PersonEditedEvent) -> str:
         event_as_dict = {
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Final
+
+from aio_pika import Message
+
+from contribution.infrastructure.database import OutboxCollection
+from .channel_pool import AioPikaChannelPool
+from .confirming_publisher import OutgoingMessage, ConfirmingPublisher
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 100
+DEFAULT_POLL_INTERVAL: Final = 0.5
+
+_STATS_INTERVAL: Final = 60
+
+
+class OutboxRelayMetrics:
+    """
+    Counters of outbox relay. Lag is age of oldest unsent
+    message at last poll, growing lag shows that relay
+    doesn't keep up with operations writing messages.
+    Retried is number of extra attempts to publish nacked
+    or failed messages.
+    """
+
+    __slots__ = ("published", "failed", "retried", "lag_seconds")
+
+    def __init__(self):
+        self.published = 0
+        self.failed = 0
+        self.retried = 0
+        self.lag_seconds = 0.0
+
+    def log_stats(self) -> None:
+        logger.info(
+            "Outbox relay stats",
+            extra={
+                "published": self.published,
+                "failed": self.failed,
+                "retried": self.retried,
+                "lag_seconds": self.lag_seconds,
+            },
+        )
+
+
+class OutboxRelay:
+    """
+    Publishes messages of outbox in order of creation,
+    batch by batch. Messages of batch are published by
+    `ConfirmingPublisher` on channel borrowed from pool,
+    then confirmed messages are marked sent with one
+    update. Messages that were not confirmed after retries
+    of publisher stay unsent and are published by next poll,
+    as are messages published before crash of relay, so
+    messages are delivered at least once.
+
+    Only one relay should run at a time, otherwise
+    messages are published several times.
+    """
+
+    def __init__(
+        self,
+        *,
+        collection: OutboxCollection,
+        channel_pool: AioPikaChannelPool,
+        publisher: ConfirmingPublisher,
+        metrics: OutboxRelayMetrics,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self._collection = collection
+        self._channel_pool = channel_pool
+        self._publisher = publisher
+        self._metrics = metrics
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Relays messages until `stop_event` is set. Outbox is
+        polled again immediately while batches are full.
+        Stats are logged every minute and on stop.
+        """
+        stats_logged_at = time.monotonic()
+
+        while not stop_event.is_set():
+            if time.monotonic() - stats_logged_at >= _STATS_INTERVAL:
+                self._metrics.log_stats()
+                stats_logged_at = time.monotonic()
+
+            try:
+                published = await self.relay_batch()
+            except Exception:
+                logger.exception("Outbox relay failed to relay batch")
+                published = 0
+
+            if published >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(
+                    stop_event.wait(),
+                    timeout=self._poll_interval,
+                )
+            except TimeoutError:
+                pass
+
+        self._metrics.log_stats()
+
+    async def relay_batch(self) -> int:
+        """
+        Relays one batch of unsent messages and returns
+        number of published messages.
+        """
+        cursor = (
+            self._collection.find({"sent": False})
+            .sort("created_at", 1)
+            .limit(self._batch_size)
+        )
+        documents = await cursor.to_list(length=self._batch_size)
+
+        if not documents:
+            self._metrics.lag_seconds = 0.0
+            return 0
+
+        oldest_created_at = _as_aware(documents[0]["created_at"])
+        self._metrics.lag_seconds = (
+            datetime.now(timezone.utc) - oldest_created_at
+        ).total_seconds()
+
+        async with self._channel_pool.acquire() as pooled_channel:
+            outcomes = await self._publisher.publish(
+                pooled_channel.exchange,
+                [_outgoing_message(document) for document in documents],
+            )
+
+        sent_ids = []
+        for document, outcome in zip(documents, outcomes):
+            self._metrics.retried += outcome.attempts - 1
+            if outcome.confirmed:
+                sent_ids.append(document["_id"])
+                continue
+
+            logger.warning(
+                "Outbox message was not confirmed by broker",
+                extra={
+                    "operation_id": document["operation_id"],
+                    "routing_key": document["routing_key"],
+                    "attempts": outcome.attempts,
+                    "confirmation": repr(outcome.confirmation),
+                },
+            )
+
+        if sent_ids:
+            await self._collection.update_many(
+                {"_id": {"$in": sent_ids}},
+                {
+                    "$set": {
+                        "sent": True,
+                        "sent_at": datetime.now(timezone.utc),
+                    },
+                },
+            )
+
+        self._metrics.published += len(sent_ids)
+        self._metrics.failed += len(documents) - len(sent_ids)
+
+        logger.debug(
+            "Outbox batch relayed",
+            extra={
+                "published": len(sent_ids),
+                "failed": len(documents) - len(sent_ids),
+                "lag_seconds": self._metrics.lag_seconds,
+            },
+        )
+
+        return len(sent_ids)
+
+
+def _outgoing_message(document: dict[str, Any]) -> OutgoingMessage:
+    message = Message(
+        document["body"].encode(),
+        message_id=str(document["_id"]),
+    )
+    return OutgoingMessage(
+        routing_key=document["routing_key"],
+        message=message,
+    )
+
+
+def _as_aware(value: datetime) -> datetime:
+    # Client may be configured without tz aware datetimes
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
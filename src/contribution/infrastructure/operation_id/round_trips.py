@@ -0,0 +1,116 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from pymongo.monitoring import (
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+    CommandFailedEvent,
+)
+
+from contribution.application import OperationId
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RoundTrips:
+    mongodb_commands: int = 0
+    redis_calls: int = 0
+    broker_publishes: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.mongodb_commands + self.redis_calls + self.broker_publishes
+
+
+_current_round_trips: ContextVar[Optional[RoundTrips]] = ContextVar(
+    "current_round_trips",
+    default=None,
+)
+
+
+@contextmanager
+def counting_round_trips() -> Iterator[RoundTrips]:
+    """
+    Counts round trips made in the current context
+    until exit.
+
+    Example of usage::
+
+        with counting_round_trips() as round_trips:
+            await add_movie.process(command)
+
+        print(round_trips.mongodb_commands)
+    """
+    round_trips = RoundTrips()
+    token = _current_round_trips.set(round_trips)
+    try:
+        yield round_trips
+    finally:
+        _current_round_trips.reset(token)
+
+
+def count_operation_round_trips(
+    operation_id: OperationId,
+) -> Iterator[OperationId]:
+    """
+    Dishka decorator of OperationId that counts round
+    trips of operation, starting when operation id is
+    requested for the first time and logging them when
+    request scope is closed.
+    """
+    round_trips = RoundTrips()
+    _current_round_trips.set(round_trips)
+
+    yield operation_id
+
+    logger.debug(
+        "Operation round trips counted",
+        extra={
+            "operation_id": operation_id,
+            "mongodb_commands": round_trips.mongodb_commands,
+            "redis_calls": round_trips.redis_calls,
+            "broker_publishes": round_trips.broker_publishes,
+        },
+    )
+
+
+def count_mongodb_command() -> None:
+    round_trips = _current_round_trips.get()
+    if round_trips:
+        round_trips.mongodb_commands += 1
+
+
+def count_redis_call() -> None:
+    round_trips = _current_round_trips.get()
+    if round_trips:
+        round_trips.redis_calls += 1
+
+
+def count_broker_publish() -> None:
+    round_trips = _current_round_trips.get()
+    if round_trips:
+        round_trips.broker_publishes += 1
+
+
+class MongoDBCommandCounter(CommandListener):
+    """
+    Command listener that counts MongoDB commands of
+    operation. Motor runs commands in executor with copy
+    of the caller's context, so counted command belongs
+    to the operation that sent it.
+    """
+
+    def started(self, event: CommandStartedEvent) -> None:
+        count_mongodb_command()
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        ...
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        ...
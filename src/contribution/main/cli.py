@@ -12,6 +12,12 @@ from contribution.presentation.cli import (
     update_movie,
     create_person,
     update_person,
+    ensure_indexes,
+    migrate_uuids,
+    run_projector,
+    import_,
+    export,
+    relay_outbox,
 )
 
 
@@ -31,6 +37,8 @@ def create_cli_app() -> App:
     app.command(run_web_api)
     app.command(run_event_consumer)
     app.command(run_tg_bot)
+    app.command(run_projector)
+    app.command(relay_outbox)
 
     app.command(create_user)
     app.command(update_user)
@@ -38,6 +46,11 @@ def create_cli_app() -> App:
     app.command(update_movie)
     app.command(create_person)
     app.command(update_person)
+    app.command(import_, name="import")
+
+    app.command(ensure_indexes)
+    app.command(migrate_uuids)
+    app.command(export)
 
     return app
 
@@ -1,25 +1,74 @@
 from importlib.metadata import version
 
 from faststream import FastStream
+from dishka import AsyncContainer
 from dishka.integrations.faststream import setup_dishka
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
-from contribution.infrastructure import rabbitmq_config_from_env
+from contribution.infrastructure import (
+    rabbitmq_config_from_env,
+    event_batching_config_from_env,
+    event_consumption_config_from_env,
+    MongoDBConfig,
+    MongoDBPoolMetrics,
+    warm_up_motor_client,
+    ensure_indexes,
+)
 from contribution.infrastructure.di.event_consumer import (
     event_consumer_ioc_container_factory,
 )
-from contribution.presentation.event_consumer import create_broker
+from contribution.presentation.event_consumer import (
+    CommandBatcher,
+    create_broker,
+)
 
 
 def create_event_consumer_app() -> FastStream:
     rabbitmq_config = rabbitmq_config_from_env()
-    broker = create_broker(rabbitmq_config.url)
+    batching_config = event_batching_config_from_env()
+    ioc_container = event_consumer_ioc_container_factory()
+
+    if batching_config:
+        batcher = CommandBatcher(
+            ioc_container=ioc_container,
+            config=batching_config,
+        )
+        broker = create_broker(
+            rabbitmq_config.url,
+            ioc_container=ioc_container,
+            batcher=batcher,
+        )
+    else:
+        broker = create_broker(
+            rabbitmq_config.url,
+            ioc_container=ioc_container,
+            consumption_config=event_consumption_config_from_env(),
+        )
 
     app = FastStream(
         broker=broker,
         title="Contribution",
         version=version("contribution"),
     )
-    ioc_container = event_consumer_ioc_container_factory()
     setup_dishka(ioc_container, app)
 
+    async def on_startup() -> None:
+        await _bootstrap_database(ioc_container)
+
+    async def on_shutdown() -> None:
+        pool_metrics = await ioc_container.get(MongoDBPoolMetrics)
+        pool_metrics.log_stats()
+
+    app.on_startup(on_startup)
+    app.on_shutdown(on_shutdown)
+
     return app
+
+
+async def _bootstrap_database(ioc_container: AsyncContainer) -> None:
+    mongodb_config = await ioc_container.get(MongoDBConfig)
+    motor_client = await ioc_container.get(AsyncIOMotorClient)
+    await warm_up_motor_client(motor_client, mongodb_config)
+
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+    await ensure_indexes(motor_database)
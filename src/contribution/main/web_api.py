@@ -1,9 +1,19 @@
+from contextlib import asynccontextmanager
 from importlib.metadata import version
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from dishka import AsyncContainer
 from dishka.integrations.fastapi import setup_dishka
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
-from contribution.infrastructure import setup_logging
+from contribution.infrastructure import (
+    setup_logging,
+    MongoDBConfig,
+    MongoDBPoolMetrics,
+    warm_up_motor_client,
+    ensure_indexes,
+)
 from contribution.infrastructure.di.web_api import (
     web_api_ioc_container_factory,
 )
@@ -17,6 +27,10 @@ DESCRIPTION = """
 ## Error codes: \n
     * 10 - User is not active.
     * 20 - Not enough permissions.
+    * 30 - Data was changed by another request, request can be retried.
+    * 40 - Invalid page cursor.
+    * 50 - Too many items in batch.
+    * 60 - Item of batch is invalid.
     * 200 - Movie does not exist.
     * 220 - Invalid movie eng. title.
     * 230 - Invalid movie original title.
@@ -46,6 +60,7 @@ def create_web_api_app() -> FastAPI:
         description=DESCRIPTION,
         version=version("contribution"),
         swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+        lifespan=_lifespan,
     )
     ioc_container = web_api_ioc_container_factory()
 
@@ -55,3 +70,22 @@ def create_web_api_app() -> FastAPI:
     setup_exception_handlers(app)
 
     return app
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    ioc_container: AsyncContainer = app.state.dishka_container
+
+    mongodb_config = await ioc_container.get(MongoDBConfig)
+    motor_client = await ioc_container.get(AsyncIOMotorClient)
+    await warm_up_motor_client(motor_client, mongodb_config)
+
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+    await ensure_indexes(motor_database)
+
+    yield
+
+    pool_metrics = await ioc_container.get(MongoDBPoolMetrics)
+    pool_metrics.log_stats()
+
+    await ioc_container.close()
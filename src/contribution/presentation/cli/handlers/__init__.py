@@ -5,6 +5,12 @@ __all__ = (
     "update_movie",
     "create_person",
     "update_person",
+    "ensure_indexes",
+    "migrate_uuids",
+    "run_projector",
+    "import_",
+    "export",
+    "relay_outbox",
 )
 
 from .create_user import create_user
@@ -13,3 +19,9 @@ from .create_movie import create_movie
 from .update_movie import update_movie
 from .create_person import create_person
 from .update_person import update_person
+from .ensure_indexes import ensure_indexes
+from .migrate_uuids import migrate_uuids
+from .run_projector import run_projector
+from .import_ import import_
+from .export import export
+from .relay_outbox import relay_outbox
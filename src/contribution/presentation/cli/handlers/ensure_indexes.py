@@ -0,0 +1,24 @@
+import rich
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import (
+    ensure_indexes as ensure_mongodb_indexes,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+async def ensure_indexes() -> None:
+    """
+    Creates indexes of all MongoDB collections if they
+    don't exist. Web api and event consumer do it on startup,
+    so this command is only needed to prepare database in
+    advance (for example before deployment).
+    """
+    ioc_container = cli_ioc_container_factory()
+
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+    await ensure_mongodb_indexes(motor_database)
+
+    await ioc_container.close()
+
+    rich.print("Indexes have been ensured successfully")
@@ -0,0 +1,224 @@
+import asyncio
+import importlib.util
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Annotated, Iterable, Optional
+
+import rich
+import rich.table
+from bson import Timestamp
+from cyclopts import Parameter
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import (
+    ExportCompression,
+    ExportResult,
+    SnapshotIsNotSupportedError,
+    exported_collection_names,
+    snapshot_cluster_time,
+    export_collection,
+)
+from contribution.infrastructure.database.export import DEFAULT_BATCH_SIZE
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+async def export(
+    directory: Annotated[
+        Path,
+        Parameter(help="Directory files are written to."),
+    ],
+    collections: Annotated[
+        Optional[list[str]],
+        Parameter(
+            "--collections",
+            help="Names of exported collections, all by default.",
+        ),
+    ] = None,
+    compression: Annotated[
+        ExportCompression,
+        Parameter("--compression", show_default=True),
+    ] = ExportCompression.GZIP,
+    batch_size: Annotated[
+        int,
+        Parameter("--batch-size", show_default=True),
+    ] = DEFAULT_BATCH_SIZE,
+    snapshot: Annotated[
+        bool,
+        Parameter(
+            "--snapshot",
+            show_default=True,
+            help=(
+                "Read all collections at the same point in time. "
+                "Requires replica set, export must finish within "
+                "snapshot history window of MongoDB."
+            ),
+        ),
+    ] = False,
+    processes: Annotated[
+        int,
+        Parameter(
+            "--processes",
+            show_default=True,
+            help="Number of processes exporting collections in parallel.",
+        ),
+    ] = 1,
+) -> None:
+    """
+    Exports collections into compressed NDJSON files, one
+    file per collection and one document per line in
+    MongoDB Extended JSON. Documents are read in batches,
+    so memory usage doesn't depend on size of collections.
+    """
+    ioc_container = cli_ioc_container_factory()
+
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+
+    all_collection_names = exported_collection_names(motor_database)
+    collection_names = collections or all_collection_names
+    unknown_collection_names = set(collection_names).difference(
+        all_collection_names,
+    )
+    if unknown_collection_names:
+        await ioc_container.close()
+        _exit_with_error(
+            f"Unknown collections: {', '.join(unknown_collection_names)}",
+        )
+
+    if (
+        compression is ExportCompression.ZSTD
+        and importlib.util.find_spec("zstandard") is None
+    ):
+        await ioc_container.close()
+        _exit_with_error("zstd compression requires 'zstandard' package")
+
+    cluster_time = None
+    if snapshot:
+        try:
+            cluster_time = await snapshot_cluster_time(motor_database)
+        except SnapshotIsNotSupportedError as error:
+            await ioc_container.close()
+            _exit_with_error(str(error))
+
+    directory.mkdir(parents=True, exist_ok=True)
+    started_at = time.perf_counter()
+
+    if processes > 1:
+        await ioc_container.close()
+        export_results = await _export_in_processes(
+            collection_names,
+            directory,
+            compression=compression,
+            batch_size=batch_size,
+            cluster_time=cluster_time,
+            processes=processes,
+        )
+    else:
+        export_results = [
+            await export_collection(
+                motor_database,
+                collection_name,
+                directory,
+                compression=compression,
+                batch_size=batch_size,
+                cluster_time=cluster_time,
+            )
+            for collection_name in collection_names
+        ]
+        await ioc_container.close()
+
+    duration = time.perf_counter() - started_at
+
+    rich.print(f"Collections have been exported in {duration:.1f} s")
+    rich.print(_export_table_factory(export_results))
+
+
+async def _export_in_processes(
+    collection_names: Iterable[str],
+    directory: Path,
+    *,
+    compression: ExportCompression,
+    batch_size: int,
+    cluster_time: Optional[Timestamp],
+    processes: int,
+) -> list[ExportResult]:
+    """
+    Exports collections in pool of processes, one
+    collection per task. Processes are spawned rather than
+    forked, because parent process has threads of MongoDB
+    driver.
+    """
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _export_in_process,
+                    collection_name,
+                    directory,
+                    compression,
+                    batch_size,
+                    cluster_time,
+                )
+                for collection_name in collection_names
+            ),
+        )
+
+
+def _export_in_process(
+    collection_name: str,
+    directory: Path,
+    compression: ExportCompression,
+    batch_size: int,
+    cluster_time: Optional[Timestamp],
+) -> ExportResult:
+    async def export_() -> ExportResult:
+        ioc_container = cli_ioc_container_factory()
+
+        motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+        export_result = await export_collection(
+            motor_database,
+            collection_name,
+            directory,
+            compression=compression,
+            batch_size=batch_size,
+            cluster_time=cluster_time,
+        )
+
+        await ioc_container.close()
+
+        return export_result
+
+    return asyncio.run(export_())
+
+
+def _export_table_factory(
+    export_results: Iterable[ExportResult],
+) -> rich.table.Table:
+    export_table = rich.table.Table(
+        "collection",
+        "documents",
+        "file size",
+        "file",
+        title="Export",
+    )
+    for export_result in export_results:
+        export_table.add_row(
+            export_result.collection_name,
+            str(export_result.documents),
+            f"{export_result.file_size} B",
+            str(export_result.path),
+        )
+
+    return export_table
+
+
+def _exit_with_error(message: str) -> None:
+    rich.print(message)
+    sys.exit(1)
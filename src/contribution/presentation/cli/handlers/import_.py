@@ -0,0 +1,266 @@
+import json
+import os
+import sys
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Annotated, Any, Final, Iterator, Optional, TextIO
+
+import rich
+from adaptix import Retort
+from adaptix.load_error import LoadError
+from cyclopts import Parameter
+from dishka import AsyncContainer
+
+from contribution.domain import DomainError
+from contribution.application import (
+    ApplicationError,
+    CommandProcessor,
+    CreateUserCommand,
+    CreateMovieCommand,
+    CreatePersonCommand,
+    ImportUsersCommand,
+    ImportMoviesCommand,
+    ImportPersonsCommand,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+DEFAULT_CHUNK_SIZE: Final = 500
+
+_retort = Retort()
+
+
+class ImportKind(StrEnum):
+    USERS = "users"
+    MOVIES = "movies"
+    PERSONS = "persons"
+
+
+class _RecordIsInvalidError(Exception):
+    def __init__(self, line_number: int, reason: str):
+        self.line_number = line_number
+        self.reason = reason
+
+
+async def import_(
+    kind: Annotated[ImportKind, Parameter(help="Kind of records.")],
+    path: Annotated[
+        Optional[Path],
+        Parameter(
+            help=(
+                "File with records in [bright_red]NDJSON[/bright_red] "
+                "format, one record per line in the same format as "
+                "arguments of create command. Records are read from "
+                "stdin if file is not specified."
+            ),
+        ),
+    ] = None,
+    chunk_size: Annotated[
+        int,
+        Parameter(
+            "--chunk-size",
+            show_default=True,
+            help="Number of records committed in one transaction.",
+        ),
+    ] = DEFAULT_CHUNK_SIZE,
+    checkpoint: Annotated[
+        Optional[Path],
+        Parameter(
+            "--checkpoint",
+            help=(
+                "File with number of committed lines. Defaults to "
+                "'<path>.checkpoint' if records are read from file."
+            ),
+        ),
+    ] = None,
+) -> None:
+    """
+    Imports users, movies or persons from NDJSON stream.
+    Records are validated and checked the same way as by
+    create commands and committed in chunks, one transaction
+    per chunk. Number of committed lines is stored in
+    checkpoint file after every chunk, so import that has
+    failed or was interrupted continues after last committed
+    chunk when run again with the same checkpoint. Chunk
+    can be committed without its checkpoint being written,
+    so records of first chunk of run with checkpoint are
+    skipped if their ids are taken. Does not notify other
+    services about new records.
+    """
+    if checkpoint is None and path is not None:
+        checkpoint = path.with_name(f"{path.name}.checkpoint")
+    committed_lines = _read_checkpoint(checkpoint)
+    if committed_lines:
+        rich.print(f"Resuming after line {committed_lines}")
+
+    ioc_container = cli_ioc_container_factory()
+    started_at = time.perf_counter()
+    imported_records = 0
+
+    with path.open() if path else _stdin() as records_file:
+        lines = _numbered_lines(records_file, skip=committed_lines)
+        try:
+            for chunk, last_line_number in _chunks(lines, kind, chunk_size):
+                await _import_chunk(
+                    ioc_container,
+                    kind,
+                    chunk,
+                    skip_existing=(
+                        checkpoint is not None and imported_records == 0
+                    ),
+                )
+                committed_lines = last_line_number
+                _write_checkpoint(checkpoint, committed_lines)
+
+                imported_records += len(chunk)
+                rich.print(
+                    _progress(imported_records, started_at, committed_lines),
+                )
+        except _RecordIsInvalidError as error:
+            await ioc_container.close()
+            _exit_with_error(
+                f"Line {error.line_number} is invalid: {error.reason}",
+                committed_lines,
+                checkpoint,
+            )
+        except (DomainError, ApplicationError) as error:
+            await ioc_container.close()
+            _exit_with_error(
+                f"Chunk after line {committed_lines} is rejected: {error!r}",
+                committed_lines,
+                checkpoint,
+            )
+
+    await ioc_container.close()
+
+    rich.print(f"{kind.capitalize()} have been imported successfully")
+    rich.print(_progress(imported_records, started_at, committed_lines))
+
+
+async def _import_chunk(
+    ioc_container: AsyncContainer,
+    kind: ImportKind,
+    chunk: list[Any],
+    *,
+    skip_existing: bool,
+) -> None:
+    async with ioc_container() as ioc_container_request:
+        if kind is ImportKind.USERS:
+            users_processor = await ioc_container_request.get(
+                CommandProcessor[ImportUsersCommand, None],
+            )
+            await users_processor.process(
+                ImportUsersCommand(users=chunk, skip_existing=skip_existing),
+            )
+        elif kind is ImportKind.MOVIES:
+            movies_processor = await ioc_container_request.get(
+                CommandProcessor[ImportMoviesCommand, None],
+            )
+            await movies_processor.process(
+                ImportMoviesCommand(movies=chunk, skip_existing=skip_existing),
+            )
+        else:
+            persons_processor = await ioc_container_request.get(
+                CommandProcessor[ImportPersonsCommand, None],
+            )
+            await persons_processor.process(
+                ImportPersonsCommand(
+                    persons=chunk,
+                    skip_existing=skip_existing,
+                ),
+            )
+
+
+def _chunks(
+    lines: Iterator[tuple[int, str]],
+    kind: ImportKind,
+    chunk_size: int,
+) -> Iterator[tuple[list[Any], int]]:
+    """
+    Yields chunks of commands parsed from lines together
+    with number of last line of chunk. Blank lines are
+    skipped.
+    """
+    command_type = {
+        ImportKind.USERS: CreateUserCommand,
+        ImportKind.MOVIES: CreateMovieCommand,
+        ImportKind.PERSONS: CreatePersonCommand,
+    }[kind]
+
+    chunk: list[Any] = []
+    line_number = 0
+    for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            command = _retort.load(json.loads(line), command_type)
+        except (ValueError, LoadError) as error:
+            raise _RecordIsInvalidError(line_number, repr(error))
+        chunk.append(command)
+
+        if len(chunk) >= chunk_size:
+            yield chunk, line_number
+            chunk = []
+
+    if chunk:
+        yield chunk, line_number
+
+
+def _numbered_lines(
+    records_file: TextIO,
+    *,
+    skip: int,
+) -> Iterator[tuple[int, str]]:
+    for line_number, line in enumerate(records_file, start=1):
+        if line_number > skip:
+            yield line_number, line
+
+
+def _stdin() -> TextIO:
+    # Is not closed on exit of context, unlike sys.stdin
+    return open(sys.stdin.fileno(), closefd=False)
+
+
+def _read_checkpoint(checkpoint: Optional[Path]) -> int:
+    if checkpoint is None or not checkpoint.exists():
+        return 0
+    return int(checkpoint.read_text().strip() or 0)
+
+
+def _write_checkpoint(checkpoint: Optional[Path], lines: int) -> None:
+    """
+    Replaces checkpoint file atomically, so it always
+    contains number of lines of some committed chunk.
+    """
+    if checkpoint is None:
+        return
+    temporary_checkpoint = checkpoint.with_name(f"{checkpoint.name}.tmp")
+    temporary_checkpoint.write_text(str(lines))
+    os.replace(temporary_checkpoint, checkpoint)
+
+
+def _progress(records: int, started_at: float, committed_lines: int) -> str:
+    duration = time.perf_counter() - started_at
+    records_per_second = records / duration if duration else 0
+    return (
+        f"{records} records imported in {duration:.1f} s "
+        f"({records_per_second:.0f} records/s), "
+        f"{committed_lines} lines committed"
+    )
+
+
+def _exit_with_error(
+    message: str,
+    committed_lines: int,
+    checkpoint: Optional[Path],
+) -> None:
+    rich.print(message)
+    if checkpoint:
+        rich.print(
+            f"{committed_lines} lines are committed, "
+            "run this command again to continue after them",
+        )
+    else:
+        rich.print(f"{committed_lines} lines are committed")
+    sys.exit(1)
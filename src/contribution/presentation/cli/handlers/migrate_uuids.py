@@ -0,0 +1,144 @@
+from typing import Annotated, Iterable
+
+import rich
+import rich.prompt
+import rich.table
+from cyclopts import Parameter
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import (
+    UUIDRepresentation,
+    UUIDCodec,
+    CollectionSize,
+    UUIDMigrationResult,
+    collection_sizes,
+    migrate_uuids as migrate_mongodb_uuids,
+)
+from contribution.infrastructure.database.uuid_migration import (
+    DEFAULT_BATCH_SIZE,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+async def migrate_uuids(
+    to: Annotated[
+        UUIDRepresentation,
+        Parameter("--to", show_default=True),
+    ] = UUIDRepresentation.BINARY,
+    batch_size: Annotated[
+        int,
+        Parameter("--batch-size", show_default=True),
+    ] = DEFAULT_BATCH_SIZE,
+    pause: Annotated[
+        float,
+        Parameter(
+            "--pause",
+            show_default=True,
+            help="Seconds to sleep between batches.",
+        ),
+    ] = 0,
+) -> None:
+    """
+    Rewrites ids of all MongoDB documents into specified
+    representation in batches, printing document and index
+    sizes before and after. Can be run while application is
+    serving requests with MONGODB_UUID_REPRESENTATION=mixed.
+    Asks confirmation before executing.
+    """
+    executing_is_confirmed = rich.prompt.Confirm.ask(
+        f"You are going to rewrite ids of all documents as {to}.\n"
+        "Application must use 'mixed' UUID representation "
+        "until migration is finished.\n"
+        "Would you like to continue?",
+    )
+    if not executing_is_confirmed:
+        return
+
+    ioc_container = cli_ioc_container_factory()
+
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+
+    sizes_before = await collection_sizes(motor_database)
+    migration_results = await migrate_mongodb_uuids(
+        motor_database,
+        uuid_codec=UUIDCodec(to),
+        batch_size=batch_size,
+        pause=pause,
+    )
+    sizes_after = await collection_sizes(motor_database)
+
+    await ioc_container.close()
+
+    rich.print("Ids have been migrated successfully")
+    rich.print(
+        _migration_table_factory(
+            migration_results=migration_results,
+            sizes_before=sizes_before,
+            sizes_after=sizes_after,
+        ),
+    )
+
+    documents_are_skipped = any(
+        migration_result.skipped for migration_result in migration_results
+    )
+    if documents_are_skipped:
+        rich.print(
+            "Some documents were changed during migration and skipped, "
+            "run this command again to migrate them",
+        )
+    rich.print(
+        "Index files don't shrink until collections are compacted, "
+        "run 'compact' command to reclaim disk space",
+    )
+
+
+def _migration_table_factory(
+    *,
+    migration_results: Iterable[UUIDMigrationResult],
+    sizes_before: Iterable[CollectionSize],
+    sizes_after: Iterable[CollectionSize],
+) -> rich.table.Table:
+    sizes_before_by_name = {size.name: size for size in sizes_before}
+    sizes_after_by_name = {size.name: size for size in sizes_after}
+
+    migration_table = rich.table.Table(
+        "collection",
+        "scanned",
+        "converted",
+        "skipped",
+        "avg document size",
+        "data size",
+        "index size",
+        title="UUID migration",
+    )
+    for migration_result in migration_results:
+        size_before = sizes_before_by_name.get(
+            migration_result.collection_name,
+        )
+        size_after = sizes_after_by_name.get(
+            migration_result.collection_name,
+        )
+        if not size_before or not size_after:
+            continue
+
+        migration_table.add_row(
+            migration_result.collection_name,
+            str(migration_result.scanned),
+            str(migration_result.converted),
+            str(migration_result.skipped),
+            _size_change(
+                size_before.average_document_size,
+                size_after.average_document_size,
+            ),
+            _size_change(size_before.data_size, size_after.data_size),
+            _size_change(
+                size_before.total_index_size,
+                size_after.total_index_size,
+            ),
+        )
+
+    return migration_table
+
+
+def _size_change(size_before: int, size_after: int) -> str:
+    return f"{size_before} B -> {size_after} B"
@@ -0,0 +1,111 @@
+import asyncio
+import signal
+from typing import Annotated
+
+import rich
+from cyclopts import Parameter
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import (
+    OutboxRelay,
+    OutboxRelayMetrics,
+    AioPikaChannelPoolMetrics,
+    AioPikaChannelPool,
+    ConfirmMode,
+    ConfirmingPublisher,
+    outbox_collection_factory,
+)
+from contribution.infrastructure.message_broker.confirming_publisher import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_ATTEMPTS,
+)
+from contribution.infrastructure.message_broker.outbox_relay import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_POLL_INTERVAL,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+async def relay_outbox(
+    batch_size: Annotated[
+        int,
+        Parameter("--batch-size", show_default=True),
+    ] = DEFAULT_BATCH_SIZE,
+    poll_interval: Annotated[
+        float,
+        Parameter(
+            "--poll-interval",
+            show_default=True,
+            help="Seconds between polls of outbox without full batches.",
+        ),
+    ] = DEFAULT_POLL_INTERVAL,
+    confirm_mode: Annotated[
+        ConfirmMode,
+        Parameter(
+            "--confirm-mode",
+            show_default=True,
+            help=(
+                "'single' waits for confirm of each message before "
+                "publishing next one, 'windowed' pipelines publishes."
+            ),
+        ),
+    ] = ConfirmMode.WINDOWED,
+    max_in_flight: Annotated[
+        int,
+        Parameter(
+            "--max-in-flight",
+            show_default=True,
+            help="Max number of unconfirmed messages in windowed mode.",
+        ),
+    ] = DEFAULT_MAX_IN_FLIGHT,
+    max_attempts: Annotated[
+        int,
+        Parameter(
+            "--max-attempts",
+            show_default=True,
+            help="Attempts to publish nacked message before next poll.",
+        ),
+    ] = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    """
+    Run relay that publishes messages of outbox to
+    RabbitMQ until SIGINT or SIGTERM is received. Only one
+    relay should run at a time.
+    """
+    ioc_container = cli_ioc_container_factory()
+    motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+    channel_pool = await ioc_container.get(AioPikaChannelPool)
+
+    metrics = OutboxRelayMetrics()
+    relay = OutboxRelay(
+        collection=outbox_collection_factory(motor_database),
+        channel_pool=channel_pool,
+        publisher=ConfirmingPublisher(
+            mode=confirm_mode,
+            max_in_flight=max_in_flight,
+            max_attempts=max_attempts,
+        ),
+        metrics=metrics,
+        batch_size=batch_size,
+        poll_interval=poll_interval,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop_event.set)
+
+    try:
+        await relay.run(stop_event)
+    finally:
+        channel_pool_metrics = await ioc_container.get(
+            AioPikaChannelPoolMetrics,
+        )
+        channel_pool_metrics.log_stats()
+        await ioc_container.close()
+
+    rich.print(
+        f"Published {metrics.published} messages, "
+        f"{metrics.failed} were not confirmed, "
+        f"{metrics.retried} publishes were retried",
+    )
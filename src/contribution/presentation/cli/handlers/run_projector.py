@@ -0,0 +1,73 @@
+import asyncio
+import signal
+from typing import Annotated
+
+import rich
+from cyclopts import Parameter
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from contribution.infrastructure import ModerationQueueProjector
+from contribution.infrastructure.database.moderation_queue import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHECKPOINT_INTERVAL,
+)
+from contribution.infrastructure.di.cli import cli_ioc_container_factory
+
+
+async def run_projector(
+    rebuild: Annotated[
+        bool,
+        Parameter(
+            "--rebuild",
+            show_default=True,
+            help=(
+                "Recreate moderation queue from scratch before running. "
+                "Contributions must not be changed during rebuild, "
+                "otherwise counts of statuses may be wrong."
+            ),
+        ),
+    ] = False,
+    batch_size: Annotated[
+        int,
+        Parameter("--batch-size", show_default=True),
+    ] = DEFAULT_BATCH_SIZE,
+    checkpoint_interval: Annotated[
+        int,
+        Parameter(
+            "--checkpoint-interval",
+            show_default=True,
+            help="Number of changes applied between saving resume token.",
+        ),
+    ] = DEFAULT_CHECKPOINT_INTERVAL,
+) -> None:
+    """
+    Run projector that maintains moderation queue of
+    pending contributions from MongoDB change streams
+    until SIGINT or SIGTERM is received. Projector resumes
+    from last stored resume token and rebuilds queue if
+    there is no token. Rebuild needs a quiet period
+    without changes of contributions. MongoDB must be
+    replica set.
+    """
+    ioc_container = cli_ioc_container_factory()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop_event.set)
+
+    try:
+        motor_database = await ioc_container.get(AsyncIOMotorDatabase)
+        projector = ModerationQueueProjector(
+            motor_database,
+            batch_size=batch_size,
+            checkpoint_interval=checkpoint_interval,
+        )
+
+        if rebuild:
+            await projector.rebuild()
+            rich.print("Moderation queue has been rebuilt")
+
+        await projector.run(stop_event)
+    finally:
+        await ioc_container.close()
@@ -1,3 +1,4 @@
-__all__ = ("create_broker",)
+__all__ = ("create_broker", "CommandBatcher")
 
 from .broker import create_broker
+from .batching import CommandBatcher
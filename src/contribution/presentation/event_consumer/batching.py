@@ -0,0 +1,265 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from dishka import AsyncContainer
+from faststream.broker.message import StreamMessage
+
+from contribution.application import (
+    CommandProcessor,
+    TransactionRetryPolicy,
+)
+from contribution.infrastructure import (
+    EventBatchingConfig,
+    MongoDBUnitOfWork,
+    ProcessedOperations,
+)
+from .processed_operations import processed_message_id_factory
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchItem:
+    command: Any
+    message: StreamMessage
+    message_id: str
+    processed: asyncio.Future[None]
+
+
+class CommandBatcher:
+    """
+    Collects commands of each routing key into batches of
+    up to `max_size` commands or commands received within
+    `max_delay_ms` after first one, and processes batch
+    with one container, one unit of work and one commit.
+    Handlers of messages wait until their batch is
+    committed, so messages of batch are acked together.
+
+    Failed batch is split in halves that are processed
+    separately, until failed command is processed alone,
+    with usual retries, and its error is raised from
+    handler of its message. Messages that are already in
+    ledger of processed operations are acked without
+    processing. Commands of failed batches are
+    processed again, so events published by their command
+    processors may be published more than once, as they
+    may be after retry of single command.
+    """
+
+    def __init__(
+        self,
+        *,
+        ioc_container: AsyncContainer,
+        config: EventBatchingConfig,
+    ):
+        self._ioc_container = ioc_container
+        self._max_size = config.max_size
+        self._max_delay = config.max_delay_ms / 1000
+
+        self._batches: dict[str, list[_BatchItem]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    async def process(
+        self,
+        *,
+        routing_key: str,
+        processor_type: type[CommandProcessor],
+        command: Any,
+        message: StreamMessage,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        item = _BatchItem(
+            command=command,
+            message=message,
+            message_id=processed_message_id_factory(message),
+            processed=loop.create_future(),
+        )
+
+        batch = self._batches.setdefault(routing_key, [])
+        batch.append(item)
+
+        if len(batch) >= self._max_size:
+            self._flush(routing_key, processor_type)
+        elif len(batch) == 1:
+            self._timers[routing_key] = loop.call_later(
+                self._max_delay,
+                self._flush,
+                routing_key,
+                processor_type,
+            )
+
+        await item.processed
+
+    def _flush(
+        self,
+        routing_key: str,
+        processor_type: type[CommandProcessor],
+    ) -> None:
+        timer = self._timers.pop(routing_key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._batches.pop(routing_key, [])
+        if not batch:
+            return
+
+        task = asyncio.create_task(
+            self._process_new_batch(processor_type, batch),
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process_new_batch(
+        self,
+        processor_type: type[CommandProcessor],
+        batch: list[_BatchItem],
+    ) -> None:
+        try:
+            batch = await self._skip_processed(batch)
+        except Exception as error:
+            for item in batch:
+                _set_exception(item, error)
+            return
+
+        if batch:
+            await self._process_batch(processor_type, batch)
+
+    async def _skip_processed(
+        self,
+        batch: list[_BatchItem],
+    ) -> list[_BatchItem]:
+        async with self._ioc_container(
+            context={StreamMessage: batch[0].message},
+        ) as request_container:
+            processed_operations = await request_container.get(
+                ProcessedOperations,
+            )
+            processed_message_ids = await processed_operations.processed_among(
+                item.message_id for item in batch
+            )
+
+        unprocessed_batch = []
+        for item in batch:
+            if item.message_id in processed_message_ids:
+                logger.info(
+                    "Message is already processed, message is skipped",
+                    extra={"message_id": item.message_id},
+                )
+                _set_result(item)
+            else:
+                unprocessed_batch.append(item)
+
+        return unprocessed_batch
+
+    async def _process_batch(
+        self,
+        processor_type: type[CommandProcessor],
+        batch: list[_BatchItem],
+    ) -> None:
+        if len(batch) == 1:
+            await self._process_alone(processor_type, batch[0])
+            return
+
+        try:
+            await self._process_together(processor_type, batch)
+        except Exception as error:
+            logger.info(
+                "Batch of commands failed, processing its halves separately",
+                extra={"commands": len(batch), "error": repr(error)},
+            )
+            middle = len(batch) // 2
+            await self._process_batch(processor_type, batch[:middle])
+            await self._process_batch(processor_type, batch[middle:])
+            return
+
+        for item in batch:
+            _set_result(item)
+
+        logger.debug(
+            "Batch of commands processed",
+            extra={"commands": len(batch)},
+        )
+
+    async def _process_together(
+        self,
+        processor_type: type[CommandProcessor],
+        batch: list[_BatchItem],
+    ) -> None:
+        # Operation id of first message is used by whole
+        # batch
+        async with self._ioc_container(
+            context={StreamMessage: batch[0].message},
+        ) as request_container:
+            unit_of_work = await request_container.get(MongoDBUnitOfWork)
+            unit_of_work.defer_commits()
+            for item in batch:
+                unit_of_work.register_processed_message(item.message_id)
+
+            processor = await request_container.get(processor_type)
+            for item in batch:
+                await processor.process(item.command)
+
+            retry_policy = await request_container.get(TransactionRetryPolicy)
+            await _commit_deferred(unit_of_work, retry_policy)
+
+    async def _process_alone(
+        self,
+        processor_type: type[CommandProcessor],
+        item: _BatchItem,
+    ) -> None:
+        try:
+            async with self._ioc_container(
+                context={StreamMessage: item.message},
+            ) as request_container:
+                unit_of_work = await request_container.get(MongoDBUnitOfWork)
+                unit_of_work.register_processed_message(item.message_id)
+
+                processor = await request_container.get(processor_type)
+                await processor.process(item.command)
+        except Exception as error:
+            _set_exception(item, error)
+            return
+
+        _set_result(item)
+
+
+async def _commit_deferred(
+    unit_of_work: MongoDBUnitOfWork,
+    retry_policy: TransactionRetryPolicy,
+) -> None:
+    """
+    Commits changes of batch, retrying commits with unknown
+    result the same way as `TransactionProcessor` does.
+    """
+    attempt = 1
+    while True:
+        try:
+            await unit_of_work.commit_deferred()
+            return
+        except Exception as error:
+            delay = retry_policy.commit_retry_delay(error, attempt)
+            if delay is None:
+                raise
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _set_result(item: _BatchItem) -> None:
+    # Future is cancelled if handler of message was
+    # cancelled while waiting for batch
+    if not item.processed.done():
+        item.processed.set_result(None)
+
+
+def _set_exception(item: _BatchItem, error: Exception) -> None:
+    if not item.processed.done():
+        item.processed.set_exception(error)
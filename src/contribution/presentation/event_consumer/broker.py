@@ -1,11 +1,56 @@
-from faststream.rabbit import RabbitBroker
+from typing import Optional
 
-from .routers import admin_router
+from dishka import AsyncContainer
+from faststream.rabbit import Channel, RabbitBroker
 
+from contribution.infrastructure import EventConsumptionConfig
+from .batching import CommandBatcher
+from .lanes import ConsumerLanes
+from .processed_operations import ProcessedOperationsMiddleware
+from .routers import admin_router, batching_admin_router_factory
+
+
+def create_broker(
+    rabbitmq_url: str,
+    *,
+    ioc_container: AsyncContainer,
+    consumption_config: Optional[EventConsumptionConfig] = None,
+    batcher: Optional[CommandBatcher] = None,
+) -> RabbitBroker:
+    if batcher:
+        # Messages of batch stay unacked until batch is
+        # committed, so prefetch count must allow next batch to
+        # be collected meanwhile, otherwise batches are flushed
+        # only by timer
+        broker = RabbitBroker(
+            rabbitmq_url,
+            default_channel=Channel(prefetch_count=batcher.max_size * 2),
+        )
+        broker.include_router(batching_admin_router_factory(batcher))
+        return broker
 
-def create_broker(rabbitmq_url: str) -> RabbitBroker:
     broker = RabbitBroker(rabbitmq_url)
+    if not consumption_config:
+        broker.include_router(
+            admin_router,
+            middlewares=[ProcessedOperationsMiddleware],
+        )
+        return broker
+
+    # Redelivered message waits in lane for its first
+    # delivery, so it finds its operation in ledger
+    lanes = ConsumerLanes(consumption_config, ioc_container=ioc_container)
+    broker.include_router(
+        admin_router,
+        middlewares=[lanes.middleware, ProcessedOperationsMiddleware],
+    )
 
-    broker.include_router(admin_router)
+    # Each subscriber gets its own channel, so its prefetch
+    # count doesn't limit other subscribers
+    for subscriber in broker._subscribers.values():  # noqa: SLF001
+        prefetch_count = consumption_config.prefetch_count_of(
+            subscriber.queue.name,
+        )
+        subscriber.channel = Channel(prefetch_count=prefetch_count)
 
     return broker
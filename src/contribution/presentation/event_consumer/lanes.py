@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import zlib
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from dishka import AsyncContainer
+from faststream import BaseMiddleware
+from faststream.broker.message import StreamMessage
+
+from contribution.infrastructure import EditedEntities, EventConsumptionConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+# Lane group and field of message body with key of entity
+# changed by message of each routing key. Rejections of
+# adding contributions have only ids of contributions, so
+# they are ordered by contribution
+LANE_KEYS: dict[str, tuple[str, str]] = {
+    "user_created": ("user", "id"),
+    "user_updated": ("user", "user_id"),
+    "movie_created": ("movie", "id"),
+    "movie_updated": ("movie", "movie_id"),
+    "add_movie_contribution_accepted": ("movie", "movie_id"),
+    "person_created": ("person", "id"),
+    "person_updated": ("person", "person_id"),
+    "add_person_contribution_accepted": ("person", "person_id"),
+    "add_movie_contribution_rejected": ("contribution", "contribution_id"),
+    "add_person_contribution_rejected": ("contribution", "contribution_id"),
+}
+
+# Lane group of messages of editing contributions. They
+# have only ids of contributions, so they are laned by id
+# of movie or person edited by contribution, read from
+# document of contribution. Rejections share lane with
+# acceptances, so contribution isn't accepted and rejected
+# at the same time
+EDITED_ENTITY_LANE_GROUPS: dict[str, str] = {
+    "edit_movie_contribution_accepted": "movie",
+    "edit_movie_contribution_rejected": "movie",
+    "edit_person_contribution_accepted": "person",
+    "edit_person_contribution_rejected": "person",
+}
+
+
+class ConsumerLanes:
+    """
+    Serializes processing of messages changing the same
+    entity inside one event consumer, while messages of
+    different entities are processed concurrently.
+
+    Key of message is hashed onto one of lanes of its
+    group, and lane lets messages in one by one in order
+    of arrival. Messages of groups without keys, e.g.
+    messages with unknown routing keys, are not serialized.
+    Entities of messages of editing contributions are
+    looked up with `EditedEntities` of `ioc_container`.
+    """
+
+    def __init__(
+        self,
+        config: EventConsumptionConfig,
+        *,
+        ioc_container: AsyncContainer,
+    ):
+        self._config = config
+        self._ioc_container = ioc_container
+        self._lanes: dict[str, list[asyncio.Lock]] = {}
+
+    @property
+    def middleware(self) -> Callable[..., BaseMiddleware]:
+        return partial(_LaneMiddleware, lanes=self)
+
+    def lane(self, *, group: str, key: str) -> asyncio.Lock:
+        lanes = self._lanes.get(group)
+        if not lanes:
+            lanes_count = self._config.lanes_of(group)
+            lanes = [asyncio.Lock() for _ in range(lanes_count)]
+            self._lanes[group] = lanes
+
+        # Builtin hash of str differs between processes, so
+        # crc32 is used to keep key in the same lane
+        return lanes[zlib.crc32(key.encode()) % len(lanes)]
+
+    async def lane_of(self, message: StreamMessage) -> Optional[asyncio.Lock]:
+        routing_key = getattr(message.raw_message, "routing_key", None) or ""
+
+        edited_entity_group = EDITED_ENTITY_LANE_GROUPS.get(routing_key)
+        if edited_entity_group:
+            body = await message.decode()
+            if not isinstance(body, dict):
+                return None
+
+            entity_id = await self._edited_entity_id(
+                edited_entity_group,
+                body.get("contribution_id"),
+            )
+            if entity_id is None:
+                return None
+            return self.lane(group=edited_entity_group, key=str(entity_id))
+
+        lane_key = LANE_KEYS.get(routing_key)
+        if not lane_key:
+            return None
+
+        group, field = lane_key
+        body = await message.decode()
+        if not isinstance(body, dict) or body.get(field) is None:
+            return None
+
+        return self.lane(group=group, key=_normalized_key(body[field]))
+
+    async def _edited_entity_id(
+        self,
+        group: str,
+        contribution_id: Any,
+    ) -> Optional[UUID]:
+        try:
+            contribution_id = UUID(str(contribution_id))
+        except ValueError:
+            return None
+
+        edited_entities = await self._ioc_container.get(EditedEntities)
+        if group == "movie":
+            entity_id = await edited_entities.movie_id_of(contribution_id)
+        else:
+            entity_id = await edited_entities.person_id_of(contribution_id)
+
+        if entity_id is None:
+            logger.debug(
+                "Edited entity of contribution is not found, "
+                "message is not serialized",
+                extra={"contribution_id": contribution_id},
+            )
+        return entity_id
+
+
+class _LaneMiddleware(BaseMiddleware):
+    def __init__(self, msg: Any = None, *, lanes: ConsumerLanes):
+        super().__init__(msg)
+        self._lanes = lanes
+
+    async def consume_scope(
+        self,
+        call_next: Callable[[Any], Awaitable[Any]],
+        msg: StreamMessage,
+    ) -> Any:
+        lane = await self._lanes.lane_of(msg)
+        if not lane:
+            return await call_next(msg)
+
+        async with lane:
+            return await call_next(msg)
+
+
+def _normalized_key(value: Any) -> str:
+    # Ids are sent as hex with or without dashes, while
+    # ids of edited entities are UUIDs, so both are
+    # converted to the same form
+    try:
+        return str(UUID(str(value)))
+    except ValueError:
+        return str(value)
@@ -0,0 +1,81 @@
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable
+
+from dishka import AsyncContainer
+from faststream import BaseMiddleware, context
+from faststream.broker.message import StreamMessage
+
+from contribution.application import OperationId
+from contribution.infrastructure import (
+    MongoDBUnitOfWork,
+    ProcessedOperations,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def processed_message_id_factory(message: StreamMessage) -> str:
+    """
+    Returns id of message in ledger of processed
+    operations. AMQP message id is used if publisher has
+    set it, e.g. outbox relay sets id of outbox message.
+    Otherwise hash of routing key and body is used, as
+    faststream generates new message id on every delivery
+    of message without one.
+    """
+    amqp_message_id = getattr(message.raw_message, "message_id", None)
+    if amqp_message_id:
+        return str(amqp_message_id)
+
+    routing_key = getattr(message.raw_message, "routing_key", None) or ""
+    body_hash = hashlib.sha256(message.body).hexdigest()
+    return f"{routing_key}:{body_hash}"
+
+
+class ProcessedOperationsMiddleware(BaseMiddleware):
+    """
+    Acks message without processing if it is already in
+    ledger of processed operations, e.g. if message is
+    redelivered after crash of consumer. Otherwise makes
+    unit of work of message record message in ledger on
+    commit.
+
+    Messages are recorded by their own ids, as messages
+    published by one operation share its operation id.
+
+    Must be called inside middleware of dishka, which
+    opens request container of message.
+    """
+
+    async def consume_scope(
+        self,
+        call_next: Callable[[Any], Awaitable[Any]],
+        msg: StreamMessage,
+    ) -> Any:
+        # Operation id is read from decoded body of message
+        await msg.decode()
+
+        request_container: AsyncContainer = context.get_local("dishka")
+        operation_id = await request_container.get(OperationId)
+
+        message_id = processed_message_id_factory(msg)
+
+        processed_operations = await request_container.get(
+            ProcessedOperations,
+        )
+        if await processed_operations.is_processed(message_id):
+            logger.info(
+                "Message is already processed, message is skipped",
+                extra={
+                    "operation_id": operation_id,
+                    "message_id": message_id,
+                },
+            )
+            return None
+
+        unit_of_work = await request_container.get(MongoDBUnitOfWork)
+        unit_of_work.register_processed_message(message_id)
+
+        return await call_next(msg)
@@ -1,3 +1,4 @@
-__all__ = ("admin_router",)
+__all__ = ("admin_router", "batching_admin_router_factory")
 
 from .admin import router as admin_router
+from .batching_admin import batching_admin_router_factory
@@ -0,0 +1,132 @@
+from typing import Any, Awaitable, Callable
+
+from faststream.rabbit import RabbitRouter
+from faststream.rabbit.annotations import RabbitMessage
+
+from contribution.application import (
+    CreateUserCommand,
+    UpdateUserCommand,
+    CreateMovieCommand,
+    UpdateMovieCommand,
+    CreatePersonCommand,
+    UpdatePersonCommand,
+    AcceptMovieAddingCommand,
+    AcceptMovieEditingCommand,
+    AcceptPersonAddingCommand,
+    RejectMovieAddingCommand,
+    RejectMovieEditingCommand,
+    RejectPersonAddingCommand,
+)
+from contribution.presentation.event_consumer.batching import CommandBatcher
+from .admin import (
+    CreateUserProcessor,
+    UpdateUserProcessor,
+    CreateMovieProcessor,
+    UpdateMovieProcessor,
+    CreatePersonProcessor,
+    UpdatePersonProcessor,
+    AcceptMovieAddingProcessor,
+    AcceptMovieEditingProcessor,
+    AcceptPersonAddingProcessor,
+    AcceptPersonEditingProcessor,
+    RejectMovieAddingProcessor,
+    RejectMovieEditingProcessor,
+    RejectPersonAddingProcessor,
+    RejectPersonEditingProcessor,
+)
+
+
+# Routing key, command and processor of each subscriber
+# of admin router
+_ROUTES: tuple[tuple[str, type, Any], ...] = (
+    ("user_created", CreateUserCommand, CreateUserProcessor),
+    ("user_updated", UpdateUserCommand, UpdateUserProcessor),
+    ("movie_created", CreateMovieCommand, CreateMovieProcessor),
+    ("movie_updated", UpdateMovieCommand, UpdateMovieProcessor),
+    ("person_created", CreatePersonCommand, CreatePersonProcessor),
+    ("person_updated", UpdatePersonCommand, UpdatePersonProcessor),
+    (
+        "add_movie_contribution_accepted",
+        AcceptMovieAddingCommand,
+        AcceptMovieAddingProcessor,
+    ),
+    (
+        "edit_movie_contribution_accepted",
+        AcceptMovieEditingCommand,
+        AcceptMovieEditingProcessor,
+    ),
+    (
+        "add_person_contribution_accepted",
+        AcceptPersonAddingCommand,
+        AcceptPersonAddingProcessor,
+    ),
+    (
+        "edit_person_contribution_accepted",
+        AcceptPersonAddingCommand,
+        AcceptPersonEditingProcessor,
+    ),
+    (
+        "add_movie_contribution_rejected",
+        RejectMovieAddingCommand,
+        RejectMovieAddingProcessor,
+    ),
+    (
+        "edit_movie_contribution_rejected",
+        RejectMovieEditingCommand,
+        RejectMovieEditingProcessor,
+    ),
+    (
+        "add_person_contribution_rejected",
+        RejectPersonAddingCommand,
+        RejectPersonAddingProcessor,
+    ),
+    (
+        "edit_person_contribution_rejected",
+        RejectPersonAddingCommand,
+        RejectPersonEditingProcessor,
+    ),
+)
+
+
+def batching_admin_router_factory(batcher: CommandBatcher) -> RabbitRouter:
+    """
+    Returns router with the same subscribers as admin
+    router, but commands of subscribers are processed in
+    batches by `batcher`.
+    """
+    router = RabbitRouter()
+
+    for routing_key, command_type, processor_type in _ROUTES:
+        handler = _batching_handler_factory(
+            batcher=batcher,
+            routing_key=routing_key,
+            command_type=command_type,
+            processor_type=processor_type,
+        )
+        router.subscriber(routing_key)(handler)
+
+    return router
+
+
+def _batching_handler_factory(
+    *,
+    batcher: CommandBatcher,
+    routing_key: str,
+    command_type: type,
+    processor_type: Any,
+) -> Callable[..., Awaitable[None]]:
+    async def handler(command: Any, message: RabbitMessage) -> None:
+        await batcher.process(
+            routing_key=routing_key,
+            processor_type=processor_type,
+            command=command,
+            message=message,
+        )
+
+    # FastStream decodes message body into type of
+    # annotation of first argument
+    handler.__annotations__["command"] = command_type
+    handler.__name__ = routing_key
+    handler.__qualname__ = routing_key
+
+    return handler
@@ -1,6 +1,7 @@
-from typing import Union
+from dataclasses import dataclass
+from typing import Optional, Union
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import Response, JSONResponse
 
 from contribution.domain import (
@@ -25,318 +26,201 @@ from contribution.application import (
     WritersDoNotExistError,
     CrewMembersDoNotExistError,
     PersonDoesNotExistError,
+    ConcurrentModificationError,
+    InvalidContributionCursorError,
+    ContributionBatchIsTooLargeError,
 )
 
 
-def setup_exception_handlers(app: FastAPI) -> None:
-    app.add_exception_handler(
-        UserIsNotActiveError,
-        _on_user_is_not_active_error,
-    )
-    app.add_exception_handler(
-        InvalidMovieEngTitleError,
-        _on_invalid_movie_eng_title_error,
-    )
-    app.add_exception_handler(
-        InvalidMovieOriginalTitleError,
-        _on_invalid_movie_original_title_error,
-    )
-    app.add_exception_handler(
-        InvalidMovieSummaryError,
-        _on_invalid_movie_summary_error,
-    )
-    app.add_exception_handler(
-        InvalidMovieDescriptionError,
-        _on_invalid_movie_description_error,
-    )
-    app.add_exception_handler(
-        InvalidMovieDurationError,
-        _on_invalid_movie_duration_error,
-    )
-    app.add_exception_handler(
-        InvalidRoleCharacterError,
-        _on_invalid_role_character_error,
-    )
-    app.add_exception_handler(
-        InvalidRoleImportanceError,
-        _on_invalid_role_importance_error,
-    )
-    app.add_exception_handler(
-        InvalidPersonFirstNameError,
-        _on_invalid_person_first_name_error,
-    )
-    app.add_exception_handler(
-        InvalidPersonLastNameError,
-        _on_invalid_person_last_name_error,
-    )
-    app.add_exception_handler(
-        InvalidPersonBirthOrDeathDateError,
-        _on_invalid_person_birth_or_death_date_error,
-    )
-    app.add_exception_handler(
-        UserDoesNotExistError,
-        _on_user_does_not_exist_error,
-    )
-    app.add_exception_handler(
-        NotEnoughPermissionsError,
-        _on_not_enough_permissions_error,
-    )
-    app.add_exception_handler(
-        PersonsDoNotExistError,
-        _on_persons_do_not_exist_error,
-    )
-    app.add_exception_handler(
-        MovieDoesNotExistError,
-        _on_movie_does_not_exist_error,
-    )
-    app.add_exception_handler(
-        RolesDoNotExistError,
-        _on_roles_do_not_exist_error,
-    )
-    app.add_exception_handler(
-        WritersDoNotExistError,
-        _on_writers_do_not_exist_error,
-    )
-    app.add_exception_handler(
-        CrewMembersDoNotExistError,
-        _on_crew_members_do_not_exist_error,
-    )
-    app.add_exception_handler(
-        PersonDoesNotExistError,
-        _on_person_does_not_exist_error,
-    )
-    app.add_exception_handler(Exception, _on_unknown_error)
-
-
-def _on_user_is_not_active_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=10,
-            message="User is not active.",
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_movie_eng_title_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=220,
-            message=(
-                "Invalid length of eng_title. Lenght of eng_title must be "
-                "more than 1 character and less than 128 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_movie_original_title_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=230,
-            message=(
-                "Invalid length of original_title. Lenght of original_title "
-                "must be more than 1 character and less than 128 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_movie_summary_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=240,
-            message=(
-                "Invalid length of summary. Lenght of summary "
-                "must be more than 5 characters and less than 128 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_movie_description_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=250,
-            message=(
-                "Invalid length of description. Lenght of description "
-                "must be more than 32 characters and less than 512 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_movie_duration_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=260,
-            message="Invalid duration. Duration must be more than 1 minute.",
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_role_character_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=420,
-            message=(
-                "Invalid length of character. Lenght of character must be "
-                "more than 1 character and less than 64 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_role_importance_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=430,
-            message="Invalid importance. Importance must be more than 1 point",
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_person_first_name_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=320,
-            message=(
-                "Invalid length of first_name. Lenght of first_name must be "
-                "more than 1 character and less than 128 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_person_last_name_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=330,
-            message=(
-                "Invalid length of last_name. Lenght of last_name must be "
-                "more than 1 character and less than 128 characters."
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_invalid_person_birth_or_death_date_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=340,
-            message=(
-                "Invalid birth_date or death_date. Date of death must be "
-                "later than date of birth. "
-            ),
-        ),
-        status_code=400,
-    )
-
-
-def _on_user_does_not_exist_error(*_) -> Response:
-    return Response(status_code=500)
-
-
-def _on_not_enough_permissions_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=20,
-            message="User has not enough permissions.",
-        ),
-        status_code=400,
-    )
+@dataclass(frozen=True, slots=True)
+class _ErrorDescription:
+    code: int
+    # Formatted with error as `error`, e.g. "{error.person_ids}"
+    message: str
+    status_code: int = 400
+
+
+_ERROR_DESCRIPTIONS: dict[type[Exception], _ErrorDescription] = {
+    UserIsNotActiveError: _ErrorDescription(
+        code=10,
+        message="User is not active.",
+    ),
+    NotEnoughPermissionsError: _ErrorDescription(
+        code=20,
+        message="User has not enough permissions.",
+    ),
+    ConcurrentModificationError: _ErrorDescription(
+        code=30,
+        message=(
+            "Data was changed by another request. Please, retry the request."
+        ),
+        status_code=409,
+    ),
+    InvalidContributionCursorError: _ErrorDescription(
+        code=40,
+        message="Invalid page cursor.",
+    ),
+    ContributionBatchIsTooLargeError: _ErrorDescription(
+        code=50,
+        message=(
+            "Too many items in batch. "
+            "Batch must contain at most {error.max_size} items."
+        ),
+    ),
+    MovieDoesNotExistError: _ErrorDescription(
+        code=200,
+        message="Movie doesn't exist.",
+    ),
+    InvalidMovieEngTitleError: _ErrorDescription(
+        code=220,
+        message=(
+            "Invalid length of eng_title. Lenght of eng_title must be "
+            "more than 1 character and less than 128 characters."
+        ),
+    ),
+    InvalidMovieOriginalTitleError: _ErrorDescription(
+        code=230,
+        message=(
+            "Invalid length of original_title. Lenght of original_title "
+            "must be more than 1 character and less than 128 characters."
+        ),
+    ),
+    InvalidMovieSummaryError: _ErrorDescription(
+        code=240,
+        message=(
+            "Invalid length of summary. Lenght of summary "
+            "must be more than 5 characters and less than 128 characters."
+        ),
+    ),
+    InvalidMovieDescriptionError: _ErrorDescription(
+        code=250,
+        message=(
+            "Invalid length of description. Lenght of description "
+            "must be more than 32 characters and less than 512 characters."
+        ),
+    ),
+    InvalidMovieDurationError: _ErrorDescription(
+        code=260,
+        message="Invalid duration. Duration must be more than 1 minute.",
+    ),
+    PersonDoesNotExistError: _ErrorDescription(
+        code=300,
+        message="Person doesn't exist.",
+    ),
+    PersonsDoNotExistError: _ErrorDescription(
+        code=310,
+        message=(
+            "Some of persons do not exist. "
+            "Ids of non existing persons: {error.person_ids}"
+        ),
+    ),
+    InvalidPersonFirstNameError: _ErrorDescription(
+        code=320,
+        message=(
+            "Invalid length of first_name. Lenght of first_name must be "
+            "more than 1 character and less than 128 characters."
+        ),
+    ),
+    InvalidPersonLastNameError: _ErrorDescription(
+        code=330,
+        message=(
+            "Invalid length of last_name. Lenght of last_name must be "
+            "more than 1 character and less than 128 characters."
+        ),
+    ),
+    InvalidPersonBirthOrDeathDateError: _ErrorDescription(
+        code=340,
+        message=(
+            "Invalid birth_date or death_date. Date of death must be "
+            "later than date of birth. "
+        ),
+    ),
+    RolesDoNotExistError: _ErrorDescription(
+        code=410,
+        message=(
+            "Some of roles do not exist. "
+            "Ids of non existing roles: {error.role_ids}"
+        ),
+    ),
+    InvalidRoleCharacterError: _ErrorDescription(
+        code=420,
+        message=(
+            "Invalid length of character. Lenght of character must be "
+            "more than 1 character and less than 64 characters."
+        ),
+    ),
+    InvalidRoleImportanceError: _ErrorDescription(
+        code=430,
+        message="Invalid importance. Importance must be more than 1 point",
+    ),
+    WritersDoNotExistError: _ErrorDescription(
+        code=510,
+        message=(
+            "Some of writers do not exist. "
+            "Ids of non existing writers: {error.writer_ids}"
+        ),
+    ),
+    CrewMembersDoNotExistError: _ErrorDescription(
+        code=610,
+        message=(
+            "Some of crew members do not exist. Ids of non "
+            "existing crew members: {error.crew_member_ids}"
+        ),
+    ),
+}
+
+_INVALID_BATCH_ITEM_ERROR_DESCRIPTION = _ErrorDescription(
+    code=60,
+    message="Item of batch is invalid.",
+)
 
 
-def _on_persons_do_not_exist_error(
-    _,
-    error: PersonsDoNotExistError,
-) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=310,
-            message=(
-                "Some of persons do not exist. "
-                f"Ids of non existing persons: {error.person_ids}"
-            ),
-        ),
-        status_code=400,
-    )
+def setup_exception_handlers(app: FastAPI) -> None:
+    for error_type in _ERROR_DESCRIPTIONS:
+        app.add_exception_handler(error_type, _on_described_error)
+    app.add_exception_handler(UserDoesNotExistError, _on_unknown_error)
+    app.add_exception_handler(Exception, _on_unknown_error)
 
 
-def _on_movie_does_not_exist_error(*_) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=200,
-            message="Movie doesn't exist.",
-        ),
-        status_code=400,
+def batch_item_error_json_as_dict_factory(
+    error: Exception,
+) -> dict[str, Union[str, int]]:
+    """
+    Returns error of item of batch request with the same
+    code, message and status code as error response of
+    single item request.
+    """
+    error_description = (
+        _error_description(error) or _INVALID_BATCH_ITEM_ERROR_DESCRIPTION
     )
-
-
-def _on_roles_do_not_exist_error(
-    _,
-    error: RolesDoNotExistError,
-) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=410,
-            message=(
-                "Some of roles do not exist. "
-                f"Ids of non existing roles: {error.role_ids}"
-            ),
+    return {
+        **_error_json_as_dict_factory(
+            code=error_description.code,
+            message=error_description.message.format(error=error),
         ),
-        status_code=400,
-    )
+        "status_code": error_description.status_code,
+    }
 
 
-def _on_writers_do_not_exist_error(
-    _,
-    error: WritersDoNotExistError,
-) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=510,
-            message=(
-                "Some of writers do not exist. "
-                f"Ids of non existing writers: {error.writer_ids}"
-            ),
-        ),
-        status_code=400,
-    )
+def _error_description(error: Exception) -> Optional[_ErrorDescription]:
+    for error_type in type(error).__mro__:
+        error_description = _ERROR_DESCRIPTIONS.get(error_type)
+        if error_description:
+            return error_description
+    return None
 
 
-def _on_crew_members_do_not_exist_error(
-    _,
-    error: CrewMembersDoNotExistError,
-) -> JSONResponse:
-    return JSONResponse(
-        content=_error_json_as_dict_factory(
-            code=610,
-            message=(
-                "Some of crew members do not exist. Ids of non "
-                f"existing crew members: {error.crew_member_ids}"
-            ),
-        ),
-        status_code=400,
-    )
-
+def _on_described_error(_: Request, error: Exception) -> Response:
+    error_description = _error_description(error)
+    if not error_description:
+        return _on_unknown_error()
 
-def _on_person_does_not_exist_error(*_) -> JSONResponse:
     return JSONResponse(
         content=_error_json_as_dict_factory(
-            code=300,
-            message="Person doesn't exist.",
+            code=error_description.code,
+            message=error_description.message.format(error=error),
         ),
-        status_code=400,
+        status_code=error_description.status_code,
     )
 
 
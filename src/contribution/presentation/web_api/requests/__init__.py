@@ -1,7 +1,9 @@
 __all__ = (
     "EditMovieRequest",
     "EditPersonRequest",
+    "ListContributionsRequest",
 )
 
 from .movie_contribution_requests import EditMovieRequest
 from .person_contribution_requests import EditPersonRequest
+from .list_contributions import ListContributionsRequest
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from contribution.domain import ContributionStatus, UserId
+from contribution.application import (
+    MAX_CONTRIBUTION_PAGE_SIZE,
+    ListContributionsQuery,
+)
+
+
+class ListContributionsRequest(BaseModel):
+    author_id: Optional[UserId] = None
+    all_authors: bool = False
+    status: Optional[ContributionStatus] = None
+    limit: int = Field(default=20, ge=1, le=MAX_CONTRIBUTION_PAGE_SIZE)
+    cursor: Optional[str] = None
+
+    def to_query(self) -> ListContributionsQuery:
+        return ListContributionsQuery(
+            author_id=self.author_id,
+            all_authors=self.all_authors,
+            status=self.status,
+            limit=self.limit,
+            cursor=self.cursor,
+        )
@@ -0,0 +1,6 @@
+__all__ = (
+    "ErrorResponse",
+    "ContributionBatchItemResponse",
+)
+
+from .contribution_batch import ErrorResponse, ContributionBatchItemResponse
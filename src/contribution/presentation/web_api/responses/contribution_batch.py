@@ -0,0 +1,32 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from contribution.application import BatchItemResult
+from contribution.presentation.web_api.exception_handlers import (
+    batch_item_error_json_as_dict_factory,
+)
+
+
+class ErrorResponse(BaseModel):
+    code: int
+    message: str
+    # Status code of response to request with only this
+    # item
+    status_code: int
+
+
+class ContributionBatchItemResponse(BaseModel):
+    contribution_id: Optional[UUID] = None
+    error: Optional[ErrorResponse] = None
+
+    @classmethod
+    def from_result(
+        cls,
+        result: BatchItemResult[UUID],
+    ) -> "ContributionBatchItemResponse":
+        if result.error:
+            error_json = batch_item_error_json_as_dict_factory(result.error)
+            return cls(error=ErrorResponse.model_validate(error_json))
+        return cls(contribution_id=result.result)
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Query
 from dishka.integrations.fastapi import FromDishka, inject
 
 from contribution.domain import (
@@ -8,19 +10,43 @@ from contribution.domain import (
 from contribution.application import (
     CommandProcessor,
     AddMovieCommand,
+    AddMoviesCommand,
     EditMovieCommand,
+    ListContributionsQuery,
+    AddMovieContributionSummary,
+    EditMovieContributionSummary,
+    ContributionPage,
+    BatchItemResult,
+)
+from contribution.presentation.web_api.requests import (
+    EditMovieRequest,
+    ListContributionsRequest,
+)
+from contribution.presentation.web_api.responses import (
+    ContributionBatchItemResponse,
 )
-from contribution.presentation.web_api.requests import EditMovieRequest
 
 
 AddMovieCommandProcessor = CommandProcessor[
     AddMovieCommand,
     AddMovieContributionId,
 ]
+AddMoviesCommandProcessor = CommandProcessor[
+    AddMoviesCommand,
+    list[BatchItemResult[AddMovieContributionId]],
+]
 EditMovieCommandProcessor = CommandProcessor[
     EditMovieCommand,
     EditMovieContributionId,
 ]
+ListAddMovieContributionsProcessor = CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[AddMovieContributionSummary],
+]
+ListEditMovieContributionsProcessor = CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[EditMovieContributionSummary],
+]
 
 
 router = APIRouter(tags=["Movie contribution requests"])
@@ -40,6 +66,26 @@ async def add_movie(
     return await command_processor.process(command)
 
 
+@router.post("/add-movie-contribution-requests/batch")
+@inject
+async def add_movies(
+    *,
+    command: AddMoviesCommand,
+    command_processor: FromDishka[AddMoviesCommandProcessor],
+) -> list[ContributionBatchItemResponse]:
+    """
+    Creates requests to add movies on **amdb** in one
+    transaction and returns id or error of each request in
+    order of `movies`. Request rejected with error is not
+    created, other requests are. Batch must contain at
+    most 50 movies.
+    """
+    results = await command_processor.process(command)
+    return [
+        ContributionBatchItemResponse.from_result(result) for result in results
+    ]
+
+
 @router.post("/edit-movie-contribution-requests")
 @inject
 async def edit_movie(
@@ -53,3 +99,39 @@ async def edit_movie(
     """
     command = request.to_command()
     return await command_processor.process(command)
+
+
+@router.get("/add-movie-contribution-requests")
+@inject
+async def list_add_movie_contributions(
+    *,
+    request: Annotated[ListContributionsRequest, Query()],
+    query_processor: FromDishka[ListAddMovieContributionsProcessor],
+) -> ContributionPage[AddMovieContributionSummary]:
+    """
+    Returns page of requests to add movie on **amdb**
+    from newest to oldest. Next page is requested by
+    passing `next_cursor` of previous page as `cursor`.
+    Requests of current user are returned by default,
+    listing requests of other users by `author_id` or
+    `all_authors` requires moderation permissions.
+    """
+    return await query_processor.process(request.to_query())
+
+
+@router.get("/edit-movie-contribution-requests")
+@inject
+async def list_edit_movie_contributions(
+    *,
+    request: Annotated[ListContributionsRequest, Query()],
+    query_processor: FromDishka[ListEditMovieContributionsProcessor],
+) -> ContributionPage[EditMovieContributionSummary]:
+    """
+    Returns page of requests to edit movie on **amdb**
+    from newest to oldest. Next page is requested by
+    passing `next_cursor` of previous page as `cursor`.
+    Requests of current user are returned by default,
+    listing requests of other users by `author_id` or
+    `all_authors` requires moderation permissions.
+    """
+    return await query_processor.process(request.to_query())
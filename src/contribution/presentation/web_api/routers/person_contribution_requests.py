@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Query
 from dishka.integrations.fastapi import FromDishka, inject
 
 from contribution.domain import (
@@ -8,19 +10,43 @@ from contribution.domain import (
 from contribution.application import (
     CommandProcessor,
     AddPersonCommand,
+    AddPersonsCommand,
     EditPersonCommand,
+    ListContributionsQuery,
+    AddPersonContributionSummary,
+    EditPersonContributionSummary,
+    ContributionPage,
+    BatchItemResult,
+)
+from contribution.presentation.web_api.requests import (
+    EditPersonRequest,
+    ListContributionsRequest,
+)
+from contribution.presentation.web_api.responses import (
+    ContributionBatchItemResponse,
 )
-from contribution.presentation.web_api.requests import EditPersonRequest
 
 
 AddPersonCommandProcessor = CommandProcessor[
     AddPersonCommand,
     AddPersonContributionId,
 ]
+AddPersonsCommandProcessor = CommandProcessor[
+    AddPersonsCommand,
+    list[BatchItemResult[AddPersonContributionId]],
+]
 EditPersonCommandProcessor = CommandProcessor[
     EditPersonCommand,
     EditPersonContributionId,
 ]
+ListAddPersonContributionsProcessor = CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[AddPersonContributionSummary],
+]
+ListEditPersonContributionsProcessor = CommandProcessor[
+    ListContributionsQuery,
+    ContributionPage[EditPersonContributionSummary],
+]
 
 
 router = APIRouter(tags=["Person contribution requests"])
@@ -40,6 +66,26 @@ async def add_person(
     return await command_processor.process(command)
 
 
+@router.post("/add-person-contribution-requests/batch")
+@inject
+async def add_persons(
+    *,
+    command: AddPersonsCommand,
+    command_processor: FromDishka[AddPersonsCommandProcessor],
+) -> list[ContributionBatchItemResponse]:
+    """
+    Creates requests to add persons on **amdb** in one
+    transaction and returns id or error of each request in
+    order of `persons`. Request rejected with error is not
+    created, other requests are. Batch must contain at
+    most 50 persons.
+    """
+    results = await command_processor.process(command)
+    return [
+        ContributionBatchItemResponse.from_result(result) for result in results
+    ]
+
+
 @router.post("/edit-person-contribution-requests")
 @inject
 async def edit_person(
@@ -53,3 +99,39 @@ async def edit_person(
     """
     command = request.to_command()
     return await command_processor.process(command)
+
+
+@router.get("/add-person-contribution-requests")
+@inject
+async def list_add_person_contributions(
+    *,
+    request: Annotated[ListContributionsRequest, Query()],
+    query_processor: FromDishka[ListAddPersonContributionsProcessor],
+) -> ContributionPage[AddPersonContributionSummary]:
+    """
+    Returns page of requests to add person on **amdb**
+    from newest to oldest. Next page is requested by
+    passing `next_cursor` of previous page as `cursor`.
+    Requests of current user are returned by default,
+    listing requests of other users by `author_id` or
+    `all_authors` requires moderation permissions.
+    """
+    return await query_processor.process(request.to_query())
+
+
+@router.get("/edit-person-contribution-requests")
+@inject
+async def list_edit_person_contributions(
+    *,
+    request: Annotated[ListContributionsRequest, Query()],
+    query_processor: FromDishka[ListEditPersonContributionsProcessor],
+) -> ContributionPage[EditPersonContributionSummary]:
+    """
+    Returns page of requests to edit person on **amdb**
+    from newest to oldest. Next page is requested by
+    passing `next_cursor` of previous page as `cursor`.
+    Requests of current user are returned by default,
+    listing requests of other users by `author_id` or
+    `all_authors` requires moderation permissions.
+    """
+    return await query_processor.process(request.to_query())
@@ -1,8 +1,8 @@
 from unittest.mock import AsyncMock
 
 import pytest
+from uuid_extensions import uuid7
 from motor.motor_asyncio import (
-    AsyncIOMotorClientSession,
     AsyncIOMotorDatabase,
 )
 from redis.asyncio import Redis
@@ -10,6 +10,7 @@ from redis.asyncio import Redis
 from contribution.application import (
     EnsurePersonsExist,
     OnEventOccurred,
+    OperationId,
 )
 from contribution.infrastructure import (
     UserCollection,
@@ -23,6 +24,8 @@ from contribution.infrastructure import (
     AddPersonContributionCollection,
     EditPersonContributionCollection,
     AchievementCollection,
+    ProcessedOperationCollection,
+    OutboxCollection,
     PermissionsCollection,
     user_collection_factory,
     movie_collection_factory,
@@ -35,6 +38,8 @@ from contribution.infrastructure import (
     add_person_contribution_collection_factory,
     edit_person_contribution_collection_factory,
     achievement_collection_factory,
+    processed_operation_collection_factory,
+    outbox_collection_factory,
     permissions_collection_factory,
     UserMap,
     MovieMap,
@@ -72,6 +77,12 @@ from contribution.infrastructure import (
     PermissionsMapper,
     MongoDBLockFactory,
     MongoDBUnitOfWork,
+    ProcessedOperations,
+    Outbox,
+    MongoDBSession,
+    UUIDCodec,
+    ModelVersions,
+    CreditsLayout,
     PermissionsCache,
     PermissionsStorage,
     RedisConfig,
@@ -96,80 +107,94 @@ def on_event_occurred() -> OnEventOccurred:
 
 
 @pytest.fixture
-async def user_collection(
+def user_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> UserCollection:
-    return await user_collection_factory(motor_database)
+    return user_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def movie_collection(
+def movie_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> MovieCollection:
-    return await movie_collection_factory(motor_database)
+    return movie_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def person_collection(
+def person_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> PersonCollection:
-    return await person_collection_factory(motor_database)
+    return person_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def role_collection(
+def role_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> RoleCollection:
-    return await role_collection_factory(motor_database)
+    return role_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def writer_collection(
+def writer_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> WriterCollection:
-    return await writer_collection_factory(motor_database)
+    return writer_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def crew_member_collection(
+def crew_member_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> CrewMemberCollection:
-    return await crew_member_collection_factory(motor_database)
+    return crew_member_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def add_movie_contribution_collection(
+def add_movie_contribution_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> AddMovieContributionCollection:
-    return await add_movie_contribution_collection_factory(motor_database)
+    return add_movie_contribution_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def edit_movie_contribution_collection(
+def edit_movie_contribution_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> EditMovieContributionCollection:
-    return await edit_movie_contribution_collection_factory(motor_database)
+    return edit_movie_contribution_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def add_person_contribution_collection(
+def add_person_contribution_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> AddPersonContributionCollection:
-    return await add_person_contribution_collection_factory(motor_database)
+    return add_person_contribution_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def edit_person_contribution_collection(
+def edit_person_contribution_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> EditPersonContributionCollection:
-    return await edit_person_contribution_collection_factory(motor_database)
+    return edit_person_contribution_collection_factory(motor_database)
 
 
 @pytest.fixture
-async def achievement_collection(
+def achievement_collection(
     motor_database: AsyncIOMotorDatabase,
 ) -> AchievementCollection:
-    return await achievement_collection_factory(motor_database)
+    return achievement_collection_factory(motor_database)
+
+
+@pytest.fixture
+def processed_operation_collection(
+    motor_database: AsyncIOMotorDatabase,
+) -> ProcessedOperationCollection:
+    return processed_operation_collection_factory(motor_database)
+
+
+@pytest.fixture
+def outbox_collection(
+    motor_database: AsyncIOMotorDatabase,
+) -> OutboxCollection:
+    return outbox_collection_factory(motor_database)
 
 
 @pytest.fixture
@@ -179,6 +204,61 @@ def permissions_collection(
     return permissions_collection_factory(motor_database)
 
 
+@pytest.fixture
+def user_map() -> UserMap:
+    return UserMap()
+
+
+@pytest.fixture
+def movie_map() -> MovieMap:
+    return MovieMap()
+
+
+@pytest.fixture
+def person_map() -> PersonMap:
+    return PersonMap()
+
+
+@pytest.fixture
+def role_map() -> RoleMap:
+    return RoleMap()
+
+
+@pytest.fixture
+def writer_map() -> WriterMap:
+    return WriterMap()
+
+
+@pytest.fixture
+def crew_member_map() -> CrewMemberMap:
+    return CrewMemberMap()
+
+
+@pytest.fixture
+def add_movie_contribution_map() -> AddMovieContributionMap:
+    return AddMovieContributionMap()
+
+
+@pytest.fixture
+def edit_movie_contribution_map() -> EditMovieContributionMap:
+    return EditMovieContributionMap()
+
+
+@pytest.fixture
+def add_person_contribution_map() -> AddPersonContributionMap:
+    return AddPersonContributionMap()
+
+
+@pytest.fixture
+def edit_person_contribution_map() -> EditPersonContributionMap:
+    return EditPersonContributionMap()
+
+
+@pytest.fixture
+def achievement_map() -> AchievementMap:
+    return AchievementMap()
+
+
 @pytest.fixture
 def unit_of_work(
     user_collection: UserCollection,
@@ -192,249 +272,369 @@ def unit_of_work(
     add_person_contribution_collection: AddPersonContributionCollection,
     edit_person_contribution_collection: EditPersonContributionCollection,
     achievement_collection: AchievementCollection,
-    motor_session: AsyncIOMotorClientSession,
+    processed_operation_collection: ProcessedOperationCollection,
+    outbox_collection: OutboxCollection,
+    user_map: UserMap,
+    movie_map: MovieMap,
+    person_map: PersonMap,
+    role_map: RoleMap,
+    writer_map: WriterMap,
+    crew_member_map: CrewMemberMap,
+    add_movie_contribution_map: AddMovieContributionMap,
+    edit_movie_contribution_map: EditMovieContributionMap,
+    add_person_contribution_map: AddPersonContributionMap,
+    edit_person_contribution_map: EditPersonContributionMap,
+    achievement_map: AchievementMap,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
+    credits_layout: CreditsLayout,
 ) -> MongoDBUnitOfWork:
     return MongoDBUnitOfWork(
         commit_user_collection_changes=(
             CommitUserCollectionChanges(
                 collection=user_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_movie_collection_changes=(
             CommitMovieCollectionChanges(
                 collection=movie_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_person_collection_changes=(
             CommitPersonCollectionChanges(
                 collection=person_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_role_collection_changes=(
             CommitRoleCollectionChanges(
                 collection=role_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                credits_layout=credits_layout,
             )
         ),
         commit_writer_collection_changes=(
             CommitWriterCollectionChanges(
                 collection=writer_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                credits_layout=credits_layout,
             )
         ),
         commit_crew_member_collection_changes=(
             CommitCrewMemberCollectionChanges(
                 collection=crew_member_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                credits_layout=credits_layout,
             )
         ),
         commit_add_movie_contribution_collection_changes=(
             CommitAddMovieContributionCollectionChanges(
                 collection=add_movie_contribution_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_edit_movie_contribution_collection_changes=(
             CommitEditMovieContributionCollectionChanges(
                 collection=edit_movie_contribution_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_add_person_contribution_collection_changes=(
             CommitAddPersonContributionCollectionChanges(
                 collection=add_person_contribution_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_edit_person_contribution_collection_changes=(
             CommitEditPersonContributionCollectionChanges(
                 collection=edit_person_contribution_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
+                model_versions=model_versions,
             )
         ),
         commit_achievement_collection_changes=(
             CommitAchievementCollectionChanges(
                 collection=achievement_collection,
                 session=motor_session,
+                uuid_codec=uuid_codec,
             )
         ),
+        user_map=user_map,
+        movie_map=movie_map,
+        person_map=person_map,
+        role_map=role_map,
+        writer_map=writer_map,
+        crew_member_map=crew_member_map,
+        add_movie_contribution_map=add_movie_contribution_map,
+        edit_movie_contribution_map=edit_movie_contribution_map,
+        add_person_contribution_map=add_person_contribution_map,
+        edit_person_contribution_map=edit_person_contribution_map,
+        achievement_map=achievement_map,
+        processed_operations=ProcessedOperations(
+            collection=processed_operation_collection,
+            session=motor_session,
+        ),
+        outbox=Outbox(
+            collection=outbox_collection,
+            session=motor_session,
+        ),
         session=motor_session,
+        operation_id=OperationId(uuid7().hex),
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def user_gateway(
+    user_map: UserMap,
     user_collection: UserCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> UserMapper:
     return UserMapper(
-        user_map=UserMap(),
+        user_map=user_map,
         user_collection=user_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def movie_gateway(
+    movie_map: MovieMap,
     movie_collection: MovieCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> MovieMapper:
     return MovieMapper(
-        movie_map=MovieMap(),
+        movie_map=movie_map,
         movie_collection=movie_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def person_gateway(
+    person_map: PersonMap,
     person_collection: PersonCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> PersonMapper:
     return PersonMapper(
-        person_map=PersonMap(),
+        person_map=person_map,
         person_collection=person_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def role_gateway(
+    role_map: RoleMap,
     role_collection: RoleCollection,
+    movie_collection: MovieCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    credits_layout: CreditsLayout,
 ) -> RoleMapper:
     return RoleMapper(
-        role_map=RoleMap(),
+        role_map=role_map,
         role_collection=role_collection,
+        movie_collection=movie_collection,
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        credits_layout=credits_layout,
     )
 
 
 @pytest.fixture
 def writer_gateway(
+    writer_map: WriterMap,
     writer_collection: WriterCollection,
+    movie_collection: MovieCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    credits_layout: CreditsLayout,
 ) -> WriterMapper:
     return WriterMapper(
-        writer_map=WriterMap(),
+        writer_map=writer_map,
         writer_collection=writer_collection,
+        movie_collection=movie_collection,
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        credits_layout=credits_layout,
     )
 
 
 @pytest.fixture
 def crew_member_gateway(
+    crew_member_map: CrewMemberMap,
     crew_member_collection: CrewMemberCollection,
+    movie_collection: MovieCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    credits_layout: CreditsLayout,
 ) -> CrewMemberMapper:
     return CrewMemberMapper(
-        crew_member_map=CrewMemberMap(),
+        crew_member_map=crew_member_map,
         crew_member_collection=crew_member_collection,
+        movie_collection=movie_collection,
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        credits_layout=credits_layout,
     )
 
 
 @pytest.fixture
 def add_movie_contribution_gateway(
+    add_movie_contribution_map: AddMovieContributionMap,
     add_movie_contribution_collection: AddMovieContributionCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> AddMovieContributionMapper:
     return AddMovieContributionMapper(
-        contribution_map=AddMovieContributionMap(),
+        contribution_map=add_movie_contribution_map,
         contribution_collection=add_movie_contribution_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def edit_movie_contribution_gateway(
+    edit_movie_contribution_map: EditMovieContributionMap,
     edit_movie_contribution_collection: EditMovieContributionCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> EditMovieContributionMapper:
     return EditMovieContributionMapper(
-        contribution_map=EditMovieContributionMap(),
+        contribution_map=edit_movie_contribution_map,
         contribution_collection=edit_movie_contribution_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def add_person_contribution_gateway(
+    add_person_contribution_map: AddPersonContributionMap,
     add_person_contribution_collection: AddPersonContributionCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> AddPersonContributionMapper:
     return AddPersonContributionMapper(
-        contribution_map=AddPersonContributionMap(),
+        contribution_map=add_person_contribution_map,
         contribution_collection=add_person_contribution_collection,
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def edit_person_contribution_gateway(
+    edit_person_contribution_map: EditPersonContributionMap,
     edit_person_contribution_collection: EditPersonContributionCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
+    model_versions: ModelVersions,
 ) -> EditPersonContributionMapper:
     return EditPersonContributionMapper(
-        contribution_map=EditPersonContributionMap(),
+        contribution_map=edit_person_contribution_map,
         contribution_collection=(edit_person_contribution_collection),
         lock_factory=MongoDBLockFactory(),
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
+        model_versions=model_versions,
     )
 
 
 @pytest.fixture
 def achievement_gateway(
+    achievement_map: AchievementMap,
     achievement_collection: AchievementCollection,
     unit_of_work: MongoDBUnitOfWork,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    uuid_codec: UUIDCodec,
 ) -> AchievementMapper:
     return AchievementMapper(
-        achievement_map=AchievementMap(),
+        achievement_map=achievement_map,
         achievement_collection=achievement_collection,
         unit_of_work=unit_of_work,
         session=motor_session,
+        uuid_codec=uuid_codec,
     )
 
 
 @pytest.fixture
 def permissions_storage(
     permissions_collection: PermissionsCollection,
-    motor_session: AsyncIOMotorClientSession,
     redis_client: Redis,
+    uuid_codec: UUIDCodec,
 ) -> PermissionsStorage:
     permissions_mapper = PermissionsMapper(
         permissions_collection=permissions_collection,
-        session=motor_session,
+        uuid_codec=uuid_codec,
     )
     permissions_cache = PermissionsCache(redis_client)
     permissions_storage = PermissionsStorage(
@@ -1,5 +1,6 @@
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from typing import Callable, ContextManager
 from unittest.mock import AsyncMock
 
 import pytest
@@ -30,6 +31,7 @@ from contribution.application import (
     AddMovieCommand,
     AddMovieProcessor,
 )
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
 
 
 @pytest.mark.usefixtures("clear_database")
@@ -38,6 +40,7 @@ async def test_add_movie(
     add_movie_contribution_gateway: AddMovieContributionGateway,
     user_gateway: UserGateway,
     unit_of_work: UnitOfWork,
+    round_trip_budget: Callable[[type], ContextManager[RoundTrips]],
 ):
     current_timestamp = datetime.now(timezone.utc)
 
@@ -96,4 +99,5 @@ async def test_add_movie(
         unit_of_work=unit_of_work,
     )
 
-    await tx_processor.process(command)
+    with round_trip_budget(AddMovieProcessor):
+        await tx_processor.process(command)
@@ -0,0 +1,139 @@
+from datetime import date, datetime, timezone
+from typing import Callable, ContextManager
+from unittest.mock import AsyncMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    Genre,
+    MPAA,
+    UserId,
+    PersonId,
+    User,
+    InvalidMovieEngTitleError,
+    ValidateMovieEngTitle,
+    ValidateMovieOriginalTitle,
+    ValidateMovieSummary,
+    ValidateMovieDescription,
+    ValidateMovieDuration,
+    ValidateRoleCharacter,
+    ValidateRoleImportance,
+    AddMovie,
+)
+from contribution.application import (
+    ContributionRole,
+    CreateMovieRoles,
+    CreateMovieWriters,
+    CreateMovieCrew,
+    TransactionProcessor,
+    PersonsDoNotExistError,
+    AddMovieContributionGateway,
+    PersonGateway,
+    UserGateway,
+    UnitOfWork,
+    AddMovieCommand,
+    AddMoviesCommand,
+    AddMoviesProcessor,
+)
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
+
+
+def add_movie_command_factory(
+    *,
+    eng_title: str = "Matrix",
+    roles: list[ContributionRole],
+) -> AddMovieCommand:
+    return AddMovieCommand(
+        eng_title=eng_title,
+        original_title="Matrix",
+        summary="Hacker learns the truth",
+        description="A computer hacker learns that reality is simulation.",
+        release_date=date(1999, 3, 31),
+        countries=["US"],
+        genres=[Genre.ACTION, Genre.SCI_FI],
+        mpaa=MPAA.R,
+        duration=134,
+        budget=None,
+        revenue=None,
+        roles=roles,
+        writers=[],
+        crew=[],
+        photos=[],
+    )
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_add_movies(
+    add_movie_contribution_gateway: AddMovieContributionGateway,
+    person_gateway: PersonGateway,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+    round_trip_budget: Callable[[type], ContextManager[RoundTrips]],
+):
+    user = User(
+        id=UserId(uuid7()),
+        name="JohnDoe",
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+    await user_gateway.save(user)
+    await unit_of_work.commit()
+
+    identity_provider = AsyncMock()
+    identity_provider.user_id = AsyncMock(return_value=user.id)
+
+    non_existing_person_id = PersonId(uuid7())
+    command = AddMoviesCommand(
+        movies=[
+            *(add_movie_command_factory(roles=[]) for _ in range(20)),
+            add_movie_command_factory(eng_title="", roles=[]),
+            add_movie_command_factory(
+                roles=[
+                    ContributionRole(
+                        person_id=non_existing_person_id,
+                        character="Neo",
+                        importance=1,
+                        is_spoiler=False,
+                    ),
+                ],
+            ),
+        ],
+    )
+    add_movie = AddMovie(
+        validate_eng_title=ValidateMovieEngTitle(),
+        validate_original_title=ValidateMovieOriginalTitle(),
+        validate_summary=ValidateMovieSummary(),
+        validate_description=ValidateMovieDescription(),
+        valudate_duration=ValidateMovieDuration(),
+    )
+    add_movies_processor = AddMoviesProcessor(
+        add_movie=add_movie,
+        create_movie_roles=CreateMovieRoles(
+            validate_role_character=ValidateRoleCharacter(),
+            validate_role_importance=ValidateRoleImportance(),
+        ),
+        create_movie_writers=CreateMovieWriters(),
+        create_movie_crew=CreateMovieCrew(),
+        add_movie_contribution_gateway=add_movie_contribution_gateway,
+        person_gateway=person_gateway,
+        user_gateway=user_gateway,
+        identity_provider=identity_provider,
+        current_timestamp=datetime.now(timezone.utc),
+    )
+    tx_processor = TransactionProcessor(
+        processor=add_movies_processor,
+        unit_of_work=unit_of_work,
+    )
+
+    with round_trip_budget(AddMoviesProcessor):
+        results = await tx_processor.process(command)
+
+    assert all(result.result for result in results[:20])
+    assert isinstance(results[20].error, InvalidMovieEngTitleError)
+    assert isinstance(results[21].error, PersonsDoNotExistError)
+    assert results[21].error.person_ids == {non_existing_person_id}
@@ -0,0 +1,98 @@
+from datetime import date, datetime, timezone
+from typing import Callable, ContextManager, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    Sex,
+    UserId,
+    User,
+    InvalidPersonFirstNameError,
+    InvalidPersonBirthOrDeathDateError,
+    ValidatePersonFirstName,
+    ValidatePersonLastName,
+    AddPerson,
+)
+from contribution.application import (
+    TransactionProcessor,
+    AddPersonContributionGateway,
+    UserGateway,
+    UnitOfWork,
+    AddPersonCommand,
+    AddPersonsCommand,
+    AddPersonsProcessor,
+)
+from contribution.infrastructure import AddPersonContributionCollection
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
+
+
+def add_person_command_factory(
+    *,
+    first_name: str = "Keanu",
+    death_date: Optional[date] = None,
+) -> AddPersonCommand:
+    return AddPersonCommand(
+        first_name=first_name,
+        last_name="Reeves",
+        sex=Sex.MALE,
+        birth_date=date(1964, 9, 2),
+        death_date=death_date,
+        photos=[],
+    )
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_add_persons(
+    add_person_contribution_collection: AddPersonContributionCollection,
+    add_person_contribution_gateway: AddPersonContributionGateway,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+    round_trip_budget: Callable[[type], ContextManager[RoundTrips]],
+):
+    user = User(
+        id=UserId(uuid7()),
+        name="JohnDoe",
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+    await user_gateway.save(user)
+    await unit_of_work.commit()
+
+    identity_provider = AsyncMock()
+    identity_provider.user_id = AsyncMock(return_value=user.id)
+
+    command = AddPersonsCommand(
+        persons=[
+            *(add_person_command_factory() for _ in range(20)),
+            add_person_command_factory(first_name=""),
+            add_person_command_factory(death_date=date(1900, 1, 1)),
+        ],
+    )
+    add_persons_processor = AddPersonsProcessor(
+        add_person=AddPerson(
+            validate_first_name=ValidatePersonFirstName(),
+            validate_last_name=ValidatePersonLastName(),
+        ),
+        add_person_contribution_gateway=add_person_contribution_gateway,
+        user_gateway=user_gateway,
+        identity_provider=identity_provider,
+        current_timestamp=datetime.now(timezone.utc),
+    )
+    tx_processor = TransactionProcessor(
+        processor=add_persons_processor,
+        unit_of_work=unit_of_work,
+    )
+
+    with round_trip_budget(AddPersonsProcessor):
+        results = await tx_processor.process(command)
+
+    assert all(result.result for result in results[:20])
+    assert isinstance(results[20].error, InvalidPersonFirstNameError)
+    assert isinstance(results[21].error, InvalidPersonBirthOrDeathDateError)
+    assert await add_person_contribution_collection.count_documents({}) == 20
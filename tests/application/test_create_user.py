@@ -1,3 +1,5 @@
+from typing import Callable, ContextManager
+
 import pytest
 from uuid_extensions import uuid7
 
@@ -15,12 +17,14 @@ from contribution.application import (
     CreateUserCommand,
     CreateUserProcessor,
 )
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
 
 
 @pytest.mark.usefixtures("clear_database")
 async def test_create_user(
     user_gateway: UserGateway,
     unit_of_work: UnitOfWork,
+    round_trip_budget: Callable[[type], ContextManager[RoundTrips]],
 ):
     command = CreateUserCommand(
         id=UserId(uuid7()),
@@ -43,4 +47,5 @@ async def test_create_user(
         unit_of_work=unit_of_work,
     )
 
-    await tx_processor.process(command)
+    with round_trip_budget(CreateUserProcessor):
+        await tx_processor.process(command)
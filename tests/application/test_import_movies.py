@@ -0,0 +1,292 @@
+from datetime import date
+from typing import Iterable
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    Genre,
+    MPAA,
+    Sex,
+    Writing,
+    CrewMembership,
+    MovieId,
+    PersonId,
+    RoleId,
+    WriterId,
+    CrewMemberId,
+    Person,
+    MovieRole,
+    MovieWriter,
+    MovieCrewMember,
+    ValidateMovieEngTitle,
+    ValidateMovieOriginalTitle,
+    ValidateMovieSummary,
+    ValidateMovieDescription,
+    ValidateMovieDuration,
+    ValidateRoleCharacter,
+    ValidateRoleImportance,
+    CreateMovie,
+    CreateRole,
+    CreateWriter,
+    CreateCrewMember,
+)
+from contribution.application import (
+    TransactionProcessor,
+    MovieIdIsAlreadyTakenError,
+    PersonsDoNotExistError,
+    RolesAlreadyExistError,
+    WritersAlreadyExistError,
+    CrewMembersAlreadyExistError,
+    MovieGateway,
+    PersonGateway,
+    RoleGateway,
+    WriterGateway,
+    CrewMemberGateway,
+    UnitOfWork,
+    CreateMovieCommand,
+    ImportMoviesCommand,
+    ImportMoviesProcessor,
+)
+from contribution.infrastructure import MovieCollection
+
+
+def create_movie_command_factory(
+    *,
+    roles: Iterable[MovieRole] = (),
+    writers: Iterable[MovieWriter] = (),
+    crew: Iterable[MovieCrewMember] = (),
+) -> CreateMovieCommand:
+    return CreateMovieCommand(
+        id=MovieId(uuid7()),
+        eng_title="Matrix",
+        original_title="Matrix",
+        summary="Hacker learns the truth",
+        description="A computer hacker learns that reality is simulation.",
+        release_date=date(1999, 3, 31),
+        countries=["US"],
+        genres=[Genre.ACTION, Genre.SCI_FI],
+        mpaa=MPAA.R,
+        duration=134,
+        budget=None,
+        revenue=None,
+        roles=roles,
+        writers=writers,
+        crew=crew,
+    )
+
+
+def movie_role_factory(person_id: PersonId) -> MovieRole:
+    return MovieRole(
+        id=RoleId(uuid7()),
+        person_id=person_id,
+        character="Neo",
+        importance=1,
+        is_spoiler=False,
+    )
+
+
+def movie_writer_factory(person_id: PersonId) -> MovieWriter:
+    return MovieWriter(
+        id=WriterId(uuid7()),
+        person_id=person_id,
+        writing=Writing.SCREENPLAY,
+    )
+
+
+def movie_crew_member_factory(person_id: PersonId) -> MovieCrewMember:
+    return MovieCrewMember(
+        id=CrewMemberId(uuid7()),
+        person_id=person_id,
+        membership=CrewMembership.DIRECTOR,
+    )
+
+
+@pytest.fixture
+async def person(
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+) -> Person:
+    person = Person(
+        id=PersonId(uuid7()),
+        first_name="Keanu",
+        last_name="Reeves",
+        sex=Sex.MALE,
+        birth_date=date(1964, 9, 2),
+        death_date=None,
+    )
+    await person_gateway.save(person)
+    await unit_of_work.commit()
+
+    return person
+
+
+@pytest.fixture
+def tx_processor(
+    movie_gateway: MovieGateway,
+    person_gateway: PersonGateway,
+    role_gateway: RoleGateway,
+    writer_gateway: WriterGateway,
+    crew_member_gateway: CrewMemberGateway,
+    unit_of_work: UnitOfWork,
+) -> TransactionProcessor:
+    import_movies_processor = ImportMoviesProcessor(
+        create_movie=CreateMovie(
+            validate_eng_title=ValidateMovieEngTitle(),
+            validate_original_title=ValidateMovieOriginalTitle(),
+            validate_summary=ValidateMovieSummary(),
+            validate_description=ValidateMovieDescription(),
+            valudate_duration=ValidateMovieDuration(),
+        ),
+        create_role=CreateRole(
+            validate_character=ValidateRoleCharacter(),
+            validate_importance=ValidateRoleImportance(),
+        ),
+        create_writer=CreateWriter(),
+        create_crew_member=CreateCrewMember(),
+        movie_gateway=movie_gateway,
+        person_gateway=person_gateway,
+        role_gateway=role_gateway,
+        writer_gateway=writer_gateway,
+        crew_member_gateway=crew_member_gateway,
+    )
+    return TransactionProcessor(
+        processor=import_movies_processor,
+        unit_of_work=unit_of_work,
+    )
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_movies(
+    person: Person,
+    tx_processor: TransactionProcessor,
+    movie_collection: MovieCollection,
+    role_gateway: RoleGateway,
+    writer_gateway: WriterGateway,
+    crew_member_gateway: CrewMemberGateway,
+):
+    command = ImportMoviesCommand(
+        movies=[
+            create_movie_command_factory(
+                roles=[movie_role_factory(person.id)],
+                writers=[movie_writer_factory(person.id)],
+                crew=[movie_crew_member_factory(person.id)],
+            )
+            for _ in range(10)
+        ],
+    )
+
+    await tx_processor.process(command)
+
+    assert await movie_collection.count_documents({}) == 10
+    assert len(await role_gateway.list_by_person_id(person.id)) == 10
+    assert len(await writer_gateway.list_by_person_id(person.id)) == 10
+    assert len(await crew_member_gateway.list_by_person_id(person.id)) == 10
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_movies_should_raise_error_when_persons_do_not_exist(
+    person: Person,
+    tx_processor: TransactionProcessor,
+    movie_collection: MovieCollection,
+):
+    non_existing_person_id = PersonId(uuid7())
+    command = ImportMoviesCommand(
+        movies=[
+            create_movie_command_factory(
+                roles=[movie_role_factory(person.id)],
+            ),
+            create_movie_command_factory(
+                writers=[movie_writer_factory(non_existing_person_id)],
+            ),
+        ],
+    )
+
+    with pytest.raises(PersonsDoNotExistError) as error_info:
+        await tx_processor.process(command)
+
+    assert error_info.value.person_ids == {non_existing_person_id}
+    assert await movie_collection.count_documents({}) == 0
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_movies_should_raise_error_when_credit_ids_are_duplicated(
+    person: Person,
+    tx_processor: TransactionProcessor,
+):
+    role = movie_role_factory(person.id)
+    command = ImportMoviesCommand(
+        movies=[
+            create_movie_command_factory(roles=[role]),
+            create_movie_command_factory(roles=[role]),
+        ],
+    )
+
+    with pytest.raises(RolesAlreadyExistError) as error_info:
+        await tx_processor.process(command)
+
+    assert error_info.value.role_ids == [role.id]
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_movies_should_raise_error_when_ids_are_taken(
+    person: Person,
+    tx_processor: TransactionProcessor,
+    movie_collection: MovieCollection,
+):
+    writer = movie_writer_factory(person.id)
+    crew_member = movie_crew_member_factory(person.id)
+    existing_movie = create_movie_command_factory(
+        writers=[writer],
+        crew=[crew_member],
+    )
+    await tx_processor.process(ImportMoviesCommand(movies=[existing_movie]))
+
+    with pytest.raises(MovieIdIsAlreadyTakenError):
+        await tx_processor.process(
+            ImportMoviesCommand(movies=[existing_movie]),
+        )
+    with pytest.raises(WritersAlreadyExistError) as writers_error_info:
+        await tx_processor.process(
+            ImportMoviesCommand(
+                movies=[create_movie_command_factory(writers=[writer])],
+            ),
+        )
+    with pytest.raises(CrewMembersAlreadyExistError) as crew_error_info:
+        await tx_processor.process(
+            ImportMoviesCommand(
+                movies=[create_movie_command_factory(crew=[crew_member])],
+            ),
+        )
+
+    assert writers_error_info.value.writer_ids == [writer.id]
+    assert crew_error_info.value.crew_member_ids == [crew_member.id]
+    assert await movie_collection.count_documents({}) == 1
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_movies_should_skip_existing_movies_with_credits(
+    person: Person,
+    tx_processor: TransactionProcessor,
+    movie_collection: MovieCollection,
+    role_gateway: RoleGateway,
+):
+    existing_movie = create_movie_command_factory(
+        roles=[movie_role_factory(person.id)],
+    )
+    await tx_processor.process(ImportMoviesCommand(movies=[existing_movie]))
+
+    await tx_processor.process(
+        ImportMoviesCommand(
+            movies=[
+                existing_movie,
+                create_movie_command_factory(
+                    roles=[movie_role_factory(person.id)],
+                ),
+            ],
+            skip_existing=True,
+        ),
+    )
+
+    assert await movie_collection.count_documents({}) == 2
+    assert len(await role_gateway.list_by_person_id(person.id)) == 2
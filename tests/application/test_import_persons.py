@@ -0,0 +1,115 @@
+from datetime import date
+from typing import Callable, ContextManager
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    Sex,
+    PersonId,
+    ValidatePersonFirstName,
+    ValidatePersonLastName,
+    CreatePerson,
+)
+from contribution.application import (
+    TransactionProcessor,
+    PersonIdIsAlreadyTakenError,
+    PersonGateway,
+    UnitOfWork,
+    CreatePersonCommand,
+    ImportPersonsCommand,
+    ImportPersonsProcessor,
+)
+from contribution.infrastructure import PersonCollection
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
+
+
+def create_person_command_factory() -> CreatePersonCommand:
+    return CreatePersonCommand(
+        id=PersonId(uuid7()),
+        first_name="Keanu",
+        last_name="Reeves",
+        sex=Sex.MALE,
+        birth_date=date(1964, 9, 2),
+        death_date=None,
+    )
+
+
+def tx_processor_factory(
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+) -> TransactionProcessor:
+    create_person = CreatePerson(
+        validate_first_name=ValidatePersonFirstName(),
+        validate_last_name=ValidatePersonLastName(),
+    )
+    import_persons_processor = ImportPersonsProcessor(
+        create_person=create_person,
+        person_gateway=person_gateway,
+    )
+    return TransactionProcessor(
+        processor=import_persons_processor,
+        unit_of_work=unit_of_work,
+    )
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_persons(
+    person_collection: PersonCollection,
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+    round_trip_budget: Callable[[type], ContextManager[RoundTrips]],
+):
+    command = ImportPersonsCommand(
+        persons=[create_person_command_factory() for _ in range(100)],
+    )
+    tx_processor = tx_processor_factory(person_gateway, unit_of_work)
+
+    with round_trip_budget(ImportPersonsProcessor):
+        await tx_processor.process(command)
+
+    assert await person_collection.count_documents({}) == 100
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_persons_should_raise_error_when_person_id_is_taken(
+    person_collection: PersonCollection,
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+):
+    tx_processor = tx_processor_factory(person_gateway, unit_of_work)
+    existing_person = create_person_command_factory()
+    await tx_processor.process(
+        ImportPersonsCommand(persons=[existing_person]),
+    )
+
+    with pytest.raises(PersonIdIsAlreadyTakenError):
+        await tx_processor.process(
+            ImportPersonsCommand(
+                persons=[existing_person, create_person_command_factory()],
+            ),
+        )
+
+    assert await person_collection.count_documents({}) == 1
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_persons_should_skip_existing_persons(
+    person_collection: PersonCollection,
+    person_gateway: PersonGateway,
+    unit_of_work: UnitOfWork,
+):
+    tx_processor = tx_processor_factory(person_gateway, unit_of_work)
+    existing_person = create_person_command_factory()
+    await tx_processor.process(
+        ImportPersonsCommand(persons=[existing_person]),
+    )
+
+    await tx_processor.process(
+        ImportPersonsCommand(
+            persons=[existing_person, create_person_command_factory()],
+            skip_existing=True,
+        ),
+    )
+
+    assert await person_collection.count_documents({}) == 2
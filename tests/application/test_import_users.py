@@ -0,0 +1,158 @@
+from typing import Optional
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    UserId,
+    ValidateUserName,
+    ValidateEmail,
+    ValidateTelegram,
+    CreateUser,
+)
+from contribution.application import (
+    TransactionProcessor,
+    UserIdIsAlreadyTakenError,
+    UserNameIsAlreadyTakenError,
+    UserEmailIsAlreadyTakenError,
+    UserTelegramIsAlreadyTakenError,
+    UserGateway,
+    UnitOfWork,
+    CreateUserCommand,
+    ImportUsersCommand,
+    ImportUsersProcessor,
+)
+from contribution.infrastructure import UserCollection
+
+
+def create_user_command_factory(
+    *,
+    name: str,
+    email: Optional[str] = None,
+    telegram: Optional[str] = None,
+) -> CreateUserCommand:
+    return CreateUserCommand(
+        id=UserId(uuid7()),
+        name=name,
+        email=email,
+        telegram=telegram,
+        is_active=True,
+    )
+
+
+def tx_processor_factory(
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+) -> TransactionProcessor:
+    create_user = CreateUser(
+        validate_user_name=ValidateUserName(),
+        validate_email=ValidateEmail(),
+        validate_telegram=ValidateTelegram(),
+    )
+    import_users_processor = ImportUsersProcessor(
+        create_user=create_user,
+        user_gateway=user_gateway,
+    )
+    return TransactionProcessor(
+        processor=import_users_processor,
+        unit_of_work=unit_of_work,
+    )
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_users(
+    user_collection: UserCollection,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+):
+    command = ImportUsersCommand(
+        users=[
+            create_user_command_factory(
+                name=f"JohnDoe{number}",
+                email=f"johndoe{number}@gmail.com",
+            )
+            for number in range(100)
+        ],
+    )
+    tx_processor = tx_processor_factory(user_gateway, unit_of_work)
+
+    await tx_processor.process(command)
+
+    assert await user_collection.count_documents({}) == 100
+
+
+@pytest.mark.usefixtures("clear_database")
+@pytest.mark.parametrize(
+    ("existing_user", "new_user", "error_type"),
+    [
+        (
+            create_user_command_factory(name="JohnDoe"),
+            create_user_command_factory(name="JohnDoe"),
+            UserNameIsAlreadyTakenError,
+        ),
+        (
+            create_user_command_factory(
+                name="JohnDoe",
+                email="johndoe@gmail.com",
+            ),
+            create_user_command_factory(
+                name="JaneDoe",
+                email="johndoe@gmail.com",
+            ),
+            UserEmailIsAlreadyTakenError,
+        ),
+        (
+            create_user_command_factory(name="JohnDoe", telegram="johndoe"),
+            create_user_command_factory(name="JaneDoe", telegram="johndoe"),
+            UserTelegramIsAlreadyTakenError,
+        ),
+    ],
+)
+async def test_import_users_should_raise_error_when_field_is_taken(
+    existing_user: CreateUserCommand,
+    new_user: CreateUserCommand,
+    error_type: type[Exception],
+    user_collection: UserCollection,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+):
+    tx_processor = tx_processor_factory(user_gateway, unit_of_work)
+
+    with pytest.raises(error_type):
+        await tx_processor.process(
+            ImportUsersCommand(users=[existing_user, new_user]),
+        )
+    assert await user_collection.count_documents({}) == 0
+
+    await tx_processor.process(ImportUsersCommand(users=[existing_user]))
+    with pytest.raises(error_type):
+        await tx_processor.process(ImportUsersCommand(users=[new_user]))
+    assert await user_collection.count_documents({}) == 1
+
+
+@pytest.mark.usefixtures("clear_database")
+async def test_import_users_should_skip_existing_users(
+    user_collection: UserCollection,
+    user_gateway: UserGateway,
+    unit_of_work: UnitOfWork,
+):
+    tx_processor = tx_processor_factory(user_gateway, unit_of_work)
+    existing_user = create_user_command_factory(
+        name="JohnDoe",
+        email="johndoe@gmail.com",
+    )
+    await tx_processor.process(ImportUsersCommand(users=[existing_user]))
+
+    with pytest.raises(UserIdIsAlreadyTakenError):
+        await tx_processor.process(ImportUsersCommand(users=[existing_user]))
+    await tx_processor.process(
+        ImportUsersCommand(
+            users=[
+                existing_user,
+                create_user_command_factory(name="JaneDoe"),
+            ],
+            skip_existing=True,
+        ),
+    )
+
+    assert await user_collection.count_documents({}) == 2
@@ -0,0 +1,118 @@
+from typing import Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import UserId
+from contribution.application import (
+    AccessConcern,
+    NotEnoughPermissionsError,
+    ContributionPage,
+    ListContributionsQuery,
+    ContributionAuthorScopeProcessor,
+)
+
+
+CONTRIBUTOR_PERMISSIONS = 2
+MODERATOR_PERMISSIONS = 2 | 4
+
+
+def author_scope_processor_factory(
+    *,
+    current_user_id: UserId,
+    current_user_permissions: int,
+    list_processor: AsyncMock,
+) -> ContributionAuthorScopeProcessor:
+    permissions_gateway = AsyncMock()
+    permissions_gateway.for_moderation = AsyncMock(return_value=4)
+
+    identity_provider = AsyncMock()
+    identity_provider.user_id = AsyncMock(return_value=current_user_id)
+    identity_provider.permissions = AsyncMock(
+        return_value=current_user_permissions,
+    )
+
+    return ContributionAuthorScopeProcessor(
+        processor=list_processor,
+        access_concern=AccessConcern(),
+        permissions_gateway=permissions_gateway,
+        identity_provider=identity_provider,
+    )
+
+
+@pytest.mark.parametrize(
+    "current_user_permissions",
+    [CONTRIBUTOR_PERMISSIONS, MODERATOR_PERMISSIONS],
+)
+async def test_list_contributions_should_list_own_contributions_by_default(
+    current_user_permissions: int,
+):
+    current_user_id = UserId(uuid7())
+    list_processor = AsyncMock()
+    list_processor.process = AsyncMock(
+        return_value=ContributionPage(summaries=[], next_cursor=None),
+    )
+    processor = author_scope_processor_factory(
+        current_user_id=current_user_id,
+        current_user_permissions=current_user_permissions,
+        list_processor=list_processor,
+    )
+
+    await processor.process(ListContributionsQuery())
+
+    list_processor.process.assert_awaited_once_with(
+        ListContributionsQuery(author_id=current_user_id),
+    )
+
+
+@pytest.mark.parametrize(
+    ("author_id", "all_authors"),
+    [(UserId(uuid7()), False), (None, True)],
+)
+async def test_contributor_should_not_list_contributions_of_other_users(
+    author_id: Optional[UserId],
+    all_authors: bool,
+):
+    list_processor = AsyncMock()
+    processor = author_scope_processor_factory(
+        current_user_id=UserId(uuid7()),
+        current_user_permissions=CONTRIBUTOR_PERMISSIONS,
+        list_processor=list_processor,
+    )
+
+    with pytest.raises(NotEnoughPermissionsError):
+        await processor.process(
+            ListContributionsQuery(
+                author_id=author_id,
+                all_authors=all_authors,
+            ),
+        )
+    list_processor.process.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("author_id", "all_authors"),
+    [(UserId(uuid7()), False), (None, True)],
+)
+async def test_moderator_should_list_contributions_of_other_users(
+    author_id: Optional[UserId],
+    all_authors: bool,
+):
+    list_processor = AsyncMock()
+    list_processor.process = AsyncMock(
+        return_value=ContributionPage(summaries=[], next_cursor=None),
+    )
+    processor = author_scope_processor_factory(
+        current_user_id=UserId(uuid7()),
+        current_user_permissions=MODERATOR_PERMISSIONS,
+        list_processor=list_processor,
+    )
+    query = ListContributionsQuery(
+        author_id=author_id,
+        all_authors=all_authors,
+    )
+
+    await processor.process(query)
+
+    list_processor.process.assert_awaited_once_with(query)
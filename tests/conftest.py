@@ -1,20 +1,28 @@
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, ContextManager
 
 import pytest
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
-    AsyncIOMotorClientSession,
     AsyncIOMotorDatabase,
 )
 
 from contribution.infrastructure import (
     MongoDBConfig,
+    MongoDBPoolMetrics,
     motor_client_factory,
     motor_session_factory,
+    MongoDBSession,
     motor_database_factory,
+    UUIDRepresentation,
+    UUIDCodec,
+    ModelVersions,
+    CreditsLayout,
+    ensure_indexes,
     env_var_by_key,
 )
+from contribution.infrastructure.operation_id.round_trips import RoundTrips
+from .round_trips import within_round_trip_budget
 
 
 @pytest.fixture
@@ -29,24 +37,56 @@ def motor_client() -> AsyncIOMotorClient:
         url=env_var_by_key("TEST_MONGODB_URL"),
         port=port,
     )
-    motor_client = motor_client_factory(mongodb_config)
+    motor_client = motor_client_factory(
+        mongodb_config=mongodb_config,
+        pool_metrics=MongoDBPoolMetrics(),
+    )
 
     return motor_client
 
 
+@pytest.fixture
+def uuid_codec() -> UUIDCodec:
+    uuid_representation = UUIDRepresentation(
+        os.getenv("TEST_MONGODB_UUID_REPRESENTATION", UUIDRepresentation.HEX),
+    )
+    return UUIDCodec(uuid_representation)
+
+
+@pytest.fixture
+def model_versions() -> ModelVersions:
+    versioned_collections = os.getenv("TEST_MONGODB_VERSIONED_COLLECTIONS", "")
+    return ModelVersions(
+        frozenset(
+            collection_name.strip()
+            for collection_name in versioned_collections.split(",")
+            if collection_name.strip()
+        ),
+    )
+
+
+@pytest.fixture
+def credits_layout() -> CreditsLayout:
+    return CreditsLayout(
+        os.getenv("TEST_MONGODB_CREDITS_LAYOUT", CreditsLayout.COLLECTIONS),
+    )
+
+
 @pytest.fixture
 async def motor_session(
     motor_client: AsyncIOMotorClient,
-) -> AsyncGenerator[AsyncIOMotorClientSession, None]:
+) -> AsyncGenerator[MongoDBSession, None]:
     async for motor_session in motor_session_factory(motor_client):
         yield motor_session
 
 
 @pytest.fixture
-def motor_database(
-    motor_session: AsyncIOMotorClientSession,
+async def motor_database(
+    motor_client: AsyncIOMotorClient,
 ) -> AsyncIOMotorDatabase:
-    return motor_database_factory(motor_session)
+    motor_database = motor_database_factory(motor_client)
+    await ensure_indexes(motor_database)
+    return motor_database
 
 
 @pytest.fixture
@@ -55,3 +95,8 @@ async def clear_database(motor_database: AsyncIOMotorDatabase):
     for collection_name in collection_names:
         collection = motor_database.get_collection(collection_name)
         await collection.delete_many({})
+
+
+@pytest.fixture
+def round_trip_budget() -> Callable[[type], ContextManager[RoundTrips]]:
+    return within_round_trip_budget
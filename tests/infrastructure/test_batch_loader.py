@@ -0,0 +1,150 @@
+from typing import Any, Mapping
+from unittest.mock import AsyncMock, Mock
+
+from uuid_extensions import uuid7
+
+from contribution.domain import RoleId, MovieId, PersonId, Role
+from contribution.infrastructure import BatchLoader, RoleMap, UUIDCodec
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict[str, Any]]):
+        self._documents = iter(documents)
+
+    def __aiter__(self) -> "FakeCursor":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    def __init__(self, roles: list[Role]):
+        self._documents = {
+            role.id.hex: role_to_document(role) for role in roles
+        }
+        self.queried_ids: list[list[str]] = []
+
+    def find(self, filter: Mapping[str, Any], **kwargs) -> FakeCursor:
+        if "movie_id" in filter:
+            return FakeCursor(
+                [
+                    document
+                    for document in self._documents.values()
+                    if document["role"].movie_id.hex == filter["movie_id"]
+                ],
+            )
+
+        ids = filter["id"]["$in"]
+        self.queried_ids.append(ids)
+        return FakeCursor(
+            [self._documents[id] for id in ids if id in self._documents],
+        )
+
+
+def role_factory() -> Role:
+    return Role(
+        id=RoleId(uuid7()),
+        movie_id=MovieId(uuid7()),
+        person_id=PersonId(uuid7()),
+        character="Neo",
+        importance=1,
+        is_spoiler=False,
+    )
+
+
+def role_to_document(role: Role) -> dict[str, Any]:
+    return {"id": role.id.hex, "role": role}
+
+
+def batch_loader_factory(
+    role_map: RoleMap,
+    collection: FakeCollection,
+    *,
+    chunk_size: int = 500,
+) -> BatchLoader:
+    return BatchLoader(
+        identity_map=role_map,
+        collection=collection,
+        unit_of_work=Mock(),
+        session=AsyncMock(),
+        uuid_codec=UUIDCodec(),
+        document_to_model=lambda document: document["role"],
+        chunk_size=chunk_size,
+    )
+
+
+async def test_batch_loader_should_query_only_models_missing_in_map():
+    roles = [role_factory() for _ in range(3)]
+    role_map = RoleMap()
+    role_map.save(roles[0])
+    collection = FakeCollection(roles)
+
+    loaded_roles = await batch_loader_factory(role_map, collection).load(
+        role.id for role in roles
+    )
+
+    assert loaded_roles == roles
+    assert collection.queried_ids == [[roles[1].id.hex, roles[2].id.hex]]
+    assert role_map.by_id(roles[2].id) is roles[2]
+
+
+async def test_batch_loader_should_not_query_if_all_models_are_in_map():
+    roles = [role_factory() for _ in range(3)]
+    role_map = RoleMap()
+    for role in roles:
+        role_map.save(role)
+    collection = FakeCollection(roles)
+
+    loaded_roles = await batch_loader_factory(role_map, collection).load(
+        [role.id for role in roles],
+    )
+
+    assert loaded_roles == roles
+    assert collection.queried_ids == []
+
+
+async def test_batch_loader_should_query_missing_models_in_chunks():
+    roles = [role_factory() for _ in range(5)]
+    missing_role_id = RoleId(uuid7())
+    collection = FakeCollection(roles)
+
+    loaded_roles = await batch_loader_factory(
+        RoleMap(),
+        collection,
+        chunk_size=2,
+    ).load([*(role.id for role in roles), missing_role_id])
+
+    assert loaded_roles == roles
+    assert [len(ids) for ids in collection.queried_ids] == [2, 2, 2]
+
+
+async def test_batch_loader_should_return_models_matching_filter_from_map():
+    movie_id = MovieId(uuid7())
+    roles = [role_factory() for _ in range(3)]
+    for role in roles[:2]:
+        role.movie_id = movie_id
+    role_map = RoleMap()
+    role_map.save(roles[0])
+
+    copy_of_role_from_map = Role(
+        id=roles[0].id,
+        movie_id=movie_id,
+        person_id=roles[0].person_id,
+        character=roles[0].character,
+        importance=roles[0].importance,
+        is_spoiler=roles[0].is_spoiler,
+    )
+    collection = FakeCollection([copy_of_role_from_map, *roles[1:]])
+
+    loaded_roles = await batch_loader_factory(
+        role_map,
+        collection,
+    ).load_matching({"movie_id": movie_id.hex})
+
+    assert loaded_roles == roles[:2]
+    assert loaded_roles[0] is roles[0]
+    assert role_map.by_id(roles[1].id) is roles[1]
@@ -0,0 +1,72 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from bson import Decimal128
+
+from contribution.domain import Money
+from contribution.infrastructure.database.bson_values import (
+    date_to_bson,
+    date_from_bson,
+    datetime_from_bson,
+    money_to_bson,
+    money_from_bson,
+    decimal128_to_decimal,
+)
+
+
+def test_date_should_be_stored_as_bson_date():
+    release_date = date(1999, 3, 31)
+
+    bson_date = date_to_bson(release_date)
+
+    assert bson_date == datetime(1999, 3, 31)
+    assert date_from_bson(bson_date) == release_date
+
+
+def test_datetime_from_bson_should_return_timezone_aware_datetime():
+    created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert datetime_from_bson(created_at.replace(tzinfo=None)) == created_at
+
+
+def test_money_should_be_stored_as_decimal128():
+    money = Money(amount=Decimal("63000000.50"), currency="USD")
+
+    money_as_dict = money_to_bson(money)
+
+    assert money_as_dict == {
+        "amount": Decimal128("63000000.50"),
+        "currency": "USD",
+    }
+    assert money_from_bson(money_as_dict) == money
+
+
+def test_readers_should_accept_old_string_format():
+    assert date_from_bson("1999-03-31") == date(1999, 3, 31)
+    assert datetime_from_bson("2024-01-01T12:30:00+00:00") == datetime(
+        2024,
+        1,
+        1,
+        12,
+        30,
+        tzinfo=timezone.utc,
+    )
+    assert money_from_bson(
+        {"amount": "63000000.50", "currency": "USD"},
+    ) == Money(amount=Decimal("63000000.50"), currency="USD")
+
+
+def test_decimal128_to_decimal_should_match_to_decimal():
+    for value in (
+        "0",
+        "-0.01",
+        "63000000.50",
+        "1E+10",
+        "12345678901234567890.123456",
+        "Infinity",
+        "NaN",
+    ):
+        decimal128 = Decimal128(value)
+        assert str(decimal128_to_decimal(decimal128)) == str(
+            decimal128.to_decimal(),
+        )
@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from contribution.infrastructure import (
+    AioPikaChannelPoolMetrics,
+    AioPikaChannelPool,
+)
+
+
+def connection_factory() -> Mock:
+    async def channel():
+        channel = Mock()
+        channel.is_closed = False
+        channel.get_exchange = AsyncMock(return_value=Mock())
+        channel.close = AsyncMock()
+        return channel
+
+    connection = Mock()
+    connection.channel = AsyncMock(side_effect=channel)
+    return connection
+
+
+async def test_channel_and_exchange_are_reused():
+    connection = connection_factory()
+    metrics = AioPikaChannelPoolMetrics()
+    channel_pool = AioPikaChannelPool(connection=connection, metrics=metrics)
+
+    async with channel_pool.acquire() as first_pooled_channel:
+        pass
+    async with channel_pool.acquire() as second_pooled_channel:
+        pass
+
+    assert first_pooled_channel is second_pooled_channel
+    assert connection.channel.await_count == 1
+    first_pooled_channel.channel.get_exchange.assert_awaited_once_with(
+        "contribution",
+    )
+
+    stats = metrics.stats()
+    assert stats.checkouts == 2
+    assert stats.open_channels == 1
+
+
+async def test_closed_channel_is_replaced():
+    connection = connection_factory()
+    metrics = AioPikaChannelPoolMetrics()
+    channel_pool = AioPikaChannelPool(connection=connection, metrics=metrics)
+
+    async with channel_pool.acquire() as closed_pooled_channel:
+        pass
+    closed_pooled_channel.channel.is_closed = True
+
+    async with channel_pool.acquire() as pooled_channel:
+        assert pooled_channel is not closed_pooled_channel
+
+    stats = metrics.stats()
+    assert stats.open_channels == 1
+    assert stats.replaced_channels == 1
+
+
+async def test_checkouts_wait_for_returned_channel():
+    connection = connection_factory()
+    metrics = AioPikaChannelPoolMetrics()
+    channel_pool = AioPikaChannelPool(
+        connection=connection,
+        metrics=metrics,
+        max_size=1,
+    )
+
+    async def publish() -> None:
+        async with channel_pool.acquire():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(publish(), publish(), publish())
+
+    stats = metrics.stats()
+    assert connection.channel.await_count == 1
+    assert stats.checkouts == 3
+    assert stats.max_checkout_wait_ms >= 10
+
+    await channel_pool.close()
+    assert metrics.stats().open_channels == 0
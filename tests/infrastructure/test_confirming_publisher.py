@@ -0,0 +1,84 @@
+import asyncio
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aio_pika import Message
+from pamqp.commands import Basic
+
+from contribution.infrastructure import (
+    ConfirmMode,
+    OutgoingMessage,
+    ConfirmingPublisher,
+)
+
+
+class FakeExchange:
+    """
+    Confirms messages after short delay and nacks first
+    attempts of messages with routing keys in `nacked`.
+    """
+
+    def __init__(self, nacked: Optional[set[str]] = None):
+        self.nacked = nacked or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, message: Message, routing_key: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+
+        if routing_key in self.nacked:
+            self.nacked.discard(routing_key)
+            return Basic.Nack()
+        return Basic.Ack()
+
+
+def messages_factory(count: int) -> list[OutgoingMessage]:
+    return [
+        OutgoingMessage(routing_key=str(number), message=Message(b"{}"))
+        for number in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected_max_in_flight"),
+    [(ConfirmMode.SINGLE, 1), (ConfirmMode.WINDOWED, 4)],
+)
+async def test_in_flight_messages_are_limited(
+    mode: ConfirmMode,
+    expected_max_in_flight: int,
+):
+    exchange = FakeExchange()
+    publisher = ConfirmingPublisher(mode=mode, max_in_flight=4)
+
+    outcomes = await publisher.publish(exchange, messages_factory(10))
+
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert exchange.max_in_flight == expected_max_in_flight
+
+
+async def test_nacked_message_is_retried_without_blocking_others():
+    exchange = FakeExchange(nacked={"0"})
+    publisher = ConfirmingPublisher(max_in_flight=2)
+
+    outcomes = await publisher.publish(exchange, messages_factory(5))
+
+    assert all(outcome.confirmed for outcome in outcomes)
+    assert [outcome.attempts for outcome in outcomes] == [2, 1, 1, 1, 1]
+
+
+async def test_message_is_reported_after_last_attempt():
+    exchange = Mock()
+    exchange.publish = AsyncMock(side_effect=ConnectionError())
+    publisher = ConfirmingPublisher(max_attempts=2)
+
+    (outcome,) = await publisher.publish(exchange, messages_factory(1))
+
+    assert not outcome.confirmed
+    assert outcome.attempts == 2
+    assert isinstance(outcome.confirmation, ConnectionError)
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from contribution.domain import ContributionStatus
+from contribution.application import InvalidContributionCursorError
+from contribution.infrastructure.database.data_mappers.contribution_summary import (  # noqa: E501
+    contribution_page_filter,
+    encode_contribution_cursor,
+    decode_contribution_cursor,
+)
+
+
+def test_cursor_points_to_created_at_and_object_id_of_document():
+    document = {
+        "_id": ObjectId(),
+        "created_at": datetime(2024, 1, 1, 12, 30, 15, 123000),
+    }
+
+    cursor = encode_contribution_cursor(document)
+
+    assert decode_contribution_cursor(cursor) == (
+        document["created_at"],
+        document["_id"],
+    )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not a cursor", "e30=", "eyJjcmVhdGVkX2F0IjogMX0="],
+)
+def test_invalid_cursor_is_rejected(cursor: str):
+    with pytest.raises(InvalidContributionCursorError):
+        contribution_page_filter(author_id=None, status=None, cursor=cursor)
+
+
+def test_filter_without_status_matches_every_status():
+    filter = contribution_page_filter(author_id="a", status=None, cursor=None)
+
+    assert filter == {
+        "author_id": "a",
+        "status": {"$in": list(ContributionStatus)},
+    }
+
+
+def test_filter_continues_after_cursor():
+    document = {"_id": ObjectId(), "created_at": datetime(2024, 1, 1)}
+
+    filter = contribution_page_filter(
+        author_id=None,
+        status=ContributionStatus.PENDING,
+        cursor=encode_contribution_cursor(document),
+    )
+
+    assert filter == {
+        "status": ContributionStatus.PENDING,
+        "$or": [
+            {"created_at": {"$lt": document["created_at"]}},
+            {
+                "created_at": document["created_at"],
+                "_id": {"$lt": document["_id"]},
+            },
+        ],
+    }
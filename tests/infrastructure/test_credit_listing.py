@@ -0,0 +1,412 @@
+from typing import Any, Callable, Mapping
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    Writing,
+    CrewMembership,
+    RoleId,
+    WriterId,
+    CrewMemberId,
+    MovieId,
+    PersonId,
+    Role,
+    Writer,
+    CrewMember,
+)
+from contribution.infrastructure import (
+    CreditsLayout,
+    RoleMapper,
+    WriterMapper,
+    CrewMemberMapper,
+    RoleMap,
+    WriterMap,
+    CrewMemberMap,
+    UUIDCodec,
+)
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict[str, Any]]):
+        self._documents = iter(documents)
+
+    def __aiter__(self) -> "FakeCursor":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def matches(document: Mapping[str, Any], filter: Mapping[str, Any]) -> bool:
+    for key, value in filter.items():
+        field, _, embedded_key = key.partition(".")
+        field_value = document.get(field)
+        if not embedded_key:
+            if field_value != value:
+                return False
+            continue
+
+        embedded_documents = (
+            field_value if isinstance(field_value, list) else [field_value]
+        )
+        if not any(
+            embedded_document.get(embedded_key) == value
+            for embedded_document in embedded_documents
+        ):
+            return False
+    return True
+
+
+def run_pipeline(
+    documents: list[dict[str, Any]],
+    pipeline: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Runs `$match`, `$unwind` and `$replaceWith` stages of
+    pipeline returned by `embedded_credits_pipeline`.
+    """
+    for stage in pipeline:
+        if "$match" in stage:
+            documents = [
+                document
+                for document in documents
+                if matches(document, stage["$match"])
+            ]
+        elif "$unwind" in stage:
+            field = stage["$unwind"].removeprefix("$")
+            documents = [
+                {**document, field: embedded_document}
+                for document in documents
+                for embedded_document in document[field]
+            ]
+        else:
+            embedded, merged = stage["$replaceWith"]["$mergeObjects"]
+            documents = [
+                {
+                    **document[embedded.removeprefix("$")],
+                    **{
+                        key: document[value.removeprefix("$")]
+                        for key, value in merged.items()
+                    },
+                }
+                for document in documents
+            ]
+    return documents
+
+
+class FakeCreditCollection:
+    def __init__(self, documents: list[dict[str, Any]]):
+        self._documents = documents
+        self.filters: list[Mapping[str, Any]] = []
+
+    def find(self, filter: Mapping[str, Any], **kwargs) -> FakeCursor:
+        self.filters.append(filter)
+        return FakeCursor(
+            [
+                document
+                for document in self._documents
+                if matches(document, filter)
+            ],
+        )
+
+
+class FakeMovieCollection:
+    def __init__(self, documents: list[dict[str, Any]]):
+        self._documents = documents
+        self.pipelines: list[list[dict[str, Any]]] = []
+
+    def aggregate(
+        self,
+        pipeline: list[dict[str, Any]],
+        **kwargs,
+    ) -> FakeCursor:
+        self.pipelines.append(pipeline)
+        return FakeCursor(run_pipeline(self._documents, pipeline))
+
+
+MOVIE_ID = MovieId(uuid7())
+OTHER_MOVIE_ID = MovieId(uuid7())
+PERSON_ID = PersonId(uuid7())
+OTHER_PERSON_ID = PersonId(uuid7())
+
+
+def role_factory(movie_id: MovieId, person_id: PersonId) -> Role:
+    return Role(
+        id=RoleId(uuid7()),
+        movie_id=movie_id,
+        person_id=person_id,
+        character="Neo",
+        importance=1,
+        is_spoiler=False,
+    )
+
+
+def writer_factory(movie_id: MovieId, person_id: PersonId) -> Writer:
+    return Writer(
+        id=WriterId(uuid7()),
+        movie_id=movie_id,
+        person_id=person_id,
+        writing=Writing.SCREENPLAY,
+    )
+
+
+def crew_member_factory(
+    movie_id: MovieId,
+    person_id: PersonId,
+) -> CrewMember:
+    return CrewMember(
+        id=CrewMemberId(uuid7()),
+        movie_id=movie_id,
+        person_id=person_id,
+        membership=CrewMembership.DIRECTOR,
+    )
+
+
+def role_to_document(role: Role) -> dict[str, Any]:
+    return {
+        "id": role.id.hex,
+        "movie_id": role.movie_id.hex,
+        "person_id": role.person_id.hex,
+        "character": role.character,
+        "importance": role.importance,
+        "is_spoiler": role.is_spoiler,
+    }
+
+
+def writer_to_document(writer: Writer) -> dict[str, Any]:
+    return {
+        "id": writer.id.hex,
+        "movie_id": writer.movie_id.hex,
+        "person_id": writer.person_id.hex,
+        "writing": writer.writing,
+    }
+
+
+def crew_member_to_document(crew_member: CrewMember) -> dict[str, Any]:
+    return {
+        "id": crew_member.id.hex,
+        "movie_id": crew_member.movie_id.hex,
+        "person_id": crew_member.person_id.hex,
+        "membership": crew_member.membership,
+    }
+
+
+CREDIT_KINDS = [
+    pytest.param(
+        RoleMapper,
+        RoleMap,
+        role_factory,
+        role_to_document,
+        "roles",
+        id="roles",
+    ),
+    pytest.param(
+        WriterMapper,
+        WriterMap,
+        writer_factory,
+        writer_to_document,
+        "writers",
+        id="writers",
+    ),
+    pytest.param(
+        CrewMemberMapper,
+        CrewMemberMap,
+        crew_member_factory,
+        crew_member_to_document,
+        "crew",
+        id="crew",
+    ),
+]
+
+
+def mapper_factory(
+    *,
+    mapper_type: type,
+    map_type: type,
+    credits_layout: CreditsLayout,
+    credit_collection: FakeCreditCollection,
+    movie_collection: FakeMovieCollection,
+    unit_of_work: Mock,
+) -> Any:
+    return mapper_type(
+        map_type(),
+        credit_collection,
+        movie_collection,
+        unit_of_work,
+        AsyncMock(),
+        UUIDCodec(),
+        credits_layout,
+    )
+
+
+def collections_factory(
+    *,
+    credits: list[Any],
+    credit_to_document: Callable[[Any], dict[str, Any]],
+    embedded_field: str,
+) -> tuple[FakeCreditCollection, FakeMovieCollection]:
+    credit_documents = [credit_to_document(credit) for credit in credits]
+
+    movie_documents = []
+    for movie_id in (MOVIE_ID, OTHER_MOVIE_ID):
+        embedded_documents = []
+        for document in credit_documents:
+            if document["movie_id"] != movie_id.hex:
+                continue
+            embedded_document = document.copy()
+            del embedded_document["movie_id"]
+            embedded_documents.append(embedded_document)
+        movie_documents.append(
+            {"id": movie_id.hex, embedded_field: embedded_documents},
+        )
+
+    return (
+        FakeCreditCollection(credit_documents),
+        FakeMovieCollection(movie_documents),
+    )
+
+
+@pytest.mark.parametrize(
+    "credits_layout",
+    [CreditsLayout.COLLECTIONS, CreditsLayout.EMBEDDED],
+)
+@pytest.mark.parametrize(
+    (
+        "mapper_type",
+        "map_type",
+        "credit_factory",
+        "credit_to_document",
+        "embedded_field",
+    ),
+    CREDIT_KINDS,
+)
+async def test_list_by_movie_id_should_return_credits_of_movie(
+    credits_layout: CreditsLayout,
+    mapper_type: type,
+    map_type: type,
+    credit_factory: Callable[[MovieId, PersonId], Any],
+    credit_to_document: Callable[[Any], dict[str, Any]],
+    embedded_field: str,
+):
+    credits_of_movie = [
+        credit_factory(MOVIE_ID, PERSON_ID),
+        credit_factory(MOVIE_ID, OTHER_PERSON_ID),
+    ]
+    credit_of_other_movie = credit_factory(OTHER_MOVIE_ID, PERSON_ID)
+    credit_collection, movie_collection = collections_factory(
+        credits=[*credits_of_movie, credit_of_other_movie],
+        credit_to_document=credit_to_document,
+        embedded_field=embedded_field,
+    )
+    unit_of_work = Mock()
+    mapper = mapper_factory(
+        mapper_type=mapper_type,
+        map_type=map_type,
+        credits_layout=credits_layout,
+        credit_collection=credit_collection,
+        movie_collection=movie_collection,
+        unit_of_work=unit_of_work,
+    )
+
+    credits = await mapper.list_by_movie_id(MOVIE_ID)
+
+    assert credits == credits_of_movie
+    assert unit_of_work.register_clean.call_count == 2
+    if credits_layout is CreditsLayout.EMBEDDED:
+        assert not credit_collection.filters
+        assert movie_collection.pipelines[0][0] == {
+            "$match": {"id": MOVIE_ID.hex},
+        }
+    else:
+        assert not movie_collection.pipelines
+        assert credit_collection.filters == [{"movie_id": MOVIE_ID.hex}]
+
+
+@pytest.mark.parametrize(
+    "credits_layout",
+    [CreditsLayout.COLLECTIONS, CreditsLayout.EMBEDDED],
+)
+@pytest.mark.parametrize(
+    (
+        "mapper_type",
+        "map_type",
+        "credit_factory",
+        "credit_to_document",
+        "embedded_field",
+    ),
+    CREDIT_KINDS,
+)
+async def test_list_by_person_id_should_return_credits_of_person(
+    credits_layout: CreditsLayout,
+    mapper_type: type,
+    map_type: type,
+    credit_factory: Callable[[MovieId, PersonId], Any],
+    credit_to_document: Callable[[Any], dict[str, Any]],
+    embedded_field: str,
+):
+    credits_of_person = [
+        credit_factory(MOVIE_ID, PERSON_ID),
+        credit_factory(OTHER_MOVIE_ID, PERSON_ID),
+    ]
+    credit_of_other_person = credit_factory(MOVIE_ID, OTHER_PERSON_ID)
+    credit_collection, movie_collection = collections_factory(
+        credits=[*credits_of_person, credit_of_other_person],
+        credit_to_document=credit_to_document,
+        embedded_field=embedded_field,
+    )
+    mapper = mapper_factory(
+        mapper_type=mapper_type,
+        map_type=map_type,
+        credits_layout=credits_layout,
+        credit_collection=credit_collection,
+        movie_collection=movie_collection,
+        unit_of_work=Mock(),
+    )
+
+    credits = await mapper.list_by_person_id(PERSON_ID)
+
+    assert sorted(credits, key=lambda credit: credit.id) == sorted(
+        credits_of_person,
+        key=lambda credit: credit.id,
+    )
+    if credits_layout is CreditsLayout.EMBEDDED:
+        assert not credit_collection.filters
+        assert movie_collection.pipelines[0][0] == {
+            "$match": {f"{embedded_field}.person_id": PERSON_ID.hex},
+        }
+    else:
+        assert not movie_collection.pipelines
+        assert credit_collection.filters == [{"person_id": PERSON_ID.hex}]
+
+
+async def test_list_by_movie_id_should_reuse_credits_from_identity_map():
+    role = role_factory(MOVIE_ID, PERSON_ID)
+    credit_collection, movie_collection = collections_factory(
+        credits=[role],
+        credit_to_document=role_to_document,
+        embedded_field="roles",
+    )
+    role_map = RoleMap()
+    role_from_map = role_factory(MOVIE_ID, PERSON_ID)
+    role_from_map.id = role.id
+    role_map.save(role_from_map)
+    unit_of_work = Mock()
+    mapper = RoleMapper(
+        role_map,
+        credit_collection,
+        movie_collection,
+        unit_of_work,
+        AsyncMock(),
+        UUIDCodec(),
+        CreditsLayout.EMBEDDED,
+    )
+
+    roles = await mapper.list_by_movie_id(MOVIE_ID)
+
+    assert roles[0] is role_from_map
+    unit_of_work.register_clean.assert_not_called()
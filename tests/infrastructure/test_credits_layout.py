@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, Mock
+
+from pymongo import UpdateOne
+from uuid_extensions import uuid7
+
+from contribution.domain import RoleId, MovieId, PersonId, Role
+from contribution.infrastructure import (
+    CreditsLayout,
+    CommitRoleCollectionChanges,
+    UUIDCodec,
+)
+from contribution.infrastructure.database.credits_layout import (
+    embedded_credits_pipeline,
+)
+
+
+def role_factory(movie_id: MovieId) -> Role:
+    return Role(
+        id=RoleId(uuid7()),
+        movie_id=movie_id,
+        person_id=PersonId(uuid7()),
+        character="Neo",
+        importance=1,
+        is_spoiler=False,
+    )
+
+
+def committer_factory() -> CommitRoleCollectionChanges:
+    role_collection = Mock()
+    role_collection.full_name = "contribution.roles"
+    movie_collection = Mock()
+    movie_collection.full_name = "contribution.movies"
+
+    return CommitRoleCollectionChanges(
+        collection=role_collection,
+        movie_collection=movie_collection,
+        session=AsyncMock(),
+        uuid_codec=UUIDCodec(),
+        credits_layout=CreditsLayout.EMBEDDED,
+    )
+
+
+def test_new_and_deleted_credits_are_written_by_one_update_per_movie():
+    matrix_id = MovieId(uuid7())
+    matrix_roles = [role_factory(matrix_id) for _ in range(3)]
+    constantine_id = MovieId(uuid7())
+    constantine_role = role_factory(constantine_id)
+
+    write_models = committer_factory().write_models(
+        new=[*matrix_roles, constantine_role],
+        dirty=[],
+        deleted=matrix_roles[:2],
+    )
+
+    assert len(write_models) == 3
+    assert write_models[0] == UpdateOne(
+        {"id": matrix_id.hex},
+        {
+            "$push": {
+                "roles": {
+                    "$each": [
+                        {
+                            "id": role.id.hex,
+                            "person_id": role.person_id.hex,
+                            "character": role.character,
+                            "importance": role.importance,
+                            "is_spoiler": role.is_spoiler,
+                        }
+                        for role in matrix_roles
+                    ],
+                },
+            },
+        },
+        namespace="contribution.movies",
+    )
+    assert write_models[2] == UpdateOne(
+        {"id": matrix_id.hex},
+        {
+            "$pull": {
+                "roles": {
+                    "id": {"$in": [role.id.hex for role in matrix_roles[:2]]},
+                },
+            },
+        },
+        namespace="contribution.movies",
+    )
+
+
+def test_changed_credit_is_updated_in_place():
+    role = role_factory(MovieId(uuid7()))
+    role.character = "Thomas Anderson"
+
+    (write_model,) = committer_factory().write_models(
+        new=[],
+        dirty=[(role, {"character"})],
+        deleted=[],
+    )
+
+    assert write_model == UpdateOne(
+        {"id": role.movie_id.hex, "roles.id": role.id.hex},
+        {"$set": {"roles.$.character": "Thomas Anderson"}},
+        namespace="contribution.movies",
+    )
+
+
+def test_pipeline_returns_embedded_documents_with_movie_id():
+    pipeline = embedded_credits_pipeline("writers", {"id": {"$in": ["a"]}})
+
+    assert pipeline == [
+        {"$match": {"writers.id": {"$in": ["a"]}}},
+        {"$unwind": "$writers"},
+        {"$match": {"writers.id": {"$in": ["a"]}}},
+        {
+            "$replaceWith": {
+                "$mergeObjects": ["$writers", {"movie_id": "$id"}],
+            },
+        },
+    ]
+
+
+def test_pipeline_matches_movie_id_on_movie_document():
+    pipeline = embedded_credits_pipeline("crew", {"movie_id": "a"})
+
+    assert pipeline == [
+        {"$match": {"id": "a"}},
+        {"$unwind": "$crew"},
+        {
+            "$replaceWith": {
+                "$mergeObjects": ["$crew", {"movie_id": "$id"}],
+            },
+        },
+    ]
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, Mock
+
+from uuid_extensions import uuid7
+
+from contribution.infrastructure import EditedEntities, UUIDCodec
+
+
+async def test_only_id_of_edited_movie_is_read():
+    contribution_id = uuid7()
+    movie_id = uuid7()
+
+    edit_movie_contribution_collection = Mock()
+    edit_movie_contribution_collection.find_one = AsyncMock(
+        return_value={"movie_id": movie_id.hex},
+    )
+    edited_entities = EditedEntities(
+        edit_movie_contribution_collection=edit_movie_contribution_collection,
+        edit_person_contribution_collection=Mock(),
+        uuid_codec=UUIDCodec(),
+    )
+
+    assert await edited_entities.movie_id_of(contribution_id) == movie_id
+    edit_movie_contribution_collection.find_one.assert_awaited_once_with(
+        {"id": contribution_id.hex},
+        {"_id": False, "movie_id": True},
+    )
+
+
+async def test_missing_contribution_has_no_edited_person():
+    edit_person_contribution_collection = Mock()
+    edit_person_contribution_collection.find_one = AsyncMock(
+        return_value=None,
+    )
+    edited_entities = EditedEntities(
+        edit_movie_contribution_collection=Mock(),
+        edit_person_contribution_collection=edit_person_contribution_collection,
+        uuid_codec=UUIDCodec(),
+    )
+
+    assert await edited_entities.person_id_of(uuid7()) is None
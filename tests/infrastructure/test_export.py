@@ -0,0 +1,94 @@
+import gzip
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import UUID
+
+import pytest
+from bson import Binary, Timestamp
+from bson.json_util import RELAXED_JSON_OPTIONS, loads
+
+from contribution.infrastructure import (
+    ExportCompression,
+    SnapshotIsNotSupportedError,
+    snapshot_cluster_time,
+    export_collection,
+)
+
+
+def database_factory(replies: list[dict[str, Any]]) -> Mock:
+    database = Mock()
+    database.command = AsyncMock(side_effect=replies)
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    database.client.start_session = AsyncMock(return_value=session)
+    return database
+
+
+async def test_collection_is_exported_batch_by_batch(tmp_path: Path):
+    first_user = {
+        "_id": 1,
+        "id": Binary.from_uuid(UUID(int=1)),
+        "created_at": datetime(2024, 1, 1),
+    }
+    second_user = {"_id": 2, "name": "Нео"}
+    database = database_factory(
+        [
+            {"cursor": {"id": 7, "firstBatch": [first_user]}},
+            {"cursor": {"id": 0, "nextBatch": [second_user]}},
+        ],
+    )
+    cluster_time = Timestamp(1700000000, 1)
+
+    export_result = await export_collection(
+        database,
+        "users",
+        tmp_path,
+        batch_size=1,
+        cluster_time=cluster_time,
+    )
+
+    assert export_result.path == tmp_path / "users.ndjson.gz"
+    assert export_result.documents == 2
+    assert export_result.file_size == export_result.path.stat().st_size
+    assert list(tmp_path.iterdir()) == [export_result.path]
+
+    with gzip.open(export_result.path, "rt", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert [
+        loads(line, json_options=RELAXED_JSON_OPTIONS) for line in lines
+    ] == [
+        first_user,
+        second_user,
+    ]
+
+    find_command = database.command.await_args_list[0].args[0]
+    assert find_command["readConcern"] == {
+        "level": "snapshot",
+        "atClusterTime": cluster_time,
+    }
+    get_more_command = database.command.await_args_list[1].args[0]
+    assert get_more_command["getMore"] == 7
+
+
+async def test_empty_collection_is_exported_into_empty_file(tmp_path: Path):
+    database = database_factory([{"cursor": {"id": 0, "firstBatch": []}}])
+
+    export_result = await export_collection(
+        database,
+        "roles",
+        tmp_path,
+        compression=ExportCompression.NONE,
+    )
+
+    assert export_result.documents == 0
+    assert export_result.path.read_text() == ""
+    assert "readConcern" not in database.command.await_args.args[0]
+
+
+async def test_snapshot_requires_replica_set():
+    database = database_factory([{"ok": 1.0}])
+
+    with pytest.raises(SnapshotIsNotSupportedError):
+        await snapshot_cluster_time(database)
@@ -0,0 +1,59 @@
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.domain import UserId, User
+from contribution.infrastructure import UserMap
+
+
+def user_factory() -> User:
+    return User(
+        id=UserId(uuid7()),
+        name="JohnDoe",
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+
+
+def test_identity_map_should_return_saved_model_by_id():
+    user = user_factory()
+    user_map = UserMap()
+
+    user_map.save(user)
+
+    assert user_map.by_id(user.id) is user
+    assert user_map.by_id(UserId(uuid7())) is None
+    assert not user_map.is_acquired(user)
+
+
+def test_saving_model_with_same_id_twice_should_raise_error():
+    user = user_factory()
+    user_map = UserMap()
+
+    user_map.save(user)
+
+    with pytest.raises(Exception):
+        user_map.save(user)
+
+
+def test_saving_saved_model_as_acquired_should_mark_it_acquired():
+    user = user_factory()
+    user_map = UserMap()
+
+    user_map.save(user)
+    user_map.save_acquired(user)
+
+    assert user_map.is_acquired(user)
+
+    with pytest.raises(Exception):
+        user_map.save_acquired(user)
+
+
+def test_is_acquired_should_raise_error_if_model_does_not_exist():
+    user_map = UserMap()
+
+    with pytest.raises(Exception):
+        user_map.is_acquired(user_factory())
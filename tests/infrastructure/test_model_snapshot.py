@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    ContributionStatus,
+    EditMovieContributionId,
+    EditMovieContribution,
+    Maybe,
+    MovieId,
+    RoleId,
+    UserId,
+    User,
+)
+from contribution.infrastructure.database.model_snapshot import (
+    ModelSnapshot,
+)
+
+
+def user_factory() -> User:
+    return User(
+        id=UserId(uuid7()),
+        name="JohnDoe",
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+
+
+def contribution_factory() -> EditMovieContribution:
+    return EditMovieContribution(
+        id=EditMovieContributionId(uuid7()),
+        status=ContributionStatus.PENDING,
+        created_at=datetime.now(timezone.utc),
+        status_updated_at=None,
+        author_id=UserId(uuid7()),
+        movie_id=MovieId(uuid7()),
+        eng_title=Maybe[str].with_value("Matrix"),
+        original_title=Maybe[str].without_value(),
+        summary=Maybe[str].without_value(),
+        description=Maybe[str].without_value(),
+        release_date=Maybe.without_value(),
+        countries=Maybe.with_value(["US"]),
+        genres=Maybe.without_value(),
+        mpaa=Maybe.without_value(),
+        duration=Maybe[int].without_value(),
+        budget=Maybe.without_value(),
+        revenue=Maybe.without_value(),
+        roles_to_add=[],
+        roles_to_remove=[RoleId(uuid7())],
+        writers_to_add=[],
+        writers_to_remove=[],
+        crew_to_add=[],
+        crew_to_remove=[],
+        photos_to_add=[],
+    )
+
+
+def test_snapshot_of_unchanged_model_should_have_no_changed_fields():
+    user = user_factory()
+    snapshot = ModelSnapshot(user)
+
+    user.rating = 0
+
+    assert snapshot.changed_fields(user) == frozenset()
+
+
+def test_snapshot_should_return_reassigned_fields():
+    user = user_factory()
+    snapshot = ModelSnapshot(user)
+
+    user.rating = 10
+    user.accepted_contributions_count += 1
+
+    assert snapshot.changed_fields(user) == {
+        "rating",
+        "accepted_contributions_count",
+    }
+
+
+def test_snapshot_should_compare_maybe_and_lists_by_value():
+    contribution = contribution_factory()
+    snapshot = ModelSnapshot(contribution)
+
+    contribution.eng_title = Maybe[str].with_value("Matrix")
+    contribution.countries = Maybe.with_value(("US",))
+    contribution.roles_to_remove = list(contribution.roles_to_remove)
+    assert snapshot.changed_fields(contribution) == frozenset()
+
+    contribution.summary = Maybe[str].with_value("Summary")
+    contribution.roles_to_remove.append(RoleId(uuid7()))
+    contribution.status = ContributionStatus.ACCEPTED
+    assert snapshot.changed_fields(contribution) == {
+        "summary",
+        "roles_to_remove",
+        "status",
+    }
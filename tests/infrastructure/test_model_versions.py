@@ -0,0 +1,355 @@
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo import UpdateOne, DeleteOne, DeleteMany
+from uuid_extensions import uuid7
+
+from contribution.domain import (
+    UserId,
+    MovieId,
+    PersonId,
+    RoleId,
+    User,
+    Role,
+)
+from contribution.application import (
+    ConcurrentModificationError,
+    OperationId,
+)
+from contribution.infrastructure import (
+    ConcurrencyMode,
+    ModelVersions,
+    CommitUserCollectionChanges,
+    MongoDBUnitOfWork,
+    UserMap,
+    MovieMap,
+    PersonMap,
+    RoleMap,
+    WriterMap,
+    CrewMemberMap,
+    AddMovieContributionMap,
+    EditMovieContributionMap,
+    AddPersonContributionMap,
+    EditPersonContributionMap,
+    AchievementMap,
+    UserMapper,
+    UUIDCodec,
+    ProcessedOperations,
+    Outbox,
+)
+
+
+def user_factory() -> User:
+    return User(
+        id=UserId(uuid7()),
+        name="John Doe",
+        email=None,
+        telegram=None,
+        is_active=True,
+        rating=0,
+        accepted_contributions_count=0,
+        rejected_contributions_count=0,
+    )
+
+
+def user_to_document(user: User, version: int) -> dict:
+    return {
+        "id": user.id.hex,
+        "version": version,
+        "name": user.name,
+        "email": user.email,
+        "telegram": user.telegram,
+        "is_active": user.is_active,
+        "rating": user.rating,
+        "accepted_contributions_count": user.accepted_contributions_count,
+        "rejected_contributions_count": user.rejected_contributions_count,
+    }
+
+
+def collection_factory() -> Mock:
+    collection = Mock()
+    collection.name = "users"
+    collection.full_name = "contribution.users"
+    return collection
+
+
+def role_factory() -> Role:
+    return Role(
+        id=RoleId(uuid7()),
+        movie_id=MovieId(uuid7()),
+        person_id=PersonId(uuid7()),
+        character="Neo",
+        importance=1,
+        is_spoiler=False,
+    )
+
+
+def unit_of_work_factory(
+    *,
+    commit_user_collection_changes: Mock,
+    session: AsyncMock,
+    model_versions: ModelVersions,
+    commit_role_collection_changes: Optional[Mock] = None,
+) -> MongoDBUnitOfWork:
+    return MongoDBUnitOfWork(
+        commit_user_collection_changes=commit_user_collection_changes,
+        commit_movie_collection_changes=AsyncMock(),
+        commit_person_collection_changes=AsyncMock(),
+        commit_role_collection_changes=(
+            commit_role_collection_changes or AsyncMock()
+        ),
+        commit_writer_collection_changes=AsyncMock(),
+        commit_crew_member_collection_changes=AsyncMock(),
+        commit_add_movie_contribution_collection_changes=AsyncMock(),
+        commit_edit_movie_contribution_collection_changes=AsyncMock(),
+        commit_add_person_contribution_collection_changes=AsyncMock(),
+        commit_edit_person_contribution_collection_changes=AsyncMock(),
+        commit_achievement_collection_changes=AsyncMock(),
+        user_map=UserMap(),
+        movie_map=MovieMap(),
+        person_map=PersonMap(),
+        role_map=RoleMap(),
+        writer_map=WriterMap(),
+        crew_member_map=CrewMemberMap(),
+        add_movie_contribution_map=AddMovieContributionMap(),
+        edit_movie_contribution_map=EditMovieContributionMap(),
+        add_person_contribution_map=AddPersonContributionMap(),
+        edit_person_contribution_map=EditPersonContributionMap(),
+        achievement_map=AchievementMap(),
+        processed_operations=ProcessedOperations(
+            collection=collection_factory(),
+            session=session,
+        ),
+        outbox=Outbox(collection=collection_factory(), session=session),
+        session=session,
+        operation_id=OperationId(uuid7().hex),
+        model_versions=model_versions,
+    )
+
+
+def session_factory() -> AsyncMock:
+    session = AsyncMock()
+    session.client = Mock()
+    session.client.topology_description.known_servers = []
+    return session
+
+
+def test_concurrency_mode_is_selected_by_collection_name() -> None:
+    model_versions = ModelVersions(frozenset(["users"]))
+
+    users = collection_factory()
+    movies = collection_factory()
+    movies.name = "movies"
+
+    assert model_versions.concurrency_mode(users) is ConcurrencyMode.VERSION
+    assert model_versions.concurrency_mode(movies) is ConcurrencyMode.LOCK
+
+
+def test_filter_matches_version_model_was_acquired_with() -> None:
+    model_versions = ModelVersions()
+    acquired_user = user_factory()
+    legacy_user = user_factory()
+    not_acquired_user = user_factory()
+
+    model_versions.save(acquired_user, {"version": 3})
+    model_versions.save(legacy_user, {})
+
+    assert model_versions.filter(acquired_user) == {"version": 3}
+    assert model_versions.filter(legacy_user) == {"version": None}
+    assert model_versions.filter(not_acquired_user) == {}
+
+
+async def test_acquire_by_id_does_not_write_lock_in_version_mode() -> None:
+    user = user_factory()
+    model_versions = ModelVersions(frozenset(["users"]))
+
+    collection = collection_factory()
+    collection.find_one = AsyncMock(return_value=user_to_document(user, 7))
+    collection.find_one_and_update = AsyncMock()
+
+    user_mapper = UserMapper(
+        user_map=UserMap(),
+        user_collection=collection,
+        lock_factory=Mock(),
+        unit_of_work=Mock(),
+        session=AsyncMock(),
+        uuid_codec=UUIDCodec(),
+        model_versions=model_versions,
+    )
+    acquired_user = await user_mapper.acquire_by_id(user.id)
+
+    assert acquired_user == user
+    collection.find_one_and_update.assert_not_awaited()
+    assert model_versions.filter(acquired_user) == {"version": 7}
+
+
+async def test_acquire_by_id_does_not_save_version_in_lock_mode() -> None:
+    user = user_factory()
+    model_versions = ModelVersions()
+
+    collection = collection_factory()
+    collection.find_one_and_update = AsyncMock(
+        return_value=user_to_document(user, 7),
+    )
+
+    user_mapper = UserMapper(
+        user_map=UserMap(),
+        user_collection=collection,
+        lock_factory=Mock(),
+        unit_of_work=Mock(),
+        session=AsyncMock(),
+        uuid_codec=UUIDCodec(),
+        model_versions=model_versions,
+    )
+    acquired_user = await user_mapper.acquire_by_id(user.id)
+
+    assert acquired_user == user
+    assert not model_versions.is_versioned(acquired_user)
+    assert model_versions.filter(acquired_user) == {}
+
+
+def test_committer_updates_only_unchanged_version() -> None:
+    user = user_factory()
+    model_versions = ModelVersions(frozenset(["users"]))
+    model_versions.save(user, {"version": 7})
+
+    committer = CommitUserCollectionChanges(
+        collection=collection_factory(),
+        session=AsyncMock(),
+        uuid_codec=UUIDCodec(),
+        model_versions=model_versions,
+    )
+    user.rating = 10
+    update, delete = committer.write_models(
+        new=[],
+        dirty=[(user, {"rating"})],
+        deleted=[user],
+    )
+
+    assert update == UpdateOne(
+        {"id": user.id.hex, "version": 7},
+        {"$set": {"rating": 10}, "$inc": {"version": 1}},
+        namespace="contribution.users",
+    )
+    assert delete == DeleteOne(
+        {"id": user.id.hex, "version": 7},
+        namespace="contribution.users",
+    )
+
+
+@pytest.mark.parametrize(
+    ("versioned", "matched_count", "conflict_expected"),
+    [
+        (True, 1, False),
+        (True, 0, True),
+        (False, 0, False),
+    ],
+)
+async def test_commit_raises_conflict_when_version_moved(
+    versioned: bool,
+    matched_count: int,
+    conflict_expected: bool,
+) -> None:
+    user = user_factory()
+    model_versions = ModelVersions()
+    if versioned:
+        model_versions.save(user, {"version": 7})
+
+    session = session_factory()
+    commit_user_collection_changes = AsyncMock(
+        return_value=Mock(matched_count=matched_count, deleted_count=0),
+    )
+    unit_of_work = unit_of_work_factory(
+        commit_user_collection_changes=commit_user_collection_changes,
+        session=session,
+        model_versions=model_versions,
+    )
+    unit_of_work.register_clean(user)
+    user.rating = 10
+    unit_of_work.register_dirty(user)
+
+    if conflict_expected:
+        with pytest.raises(ConcurrentModificationError):
+            await unit_of_work.commit()
+        session.abort_transaction.assert_awaited_once()
+        session.commit_transaction.assert_not_awaited()
+    else:
+        await unit_of_work.commit()
+        session.commit_transaction.assert_awaited_once()
+
+
+async def test_unversioned_deletes_do_not_affect_version_check() -> None:
+    user = user_factory()
+    role = role_factory()
+    model_versions = ModelVersions()
+    model_versions.save(user, {"version": 7})
+
+    session = session_factory()
+    # Deletes of roles match nothing, e.g. roles were
+    # already deleted, but update of user matches
+    commit_user_collection_changes = AsyncMock(
+        return_value=Mock(matched_count=1, deleted_count=0),
+    )
+    commit_role_collection_changes = AsyncMock(
+        return_value=Mock(matched_count=0, deleted_count=0),
+    )
+    unit_of_work = unit_of_work_factory(
+        commit_user_collection_changes=commit_user_collection_changes,
+        commit_role_collection_changes=commit_role_collection_changes,
+        session=session,
+        model_versions=model_versions,
+    )
+    unit_of_work.register_clean(user)
+    user.rating = 10
+    unit_of_work.register_dirty(user)
+    unit_of_work.register_deleted(role)
+
+    await unit_of_work.commit()
+
+    session.commit_transaction.assert_awaited_once()
+
+
+async def test_unversioned_deletes_do_not_hide_version_conflict() -> None:
+    user = user_factory()
+    role = role_factory()
+    model_versions = ModelVersions()
+    model_versions.save(user, {"version": 7})
+
+    session = session_factory()
+    session.client.topology_description.known_servers = [
+        Mock(max_wire_version=25),
+    ]
+    # Delete of roles matches two documents, but update
+    # of user matches nothing
+    session.client.bulk_write = AsyncMock(
+        return_value=Mock(
+            update_results={0: Mock(matched_count=0)},
+            delete_results={1: Mock(deleted_count=2)},
+        ),
+    )
+    commit_user_collection_changes = Mock()
+    commit_user_collection_changes.write_models.return_value = [
+        UpdateOne({}, {}),
+    ]
+    commit_role_collection_changes = Mock()
+    commit_role_collection_changes.write_models.return_value = [
+        DeleteMany({}),
+    ]
+    unit_of_work = unit_of_work_factory(
+        commit_user_collection_changes=commit_user_collection_changes,
+        commit_role_collection_changes=commit_role_collection_changes,
+        session=session,
+        model_versions=model_versions,
+    )
+    unit_of_work.register_clean(user)
+    user.rating = 10
+    unit_of_work.register_dirty(user)
+    unit_of_work.register_deleted(role)
+
+    with pytest.raises(ConcurrentModificationError):
+        await unit_of_work.commit()
+
+    assert session.client.bulk_write.await_args.kwargs["verbose_results"]
+    session.abort_transaction.assert_awaited_once()
+    session.commit_transaction.assert_not_awaited()
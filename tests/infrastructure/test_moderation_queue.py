@@ -0,0 +1,108 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+from bson import ObjectId
+
+from contribution.domain import ContributionStatus
+from contribution.infrastructure import ModerationQueueProjector
+
+
+def database_factory() -> Mock:
+    collections: dict[str, AsyncMock] = {}
+
+    def get_collection(name: str) -> AsyncMock:
+        if name not in collections:
+            collections[name] = AsyncMock(name=name)
+            collections[name].name = name
+        return collections[name]
+
+    database = Mock()
+    database.get_collection.side_effect = get_collection
+    return database
+
+
+def change_factory(
+    operation_type: str,
+    status: ContributionStatus,
+) -> dict:
+    return {
+        "operationType": operation_type,
+        "ns": {"coll": "add_person_contributions"},
+        "documentKey": {"_id": ObjectId()},
+        "fullDocument": {
+            "id": "id",
+            "author_id": "author_id",
+            "status": status,
+            "created_at": datetime(2024, 1, 1),
+            "first_name": "Keanu",
+            "last_name": "Reeves",
+        },
+    }
+
+
+async def test_new_pending_contribution_is_queued_and_counted():
+    database = database_factory()
+    queue = database.get_collection("moderation_queue")
+    queue.replace_one.return_value = Mock(upserted_id=ObjectId())
+    counts = database.get_collection("moderation_queue_counts")
+    change = change_factory("insert", ContributionStatus.PENDING)
+
+    await ModerationQueueProjector(database).apply(change)
+
+    queue.replace_one.assert_awaited_once_with(
+        {"_id": change["documentKey"]["_id"]},
+        {
+            "kind": "add_person",
+            "contribution_id": "id",
+            "author_id": "author_id",
+            "created_at": datetime(2024, 1, 1),
+            "first_name": "Keanu",
+            "last_name": "Reeves",
+        },
+        upsert=True,
+    )
+    counts.update_one.assert_awaited_once_with(
+        {"_id": "add_person"},
+        {"$inc": {ContributionStatus.PENDING: 1}},
+        upsert=True,
+    )
+
+
+async def test_replayed_change_does_not_change_counts():
+    database = database_factory()
+    queue = database.get_collection("moderation_queue")
+    queue.replace_one.return_value = Mock(upserted_id=None)
+    queue.delete_one.return_value = Mock(deleted_count=0)
+    counts = database.get_collection("moderation_queue_counts")
+    projector = ModerationQueueProjector(database)
+
+    await projector.apply(change_factory("insert", ContributionStatus.PENDING))
+    await projector.apply(
+        change_factory("update", ContributionStatus.ACCEPTED),
+    )
+
+    counts.update_one.assert_not_awaited()
+
+
+async def test_accepted_contribution_leaves_queue():
+    database = database_factory()
+    queue = database.get_collection("moderation_queue")
+    queue.delete_one.return_value = Mock(deleted_count=1)
+    counts = database.get_collection("moderation_queue_counts")
+    change = change_factory("update", ContributionStatus.ACCEPTED)
+
+    await ModerationQueueProjector(database).apply(change)
+
+    queue.delete_one.assert_awaited_once_with(
+        {"_id": change["documentKey"]["_id"]},
+    )
+    counts.update_one.assert_awaited_once_with(
+        {"_id": "add_person"},
+        {
+            "$inc": {
+                ContributionStatus.PENDING: -1,
+                ContributionStatus.ACCEPTED: 1,
+            },
+        },
+        upsert=True,
+    )
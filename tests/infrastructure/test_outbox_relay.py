@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+from pamqp.commands import Basic
+
+from contribution.infrastructure import (
+    ConfirmingPublisher,
+    OutboxRelay,
+    OutboxRelayMetrics,
+)
+
+
+def collection_factory(documents: list[dict]) -> Mock:
+    cursor = Mock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=documents)
+
+    collection = Mock()
+    collection.find.return_value = cursor
+    collection.update_many = AsyncMock()
+    return collection
+
+
+def channel_pool_factory(exchange: Mock) -> Mock:
+    @asynccontextmanager
+    async def acquire():
+        yield Mock(exchange=exchange)
+
+    channel_pool = Mock()
+    channel_pool.acquire = acquire
+    return channel_pool
+
+
+def document_factory(id: int, created_at: datetime) -> dict:
+    return {
+        "_id": id,
+        "routing_key": "contribution.movie_added",
+        "body": "{}",
+        "operation_id": str(id),
+        "created_at": created_at,
+        "sent": False,
+        "sent_at": None,
+    }
+
+
+async def test_only_confirmed_messages_are_marked_sent():
+    created_at = datetime.now(timezone.utc) - timedelta(seconds=10)
+    collection = collection_factory(
+        [
+            document_factory(1, created_at),
+            document_factory(2, created_at),
+            document_factory(3, created_at),
+        ],
+    )
+    exchange = Mock()
+    exchange.publish = AsyncMock(
+        side_effect=[Basic.Ack(), Basic.Nack(), ConnectionError()],
+    )
+    metrics = OutboxRelayMetrics()
+    relay = OutboxRelay(
+        collection=collection,
+        channel_pool=channel_pool_factory(exchange),
+        publisher=ConfirmingPublisher(max_attempts=1),
+        metrics=metrics,
+    )
+
+    published = await relay.relay_batch()
+
+    assert published == 1
+    assert collection.update_many.await_args.args[0] == {"_id": {"$in": [1]}}
+    assert metrics.published == 1
+    assert metrics.failed == 2
+    assert metrics.lag_seconds >= 10
+
+
+async def test_empty_outbox_has_no_lag():
+    collection = collection_factory([])
+    metrics = OutboxRelayMetrics()
+    metrics.lag_seconds = 5
+    relay = OutboxRelay(
+        collection=collection,
+        channel_pool=channel_pool_factory(Mock()),
+        publisher=ConfirmingPublisher(),
+        metrics=metrics,
+    )
+
+    assert await relay.relay_batch() == 0
+    assert metrics.lag_seconds == 0
+    collection.update_many.assert_not_awaited()
@@ -0,0 +1,70 @@
+import pytest
+from pymongo.monitoring import (
+    ConnectionCreatedEvent,
+    ConnectionClosedEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckedInEvent,
+    ConnectionCheckOutFailedEvent,
+)
+
+from contribution.infrastructure import (
+    CHECKOUT_WAIT_BUCKETS_MS,
+    MongoDBClientProfile,
+    MongoDBPoolMetrics,
+    mongodb_config_from_env,
+)
+
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_checkout_waits_are_counted_into_buckets() -> None:
+    pool_metrics = MongoDBPoolMetrics()
+
+    for connection_id, duration in enumerate([0.0005, 0.003, 0.003, 2]):
+        pool_metrics.connection_created(
+            ConnectionCreatedEvent(ADDRESS, connection_id),
+        )
+        pool_metrics.connection_checked_out(
+            ConnectionCheckedOutEvent(ADDRESS, connection_id, duration),
+        )
+    pool_metrics.connection_checked_in(ConnectionCheckedInEvent(ADDRESS, 0))
+    pool_metrics.connection_closed(ConnectionClosedEvent(ADDRESS, 0, "idle"))
+    pool_metrics.connection_check_out_failed(
+        ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 2),
+    )
+
+    stats = pool_metrics.stats()
+
+    expected_histogram = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+    expected_histogram[0] = 1
+    expected_histogram[1] = 2
+    expected_histogram[-1] = 1
+
+    assert stats.checkouts == 4
+    assert stats.failed_checkouts == {"timeout": 1}
+    assert stats.checkout_wait_histogram == tuple(expected_histogram)
+    assert stats.max_checkout_wait_ms == pytest.approx(2000)
+    assert stats.mean_checkout_wait_ms == pytest.approx(2006.5 / 4)
+    assert stats.open_connections == 3
+    assert stats.checked_out_connections == 3
+
+
+def test_client_options_depend_on_profile_and_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MONGODB_URL", "mongodb://localhost")
+    monkeypatch.setenv("MONGODB_MAX_POOL_SIZE", "42")
+    monkeypatch.setenv("MONGODB_COMPRESSORS", "zstd, snappy")
+
+    web_api_config = mongodb_config_from_env(MongoDBClientProfile.WEB_API)
+    cli_config = mongodb_config_from_env(MongoDBClientProfile.CLI)
+
+    assert web_api_config.client_options.max_pool_size == 42
+    assert web_api_config.client_options.compressors == ("zstd", "snappy")
+    assert web_api_config.client_options.min_pool_size > 0
+    assert web_api_config.client_options.read_concern == "majority"
+
+    assert cli_config.client_options.max_pool_size == 42
+    assert cli_config.client_options.min_pool_size == 0
+    assert cli_config.client_options.read_concern == "local"
@@ -0,0 +1,28 @@
+from unittest.mock import AsyncMock, Mock
+
+from contribution.infrastructure import ProcessedOperations
+
+
+def collection_factory() -> Mock:
+    collection = Mock()
+    collection.full_name = "contribution.processed_operations"
+    return collection
+
+
+def test_write_models_insert_messages_by_id():
+    processed_operations = ProcessedOperations(
+        collection=collection_factory(),
+        session=AsyncMock(),
+    )
+
+    write_models = processed_operations.write_models(["1", "2"])
+
+    assert [
+        write_model._doc["_id"]  # noqa: SLF001
+        for write_model in write_models
+    ] == ["1", "2"]
+    assert all(
+        write_model._namespace  # noqa: SLF001
+        == "contribution.processed_operations"
+        for write_model in write_models
+    )
@@ -4,12 +4,14 @@ import pytest
 from uuid_extensions import uuid7
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
-    AsyncIOMotorClientSession,
     AsyncIOMotorDatabase,
 )
 
 from contribution.domain import UserId, User
-from contribution.application import UserIdIsAlreadyTakenError
+from contribution.application import (
+    OperationId,
+    UserIdIsAlreadyTakenError,
+)
 from contribution.infrastructure import (
     user_collection_factory,
     movie_collection_factory,
@@ -22,7 +24,19 @@ from contribution.infrastructure import (
     add_person_contribution_collection_factory,
     edit_person_contribution_collection_factory,
     achievement_collection_factory,
+    processed_operation_collection_factory,
+    outbox_collection_factory,
     UserMap,
+    MovieMap,
+    PersonMap,
+    RoleMap,
+    WriterMap,
+    CrewMemberMap,
+    AddMovieContributionMap,
+    EditMovieContributionMap,
+    AddPersonContributionMap,
+    EditPersonContributionMap,
+    AchievementMap,
     CommitUserCollectionChanges,
     CommitMovieCollectionChanges,
     CommitPersonCollectionChanges,
@@ -37,7 +51,13 @@ from contribution.infrastructure import (
     UserMapper,
     MongoDBLockFactory,
     MongoDBUnitOfWork,
+    MongoDBSession,
+    UUIDCodec,
+    ModelVersions,
+    CreditsLayout,
     motor_database_factory,
+    ProcessedOperations,
+    Outbox,
 )
 
 
@@ -79,29 +99,34 @@ async def test_saving_two_users_with_same_id_to_database_at_same_time_should_rai
 
 async def unit_of_work_factory(
     motor_database: AsyncIOMotorDatabase,
-    motor_session: AsyncIOMotorClientSession,
+    motor_session: MongoDBSession,
+    model_versions: ModelVersions,
+    user_map: UserMap,
 ) -> MongoDBUnitOfWork:
-    user_collection = await user_collection_factory(motor_database)
-    movie_collection = await movie_collection_factory(motor_database)
-    person_collection = await person_collection_factory(motor_database)
-    role_collection = await role_collection_factory(motor_database)
-    writer_collection = await writer_collection_factory(motor_database)
-    crew_member_collection = await crew_member_collection_factory(
+    user_collection = user_collection_factory(motor_database)
+    movie_collection = movie_collection_factory(motor_database)
+    person_collection = person_collection_factory(motor_database)
+    role_collection = role_collection_factory(motor_database)
+    writer_collection = writer_collection_factory(motor_database)
+    crew_member_collection = crew_member_collection_factory(
         motor_database,
     )
     add_movie_contribution_collection = (
-        await add_movie_contribution_collection_factory(motor_database)
+        add_movie_contribution_collection_factory(motor_database)
     )
     edit_movie_contribution_collection = (
-        await edit_movie_contribution_collection_factory(motor_database)
+        edit_movie_contribution_collection_factory(motor_database)
     )
     add_person_contribution_collection = (
-        await add_person_contribution_collection_factory(motor_database)
+        add_person_contribution_collection_factory(motor_database)
     )
     edit_person_contribution_collection = (
-        await edit_person_contribution_collection_factory(motor_database)
+        edit_person_contribution_collection_factory(motor_database)
+    )
+    achievement_collection = achievement_collection_factory(
+        motor_database,
     )
-    achievement_collection = await achievement_collection_factory(
+    processed_operation_collection = processed_operation_collection_factory(
         motor_database,
     )
 
@@ -110,69 +135,114 @@ async def unit_of_work_factory(
             CommitUserCollectionChanges(
                 collection=user_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_movie_collection_changes=(
             CommitMovieCollectionChanges(
                 collection=movie_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_person_collection_changes=(
             CommitPersonCollectionChanges(
                 collection=person_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_role_collection_changes=(
             CommitRoleCollectionChanges(
                 collection=role_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                credits_layout=CreditsLayout.COLLECTIONS,
             )
         ),
         commit_writer_collection_changes=(
             CommitWriterCollectionChanges(
                 collection=writer_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                credits_layout=CreditsLayout.COLLECTIONS,
             )
         ),
         commit_crew_member_collection_changes=(
             CommitCrewMemberCollectionChanges(
                 collection=crew_member_collection,
+                movie_collection=movie_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                credits_layout=CreditsLayout.COLLECTIONS,
             )
         ),
         commit_add_movie_contribution_collection_changes=(
             CommitAddMovieContributionCollectionChanges(
                 collection=add_movie_contribution_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_edit_movie_contribution_collection_changes=(
             CommitEditMovieContributionCollectionChanges(
                 collection=edit_movie_contribution_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_add_person_contribution_collection_changes=(
             CommitAddPersonContributionCollectionChanges(
                 collection=add_person_contribution_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_edit_person_contribution_collection_changes=(
             CommitEditPersonContributionCollectionChanges(
                 collection=edit_person_contribution_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
+                model_versions=model_versions,
             )
         ),
         commit_achievement_collection_changes=(
             CommitAchievementCollectionChanges(
                 collection=achievement_collection,
                 session=motor_session,
+                uuid_codec=UUIDCodec(),
             )
         ),
+        user_map=user_map,
+        movie_map=MovieMap(),
+        person_map=PersonMap(),
+        role_map=RoleMap(),
+        writer_map=WriterMap(),
+        crew_member_map=CrewMemberMap(),
+        add_movie_contribution_map=AddMovieContributionMap(),
+        edit_movie_contribution_map=EditMovieContributionMap(),
+        add_person_contribution_map=AddPersonContributionMap(),
+        edit_person_contribution_map=EditPersonContributionMap(),
+        achievement_map=AchievementMap(),
+        processed_operations=ProcessedOperations(
+            collection=processed_operation_collection,
+            session=motor_session,
+        ),
+        outbox=Outbox(
+            collection=outbox_collection_factory(motor_database),
+            session=motor_session,
+        ),
         session=motor_session,
+        operation_id=OperationId(uuid7().hex),
+        model_versions=model_versions,
     )
 
 
@@ -192,32 +262,33 @@ async def save_users_to_database_at_same_time(
 ) -> None:
     motor_sessions = []
     motor_databases = []
-    opened_transactions = []
     unit_of_works = []
     user_mappers = []
 
     for _ in users:
-        motor_session = await motor_client.start_session()
-        opened_transaction = (
-            await motor_session.start_transaction().__aenter__()
-        )
-        motor_database = motor_database_factory(motor_session)
+        motor_session = MongoDBSession(motor_client)
+        motor_database = motor_database_factory(motor_client)
 
+        model_versions = ModelVersions()
+        user_map = UserMap()
         unit_of_work = await unit_of_work_factory(
             motor_database=motor_database,
             motor_session=motor_session,
+            model_versions=model_versions,
+            user_map=user_map,
         )
         user_mapper = UserMapper(
-            user_map=UserMap(),
-            user_collection=await user_collection_factory(motor_database),
+            user_map=user_map,
+            user_collection=user_collection_factory(motor_database),
             lock_factory=MongoDBLockFactory(),
             unit_of_work=unit_of_work,
             session=motor_session,
+            uuid_codec=UUIDCodec(),
+            model_versions=model_versions,
         )
 
         motor_sessions.append(motor_session)
         motor_databases.append(motor_database)
-        opened_transactions.append(opened_transaction)
         unit_of_works.append(unit_of_work)
         user_mappers.append(user_mapper)
 
@@ -237,5 +308,5 @@ async def save_users_to_database_at_same_time(
     try:
         await asyncio.gather(*coros)
     finally:
-        for opened_transaction in opened_transactions:
-            await opened_transaction.__aexit__(None, None, None)
+        for motor_session in motor_sessions:
+            await motor_session.end()
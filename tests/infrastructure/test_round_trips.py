@@ -0,0 +1,23 @@
+from contribution.infrastructure.operation_id.round_trips import (
+    counting_round_trips,
+    count_mongodb_command,
+    count_redis_call,
+    count_broker_publish,
+)
+
+
+def test_counting_round_trips_should_count_only_inside_of_context():
+    count_mongodb_command()
+
+    with counting_round_trips() as round_trips:
+        count_mongodb_command()
+        count_mongodb_command()
+        count_redis_call()
+        count_broker_publish()
+
+    count_redis_call()
+
+    assert round_trips.mongodb_commands == 2
+    assert round_trips.redis_calls == 1
+    assert round_trips.broker_publishes == 1
+    assert round_trips.total == 4
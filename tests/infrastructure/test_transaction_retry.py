@@ -0,0 +1,245 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo.errors import OperationFailure
+from uuid_extensions import uuid7
+
+from contribution.application import (
+    ConcurrentModificationError,
+    OperationId,
+    TransactionProcessor,
+)
+from contribution.infrastructure import (
+    TransactionRetryMetrics,
+    MongoDBTransactionRetryPolicy,
+    MongoDBUnitOfWork,
+    ModelVersions,
+    OutboxMessage,
+    UserMap,
+    MovieMap,
+    PersonMap,
+    RoleMap,
+    WriterMap,
+    CrewMemberMap,
+    AddMovieContributionMap,
+    EditMovieContributionMap,
+    AddPersonContributionMap,
+    EditPersonContributionMap,
+    AchievementMap,
+)
+
+
+MAX_ATTEMPTS = 3
+MAX_DELAY = 0.04
+
+
+def error_with_label(label: str) -> OperationFailure:
+    return OperationFailure(
+        "Error",
+        code=112,
+        details={"errorLabels": [label]},
+    )
+
+
+def retry_policy_factory(
+    metrics: TransactionRetryMetrics,
+) -> MongoDBTransactionRetryPolicy:
+    return MongoDBTransactionRetryPolicy(
+        max_attempts=MAX_ATTEMPTS,
+        base_delay=0.01,
+        max_delay=MAX_DELAY,
+        metrics=metrics,
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "reason"),
+    [
+        (ConcurrentModificationError(), "concurrent_modification"),
+        (
+            error_with_label("TransientTransactionError"),
+            "transient_transaction_error",
+        ),
+    ],
+)
+def test_retryable_operation_errors_are_retried_with_bounded_delays(
+    error: Exception,
+    reason: str,
+) -> None:
+    metrics = TransactionRetryMetrics()
+    retry_policy = retry_policy_factory(metrics)
+
+    for attempt in range(1, MAX_ATTEMPTS):
+        delay = retry_policy.operation_retry_delay(error, attempt)
+        assert delay is not None
+        assert 0 <= delay <= min(MAX_DELAY, 0.01 * 2 ** (attempt - 1))
+
+    assert retry_policy.operation_retry_delay(error, MAX_ATTEMPTS) is None
+    assert metrics.retries[reason] == MAX_ATTEMPTS - 1
+    assert metrics.exhausted[reason] == 1
+
+
+def test_other_errors_are_not_retried() -> None:
+    retry_policy = retry_policy_factory(TransactionRetryMetrics())
+
+    assert retry_policy.operation_retry_delay(ValueError(), 1) is None
+    assert (
+        retry_policy.operation_retry_delay(
+            error_with_label("UnknownTransactionCommitResult"),
+            1,
+        )
+        is None
+    )
+    assert (
+        retry_policy.commit_retry_delay(
+            error_with_label("TransientTransactionError"),
+            1,
+        )
+        is None
+    )
+
+
+async def test_transaction_processor_runs_operation_again() -> None:
+    processor = AsyncMock()
+    processor.process.side_effect = [
+        error_with_label("TransientTransactionError"),
+        "result",
+    ]
+    unit_of_work = AsyncMock()
+
+    tx_processor = TransactionProcessor(
+        processor=processor,
+        unit_of_work=unit_of_work,
+        retry_policy=retry_policy_factory(TransactionRetryMetrics()),
+    )
+
+    assert await tx_processor.process("command") == "result"
+    assert processor.process.await_count == 2
+    unit_of_work.rollback.assert_awaited_once()
+    unit_of_work.commit.assert_awaited_once()
+
+
+async def test_transaction_processor_retries_only_commit() -> None:
+    processor = AsyncMock()
+    processor.process.return_value = "result"
+    unit_of_work = AsyncMock()
+    unit_of_work.commit.side_effect = [
+        error_with_label("UnknownTransactionCommitResult"),
+        None,
+    ]
+
+    tx_processor = TransactionProcessor(
+        processor=processor,
+        unit_of_work=unit_of_work,
+        retry_policy=retry_policy_factory(TransactionRetryMetrics()),
+    )
+
+    assert await tx_processor.process("command") == "result"
+    processor.process.assert_awaited_once()
+    unit_of_work.rollback.assert_not_awaited()
+    assert unit_of_work.commit.await_count == 2
+
+
+async def test_transaction_processor_raises_when_attempts_exhausted() -> None:
+    processor = AsyncMock()
+    processor.process.side_effect = ConcurrentModificationError()
+    unit_of_work = AsyncMock()
+
+    tx_processor = TransactionProcessor(
+        processor=processor,
+        unit_of_work=unit_of_work,
+        retry_policy=retry_policy_factory(TransactionRetryMetrics()),
+    )
+
+    with pytest.raises(ConcurrentModificationError):
+        await tx_processor.process("command")
+    assert processor.process.await_count == MAX_ATTEMPTS
+    assert unit_of_work.rollback.await_count == MAX_ATTEMPTS - 1
+
+
+def unit_of_work_factory(
+    *,
+    session: AsyncMock,
+    outbox: Mock,
+) -> MongoDBUnitOfWork:
+    return MongoDBUnitOfWork(
+        commit_user_collection_changes=AsyncMock(),
+        commit_movie_collection_changes=AsyncMock(),
+        commit_person_collection_changes=AsyncMock(),
+        commit_role_collection_changes=AsyncMock(),
+        commit_writer_collection_changes=AsyncMock(),
+        commit_crew_member_collection_changes=AsyncMock(),
+        commit_add_movie_contribution_collection_changes=AsyncMock(),
+        commit_edit_movie_contribution_collection_changes=AsyncMock(),
+        commit_add_person_contribution_collection_changes=AsyncMock(),
+        commit_edit_person_contribution_collection_changes=AsyncMock(),
+        commit_achievement_collection_changes=AsyncMock(),
+        user_map=UserMap(),
+        movie_map=MovieMap(),
+        person_map=PersonMap(),
+        role_map=RoleMap(),
+        writer_map=WriterMap(),
+        crew_member_map=CrewMemberMap(),
+        add_movie_contribution_map=AddMovieContributionMap(),
+        edit_movie_contribution_map=EditMovieContributionMap(),
+        add_person_contribution_map=AddPersonContributionMap(),
+        edit_person_contribution_map=EditPersonContributionMap(),
+        achievement_map=AchievementMap(),
+        processed_operations=Mock(),
+        outbox=outbox,
+        session=session,
+        operation_id=OperationId(uuid7().hex),
+        model_versions=ModelVersions(),
+    )
+
+
+async def test_events_of_rolled_back_attempts_are_not_published() -> None:
+    session = AsyncMock()
+    session.client = Mock()
+    session.client.topology_description.known_servers = []
+    recorded_messages = []
+
+    async def record(messages: list[OutboxMessage]) -> None:
+        recorded_messages.extend(messages)
+
+    outbox = Mock()
+    outbox.record = record
+    unit_of_work = unit_of_work_factory(session=session, outbox=outbox)
+
+    attempts = 0
+    transient_error = error_with_label("TransientTransactionError")
+
+    async def process(command: str) -> int:
+        # Like callbacks of events, registers event of
+        # attempt and fails first attempt after that
+        nonlocal attempts
+        attempts += 1
+        unit_of_work.register_outbox_message(
+            OutboxMessage(
+                routing_key="contribution.movie_added",
+                body=f'{{"attempt": {attempts}}}',
+                operation_id=OperationId(uuid7().hex),
+                created_at=datetime.now(timezone.utc),
+            ),
+        )
+        if attempts == 1:
+            raise transient_error
+        return attempts
+
+    processor = Mock()
+    processor.process = process
+
+    tx_processor = TransactionProcessor(
+        processor=processor,
+        unit_of_work=unit_of_work,
+        retry_policy=retry_policy_factory(TransactionRetryMetrics()),
+    )
+
+    assert await tx_processor.process("command") == 2
+
+    assert [message.body for message in recorded_messages] == [
+        '{"attempt": 2}',
+    ]
+    session.abort_transaction.assert_awaited_once()
+    session.commit_transaction.assert_awaited_once()
@@ -0,0 +1,74 @@
+from bson import Binary
+from uuid_extensions import uuid7
+
+from contribution.infrastructure import UUIDRepresentation, UUIDCodec
+from contribution.infrastructure.database.uuid_migration import (
+    _converted_fields,
+)
+
+
+def test_uuid_codec_should_decode_both_representations():
+    uuid = uuid7()
+    uuid_codec = UUIDCodec(UUIDRepresentation.BINARY)
+
+    assert uuid_codec.encode(uuid) == Binary.from_uuid(uuid)
+    assert uuid_codec.decode(uuid.hex) == uuid
+    assert uuid_codec.decode(Binary.from_uuid(uuid)) == uuid
+
+
+def test_mixed_uuid_codec_should_query_both_representations():
+    uuids = [uuid7(), uuid7()]
+    uuid_codec = UUIDCodec(UUIDRepresentation.MIXED)
+
+    assert uuid_codec.encode(uuids[0]) == Binary.from_uuid(uuids[0])
+    assert uuid_codec.query(uuids[0]) == {
+        "$in": [Binary.from_uuid(uuids[0]), uuids[0].hex],
+    }
+    assert uuid_codec.query_many(uuids) == {
+        "$in": [
+            Binary.from_uuid(uuids[0]),
+            uuids[0].hex,
+            Binary.from_uuid(uuids[1]),
+            uuids[1].hex,
+        ],
+    }
+
+
+def test_migration_should_convert_only_uuid_fields():
+    contribution_id, author_id, role_id, person_id = (
+        uuid7() for _ in range(4)
+    )
+    document = {
+        "_id": 1,
+        "id": contribution_id.hex,
+        "author_id": author_id.hex,
+        "status": 0,
+        "roles_to_add": [
+            {
+                "id": role_id.hex,
+                "person_id": person_id.hex,
+                "character": "Neo",
+            },
+        ],
+        "roles_to_remove": [role_id.hex],
+        "photos_to_add": ["https://example.com/a.jpg"],
+    }
+
+    converted_fields = _converted_fields(
+        document,
+        UUIDCodec(UUIDRepresentation.BINARY),
+    )
+
+    assert converted_fields == {
+        "id": Binary.from_uuid(contribution_id),
+        "author_id": Binary.from_uuid(author_id),
+        "roles_to_add": [
+            {
+                "id": Binary.from_uuid(role_id),
+                "person_id": Binary.from_uuid(person_id),
+                "character": "Neo",
+            },
+        ],
+        "roles_to_remove": [Binary.from_uuid(role_id)],
+    }
+    assert _converted_fields(document, UUIDCodec()) == {}
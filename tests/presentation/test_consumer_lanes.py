@@ -0,0 +1,149 @@
+import asyncio
+from typing import Any, Optional
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID
+
+from uuid_extensions import uuid7
+
+from contribution.infrastructure import EditedEntities, EventConsumptionConfig
+from contribution.presentation.event_consumer.lanes import ConsumerLanes
+
+
+def ioc_container_factory(
+    movie_ids: Optional[dict[UUID, UUID]] = None,
+) -> Mock:
+    movie_ids = movie_ids or {}
+    edited_entities = Mock()
+    edited_entities.movie_id_of = AsyncMock(side_effect=movie_ids.get)
+
+    ioc_container = Mock()
+    ioc_container.get = AsyncMock(
+        side_effect={EditedEntities: edited_entities}.get,
+    )
+    return ioc_container
+
+
+def message_factory(routing_key: str, body: dict[str, Any]) -> Mock:
+    message = Mock()
+    message.raw_message.routing_key = routing_key
+    message.decode = AsyncMock(return_value=body)
+    return message
+
+
+async def test_messages_of_one_entity_are_serialized():
+    lanes = ConsumerLanes(
+        EventConsumptionConfig(lanes=4),
+        ioc_container=ioc_container_factory(),
+    )
+    events: list[tuple[str, int]] = []
+
+    async def handle(message: Mock) -> None:
+        number = message.decode.return_value["number"]
+        events.append(("started", number))
+        await asyncio.sleep(0.01)
+        events.append(("completed", number))
+
+    messages = [
+        message_factory("movie_updated", {"movie_id": "1", "number": 1}),
+        message_factory(
+            "add_movie_contribution_accepted",
+            {"movie_id": "1", "number": 2},
+        ),
+    ]
+    await asyncio.gather(
+        *(
+            lanes.middleware(message).consume_scope(handle, message)
+            for message in messages
+        ),
+    )
+
+    assert events == [
+        ("started", 1),
+        ("completed", 1),
+        ("started", 2),
+        ("completed", 2),
+    ]
+
+
+async def test_editing_of_movie_is_serialized_with_updates_of_movie():
+    movie_id = uuid7()
+    contribution_id = uuid7()
+    lanes = ConsumerLanes(
+        # Lanes of contributions would let messages run
+        # concurrently
+        EventConsumptionConfig(lanes=4),
+        ioc_container=ioc_container_factory({contribution_id: movie_id}),
+    )
+    events: list[tuple[str, int]] = []
+
+    async def handle(message: Mock) -> None:
+        number = message.decode.return_value["number"]
+        events.append(("started", number))
+        await asyncio.sleep(0.01)
+        events.append(("completed", number))
+
+    messages = [
+        message_factory(
+            "movie_updated",
+            {"movie_id": movie_id.hex, "number": 1},
+        ),
+        message_factory(
+            "edit_movie_contribution_accepted",
+            {"contribution_id": str(contribution_id), "number": 2},
+        ),
+    ]
+    await asyncio.gather(
+        *(
+            lanes.middleware(message).consume_scope(handle, message)
+            for message in messages
+        ),
+    )
+
+    assert events == [
+        ("started", 1),
+        ("completed", 1),
+        ("started", 2),
+        ("completed", 2),
+    ]
+
+
+async def test_editing_of_unknown_contribution_is_not_serialized():
+    lanes = ConsumerLanes(
+        EventConsumptionConfig(),
+        ioc_container=ioc_container_factory(),
+    )
+
+    lane = await lanes.lane_of(
+        message_factory(
+            "edit_movie_contribution_rejected",
+            {"contribution_id": str(uuid7())},
+        ),
+    )
+
+    assert lane is None
+
+
+async def test_key_is_hashed_onto_the_same_lane():
+    lanes = ConsumerLanes(
+        EventConsumptionConfig(lanes=8, group_lanes={"person": 2}),
+        ioc_container=ioc_container_factory(),
+    )
+
+    assert lanes.lane(group="person", key="1") is lanes.lane(
+        group="person",
+        key="1",
+    )
+    assert (
+        len({lanes.lane(group="person", key=str(i)) for i in range(50)}) == 2
+    )
+
+
+async def test_message_without_key_is_not_serialized():
+    lanes = ConsumerLanes(
+        EventConsumptionConfig(),
+        ioc_container=ioc_container_factory(),
+    )
+
+    lane = await lanes.lane_of(message_factory("unknown", {"id": "1"}))
+
+    assert lane is None
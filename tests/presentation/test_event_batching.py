@@ -0,0 +1,207 @@
+import asyncio
+import warnings
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, Mock
+
+from contribution.application import TransactionRetryPolicy
+from contribution.infrastructure import (
+    EventBatchingConfig,
+    MongoDBUnitOfWork,
+    ProcessedOperations,
+)
+from contribution.presentation.event_consumer import CommandBatcher
+from contribution.presentation.event_consumer.broker import create_broker
+
+
+class FakeProcessor:
+    def __init__(self, failing_command: Any):
+        self._failing_command = failing_command
+        self.processed_commands: list[Any] = []
+
+    async def process(self, command: Any) -> None:
+        if command == self._failing_command:
+            raise ValueError(command)
+        self.processed_commands.append(command)
+
+
+def message_factory(message_id: str, operation_id: str = "1") -> Mock:
+    message = Mock()
+    message.decoded_body = {"operation_id": operation_id}
+    message.raw_message.message_id = message_id
+    return message
+
+
+def ioc_container_factory(
+    processor: FakeProcessor,
+    unit_of_work: Mock,
+    processed_message_ids: frozenset[str] = frozenset(),
+) -> Mock:
+    retry_policy = Mock()
+    retry_policy.commit_retry_delay = Mock(return_value=None)
+    processed_operations = Mock()
+    processed_operations.processed_among = AsyncMock(
+        side_effect=lambda message_ids: processed_message_ids.intersection(
+            message_ids,
+        ),
+    )
+    dependencies = {
+        ProcessedOperations: processed_operations,
+        FakeProcessor: processor,
+        MongoDBUnitOfWork: unit_of_work,
+        TransactionRetryPolicy: retry_policy,
+    }
+
+    @asynccontextmanager
+    async def ioc_container(context: dict) -> AsyncIterator[Mock]:
+        request_container = Mock()
+        request_container.get = AsyncMock(side_effect=dependencies.get)
+        yield request_container
+
+    return Mock(side_effect=ioc_container)
+
+
+async def test_failed_command_is_isolated():
+    processor = FakeProcessor(failing_command=2)
+    unit_of_work = Mock()
+    unit_of_work.commit_deferred = AsyncMock()
+    batcher = CommandBatcher(
+        ioc_container=ioc_container_factory(processor, unit_of_work),
+        config=EventBatchingConfig(max_size=4, max_delay_ms=1000),
+    )
+
+    results = await asyncio.gather(
+        *(
+            batcher.process(
+                routing_key="movie_updated",
+                processor_type=FakeProcessor,
+                command=command,
+                message=message_factory(str(command)),
+            )
+            for command in range(4)
+        ),
+        return_exceptions=True,
+    )
+
+    assert results[:2] == [None, None]
+    assert isinstance(results[2], ValueError)
+    assert results[3] is None
+    # Batch of 0..3 fails, batch of 0 and 1 is committed,
+    # batch of 2 and 3 fails, then 2 and 3 are processed
+    # alone
+    assert unit_of_work.commit_deferred.await_count == 1
+    assert processor.processed_commands.count(3) == 1
+    unit_of_work.register_processed_message.assert_any_call("3")
+
+
+async def test_batch_is_flushed_by_timer():
+    processor = FakeProcessor(failing_command=None)
+    unit_of_work = Mock()
+    unit_of_work.commit_deferred = AsyncMock()
+    batcher = CommandBatcher(
+        ioc_container=ioc_container_factory(processor, unit_of_work),
+        config=EventBatchingConfig(max_size=100, max_delay_ms=10),
+    )
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            batcher.process(
+                routing_key="user_created",
+                processor_type=FakeProcessor,
+                command=1,
+                message=message_factory("1"),
+            ),
+            batcher.process(
+                routing_key="user_created",
+                processor_type=FakeProcessor,
+                command=2,
+                message=message_factory("2"),
+            ),
+        ),
+        timeout=1,
+    )
+
+    assert processor.processed_commands == [1, 2]
+    unit_of_work.defer_commits.assert_called_once()
+    unit_of_work.commit_deferred.assert_awaited_once()
+
+
+async def test_processed_messages_are_skipped():
+    processor = FakeProcessor(failing_command=None)
+    unit_of_work = Mock()
+    unit_of_work.commit_deferred = AsyncMock()
+    batcher = CommandBatcher(
+        ioc_container=ioc_container_factory(
+            processor,
+            unit_of_work,
+            processed_message_ids=frozenset({"1"}),
+        ),
+        config=EventBatchingConfig(max_size=2, max_delay_ms=1000),
+    )
+
+    await asyncio.gather(
+        *(
+            batcher.process(
+                routing_key="user_created",
+                processor_type=FakeProcessor,
+                command=command,
+                message=message_factory(str(command)),
+            )
+            for command in (1, 2)
+        ),
+    )
+
+    assert processor.processed_commands == [2]
+
+
+async def test_messages_of_one_operation_are_processed():
+    processor = FakeProcessor(failing_command=None)
+    unit_of_work = Mock()
+    unit_of_work.commit_deferred = AsyncMock()
+    batcher = CommandBatcher(
+        ioc_container=ioc_container_factory(
+            processor,
+            unit_of_work,
+            processed_message_ids=frozenset({"1"}),
+        ),
+        config=EventBatchingConfig(max_size=3, max_delay_ms=1000),
+    )
+
+    # Messages published by one operation, e.g. by batch of
+    # contributions, share its operation id
+    await asyncio.gather(
+        *(
+            batcher.process(
+                routing_key="movie_added",
+                processor_type=FakeProcessor,
+                command=command,
+                message=message_factory(str(command), operation_id="1"),
+            )
+            for command in (1, 2, 3)
+        ),
+    )
+
+    assert processor.processed_commands == [2, 3]
+    assert [
+        call.args
+        for call in unit_of_work.register_processed_message.call_args_list
+    ] == [("2",), ("3",)]
+
+
+def test_batching_broker_prefetches_two_batches():
+    ioc_container = Mock()
+    batcher = CommandBatcher(
+        ioc_container=ioc_container,
+        config=EventBatchingConfig(max_size=10),
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        broker = create_broker(
+            "amqp://localhost",
+            ioc_container=ioc_container,
+            batcher=batcher,
+        )
+
+    channel = broker._connection_kwargs["channel_settings"]  # noqa: SLF001
+    assert channel.prefetch_count == 20
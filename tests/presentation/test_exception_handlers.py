@@ -0,0 +1,44 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+
+from contribution.domain import InvalidPersonFirstNameError
+from contribution.application import (
+    PersonsDoNotExistError,
+    ConcurrentModificationError,
+)
+from contribution.presentation.web_api.exception_handlers import (
+    batch_item_error_json_as_dict_factory,
+    setup_exception_handlers,
+)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        InvalidPersonFirstNameError(),
+        PersonsDoNotExistError({"non_existing_person_id"}),
+        ConcurrentModificationError(),
+    ],
+)
+def test_batch_item_error_should_match_error_response(error: Exception):
+    app = FastAPI()
+    setup_exception_handlers(app)
+    exception_handler = app.exception_handlers[type(error)]
+
+    response = exception_handler(Mock(), error)
+
+    assert batch_item_error_json_as_dict_factory(error) == {
+        **json.loads(response.body),
+        "status_code": response.status_code,
+    }
+
+
+def test_batch_item_error_should_be_generic_for_unknown_error():
+    assert batch_item_error_json_as_dict_factory(ValueError()) == {
+        "code": 60,
+        "message": "Item of batch is invalid.",
+        "status_code": 400,
+    }
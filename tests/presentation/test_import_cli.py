@@ -0,0 +1,110 @@
+import importlib
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from contribution.presentation.cli.handlers.import_ import (
+    ImportKind,
+    _RecordIsInvalidError,
+    _chunks,
+    _read_checkpoint,
+    _write_checkpoint,
+    import_,
+)
+
+
+# Module is shadowed by `import_` handler in package namespace
+import_handler = importlib.import_module(
+    "contribution.presentation.cli.handlers.import_",
+)
+
+
+def person_line_factory() -> str:
+    record = {
+        "id": str(uuid7()),
+        "first_name": "Keanu",
+        "last_name": "Reeves",
+        "sex": "Male",
+        "birth_date": "1964-09-02",
+        "death_date": None,
+    }
+    return json.dumps(record)
+
+
+def test_chunks_should_yield_chunks_with_number_of_last_line():
+    lines = [
+        (1, person_line_factory()),
+        (2, "\n"),
+        (3, person_line_factory()),
+        (4, person_line_factory()),
+    ]
+
+    chunks = list(_chunks(iter(lines), ImportKind.PERSONS, 2))
+
+    assert [len(chunk) for chunk, _ in chunks] == [2, 1]
+    assert [last_line_number for _, last_line_number in chunks] == [3, 4]
+    assert str(chunks[1][0][0].id) == json.loads(lines[3][1])["id"]
+
+
+def test_chunks_should_raise_error_with_number_of_invalid_line():
+    lines = [(1, person_line_factory()), (2, '{"first_name": "Keanu"}')]
+
+    with pytest.raises(_RecordIsInvalidError) as error_info:
+        list(_chunks(iter(lines), ImportKind.PERSONS, 2))
+
+    assert error_info.value.line_number == 2
+
+
+def test_checkpoint_should_be_read_after_it_is_written(tmp_path: Path):
+    checkpoint = tmp_path / "persons.ndjson.checkpoint"
+
+    assert _read_checkpoint(checkpoint) == 0
+    _write_checkpoint(checkpoint, 500)
+    _write_checkpoint(checkpoint, 1000)
+
+    assert _read_checkpoint(checkpoint) == 1000
+    assert list(tmp_path.iterdir()) == [checkpoint]
+
+
+def test_checkpoint_should_be_ignored_when_it_is_not_specified():
+    _write_checkpoint(None, 500)
+
+    assert _read_checkpoint(None) == 0
+
+
+async def test_import_should_continue_after_checkpoint(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    path = tmp_path / "persons.ndjson"
+    lines = [person_line_factory() for _ in range(5)]
+    path.write_text("\n".join(lines))
+    checkpoint = tmp_path / "persons.ndjson.checkpoint"
+    checkpoint.write_text("2")
+
+    import_chunk = AsyncMock()
+    monkeypatch.setattr(import_handler, "_import_chunk", import_chunk)
+    monkeypatch.setattr(
+        import_handler,
+        "cli_ioc_container_factory",
+        AsyncMock,
+    )
+
+    await import_(ImportKind.PERSONS, path, chunk_size=2)
+
+    imported_ids = [
+        [str(command.id) for command in call.args[2]]
+        for call in import_chunk.await_args_list
+    ]
+    assert imported_ids == [
+        [json.loads(line)["id"] for line in lines[2:4]],
+        [json.loads(lines[4])["id"]],
+    ]
+    # Only first chunk could be committed without checkpoint
+    assert [
+        call.kwargs["skip_existing"] for call in import_chunk.await_args_list
+    ] == [True, False]
+    assert _read_checkpoint(checkpoint) == 5
@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock, Mock
+
+from contribution.application import OperationId
+from contribution.infrastructure import (
+    MongoDBUnitOfWork,
+    ProcessedOperations,
+)
+from contribution.presentation.event_consumer.processed_operations import (
+    ProcessedOperationsMiddleware,
+    processed_message_id_factory,
+)
+
+
+async def test_processed_operation_is_skipped(monkeypatch):
+    processed_operations = Mock()
+    processed_operations.is_processed = AsyncMock(return_value=True)
+    unit_of_work = Mock()
+    dependencies = {
+        OperationId: OperationId("1"),
+        ProcessedOperations: processed_operations,
+        MongoDBUnitOfWork: unit_of_work,
+    }
+    request_container = Mock()
+    request_container.get = AsyncMock(side_effect=dependencies.get)
+    monkeypatch.setattr(
+        "contribution.presentation.event_consumer.processed_operations."
+        "context.get_local",
+        Mock(return_value=request_container),
+    )
+    call_next = AsyncMock()
+    message = Mock()
+    message.decode = AsyncMock()
+    message.raw_message.message_id = "2"
+
+    result = await ProcessedOperationsMiddleware(message).consume_scope(
+        call_next,
+        message,
+    )
+
+    assert result is None
+    processed_operations.is_processed.assert_awaited_once_with("2")
+    call_next.assert_not_awaited()
+    unit_of_work.register_processed_message.assert_not_called()
+
+
+async def test_messages_of_one_operation_are_processed(monkeypatch):
+    processed_message_ids: set[str] = set()
+    processed_operations = Mock()
+    processed_operations.is_processed = AsyncMock(
+        side_effect=lambda message_id: message_id in processed_message_ids,
+    )
+    unit_of_work = Mock()
+    unit_of_work.register_processed_message = Mock(
+        side_effect=processed_message_ids.add,
+    )
+    dependencies = {
+        OperationId: OperationId("1"),
+        ProcessedOperations: processed_operations,
+        MongoDBUnitOfWork: unit_of_work,
+    }
+    request_container = Mock()
+    request_container.get = AsyncMock(side_effect=dependencies.get)
+    monkeypatch.setattr(
+        "contribution.presentation.event_consumer.processed_operations."
+        "context.get_local",
+        Mock(return_value=request_container),
+    )
+    call_next = AsyncMock()
+
+    # Both messages share operation id "1", e.g. events of
+    # batch of contributions
+    for message_id in ("2", "3"):
+        message = Mock()
+        message.decode = AsyncMock()
+        message.raw_message.message_id = message_id
+        await ProcessedOperationsMiddleware(message).consume_scope(
+            call_next,
+            message,
+        )
+
+    assert call_next.await_count == 2
+    assert processed_message_ids == {"2", "3"}
+
+
+def test_processed_message_id_is_hash_of_message_without_id():
+    def message_factory(body: bytes) -> Mock:
+        message = Mock()
+        message.raw_message.message_id = None
+        message.raw_message.routing_key = "movie_added"
+        message.body = body
+        return message
+
+    message_id = processed_message_id_factory(message_factory(b"{}"))
+
+    assert message_id == processed_message_id_factory(message_factory(b"{}"))
+    assert message_id != processed_message_id_factory(message_factory(b"[]"))
@@ -0,0 +1,73 @@
+"""
+Round trip budgets of command processors. Every command
+processor covered by tests should declare its budget here,
+so tests fail once processor starts making more round
+trips to MongoDB, Redis or message broker than expected.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from contribution.application import (
+    AddMovieProcessor,
+    AddMoviesProcessor,
+    AddPersonsProcessor,
+    CreateUserProcessor,
+    ImportPersonsProcessor,
+)
+from contribution.infrastructure.operation_id.round_trips import (
+    RoundTrips,
+    counting_round_trips,
+)
+
+
+ROUND_TRIP_BUDGETS: dict[type, RoundTrips] = {
+    # by_id, by_name, by_email, insert, commitTransaction
+    CreateUserProcessor: RoundTrips(mongodb_commands=5),
+    # users and contributions inserts, commitTransaction
+    AddMovieProcessor: RoundTrips(mongodb_commands=3),
+    # by_id, persons list_by_ids, contributions insert,
+    # commitTransaction regardless of number of movies in
+    # batch
+    AddMoviesProcessor: RoundTrips(mongodb_commands=4),
+    # by_id, contributions insert, commitTransaction
+    # regardless of number of persons in batch
+    AddPersonsProcessor: RoundTrips(mongodb_commands=3),
+    # list_by_ids, insert, commitTransaction regardless of
+    # number of persons in batch
+    ImportPersonsProcessor: RoundTrips(mongodb_commands=3),
+}
+
+
+class RoundTripBudgetExceededError(AssertionError):
+    ...
+
+
+@contextmanager
+def within_round_trip_budget(processor_type: type) -> Iterator[RoundTrips]:
+    """
+    Counts round trips made inside of context and raises
+    RoundTripBudgetExceededError on exit if they exceed
+    budget declared for processor type.
+
+    Example of usage::
+
+        with within_round_trip_budget(AddMovieProcessor):
+            await tx_processor.process(command)
+    """
+    budget = ROUND_TRIP_BUDGETS[processor_type]
+
+    with counting_round_trips() as round_trips:
+        yield round_trips
+
+    budget_is_exceeded = (
+        round_trips.mongodb_commands > budget.mongodb_commands
+        or round_trips.redis_calls > budget.redis_calls
+        or round_trips.broker_publishes > budget.broker_publishes
+    )
+    if budget_is_exceeded:
+        message = (
+            f"{processor_type.__name__} exceeded its round trip budget: "
+            f"made {round_trips}, budget is {budget}"
+        )
+        raise RoundTripBudgetExceededError(message)